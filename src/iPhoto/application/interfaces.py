@@ -14,9 +14,17 @@ class IMetadataProvider(ABC):
         pass
 
     @abstractmethod
-    def normalize_metadata(self, root: Path, file_path: Path, raw_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_metadata(
+        self,
+        root: Path,
+        file_path: Path,
+        raw_metadata: Dict[str, Any],
+        *,
+        asset_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Normalize raw metadata into the application's standard index row format.
+        A known *asset_id* spares hashing the file.
         """
         pass
 
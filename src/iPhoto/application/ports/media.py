@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Protocol
@@ -19,8 +19,15 @@ class MediaScannerPort(Protocol):
         *,
         existing_index: dict[str, dict[str, Any]] | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        completed_dirs: Collection[str] | None = None,
+        directory_callback: Callable[[str], None] | None = None,
     ) -> Iterator[dict[str, Any]]:
-        """Yield normalized scan rows."""
+        """Yield normalized scan rows.
+
+        Rows under *completed_dirs* are replayed from *existing_index* without
+        revisiting the filesystem; *directory_callback* is told about every
+        directory whose rows have all been yielded.
+        """
 
 
 class MetadataReaderPort(Protocol):
@@ -34,8 +41,10 @@ class MetadataReaderPort(Protocol):
         root: Path,
         file_path: Path,
         raw_metadata: dict[str, Any],
+        *,
+        asset_id: str | None = None,
     ) -> dict[str, Any]:
-        """Normalize one metadata payload into the index row shape."""
+        """Normalize one metadata payload into the index row shape; *asset_id* skips hashing."""
 
 
 class MetadataWriterPort(Protocol):
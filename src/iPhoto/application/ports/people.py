@@ -29,6 +29,22 @@ class PeopleAssetRepositoryPort(Protocol):
     def count_by_face_status(self) -> dict[str, int]:
         """Return face-status counts from the asset index."""
 
+    def replace_asset_people(
+        self,
+        rows: Iterable[tuple[str, str, str]],
+        *,
+        person_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Replace searchable ``(asset_id, person_id, name)`` memberships, optionally of *person_ids* only."""
+
+    def replace_person_assets(
+        self,
+        rows: Iterable[tuple[str, str]],
+        *,
+        person_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Replace ``(asset_id, person_id)`` memberships, optionally of *person_ids* only."""
+
 
 class PeopleIndexPort(Protocol):
     """Application boundary for People runtime and stable state."""
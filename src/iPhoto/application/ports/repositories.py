@@ -8,7 +8,17 @@ from pathlib import Path
 from dataclasses import dataclass
 from typing import Any, Protocol
 
-from ...domain.models.query import CollectionQuery, PageCursor, PageResult, WindowResult
+from ...domain.models.query import (
+    AlbumStats,
+    CollectionQuery,
+    GeoFeedDelta,
+    PageCursor,
+    PageResult,
+    TimelineSummary,
+    TrashLedgerEntry,
+    WindowResult,
+)
+from ...domain.models.scan import ScanJobProgress
 
 
 @dataclass(frozen=True)
@@ -67,9 +77,18 @@ class AssetRepositoryPort(Protocol):
     def remove_rows(self, rels: Iterable[str]) -> None:
         """Remove rows identified by library-relative paths."""
 
+    def move_rows(self, moves: Iterable[dict[str, Any]]) -> int:
+        """Re-key rows from ``old_rel`` to ``rel`` in place, keeping their metadata."""
+
     def get_rows_by_rels(self, rels: Iterable[str]) -> dict[str, dict[str, Any]]:
         """Return existing rows keyed by library-relative path."""
 
+    def get_rows_by_ids(self, asset_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """Return existing rows keyed by asset id."""
+
+    def get_asset_ids_for_persons(self, person_ids: Iterable[str]) -> list[str]:
+        """Return ids of assets in which every one of *person_ids* appears."""
+
     def read_all(
         self,
         sort_by_date: bool = False,
@@ -144,6 +163,26 @@ class AssetRepositoryPort(Protocol):
     ) -> WindowResult:
         """Return only paths and existing full-thumbnail cache keys."""
 
+    def search_assets(
+        self,
+        query: CollectionQuery,
+        first: int = 0,
+        limit: int = 100,
+    ) -> WindowResult:
+        """Return one relevance-ranked page of full-text search results."""
+
+    def geo_revision(self) -> int:
+        """Return the latest geotagged-asset change revision."""
+
+    def read_geotagged_changes(self, since_revision: int) -> GeoFeedDelta:
+        """Return geotagged rows changed or removed after *since_revision*."""
+
+    def read_album_stats(self) -> dict[str, AlbumStats]:
+        """Return materialised direct and recursive figures keyed by album path."""
+
+    def read_timeline(self, query: CollectionQuery) -> TimelineSummary:
+        """Return per-day buckets of *query* with first-row offsets."""
+
     def read_thumbnail_backfill_candidates(
         self,
         query: CollectionQuery,
@@ -162,6 +201,19 @@ class AssetRepositoryPort(Protocol):
     ) -> None:
         """Update thumbnail readiness for one row."""
 
+    def read_legacy_micro_thumbnails(
+        self,
+        after_rel: str | None = None,
+        limit: int = 256,
+    ) -> list[tuple[str, bytes]]:
+        """Return micro thumbnails still stored in the pre-raw format."""
+
+    def replace_micro_thumbnails(
+        self,
+        updates: Iterable[tuple[str, bytes, bytes | None]],
+    ) -> int:
+        """Swap micro thumbnails that have not changed since they were read."""
+
     def create_scan_job(
         self,
         *,
@@ -203,12 +255,37 @@ class AssetRepositoryPort(Protocol):
     ) -> dict[str, Any] | None:
         """Return the newest scan job matching *root* and optional *scope*."""
 
+    def resume_scan_job(self, job_id: str) -> set[str]:
+        """Reopen an interrupted scan job and return its committed directories."""
+
+    def record_scan_checkpoint(
+        self,
+        job_id: str,
+        rel_dirs: Iterable[str],
+        *,
+        found_count: int | None = None,
+        processed_count: int | None = None,
+    ) -> None:
+        """Record directories whose scan rows have all been committed."""
+
+    def scan_job_progress(self, job_id: str) -> ScanJobProgress | None:
+        """Return throughput and ETA figures for one scan job."""
+
     def find_row_by_path(self, query: CollectionQuery, path: Path) -> int | None:
         """Return a row index for *path* inside *query*."""
 
     def find_live_partner(self, asset_id: str) -> dict[str, Any] | None:
         """Return an asset's Live Photo partner row."""
 
+    def read_live_pair_candidates(
+        self,
+        album_path: str | None,
+        *,
+        content_ids: Iterable[str] = (),
+        sort_ts_windows: Iterable[tuple[int, int]] = (),
+    ) -> list[dict[str, Any]]:
+        """Return unpaired rows matching a content id or ``sort_ts`` window."""
+
     def apply_live_role_updates(
         self,
         updates: Iterable[tuple[str, int, str | None]],
@@ -222,6 +299,42 @@ class AssetRepositoryPort(Protocol):
     ) -> None:
         """Replace Live Photo role state only inside a library-relative prefix."""
 
+    def assign_live_roles(
+        self,
+        updates: Iterable[tuple[str, int, str | None]],
+    ) -> None:
+        """Set Live Photo role state for the listed rels without resetting others."""
+
+
+    def find_album_path_by_id(self, album_id: str) -> str | None:
+        """Return the registered library-relative path of manifest *album_id*."""
+
+    def read_album_registry(self) -> dict[str, tuple[str, int | None]]:
+        """Return ``album_path`` → ``(album_id, manifest_mtime_ns)`` registrations."""
+
+    def read_album_covers(self) -> dict[str, str | None]:
+        """Return ``album_path`` → album-relative manifest cover of registered albums."""
+
+    def update_album_registry(
+        self,
+        entries: Iterable[tuple[str, str, int | None, str | None]],
+        *,
+        removed_paths: Iterable[str] = (),
+    ) -> None:
+        """Record album id registrations and forget *removed_paths*."""
+
+    def read_trash_entries(self, rels: Iterable[str]) -> dict[str, TrashLedgerEntry]:
+        """Return Recently Deleted ledger entries recorded for *rels*."""
+
+    def read_trash_window(
+        self,
+        after: tuple[int, str] | None = None,
+        limit: int = 256,
+        *,
+        expired_before: int | None = None,
+    ) -> list[TrashLedgerEntry]:
+        """Return ledger entries after the ``(deleted_at, rel)`` key *after*."""
+
 
 class AlbumRepositoryPort(Protocol):
     """Read and write album manifests without exposing legacy shims upstream."""
@@ -248,6 +361,14 @@ class LibraryStateRepositoryPort(Protocol):
     def update_location(self, rel: str, location: str) -> None:
         """Persist a display location string."""
 
+    def update_asset_details(
+        self,
+        rel: str,
+        details: dict[str, Any],
+        extended_meta: str,
+    ) -> bool:
+        """Persist lazily extracted detail columns and extended metadata."""
+
     def update_asset_geodata(
         self,
         rel: str,
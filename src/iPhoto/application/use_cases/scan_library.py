@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import inspect
 import logging
 import time
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Collection, Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -33,6 +34,7 @@ class ScanLibraryRequest:
     scan_job_id: str | None = None
     scan_started_at_ms: int | None = None
     scan_stage_elapsed_ms: dict[str, float] | None = None
+    completed_dirs: Collection[str] = ()
 
 
 @dataclass(frozen=True)
@@ -62,23 +64,70 @@ class ScanLibraryUseCase:
         chunk_size = max(1, int(request.chunk_size))
         scan_started = _monotonic_ms()
         last_chunk_flush = scan_started
+        completed_dirs = frozenset(request.completed_dirs)
+        # Directories reported complete by the scanner whose rows are not yet
+        # known to be committed; they are checkpointed after the next flush.
+        pending_dirs: list[str] = []
+        progress = [0, 0]
+
+        def track_progress(processed: int, found: int) -> None:
+            progress[0], progress[1] = processed, found
+            if request.progress_callback is not None:
+                request.progress_callback(processed, found)
+
+        scan_kwargs: dict[str, Any] = {
+            "existing_index": request.existing_index,
+            "progress_callback": track_progress,
+        }
+        record_checkpoint = getattr(self._asset_repository, "record_scan_checkpoint", None)
+        checkpointing = (
+            request.persist_chunks
+            and bool(request.scan_job_id)
+            and callable(record_checkpoint)
+            and _accepts_keyword(self._scanner.scan, "directory_callback")
+        )
+        if checkpointing:
+            scan_kwargs["directory_callback"] = pending_dirs.append
+            if completed_dirs:
+                scan_kwargs["completed_dirs"] = completed_dirs
+
+        def flush(pending_chunk: list[dict[str, Any]], elapsed_ms: float) -> int:
+            ready_dirs = list(pending_dirs)
+            pending_dirs.clear()
+            failed = (
+                self._merge_chunk(pending_chunk, request, metadata_elapsed_ms=elapsed_ms)
+                if pending_chunk
+                else 0
+            )
+            if checkpointing and not failed:
+                record_checkpoint(
+                    request.scan_job_id,
+                    ready_dirs,
+                    found_count=progress[1],
+                    processed_count=progress[0],
+                )
+            return failed
 
         for scanned_row in self._scanner.scan(
             request.root,
             request.include,
             request.exclude,
-            existing_index=request.existing_index,
-            progress_callback=request.progress_callback,
+            **scan_kwargs,
         ):
             if request.is_cancelled is not None and request.is_cancelled():
                 break
 
             row = dict(scanned_row)
+            replayed = (
+                "completed_dirs" in scan_kwargs
+                and str(row.get("rel") or "").rpartition("/")[0] in completed_dirs
+            )
             if request.row_transform is not None:
                 row = request.row_transform(row)
 
             rows.append(row)
-            if request.persist_chunks:
+            # Rows replayed from checkpointed directories are already stored.
+            if request.persist_chunks and not replayed:
                 chunk_row = dict(row)
                 if request.scan_job_id:
                     chunk_row["scan_job_id"] = request.scan_job_id
@@ -91,24 +140,15 @@ class ScanLibraryUseCase:
                     last_flush_ms=last_chunk_flush,
                     now_ms=now,
                 ):
-                    failed_count += self._merge_chunk(
-                        chunk,
-                        request,
-                        metadata_elapsed_ms=round(now - scan_started, 3),
-                    )
+                    failed_count += flush(chunk, round(now - scan_started, 3))
                     chunk = []
                     last_chunk_flush = _monotonic_ms()
 
-        if (
-            request.persist_chunks
-            and chunk
-            and not (request.is_cancelled is not None and request.is_cancelled())
+        if request.persist_chunks and not (
+            request.is_cancelled is not None and request.is_cancelled()
         ):
-            failed_count += self._merge_chunk(
-                chunk,
-                request,
-                metadata_elapsed_ms=round(_monotonic_ms() - scan_started, 3),
-            )
+            if chunk or pending_dirs:
+                failed_count += flush(chunk, round(_monotonic_ms() - scan_started, 3))
 
         return ScanLibraryResult(
             rows=rows,
@@ -189,6 +229,17 @@ def _monotonic_ms() -> float:
     return time.perf_counter() * 1000
 
 
+def _accepts_keyword(func: Callable[..., Any], name: str) -> bool:
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(
+        parameter.name == name or parameter.kind is inspect.Parameter.VAR_KEYWORD
+        for parameter in parameters
+    )
+
+
 def _should_flush_chunk(
     chunk: list[dict[str, Any]],
     *,
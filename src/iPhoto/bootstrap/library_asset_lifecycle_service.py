@@ -15,8 +15,13 @@ from ..application.ports import AssetRepositoryPort
 from ..cache.index_store import get_global_repository
 from ..cache.lock import FileLock
 from ..config import ALBUM_MANIFEST_NAMES, RECENTLY_DELETED_DIR_NAME
+from ..domain.models.query import ThumbnailState
 from ..errors import IPhotoError
-from ..index_sync_service import prune_index_scope
+from ..index_sync_service import prune_index_scope, sync_album_registry
+from ..infrastructure.services.thumbnail_cache_keys import (
+    thumbnail_cache_file_for_key,
+    thumbnail_cache_key,
+)
 from ..io.scanner_adapter import ensure_scan_thumbnail, process_media_paths
 from ..media_classifier import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 from ..schemas import validate_album
@@ -27,6 +32,10 @@ from .library_scan_service import LibraryScanService
 
 LOGGER = get_logger()
 
+# Trash ledger entries checked per delete, and per window of a full cleanup.
+_TRASH_PRUNE_BATCH = 64
+_TRASH_WINDOW_SIZE = 512
+
 
 @dataclass(frozen=True)
 class AssetLifecycleResult:
@@ -57,6 +66,11 @@ class LibraryAssetLifecycleService:
         self._repository_factory = repository_factory or get_global_repository
         self._media_processor = media_processor or process_media_paths
         self._album_root_cache: dict[str, Path | None] = {}
+        # ``(deleted_at, rel)`` key where the next trash prune window starts.
+        # Kept in memory only: a new session starts again from the oldest
+        # entries, which is harmless because ``cleanup_deleted_index`` walks
+        # the whole ledger whenever Recently Deleted is opened.
+        self._trash_prune_cursor: tuple[int, str] | None = None
 
     def apply_move(
         self,
@@ -77,19 +91,35 @@ class LibraryAssetLifecycleService:
         source_index_ok = True
         destination_index_ok = True
         cached_source_rows: dict[str, dict[str, Any]] = {}
+        unindexed_pairs = moved_pairs
 
-        try:
-            cached_source_rows = self._remove_source_rows(
-                moved_pairs,
-                source_root=Path(source_root),
-            )
-        except (IPhotoError, sqlite3.Error, OSError) as exc:
-            source_index_ok = False
-            errors.append(str(exc))
+        if self._can_rekey_in_place():
+            try:
+                unindexed_pairs = self._rekey_moved_rows(
+                    moved_pairs,
+                    source_root=Path(source_root),
+                    destination_root=Path(destination_root),
+                    trash_root=Path(trash_root) if trash_root is not None else None,
+                    is_restore=is_restore,
+                )
+            except (IPhotoError, sqlite3.Error, OSError) as exc:
+                source_index_ok = False
+                destination_index_ok = False
+                errors.append(str(exc))
+                unindexed_pairs = []
+        else:
+            try:
+                cached_source_rows = self._remove_source_rows(
+                    moved_pairs,
+                    source_root=Path(source_root),
+                )
+            except (IPhotoError, sqlite3.Error, OSError) as exc:
+                source_index_ok = False
+                errors.append(str(exc))
 
         try:
             self._append_destination_rows(
-                moved_pairs,
+                unindexed_pairs,
                 destination_root=Path(destination_root),
                 trash_root=Path(trash_root) if trash_root is not None else None,
                 is_restore=is_restore,
@@ -110,13 +140,31 @@ class LibraryAssetLifecycleService:
             errors=errors,
         )
 
-    def read_restore_index_rows(self, trash_root: Path) -> list[dict[str, Any]]:
-        """Read indexed rows for Recently Deleted without exposing the repository."""
+    def read_restore_index_rows(
+        self,
+        trash_root: Path,
+        paths: Iterable[Path] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read indexed rows for Recently Deleted without exposing the repository.
+
+        With *paths* only the rows of those trashed files are read, so a
+        restore costs one keyed lookup per item instead of a trash scan.
+        """
 
         root = self._repository_root_for_read(Path(trash_root))
         repository = self._repository(root)
         album_path = self._album_path(Path(trash_root))
-        if album_path:
+        if album_path and paths is not None:
+            rels = [
+                rel
+                for rel in (
+                    self._relative_for_index(Path(path), base=Path(trash_root))
+                    for path in paths
+                )
+                if rel is not None
+            ]
+            rows = repository.get_rows_by_rels(rels).values() if rels else ()
+        elif album_path:
             rows = repository.read_album_assets(
                 album_path,
                 include_subalbums=True,
@@ -143,6 +191,30 @@ class LibraryAssetLifecycleService:
             if isinstance(row, dict)
         }
 
+    def album_root_for_id(self, album_id: str) -> Path | None:
+        """Return the registered root of the album whose manifest id is *album_id*."""
+
+        if self.library_root is None or not album_id:
+            return None
+        album_path = self._repository(self.library_root).find_album_path_by_id(album_id)
+        if album_path is None:
+            return None
+        return self.library_root / album_path if album_path else self.library_root
+
+    def register_album_roots(self, album_roots: Iterable[Path]) -> None:
+        """Record the manifest ids of *album_roots* in the album registry."""
+
+        if self.library_root is None:
+            return
+        try:
+            sync_album_registry(
+                self.library_root,
+                album_roots,
+                repository=self._repository(self.library_root),
+            )
+        except Exception as exc:  # pragma: no cover - registry is a derived lookup
+            LOGGER.warning("Failed to register album ids: %s", exc)
+
     def preserve_trash_metadata(
         self,
         trash_root: Path,
@@ -157,14 +229,17 @@ class LibraryAssetLifecycleService:
             "original_album_subpath",
         )
         try:
-            preserved_rows = {
-                str(row["rel"]): row
-                for row in self.read_restore_index_rows(trash_root)
-                if row.get("rel") is not None
-                and any(row.get(field) is not None for field in preserved_fields)
-            }
+            preserved_rows = self._read_preserved_trash_rows(
+                Path(trash_root),
+                materialized,
+            )
         except (IPhotoError, sqlite3.Error):
             return materialized
+        preserved_rows = {
+            rel: row
+            for rel, row in preserved_rows.items()
+            if any(row.get(field) is not None for field in preserved_fields)
+        }
 
         if not preserved_rows:
             return materialized
@@ -182,30 +257,35 @@ class LibraryAssetLifecycleService:
         return materialized
 
     def cleanup_deleted_index(self, trash_root: Path) -> int:
-        """Drop stale Recently Deleted rows for this library session."""
+        """Drop stale Recently Deleted rows for this library session.
+
+        Library sessions walk the trash ledger in windows of
+        ``_TRASH_WINDOW_SIZE`` entries and prune each window as it goes, so
+        memory stays bounded however large the trash grows.
+        """
 
         try:
             root = self._repository_root_for_read(Path(trash_root))
             repository = self._repository(root)
             album_path = self._album_path(Path(trash_root))
-            if album_path:
-                rows = repository.read_album_assets(
-                    album_path,
-                    include_subalbums=True,
-                    filter_hidden=False,
-                )
-                process_root = root
-            elif self.library_root is None:
-                rows = repository.read_all(filter_hidden=False)
-                process_root = Path(trash_root)
-            else:
-                return 0
 
             try:
                 has_files = next(Path(trash_root).iterdir(), None) is not None
             except OSError:
                 has_files = False
 
+            if album_path:
+                return self._prune_trash_windows(
+                    repository,
+                    root,
+                    album_path,
+                    check_files=has_files,
+                )
+            if self.library_root is not None:
+                return 0
+            rows = repository.read_all(filter_hidden=False)
+            process_root = Path(trash_root)
+
             missing_rels = [
                 row_rel
                 for row_rel in (row.get("rel") for row in rows)
@@ -318,6 +398,108 @@ class LibraryAssetLifecycleService:
             repository.remove_rows(rels)
         return cached_source_rows
 
+    def _can_rekey_in_place(self) -> bool:
+        # Sessionless moves read and write separate per-album indexes, so
+        # only a library session can re-key rows inside one database.
+        if self.library_root is None:
+            return False
+        return callable(getattr(self._repository(self.library_root), "move_rows", None))
+
+    def _rekey_moved_rows(
+        self,
+        moved: list[tuple[Path, Path]],
+        *,
+        source_root: Path,
+        destination_root: Path,
+        trash_root: Path | None,
+        is_restore: bool,
+    ) -> list[tuple[Path, Path]]:
+        """Re-key indexed rows of *moved* in place and return the unindexed pairs.
+
+        Rows keep their metadata and micro thumbnail; the 512px cache file
+        is renamed to the destination's cache key instead of being decoded
+        again.  Only rows without a usable cached thumbnail regenerate it.
+        """
+
+        process_root = self._process_root(destination_root)
+        repository = self._repository(process_root)
+        is_trash_destination = self._paths_equal(destination_root, trash_root)
+
+        old_rels: dict[str, str] = {}
+        for original, _target in moved:
+            rel = self._relative_for_index(original, base=source_root)
+            if rel is not None:
+                old_rels[str(original)] = rel
+        source_rows = repository.get_rows_by_rels(old_rels.values()) if old_rels else {}
+
+        unindexed: list[tuple[Path, Path]] = []
+        rows: list[dict[str, Any]] = []
+        old_rel_by_target: dict[str, str] = {}
+        for original, target in moved:
+            old_rel = old_rels.get(str(original))
+            cached = source_rows.get(old_rel) if old_rel is not None else None
+            if not isinstance(cached, dict):
+                unindexed.append((original, target))
+                continue
+            row = dict(cached)
+            row["rel"] = self._target_rel(target, process_root)
+            old_rel_by_target[row["rel"]] = old_rel
+            self._rekey_row_thumbnail(row, target, process_root)
+            rows.append(row)
+
+        if is_trash_destination and not is_restore:
+            rows = self._annotate_trash_rows(rows, moved, process_root)
+        moves = [
+            {
+                "old_rel": old_rel_by_target[row["rel"]],
+                **self._normalise_destination_row(
+                    row,
+                    is_trash_destination=is_trash_destination,
+                    is_restore=is_restore,
+                ),
+            }
+            for row in rows
+        ]
+        if moves:
+            repository.move_rows(moves)
+        return unindexed
+
+    def _rekey_row_thumbnail(self, row: dict[str, Any], target: Path, process_root: Path) -> None:
+        cache_dir = self._thumbnail_cache_dir(process_root)
+        old_key = str(row.get("thumb_cache_key") or "").strip()
+        if row.get("thumbnail_state") == ThumbnailState.READY.value and old_key:
+            new_key = thumbnail_cache_key(target)
+            if new_key == old_key:
+                return
+            try:
+                os.replace(
+                    thumbnail_cache_file_for_key(cache_dir, old_key),
+                    thumbnail_cache_file_for_key(cache_dir, new_key),
+                )
+            except OSError:
+                LOGGER.debug("Thumbnail cache for %s not re-keyed", target, exc_info=True)
+            else:
+                row["thumb_cache_key"] = new_key
+                return
+        self._refresh_row_thumbnail(row, target, process_root)
+
+    def _refresh_row_thumbnail(self, row: dict[str, Any], target: Path, process_root: Path) -> None:
+        thumbnail = ensure_scan_thumbnail(
+            target,
+            str(row.get("id") or target),
+            thumbnail_cache_dir=self._thumbnail_cache_dir(process_root),
+            refresh_cache=True,
+        )
+        row["thumbnail_state"] = thumbnail.state.value
+        row.pop("thumb_error", None)
+        if thumbnail.micro_thumbnail is not None:
+            row["micro_thumbnail"] = thumbnail.micro_thumbnail
+        if thumbnail.thumb_cache_key:
+            row["thumb_cache_key"] = thumbnail.thumb_cache_key
+        if thumbnail.thumb_error:
+            row["thumb_error"] = thumbnail.thumb_error
+            row.pop("thumb_cache_key", None)
+
     def _append_destination_rows(
         self,
         moved: list[tuple[Path, Path]],
@@ -345,21 +527,7 @@ class LibraryAssetLifecycleService:
                 row = dict(cached)
                 row["rel"] = self._target_rel(target, process_root)
                 row["parent_album_path"] = self._parent_album_path(row["rel"])
-                thumbnail = ensure_scan_thumbnail(
-                    target,
-                    str(row.get("id") or target),
-                    thumbnail_cache_dir=self._thumbnail_cache_dir(process_root),
-                    refresh_cache=True,
-                )
-                row["thumbnail_state"] = thumbnail.state.value
-                row.pop("thumb_error", None)
-                if thumbnail.micro_thumbnail is not None:
-                    row["micro_thumbnail"] = thumbnail.micro_thumbnail
-                if thumbnail.thumb_cache_key:
-                    row["thumb_cache_key"] = thumbnail.thumb_cache_key
-                if thumbnail.thumb_error:
-                    row["thumb_error"] = thumbnail.thumb_error
-                    row.pop("thumb_cache_key", None)
+                self._refresh_row_thumbnail(row, target, process_root)
                 reused_rows.append(row)
                 continue
 
@@ -438,25 +606,83 @@ class LibraryAssetLifecycleService:
         repository: AssetRepositoryPort,
         process_root: Path,
     ) -> None:
+        """Prune the next window of the trash ledger before adding trashed rows.
+
+        Each delete checks at most ``_TRASH_PRUNE_BATCH`` entries and resumes
+        after the last one on the next call, wrapping around at the end, so
+        deleting one item costs the same whatever the size of the trash.
+        The cursor lives for this service instance only; see ``__init__``.
+        """
+
         try:
-            existing_trash_rows = list(
-                repository.read_album_assets(
-                    RECENTLY_DELETED_DIR_NAME,
-                    include_subalbums=True,
-                    filter_hidden=False,
-                )
+            entries = repository.read_trash_window(
+                self._trash_prune_cursor,
+                _TRASH_PRUNE_BATCH,
+            )
+            self._trash_prune_cursor = (
+                (entries[-1].deleted_at, entries[-1].rel)
+                if len(entries) >= _TRASH_PRUNE_BATCH
+                else None
             )
             missing_rels = [
-                row_rel
-                for row_rel in (row.get("rel") for row in existing_trash_rows)
-                if isinstance(row_rel, str)
-                and not (process_root / row_rel).exists()
+                entry.rel for entry in entries if not (process_root / entry.rel).exists()
             ]
             if missing_rels:
                 repository.remove_rows(missing_rels)
         except (IPhotoError, sqlite3.Error, OSError) as exc:
             LOGGER.debug("Trash cleanup during move skipped: %s", exc)
 
+    def _prune_trash_windows(
+        self,
+        repository: AssetRepositoryPort,
+        process_root: Path,
+        album_path: str,
+        *,
+        check_files: bool,
+    ) -> int:
+        prefix = f"{album_path}/"
+        removed = 0
+        after: tuple[int, str] | None = None
+        while True:
+            entries = repository.read_trash_window(after, _TRASH_WINDOW_SIZE)
+            if not entries:
+                break
+            after = (entries[-1].deleted_at, entries[-1].rel)
+            missing_rels = [
+                entry.rel
+                for entry in entries
+                if entry.rel.startswith(prefix)
+                and (not check_files or not (process_root / entry.rel).exists())
+            ]
+            if missing_rels:
+                repository.remove_rows(missing_rels)
+                removed += len(missing_rels)
+            if len(entries) < _TRASH_WINDOW_SIZE:
+                break
+        return removed
+
+    def _read_preserved_trash_rows(
+        self,
+        trash_root: Path,
+        rows: list[dict[str, Any]],
+    ) -> dict[str, dict[str, Any]]:
+        rels = [str(row["rel"]) for row in rows if row.get("rel") is not None]
+        repository = self._repository(self._repository_root_for_read(trash_root))
+        if self._album_path(trash_root):
+            return {
+                rel: {
+                    "original_rel_path": entry.original_rel_path,
+                    "original_album_id": entry.original_album_id,
+                    "original_album_subpath": entry.original_album_subpath,
+                }
+                for rel, entry in repository.read_trash_entries(rels).items()
+            }
+        return {
+            str(row["rel"]): row
+            for row in self.read_restore_index_rows(trash_root)
+            if row.get("rel") is not None
+        }
+
     def _annotate_trash_rows(
         self,
         rows: list[dict[str, Any]],
@@ -475,6 +701,7 @@ class LibraryAssetLifecycleService:
         annotated_rows: list[dict[str, Any]] = []
         library_root_key = self._normalised_string(self.library_root)
         album_uuid_cache: dict[str, str | None] = {}
+        album_roots: list[Path] = []
         for row in rows:
             rel_value = row.get("rel")
             if not isinstance(rel_value, str):
@@ -498,6 +725,7 @@ class LibraryAssetLifecycleService:
                 if album_key is not None:
                     if album_key not in album_uuid_cache:
                         album_uuid_cache[album_key] = self._read_album_uuid(album_root)
+                        album_roots.append(album_root)
                     original_album_id = album_uuid_cache.get(album_key)
 
                 relative_to_album = self._relative_to(original_path, album_root)
@@ -510,6 +738,9 @@ class LibraryAssetLifecycleService:
             enriched["original_album_id"] = original_album_id
             enriched["original_album_subpath"] = original_album_subpath
             annotated_rows.append(enriched)
+        # Restores resolve ``original_album_id`` through the registry.
+        if album_roots:
+            self.register_album_roots(album_roots)
         return annotated_rows
 
     def _pair_after_move(self, source_root: Path) -> None:
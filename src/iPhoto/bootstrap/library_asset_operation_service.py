@@ -288,7 +288,7 @@ class LibraryAssetOperationService:
             metadata_lookup=metadata_lookup,
         )
 
-        row_lookup = self._read_restore_row_lookup(normalized_trash_root)
+        row_lookup = self._read_restore_row_lookup(normalized_trash_root, normalized)
         fallback_rows = self._read_fallback_restore_rows(
             normalized,
             trash_root=normalized_trash_root,
@@ -530,9 +530,13 @@ class LibraryAssetOperationService:
                 return self._normalize_path(motion_path)
         return None
 
-    def _read_restore_row_lookup(self, trash_root: Path) -> dict[str, dict[str, Any]]:
+    def _read_restore_row_lookup(
+        self,
+        trash_root: Path,
+        paths: list[Path],
+    ) -> dict[str, dict[str, Any]]:
         row_lookup: dict[str, dict[str, Any]] = {}
-        for row in self.lifecycle_service.read_restore_index_rows(trash_root):
+        for row in self.lifecycle_service.read_restore_index_rows(trash_root, paths):
             if not isinstance(row, dict):
                 continue
             rel_value = row.get("rel")
@@ -703,6 +707,18 @@ class LibraryAssetOperationService:
         if self.library_root is None:
             return None
 
+        # The album registry answers with one indexed lookup; the tree walk
+        # below only runs for albums it does not know yet or has stale.
+        album_root_for_id = getattr(self.lifecycle_service, "album_root_for_id", None)
+        if callable(album_root_for_id):
+            registered_root = album_root_for_id(album_id)
+            if registered_root is not None and self._album_root_matches_uuid(
+                registered_root,
+                album_id,
+            ):
+                self._album_uuid_cache[album_id] = registered_root
+                return registered_root
+
         for manifest_name in ALBUM_MANIFEST_NAMES:
             for manifest_path in self.library_root.rglob(manifest_name):
                 try:
@@ -720,6 +736,13 @@ class LibraryAssetOperationService:
                 else:
                     album_root = manifest_path.parent
                 self._album_uuid_cache[album_id] = album_root
+                register_album_roots = getattr(
+                    self.lifecycle_service,
+                    "register_album_roots",
+                    None,
+                )
+                if callable(register_album_roots):
+                    register_album_roots([album_root])
                 return album_root
 
         return None
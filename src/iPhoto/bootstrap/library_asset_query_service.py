@@ -16,20 +16,37 @@ from ..cache.index_store import get_global_repository
 from ..config import RECENTLY_DELETED_DIR_NAME
 from ..domain.models.core import MediaType
 from ..domain.models.query import (
+    AlbumDashboardEntry,
+    AlbumStats,
     AssetQuery,
     CollectionQuery,
     CollectionType,
+    GeoFeedDelta,
     PageCursor,
     PageResult,
     SortDirection,
     SortOrder,
+    ThumbnailState,
+    TimelineSummary,
     WindowResult,
 )
 from ..domain.models.scan import ScanBatchCommitted
+from ..index_sync_service import sync_album_registry
+from ..infrastructure.services.thumbnail_cache_keys import thumbnail_cache_file_for_key
+from ..io.extended_metadata import (
+    DETAIL_FIELDS,
+    decode_extended_metadata,
+    encode_extended_metadata,
+)
 from ..io.scanner_adapter import ensure_scan_thumbnail
 from ..path_normalizer import compute_album_path
+from ..utils.deps import load_pillow
+from ..utils.micro_thumbnail import convert_legacy_micro_thumbnail
 from ..utils.pathutils import ensure_work_dir
 
+# Rows re-encoded per transaction by the micro thumbnail format migration.
+_MICRO_MIGRATION_BATCH_SIZE = 256
+
 
 class _CallbackSignal:
     """Small thread-safe callback signal for non-Qt application services."""
@@ -89,6 +106,7 @@ class LibraryAssetQueryService:
         self._thumbnail_backfill_lock = threading.Lock()
         self._thumbnail_backfill_pending: set[tuple[str, int, int, str]] = set()
         self._thumbnail_backfill_shutdown = False
+        self._micro_migration_requested = False
         self.thumbnail_backfill_completed = _CallbackSignal()
         self.thumbnail_backfill_progress = _CallbackSignal()
 
@@ -364,6 +382,41 @@ class LibraryAssetQueryService:
 
         return self._repository().read_collection_window(query, first, limit)
 
+    def search_assets(
+        self,
+        text: str,
+        *,
+        root: Path | None = None,
+        first: int = 0,
+        limit: int = 50,
+    ) -> WindowResult:
+        """Return a relevance-ranked page of assets matching *text*.
+
+        *text* accepts the syntax of ``parse_search_query`` (words, quoted
+        phrases, ``location:``/``camera:``/``lens:``/``album:``/``person:``
+        fields and ``-exclusions``).  When *root* is given the search is
+        scoped to that album and its sub-albums and rows are returned
+        relative to it.
+        """
+
+        album_path = self.album_path_for(root) if root is not None else None
+        query = CollectionQuery(
+            collection_type=CollectionType.SEARCH,
+            album_path=album_path,
+            search_text=text,
+            min_thumbnail_state=None,
+        )
+        search = getattr(self._repository(), "search_assets", None)
+        if not callable(search):
+            return WindowResult(first=first, rows=[], total_count=0, collection_revision=0)
+        window = search(query, first, limit)
+        return WindowResult(
+            first=window.first,
+            rows=list(self._scoped_rows(window.rows, album_path)),
+            total_count=window.total_count,
+            collection_revision=window.collection_revision,
+        )
+
     def read_thumbnail_backfill_candidates(
         self,
         root: Path,
@@ -414,6 +467,7 @@ class LibraryAssetQueryService:
         if self._thumbnail_backfill_shutdown or not self._can_use_collection_api(query):
             return 0
 
+        self.request_micro_thumbnail_migration()
         request_key = (root.as_posix(), max(0, int(first)), max(0, int(limit)), repr(query))
         with self._thumbnail_backfill_lock:
             if request_key in self._thumbnail_backfill_pending:
@@ -430,6 +484,63 @@ class LibraryAssetQueryService:
         )
         return 1
 
+    def request_micro_thumbnail_migration(self) -> bool:
+        """Queue the one-off re-encoding of JPEG micro thumbnails as raw pixels.
+
+        The migration runs once per session on the low-priority backfill
+        worker, one batch per task, so gallery backfill requests queued in
+        the meantime are not held up behind it.
+        """
+
+        repository = self._repository()
+        if not callable(getattr(repository, "read_legacy_micro_thumbnails", None)):
+            return False
+        if not callable(getattr(repository, "replace_micro_thumbnails", None)):
+            return False
+        with self._thumbnail_backfill_lock:
+            if self._micro_migration_requested or self._thumbnail_backfill_shutdown:
+                return False
+            self._micro_migration_requested = True
+        self._thumbnail_backfill_executor.submit(self._run_micro_migration_step, None)
+        return True
+
+    def migrate_micro_thumbnails(self) -> int:
+        """Re-encode every legacy micro thumbnail now; return the rows converted."""
+
+        converted = 0
+        after_rel: str | None = None
+        while True:
+            count, after_rel = self._migrate_micro_thumbnail_batch(after_rel)
+            converted += count
+            if after_rel is None:
+                return converted
+
+    def _run_micro_migration_step(self, after_rel: str | None) -> None:
+        _count, next_rel = self._migrate_micro_thumbnail_batch(after_rel)
+        with self._thumbnail_backfill_lock:
+            if next_rel is None or self._thumbnail_backfill_shutdown:
+                return
+        self._thumbnail_backfill_executor.submit(self._run_micro_migration_step, next_rel)
+
+    def _migrate_micro_thumbnail_batch(self, after_rel: str | None) -> tuple[int, str | None]:
+        """Convert one batch after *after_rel*; return the count and the next cursor."""
+
+        repository = self._repository()
+        read_legacy = getattr(repository, "read_legacy_micro_thumbnails", None)
+        replace = getattr(repository, "replace_micro_thumbnails", None)
+        if not callable(read_legacy) or not callable(replace) or self._thumbnail_backfill_shutdown:
+            return 0, None
+        # Without Pillow every blob would look undecodable and be cleared.
+        if load_pillow() is None:
+            return 0, None
+        batch = read_legacy(after_rel, _MICRO_MIGRATION_BATCH_SIZE)
+        if not batch:
+            return 0, None
+        converted = replace(
+            [(rel, blob, convert_legacy_micro_thumbnail(blob)) for rel, blob in batch]
+        )
+        return converted, batch[-1][0]
+
     def thumbnail_backfill_pending(self) -> bool:
         """Return whether any queued stale thumbnail backfill is still active."""
 
@@ -574,6 +685,118 @@ class LibraryAssetQueryService:
             if isinstance(row, dict):
                 yield dict(row)
 
+    def geo_revision(self) -> int | None:
+        """Return the geotagged change revision, or None when untracked."""
+
+        geo_revision = getattr(self._repository(), "geo_revision", None)
+        if not callable(geo_revision):
+            return None
+        return int(geo_revision())
+
+    def read_geotagged_changes(self, since_revision: int) -> GeoFeedDelta | None:
+        """Return geotagged rows changed after *since_revision*, if supported."""
+
+        read_changes = getattr(self._repository(), "read_geotagged_changes", None)
+        if not callable(read_changes):
+            return None
+        return read_changes(int(since_revision))
+
+    def read_album_stats(self) -> dict[str, AlbumStats] | None:
+        """Return materialised per-album figures, or None when unsupported."""
+
+        read_album_stats = getattr(self._repository(), "read_album_stats", None)
+        if not callable(read_album_stats):
+            return None
+        return read_album_stats()
+
+    def read_album_dashboard_feed(
+        self,
+        album_roots: Iterable[Path],
+    ) -> dict[Path, AlbumDashboardEntry] | None:
+        """Return the dashboard card of every root in *album_roots*.
+
+        Counts and newest-asset covers come from one ``album_stats`` read and
+        manifest covers from the album registry, which only re-reads
+        manifests whose modification time changed.  Cover thumbnail keys are
+        fetched with one batched row lookup.  Returns None when the
+        repository has no materialised album stats.
+        """
+
+        repository = self._repository()
+        read_album_stats = getattr(repository, "read_album_stats", None)
+        if not callable(read_album_stats):
+            return None
+        roots = [Path(root) for root in album_roots]
+        manifest_covers: dict[str, str | None] = {}
+        read_album_covers = getattr(repository, "read_album_covers", None)
+        if callable(read_album_covers):
+            sync_album_registry(self.library_root, roots, repository=repository)
+            manifest_covers = read_album_covers()
+        stats = read_album_stats()
+
+        candidates: dict[Path, tuple[str, list[str]]] = {}
+        for root in roots:
+            album_path = self.album_path_for(root) or ""
+            cover_rels: list[str] = []
+            manifest_cover = manifest_covers.get(album_path)
+            if manifest_cover:
+                cover_rels.append((Path(album_path) / manifest_cover).as_posix())
+            figures = stats.get(album_path)
+            if figures is not None and figures.recursive.cover_rel:
+                cover_rels.append(figures.recursive.cover_rel)
+            candidates[root] = (album_path, cover_rels)
+        rows = repository.get_rows_by_rels(
+            {rel for _album_path, cover_rels in candidates.values() for rel in cover_rels}
+        )
+
+        feed: dict[Path, AlbumDashboardEntry] = {}
+        for root, (album_path, cover_rels) in candidates.items():
+            cover_rel = next(
+                (
+                    rel
+                    for rel in cover_rels
+                    if rel in rows or (self.library_root / rel).exists()
+                ),
+                None,
+            )
+            row = rows.get(cover_rel) if cover_rel is not None else None
+            thumb_key = None
+            if row is not None and row.get("thumbnail_state") == ThumbnailState.READY.value:
+                thumb_key = str(row.get("thumb_cache_key") or "").strip() or None
+            figures = stats.get(album_path)
+            feed[root] = AlbumDashboardEntry(
+                album_path=album_path,
+                asset_count=figures.recursive.asset_count if figures is not None else 0,
+                cover_rel=cover_rel,
+                cover_thumb_key=thumb_key,
+                registered=album_path in manifest_covers,
+            )
+        return feed
+
+    def thumbnail_cache_file(self, cache_key: str) -> Path:
+        """Return the disk-cache file of a ready thumbnail's *cache_key*."""
+
+        return thumbnail_cache_file_for_key(self._thumbnail_cache_dir(), cache_key)
+
+    def read_timeline(
+        self,
+        query: CollectionQuery | AssetQuery,
+    ) -> TimelineSummary | None:
+        """Return the year/month/day timeline of *query*, or None when unsupported.
+
+        Bucket offsets index the same rows as the gallery windows served for
+        *query*, so they can drive a date scrubber directly.
+        """
+
+        if isinstance(query, AssetQuery):
+            if not self._can_use_collection_api(query):
+                return None
+            query = self._collection_query_for_asset_query(query)
+        read_timeline = getattr(self._repository(), "read_timeline", None)
+        if not callable(read_timeline):
+            return None
+        return read_timeline(query)
+
     def favorite_status_for_path(self, path: Path) -> bool | None:
         """Return favorite state for *path*, or None when no indexed row exists."""
 
@@ -583,6 +806,44 @@ class LibraryAssetQueryService:
             return None
         return bool(row.get("is_favorite"))
 
+    def read_asset_details(self, path: Path) -> dict[str, Any] | None:
+        """Return info-panel metadata for *path* from the index.
+
+        Returns None when the row has no current extended-metadata payload,
+        i.e. it was indexed before the payload existed and still needs one
+        extraction.
+        """
+
+        rel = self._library_relative_path(path)
+        row = self._repository().get_rows_by_rels([rel]).get(rel)
+        if row is None:
+            return None
+        extended = decode_extended_metadata(row.get("extended_meta"))
+        if extended is None:
+            return None
+        details = {key: row.get(key) for key in DETAIL_FIELDS if row.get(key) is not None}
+        details.update(extended)
+        return details
+
+    def store_asset_details(
+        self,
+        path: Path,
+        details: dict[str, Any],
+        extended: dict[str, Any],
+    ) -> bool:
+        """Persist metadata extracted after the scan so later reads stay in the index."""
+
+        update_asset_details = getattr(self._repository(), "update_asset_details", None)
+        if not callable(update_asset_details):
+            return False
+        return bool(
+            update_asset_details(
+                self._library_relative_path(path),
+                details,
+                encode_extended_metadata(extended),
+            )
+        )
+
     def location_cache_writer(self, root: Path) -> _ScopedLocationCacheWriter:
         """Return an object compatible with legacy asset-entry location writes."""
 
@@ -614,7 +875,10 @@ class LibraryAssetQueryService:
 
     def _filtered_query_rows(self, query: AssetQuery) -> Iterator[dict[str, Any]]:
         repository = self._repository()
-        if query.asset_ids:
+        if query.person_ids:
+            member_ids = repository.get_asset_ids_for_persons(query.person_ids)
+            rows = repository.get_rows_by_ids(member_ids).values()
+        elif query.asset_ids:
             get_rows_by_ids = getattr(repository, "get_rows_by_ids", None)
             if callable(get_rows_by_ids):
                 rows = get_rows_by_ids(query.asset_ids).values()
@@ -759,7 +1023,7 @@ class LibraryAssetQueryService:
         return params or None
 
     def _requires_in_memory_query(self, query: AssetQuery) -> bool:
-        if query.asset_ids or query.album_id:
+        if query.asset_ids or query.person_ids or query.album_id:
             return True
         if query.has_gps is not None:
             return True
@@ -804,7 +1068,9 @@ class LibraryAssetQueryService:
             media_types = (0, 1)
 
         collection_type = CollectionType.ALL_PHOTOS
-        if query.album_path:
+        if query.person_ids:
+            collection_type = CollectionType.PEOPLE
+        elif query.album_path:
             collection_type = CollectionType.ALBUM
         elif query.is_favorite is True:
             collection_type = CollectionType.FAVORITES
@@ -828,6 +1094,7 @@ class LibraryAssetQueryService:
             has_gps=query.has_gps,
             date_from=query.date_from,
             date_to=query.date_to,
+            person_ids=tuple(query.person_ids),
             sort_key="sort_ts",
             sort_direction=SortDirection.DESC,
             min_thumbnail_state=min_thumbnail_state,
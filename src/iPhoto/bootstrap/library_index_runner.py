@@ -0,0 +1,255 @@
+"""Headless batch indexing for unattended library maintenance."""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ..people.status import FACE_STATUS_PENDING, FACE_STATUS_RETRY
+from ..utils.logging import get_logger
+from .library_scan_service import LibraryScanService
+from .library_session import LibrarySession
+
+LOGGER = get_logger()
+# Coordinates resolved per reverse geocoder query during the geocode stage.
+_GEOCODE_BATCH_SIZE = 512
+
+
+@dataclass
+class IndexStageReport:
+    """Wall time and throughput of one headless index stage."""
+
+    name: str
+    wall_s: float = 0.0
+    items: int = 0
+    skipped: str | None = None
+
+    @property
+    def items_per_sec(self) -> float | None:
+        if self.wall_s <= 0 or not self.items:
+            return None
+        return round(self.items / self.wall_s, 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        payload: dict[str, Any] = {
+            "wall_s": round(self.wall_s, 3),
+            "items": self.items,
+            "items_per_sec": self.items_per_sec,
+        }
+        if self.skipped is not None:
+            payload["skipped"] = self.skipped
+        return payload
+
+
+@dataclass
+class LibraryIndexReport:
+    """Machine-readable summary of one ``iphoto index`` run."""
+
+    library_root: Path
+    workers: int
+    stages: list[IndexStageReport] = field(default_factory=list)
+    scan_job_id: str | None = None
+    interrupted: bool = False
+    peak_rss_bytes: int | None = None
+    peak_worker_rss_bytes: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "library_root": self.library_root.as_posix(),
+            "workers": self.workers,
+            "scan_job_id": self.scan_job_id,
+            "interrupted": self.interrupted,
+            "stages": {stage.name: stage.as_dict() for stage in self.stages},
+            "wall_s": round(sum(stage.wall_s for stage in self.stages), 3),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "peak_worker_rss_bytes": self.peak_worker_rss_bytes,
+        }
+
+
+class LibraryIndexRunner:
+    """Run scan, finalize, geocode and optional face stages without a GUI.
+
+    Metadata and thumbnail extraction fan out over a process pool; the other
+    stages are database bound and stay in the calling process. ``cancel`` may
+    be called from a signal handler: the running stage stops at its next
+    checkpoint and later stages are skipped, leaving the scan job resumable.
+    """
+
+    def __init__(
+        self,
+        session: LibrarySession,
+        *,
+        workers: int = 1,
+        detect_faces: bool = False,
+        resume: bool = False,
+        scan_service_factory: Callable[[Path, int], LibraryScanService] | None = None,
+    ) -> None:
+        self._session = session
+        self._library_root = Path(session.library_root)
+        self._workers = max(1, int(workers))
+        self._detect_faces = detect_faces
+        self._resume = resume
+        self._scan_service_factory = scan_service_factory or (
+            lambda root, workers: LibraryScanService(root, scan_workers=workers)
+        )
+        self._cancelled = False
+        self._face_worker = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+    def cancel(self) -> None:
+        self._cancelled = True
+        face_worker = self._face_worker
+        if face_worker is not None:
+            face_worker.cancel()
+
+    def run(self) -> LibraryIndexReport:
+        report = LibraryIndexReport(self._library_root, self._workers)
+        scan_service = self._scan_service_factory(self._library_root, self._workers)
+        scan_result = None
+
+        def scan(stage: IndexStageReport) -> int:
+            nonlocal scan_result
+            scan_result = scan_service.scan_album(
+                self._library_root,
+                persist_chunks=True,
+                resume=self._resume,
+                is_cancelled=lambda: self._cancelled,
+            )
+            report.scan_job_id = scan_result.scan_job_id
+            return len(scan_result.rows)
+
+        def finalize(stage: IndexStageReport) -> int:
+            scan_service.finalize_scan_result(
+                self._library_root,
+                scan_result.rows,
+                preserve_modified_after_ms=scan_result.scan_started_at_ms,
+                current_scan_job_id=scan_result.scan_job_id,
+            )
+            return len(scan_result.rows)
+
+        self._run_stage(report, "scan", scan)
+        # A partial row set must never reach finalize, which prunes every
+        # indexed row the scan did not see; cancellation skips it.
+        self._run_stage(report, "finalize", finalize)
+        self._run_stage(report, "geocode", self._backfill_locations)
+        if self._detect_faces:
+            self._run_stage(report, "faces", self._scan_faces)
+        else:
+            report.stages.append(IndexStageReport("faces", skipped="disabled"))
+
+        report.interrupted = self._cancelled
+        report.peak_rss_bytes, report.peak_worker_rss_bytes = _peak_rss_bytes()
+        return report
+
+    def _run_stage(
+        self,
+        report: LibraryIndexReport,
+        name: str,
+        action: Callable[[IndexStageReport], int],
+    ) -> None:
+        stage = IndexStageReport(name)
+        report.stages.append(stage)
+        if self._cancelled:
+            stage.skipped = "interrupted"
+            return
+        started = time.perf_counter()
+        try:
+            stage.items = action(stage)
+        finally:
+            stage.wall_s = time.perf_counter() - started
+        LOGGER.info(
+            "index stage %s: %s items in %.3fs",
+            name,
+            stage.items,
+            stage.wall_s,
+        )
+
+    def _backfill_locations(self, stage: IndexStageReport) -> int:
+        query_service = self._session.asset_queries
+        if query_service is None:
+            stage.skipped = "unavailable"
+            return 0
+        from ..utils import geocoding
+
+        if not geocoding.reverse_geocoding_available():
+            stage.skipped = "no reverse geocoder installed"
+            return 0
+
+        resolved = 0
+        batch: list[tuple[str, object]] = []
+
+        def flush() -> int:
+            names = geocoding.resolve_location_names(gps for _, gps in batch)
+            written = 0
+            for (rel, _), location in zip(batch, names, strict=True):
+                if location:
+                    query_service.update_location(rel, location)
+                    written += 1
+            batch.clear()
+            return written
+
+        for row in query_service.read_geotagged_rows():
+            if self._cancelled:
+                break
+            if str(row.get("location") or "").strip():
+                continue
+            rel = row.get("rel")
+            if isinstance(rel, str):
+                batch.append((rel, row.get("gps")))
+            if len(batch) >= _GEOCODE_BATCH_SIZE:
+                resolved += flush()
+        if batch and not self._cancelled:
+            resolved += flush()
+        return resolved
+
+    def _scan_faces(self, stage: IndexStageReport) -> int:
+        people_service = self._session.people
+        if people_service is None or people_service.coordinator is None:
+            stage.skipped = "unavailable"
+            return 0
+        from ..library.workers.face_scan_worker import FaceScanWorker
+
+        pending_before = _pending_face_count(people_service.asset_repository)
+        worker = FaceScanWorker(self._library_root, people_service=people_service)
+        worker.finish_input()
+        self._face_worker = worker
+        try:
+            if not self._cancelled:
+                # ``run`` is called directly; the headless box has no event
+                # loop and the worker's signals have no listeners here.
+                worker.run()
+        finally:
+            self._face_worker = None
+        return max(0, pending_before - _pending_face_count(people_service.asset_repository))
+
+
+def _pending_face_count(repository: Any) -> int:
+    count_by_face_status = getattr(repository, "count_by_face_status", None)
+    if not callable(count_by_face_status):
+        return 0
+    counts = count_by_face_status()
+    return int(counts.get(FACE_STATUS_PENDING, 0)) + int(counts.get(FACE_STATUS_RETRY, 0))
+
+
+def _peak_rss_bytes() -> tuple[int | None, int | None]:
+    """Return peak RSS of this process and of its largest reaped child."""
+
+    try:
+        import resource
+    except ImportError:  # pragma: no cover - Windows
+        return None, None
+    # ``ru_maxrss`` is kilobytes on Linux and bytes on macOS.
+    scale = 1 if sys.platform == "darwin" else 1024
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return int(own), int(children) if children else None
+
+
+__all__ = ["IndexStageReport", "LibraryIndexReport", "LibraryIndexRunner"]
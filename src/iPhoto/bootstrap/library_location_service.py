@@ -10,7 +10,13 @@ from .library_asset_query_service import LibraryAssetQueryService
 
 
 class LibraryLocationService:
-    """Own geotagged asset reads for one active library session."""
+    """Own geotagged asset reads for one active library session.
+
+    When the query service exposes the geotagged change log the cached
+    assets are kept across invalidations and refreshed from the rows changed
+    since the last revision; unchanged assets keep their identity so map
+    consumers can diff by object.
+    """
 
     def __init__(
         self,
@@ -23,40 +29,99 @@ class LibraryLocationService:
             self.library_root
         )
         self._geotagged_assets_cache: list[GeotaggedAsset] | None = None
+        self._assets_by_rel: dict[str, GeotaggedAsset] = {}
+        self._geo_revision: int | None = None
+        self._stale = False
 
     def list_geotagged_assets(self) -> list[GeotaggedAsset]:
         """Return visible GPS assets, deduplicated and sorted by relative path."""
 
-        if self._geotagged_assets_cache is not None:
+        if self._geotagged_assets_cache is not None and not self._stale:
+            return list(self._geotagged_assets_cache)
+        if self._geotagged_assets_cache is not None and self._apply_changes():
             return list(self._geotagged_assets_cache)
+        return self._load_all()
 
-        seen: set[Path] = set()
-        assets: list[GeotaggedAsset] = []
+    def asset_from_row(self, row: object) -> GeotaggedAsset | None:
+        """Convert one index row to a location asset for incremental updates."""
+
+        return geotagged_asset_from_row(self.library_root, row)
+
+    def invalidate_cache(self) -> None:
+        """Mark cached map assets stale.
+
+        Revision-tracked caches are patched on the next read; others are
+        reloaded in full.
+        """
+
+        self._stale = True
+        if self._geo_revision is None:
+            self._geotagged_assets_cache = None
+
+    def _load_all(self) -> list[GeotaggedAsset]:
         try:
+            # Read the revision first so changes racing the full read are
+            # fetched again by the next delta.
+            revision = self._current_revision()
             rows = self._query_service.read_geotagged_rows()
         except Exception:
+            revision = None
             rows = ()
 
+        assets_by_rel: dict[str, GeotaggedAsset] = {}
+        seen: set[Path] = set()
         for row in rows:
             asset = self.asset_from_row(row)
             if asset is None or asset.absolute_path in seen:
                 continue
             seen.add(asset.absolute_path)
-            assets.append(asset)
-
-        assets.sort(key=lambda item: item.library_relative)
-        self._geotagged_assets_cache = list(assets)
-        return list(assets)
-
-    def asset_from_row(self, row: object) -> GeotaggedAsset | None:
-        """Convert one index row to a location asset for incremental updates."""
+            assets_by_rel[asset.library_relative] = asset
 
-        return geotagged_asset_from_row(self.library_root, row)
+        self._assets_by_rel = assets_by_rel
+        self._geo_revision = revision
+        self._stale = False
+        return self._publish()
 
-    def invalidate_cache(self) -> None:
-        """Drop cached map assets."""
+    def _apply_changes(self) -> bool:
+        """Patch the cache from the change log; return False to force a reload."""
 
-        self._geotagged_assets_cache = None
+        if self._geo_revision is None:
+            return False
+        read_changes = getattr(self._query_service, "read_geotagged_changes", None)
+        if not callable(read_changes):
+            return False
+        try:
+            delta = read_changes(self._geo_revision)
+        except Exception:
+            return False
+        if delta is None:
+            return False
+
+        for rel in delta.removed_rels:
+            self._assets_by_rel.pop(rel, None)
+        for row in delta.rows:
+            rel = row.get("rel") if isinstance(row, dict) else None
+            asset = self.asset_from_row(row)
+            if asset is not None:
+                self._assets_by_rel[asset.library_relative] = asset
+            elif isinstance(rel, str):
+                self._assets_by_rel.pop(rel, None)
+        self._geo_revision = int(delta.revision)
+        self._stale = False
+        if delta.rows or delta.removed_rels:
+            self._publish()
+        return True
+
+    def _current_revision(self) -> int | None:
+        geo_revision = getattr(self._query_service, "geo_revision", None)
+        if not callable(geo_revision):
+            return None
+        return geo_revision()
+
+    def _publish(self) -> list[GeotaggedAsset]:
+        assets = sorted(self._assets_by_rel.values(), key=lambda item: item.library_relative)
+        self._geotagged_assets_cache = assets
+        return list(assets)
 
 
 __all__ = ["LibraryLocationService"]
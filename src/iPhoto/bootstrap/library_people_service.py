@@ -52,6 +52,22 @@ class IndexStorePeopleAssetRepository:
     def count_by_face_status(self) -> dict[str, int]:
         return dict(self._repository().count_by_face_status())
 
+    def replace_asset_people(
+        self,
+        rows: Iterable[tuple[str, str, str]],
+        *,
+        person_ids: Iterable[str] | None = None,
+    ) -> None:
+        self._repository().replace_asset_people(rows, person_ids=person_ids)
+
+    def replace_person_assets(
+        self,
+        rows: Iterable[tuple[str, str]],
+        *,
+        person_ids: Iterable[str] | None = None,
+    ) -> None:
+        self._repository().replace_person_assets(rows, person_ids=person_ids)
+
     def _repository(self) -> Any:
         return self._repository_factory(self.library_root)
 
@@ -6,7 +6,7 @@ import inspect
 import sqlite3
 import time
 import uuid
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,6 +22,7 @@ from ..config import (
     ALBUM_MANIFEST_NAMES,
     DEFAULT_EXCLUDE,
     DEFAULT_INCLUDE,
+    PAIR_TIME_DELTA_SEC,
     RECENTLY_DELETED_DIR_NAME,
 )
 from ..errors import (
@@ -32,12 +33,15 @@ from ..errors import (
 )
 from ..index_sync_service import (
     ensure_links,
+    iter_album_roots,
+    link_new_rows,
     load_incremental_index_cache,
     prune_index_scope,
+    sync_album_registry,
     update_index_snapshot,
 )
 from ..infrastructure.services.filesystem_media_scanner import FilesystemMediaScanner
-from ..domain.models.scan import ScanStage
+from ..domain.models.scan import ScanJobProgress, ScanStage
 from ..domain.models.scan import ScanBatchCommitted
 from ..io.scanner_adapter import process_media_paths
 from ..media_classifier import ALL_IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
@@ -84,10 +88,12 @@ class LibraryScanService:
         *,
         scanner: MediaScannerPort | None = None,
         repository_factory: Callable[[Path], AssetRepositoryPort] | None = None,
+        scan_workers: int = 1,
     ) -> None:
         self.library_root = Path(library_root)
         self._scanner = scanner or FilesystemMediaScanner(
             thumbnail_cache_dir=self._thumbnail_cache_dir(),
+            workers=scan_workers,
         )
         self._repository_factory = repository_factory or get_global_repository
 
@@ -166,8 +172,13 @@ class LibraryScanService:
         visible_publish_size: int = 100,
         max_chunk_interval_ms: float | None = None,
         persist_chunks: bool = False,
+        resume: bool = False,
     ) -> ScanLibraryResult:
-        """Scan *root* using the shared application use case."""
+        """Scan *root* using the shared application use case.
+
+        With *resume*, the newest unfinished job for the same root and scope
+        is reopened and directories it already committed are not rescanned.
+        """
 
         scan_started_ms = _monotonic_ms()
         scan_started_at_ms = _utc_ms()
@@ -184,7 +195,25 @@ class LibraryScanService:
         update_scan_job_stage = getattr(repository, "update_scan_job_stage", None)
         append_scan_event = getattr(repository, "append_scan_event", None)
         scan_scope = "album" if self._album_path(scan_root) else "library"
-        if callable(create_scan_job):
+        resumable_job = (
+            self._resumable_scan_job(scan_root, scan_scope) if resume else None
+        )
+        completed_dirs: set[str] = set()
+        if resumable_job is not None:
+            scan_job_id = str(resumable_job["job_id"])
+            completed_dirs = repository.resume_scan_job(scan_job_id)
+            if callable(update_scan_job_stage):
+                update_scan_job_stage(scan_job_id, stage=ScanStage.DISCOVER.value)
+            if callable(append_scan_event):
+                append_scan_event(
+                    scan_job_id,
+                    "resumed",
+                    {
+                        "checkpointed_dirs": len(completed_dirs),
+                        "discovery_cursor": resumable_job.get("discovery_cursor"),
+                    },
+                )
+        elif callable(create_scan_job):
             create_scan_job(
                 job_id=scan_job_id,
                 root=scan_root.as_posix(),
@@ -198,6 +227,8 @@ class LibraryScanService:
                 "stage_changed",
                 {"stage": ScanStage.DISCOVER.value},
             )
+        if callable(getattr(repository, "update_album_registry", None)):
+            self.sync_album_registry(iter_album_roots(scan_root))
         stage_elapsed_ms[ScanStage.DISCOVER.value] = round(
             _monotonic_ms() - scan_started_ms,
             3,
@@ -208,6 +239,14 @@ class LibraryScanService:
             library_root=self.library_root,
             repository=repository,
         )
+        album_path = self._album_path(scan_root)
+        if completed_dirs and album_path:
+            # Album scopes load library-relative rows; checkpointed rows are
+            # replayed by the scanner, which works relative to the album.
+            existing_index = {
+                row["rel"]: row
+                for row in self._album_relative_rows(existing_index.values(), album_path)
+            }
         stage_elapsed_ms[ScanStage.STAT_CACHE.value] = round(
             _monotonic_ms() - stat_cache_started_ms,
             3,
@@ -256,6 +295,7 @@ class LibraryScanService:
                     scan_job_id=scan_job_id,
                     scan_started_at_ms=scan_started_at_ms,
                     scan_stage_elapsed_ms=stage_elapsed_ms,
+                    completed_dirs=frozenset(completed_dirs),
                 )
             )
             stage_elapsed_ms[ScanStage.METADATA.value] = round(
@@ -477,8 +517,14 @@ class LibraryScanService:
         self,
         root: Path,
         files: Iterable[Path],
+        *,
+        asset_ids: Mapping[Path, str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Scan and merge a known set of files under *root*."""
+        """Scan and merge a known set of files under *root*.
+
+        *asset_ids* carries ids already hashed for some of *files* (imports
+        hash while copying), so those files are not hashed again.
+        """
 
         scan_root = Path(root)
         image_paths: list[Path] = []
@@ -498,6 +544,7 @@ class LibraryScanService:
                 image_paths,
                 video_paths,
                 thumbnail_cache_dir=self._thumbnail_cache_dir(),
+                asset_ids=asset_ids,
             )
         ]
         transform = self._library_relative_transform(scan_root)
@@ -530,6 +577,105 @@ class LibraryScanService:
             repository=repository,
         )
 
+    def pair_imported_files(
+        self,
+        root: Path,
+        rows: Iterable[dict[str, Any]],
+    ) -> "list[LiveGroup]":
+        """Pair freshly indexed *rows* without re-reading the whole album.
+
+        *rows* are the library-relative rows returned by
+        :meth:`scan_specific_files`.  Only unpaired rows that share a content
+        id with them or fall inside the pairing time window are loaded as
+        partner candidates.
+        """
+
+        scan_root = Path(root)
+        new_rows = [dict(row) for row in rows if row.get("rel")]
+        if not new_rows:
+            return []
+        repository = self._repository()
+        slack_us = int((PAIR_TIME_DELTA_SEC + 1) * 1_000_000)
+        windows: list[tuple[int, int]] = []
+        for row in new_rows:
+            timestamp = row.get("sort_ts", row.get("ts"))
+            if isinstance(timestamp, (int, float)):
+                windows.append((int(timestamp) - slack_us, int(timestamp) + slack_us))
+        album_path = self._album_path(scan_root)
+        new_rels = {row["rel"] for row in new_rows}
+        candidates = [
+            row
+            for row in repository.read_live_pair_candidates(
+                album_path,
+                content_ids=[row["content_id"] for row in new_rows if row.get("content_id")],
+                sort_ts_windows=windows,
+            )
+            if row.get("rel") not in new_rels
+        ]
+        if album_path:
+            new_rows = self._album_relative_rows(new_rows, album_path)
+            candidates = self._album_relative_rows(candidates, album_path)
+        return link_new_rows(
+            scan_root,
+            new_rows,
+            candidates,
+            library_root=self.library_root,
+            repository=repository,
+        )
+
+    def indexed_asset_ids(self, asset_ids: Iterable[str]) -> set[str]:
+        """Return the subset of *asset_ids* already indexed outside the trash."""
+
+        rows = self._repository().get_rows_by_ids(asset_ids)
+        return {
+            asset_id for asset_id, row in rows.items() if not row.get("is_deleted")
+        }
+
+    def sync_album_registry(
+        self,
+        album_roots: Iterable[Path],
+        *,
+        prune: bool = False,
+        repository: AssetRepositoryPort | None = None,
+    ) -> int:
+        """Refresh the album id registry for *album_roots*.
+
+        With *prune*, *album_roots* must list every album of the library
+        (including the library root); registrations for other paths are
+        dropped.
+        """
+
+        return sync_album_registry(
+            self.library_root,
+            album_roots,
+            repository=repository or self._repository(),
+            prune=prune,
+        )
+
+    def sync_library_album_registry(
+        self,
+        repository: AssetRepositoryPort | None = None,
+    ) -> int:
+        """Walk the whole library and mirror its albums into the registry.
+
+        Registrations for albums that no longer exist are dropped.  This
+        walks every directory, so call it off the GUI thread, with the
+        *repository* resolved beforehand: resolving the shared repository
+        from a worker would switch it back to this library if another one
+        was opened meanwhile.
+        """
+
+        return self.sync_album_registry(
+            iter_album_roots(self.library_root),
+            prune=True,
+            repository=repository,
+        )
+
+    def repository(self) -> AssetRepositoryPort:
+        """Return the index repository of this library."""
+
+        return self._repository()
+
     def report_album(self, root: Path) -> AlbumReport:
         """Return the asset and Live Photo counts for *root*."""
 
@@ -770,6 +916,32 @@ class LibraryScanService:
                 finished=True,
             )
 
+    def _resumable_scan_job(self, scan_root: Path, scope: str) -> dict[str, Any] | None:
+        repository = self._repository()
+        latest_scan_job = getattr(repository, "latest_scan_job", None)
+        resume_scan_job = getattr(repository, "resume_scan_job", None)
+        if not callable(latest_scan_job) or not callable(resume_scan_job):
+            return None
+        job = latest_scan_job(root=scan_root.as_posix(), scope=scope)
+        if job is None or self._scan_job_completed(job):
+            return None
+        return job
+
+    def scan_progress(self, root: Path) -> ScanJobProgress | None:
+        """Return throughput and ETA figures for the newest scan job of *root*."""
+
+        scan_root = Path(root)
+        repository = self._repository()
+        latest_scan_job = getattr(repository, "latest_scan_job", None)
+        scan_job_progress = getattr(repository, "scan_job_progress", None)
+        if not callable(latest_scan_job) or not callable(scan_job_progress):
+            return None
+        scope = "album" if self._album_path(scan_root) else "library"
+        job = latest_scan_job(root=scan_root.as_posix(), scope=scope)
+        if job is None:
+            return None
+        return scan_job_progress(str(job["job_id"]))
+
     def _mark_scan_job_failed(self, scan_job_id: str | None) -> None:
         if not scan_job_id:
             return
@@ -858,18 +1030,17 @@ def _process_media_paths_with_thumbnail_cache(
     video_paths: list[Path],
     *,
     thumbnail_cache_dir: Path,
+    asset_ids: Mapping[Path, str] | None = None,
 ) -> Iterable[dict[str, Any]]:
     try:
         signature = inspect.signature(process_media_paths)
     except (TypeError, ValueError):
         signature = None
     if signature is not None and "thumbnail_cache_dir" in signature.parameters:
-        return process_media_paths(
-            root,
-            image_paths,
-            video_paths,
-            thumbnail_cache_dir=thumbnail_cache_dir,
-        )
+        kwargs: dict[str, Any] = {"thumbnail_cache_dir": thumbnail_cache_dir}
+        if asset_ids and "asset_ids" in signature.parameters:
+            kwargs["asset_ids"] = asset_ids
+        return process_media_paths(root, image_paths, video_paths, **kwargs)
     return process_media_paths(root, image_paths, video_paths)
 
 
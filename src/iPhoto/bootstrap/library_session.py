@@ -12,6 +12,7 @@ from ..application.ports import (
     LibraryStateRepositoryPort,
     LocationAssetServicePort,
     MapInteractionServicePort,
+    MapRuntimeCapabilities,
     MapRuntimePort,
 )
 from ..application.services.map_interaction_service import LibraryMapInteractionService
@@ -19,7 +20,6 @@ from ..infrastructure.repositories.library_state_repository import (
     IndexStoreLibraryStateRepository,
 )
 from ..infrastructure.services.library_asset_runtime import LibraryAssetRuntime
-from ..infrastructure.services.map_runtime_service import SessionMapRuntimeService
 from ..people.service import PeopleService
 from .library_asset_state_service import LibraryAssetStateService
 from .library_album_metadata_service import LibraryAlbumMetadataService
@@ -89,6 +89,12 @@ class LibrarySession:
         if self.people is None:
             self.people = create_people_service(self.library_root)
         if self.maps is None:
+            # The map runtime probes OpenGL through QtWidgets; import it only
+            # for sessions that actually render maps.
+            from ..infrastructure.services.map_runtime_service import (
+                SessionMapRuntimeService,
+            )
+
             self.maps = SessionMapRuntimeService()
         if self.map_interactions is None:
             self.map_interactions = LibraryMapInteractionService()
@@ -126,6 +132,29 @@ class LibrarySession:
         self.asset_runtime.shutdown()
 
 
+class HeadlessMapRuntime:
+    """Map runtime stand-in for sessions that never display a map."""
+
+    _CAPABILITIES = MapRuntimeCapabilities(
+        display_available=False,
+        preferred_backend="unavailable",
+        python_gl_available=False,
+        native_widget_available=False,
+        osmand_extension_available=False,
+        location_search_available=False,
+        status_message="Map runtime unavailable in headless sessions.",
+    )
+
+    def is_available(self) -> bool:
+        return False
+
+    def capabilities(self) -> MapRuntimeCapabilities:
+        return self._CAPABILITIES
+
+    def package_root(self) -> Path | None:
+        return None
+
+
 def create_headless_library_session(root: Path) -> LibrarySession:
     """Create a library session for non-GUI entry points such as the CLI."""
 
@@ -133,6 +162,7 @@ def create_headless_library_session(root: Path) -> LibrarySession:
     return LibrarySession(
         library_root,
         asset_runtime=LibraryAssetRuntime(library_root),
+        maps=HeadlessMapRuntime(),
         bind_asset_runtime=False,
     )
 
@@ -144,6 +174,7 @@ def create_library_state_repository(root: Path) -> LibraryStateRepositoryPort:
 
 
 __all__ = [
+    "HeadlessMapRuntime",
     "LibrarySession",
     "create_headless_library_session",
     "create_library_state_repository",
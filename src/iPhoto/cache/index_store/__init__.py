@@ -5,6 +5,7 @@ This package provides a modular architecture for asset persistence using a
 
 - `repository`: High-level API for CRUD operations (main entry point)
 - `engine`: Low-level database connection management
+- `writer`: Dedicated writer thread that serves queued write commands
 - `migrations`: Schema initialization and updates
 - `recovery`: Database corruption recovery
 - `queries`: SQL query construction utilities
@@ -14,7 +15,8 @@ Architecture:
     go through the `AssetRepository` (aliased as `IndexStore`). Key principles:
     
     - **Single Global Database**: One database at `<library_root>/.iPhoto/global_index.db`
-    - **Single Write Gateway**: All writes through `AssetRepository`
+    - **Single Write Gateway**: All writes through `AssetRepository`, executed
+      by one writer thread that group-commits and prioritises interactive writes
     - **Idempotent Writes**: Duplicate scans don't create duplicates (INSERT OR REPLACE)
     - **Additive-Only Scans**: Scanning never deletes data from the database
 
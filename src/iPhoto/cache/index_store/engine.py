@@ -6,16 +6,32 @@ settings, and transaction context management.
 from __future__ import annotations
 
 import sqlite3
+import sys
 import threading
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional
 
 from ...utils.logging import get_logger
 
 logger = get_logger()
 
 
+class _PooledConnection(sqlite3.Connection):
+    """Reader connection kept open for reuse by the thread that owns it.
+
+    Call sites close connections they did not get from a transaction;
+    for pooled readers that hands the connection back instead.
+    """
+
+    def close(self) -> None:
+        if self.in_transaction:
+            self.rollback()
+
+    def release(self) -> None:
+        super().close()
+
+
 class DatabaseManager:
     """Manages SQLite connections and transactions.
     
@@ -23,6 +39,9 @@ class DatabaseManager:
     - Connection lifecycle management
     - Transaction context manager
     - Connection pooling support (via thread-local connections)
+    - One persistent reader connection per thread, reused across reads and
+      released once its thread has left Python code
+    - Callbacks deferred until the current transaction commits
     """
 
     def __init__(self, db_path: Path):
@@ -33,6 +52,13 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self._local = threading.local()
+        # Readers are keyed by thread ident.  A reader is only closed by its
+        # own thread, or by another one while its thread runs no Python code
+        # and so cannot be mid-query; never from a thread-exit hook, which
+        # would run while a Qt pool thread's state is being torn down.
+        self._readers: dict[int, tuple[_PooledConnection, int]] = {}
+        self._readers_lock = threading.Lock()
+        self._reader_generation = 0
 
     @property
     def _conn(self) -> Optional[sqlite3.Connection]:
@@ -47,15 +73,97 @@ class DatabaseManager:
         """Get or create a database connection.
         
         Returns:
-            An active SQLite connection.
+            The active transaction connection of this thread, or this
+            thread's pooled reader connection.
         """
         if self._conn:
             return self._conn
-        return self._create_connection()
+        return self._reader_connection()
+
+    def _reader_connection(self) -> sqlite3.Connection:
+        ident = threading.get_ident()
+        with self._readers_lock:
+            entry = self._readers.get(ident)
+        if entry is None or entry[1] != self._reader_generation:
+            if entry is not None:
+                # Stale since ``close``; this thread owns it and is not using it.
+                self._release_readers(self._pop_readers([ident]))
+            self._release_readers(self._pop_idle_readers())
+            reader = self._create_connection(factory=_PooledConnection, check_same_thread=False)
+            with self._readers_lock:
+                entry = self._readers[ident] = (reader, self._reader_generation)
+        reader = entry[0]
+        # Call sites switch ``row_factory`` freely; hand the reader out clean.
+        reader.row_factory = None
+        return reader
+
+    def _pop_readers(self, idents: list[int]) -> list[_PooledConnection]:
+        with self._readers_lock:
+            entries = [self._readers.pop(ident, None) for ident in idents]
+        return [entry[0] for entry in entries if entry is not None]
+
+    def _pop_idle_readers(self) -> list[_PooledConnection]:
+        """Take the readers of threads that are not running Python code."""
+        # Under the lock an idle thread cannot fetch its reader between the
+        # snapshot and the pop.
+        with self._readers_lock:
+            running = sys._current_frames()
+            idle = [ident for ident in self._readers if ident not in running]
+            return [self._readers.pop(ident)[0] for ident in idle]
+
+    @staticmethod
+    def _release_readers(readers: list[_PooledConnection]) -> None:
+        for reader in readers:
+            try:
+                reader.release()
+            except sqlite3.Error as exc:
+                logger.warning("Error while closing pooled reader connection: %s", exc)
+
+    def call_after_commit(self, callback: Callable[[], None]) -> None:
+        """Run *callback* once this thread's open transaction commits.
+
+        Outside a transaction it runs immediately; if the transaction rolls
+        back it is dropped.  Cache invalidation uses this so readers cannot
+        repopulate caches from the pre-commit snapshot.
+        """
+        hooks = getattr(self._local, "commit_hooks", None)
+        if hooks is None:
+            callback()
+            return
+        hooks.append(callback)
 
-    def _create_connection(self) -> sqlite3.Connection:
+    @contextmanager
+    def collect_commit_hooks(self) -> Iterator[list[Callable[[], None]]]:
+        """Collect the ``call_after_commit`` callbacks registered on this thread."""
+        previous = getattr(self._local, "commit_hooks", None)
+        hooks: list[Callable[[], None]] = []
+        self._local.commit_hooks = hooks
+        try:
+            yield hooks
+        finally:
+            self._local.commit_hooks = previous
+
+    @staticmethod
+    def run_commit_hooks(hooks: list[Callable[[], None]]) -> None:
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as exc:
+                logger.warning("Post-commit callback failed: %s", exc)
+
+    def create_writer_connection(self) -> sqlite3.Connection:
+        """Create the connection owned by the index writer thread.
+
+        Transactions on it are issued explicitly, so the driver's implicit
+        BEGIN handling is disabled.
+        """
+        conn = self._create_connection()
+        conn.isolation_level = None
+        return conn
+
+    def _create_connection(self, **kwargs) -> sqlite3.Connection:
         """Create a new database connection with optimised PRAGMA settings."""
-        conn = sqlite3.connect(self.db_path, timeout=10.0)
+        conn = sqlite3.connect(self.db_path, timeout=10.0, **kwargs)
         conn.execute("PRAGMA journal_mode=WAL")
         conn.execute("PRAGMA synchronous=NORMAL")
         conn.execute("PRAGMA cache_size=-8000")  # 8 MB cache
@@ -107,31 +215,42 @@ class DatabaseManager:
 
         self._conn = self._create_connection()
         try:
-            if begin_mode is None:
-                with self._conn:
-                    yield self._conn
-            else:
-                self._conn.execute(f"BEGIN {begin_mode}")
-                try:
-                    yield self._conn
-                except Exception:
-                    if self._conn.in_transaction:
-                        self._conn.rollback()
-                    raise
+            with self.collect_commit_hooks() as hooks:
+                if begin_mode is None:
+                    with self._conn:
+                        yield self._conn
                 else:
-                    if self._conn.in_transaction:
-                        self._conn.commit()
+                    self._conn.execute(f"BEGIN {begin_mode}")
+                    try:
+                        yield self._conn
+                    except Exception:
+                        if self._conn.in_transaction:
+                            self._conn.rollback()
+                        raise
+                    else:
+                        if self._conn.in_transaction:
+                            self._conn.commit()
         finally:
             self._conn.close()
             self._conn = None
+        self.run_commit_hooks(hooks)
 
     def close(self) -> None:
-        """Close any active connection."""
+        """Close any active connection and every pooled reader not in use.
+
+        Readers of threads still running Python code may be mid-query, so
+        they are only marked stale: their thread swaps them for a fresh
+        reader on its next read, or they are released once it goes idle.
+        """
         if self._conn:
             try:
                 self._conn.close()
             finally:
                 self._conn = None
+        with self._readers_lock:
+            self._reader_generation += 1
+        self._release_readers(self._pop_readers([threading.get_ident()]))
+        self._release_readers(self._pop_idle_readers())
 
     def execute_in_transaction(
         self,
@@ -8,11 +8,58 @@ from __future__ import annotations
 import sqlite3
 from typing import Set
 
-from ...config import RECENTLY_DELETED_DIR_NAME
+from ...config import RECENTLY_DELETED_DIR_NAME, RECENTLY_DELETED_RETENTION_DAYS
 from ...utils.logging import get_logger
 
 logger = get_logger()
 
+# Column order of the ``assets_fts`` virtual table.  ``QueryBuilder`` relies on
+# this order for per-column ``bm25`` weights.
+SEARCH_INDEX_COLUMNS: tuple[str, ...] = ("rel", "album", "location", "camera", "lens", "people")
+
+# ``timeline_buckets`` groups rows by local calendar day of ``sort_ts``
+# (microseconds since the epoch), numbered as days since 1970-01-01.  Capture
+# offsets are not stored (``dt`` is normalised to UTC), so the day follows
+# the machine's UTC offset at that instant, DST included, matching how the
+# gallery displays dates.  Rows without ``sort_ts`` share one sentinel day
+# that sorts after every dated day in descending order, like ``NULL`` does
+# in the gallery's ``ORDER BY sort_ts DESC``.
+TIMELINE_DAY_US = 86_400_000_000
+TIMELINE_UNDATED_DAY = -(1 << 40)
+# Widest UTC offset in either direction; a local day lies within this
+# margin of the UTC day with the same number.
+TIMELINE_ZONE_SLACK_US = 14 * 3_600_000_000
+
+# Local UTC offsets (in minutes) in January and July.  Buckets are rebuilt
+# when this signature differs from the one they were computed under.
+TIMELINE_ZONE_SQL = (
+    "SELECT CAST(ROUND((julianday('2001-01-15 12:00', 'localtime') "
+    "- julianday('2001-01-15 12:00')) * 1440) AS INTEGER) || '/' || "
+    "CAST(ROUND((julianday('2001-07-15 12:00', 'localtime') "
+    "- julianday('2001-07-15 12:00')) * 1440) AS INTEGER)"
+)
+
+# Filter columns of a ``timeline_buckets`` row, computed from ``assets``.
+# ``thumb_ready`` mirrors the ``min_thumbnail_state="ready"`` collection filter.
+TIMELINE_BUCKET_COLUMNS_SQL = (
+    "COALESCE(media_type, -1), COALESCE(is_favorite, 0), COALESCE(is_deleted, 0), "
+    "COALESCE(thumbnail_state = 'ready' AND TRIM(COALESCE(thumb_cache_key, '')) != '', 0)"
+)
+
+# Current time in epoch milliseconds, usable inside triggers.
+_NOW_MS_SQL = "CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)"
+TRASH_RETENTION_MS = RECENTLY_DELETED_RETENTION_DAYS * 86_400_000
+
+
+def timeline_day_sql(column: str) -> str:
+    """Return a SQL expression mapping *column* to its ``timeline_buckets`` day."""
+
+    return (
+        f"(CASE WHEN {column} IS NULL THEN {TIMELINE_UNDATED_DAY} "
+        f"ELSE CAST(julianday(date({column} / 1000000.0, 'unixepoch', 'localtime')) "
+        f"- 2440587.5 AS INTEGER) END)"
+    )
+
 
 class SchemaMigrator:
     """Manages database schema initialization and migrations.
@@ -65,6 +112,8 @@ class SchemaMigrator:
                 w INTEGER,
                 h INTEGER,
                 gps TEXT,
+                gps_lat REAL,
+                gps_lon REAL,
                 content_id TEXT,
                 frame_rate REAL,
                 codec TEXT,
@@ -91,7 +140,8 @@ class SchemaMigrator:
                 scan_job_id TEXT,
                 index_revision INTEGER DEFAULT 0,
                 index_updated_at_ms INTEGER DEFAULT 0,
-                face_status TEXT
+                face_status TEXT,
+                extended_meta TEXT
             )
         """)
 
@@ -108,7 +158,8 @@ class SchemaMigrator:
                 failed_count INTEGER DEFAULT 0,
                 started_at INTEGER,
                 updated_at INTEGER,
-                finished_at INTEGER
+                finished_at INTEGER,
+                discovery_cursor TEXT
             )
         """)
 
@@ -144,6 +195,30 @@ class SchemaMigrator:
         # Create or update indexes for query optimization
         SchemaMigrator._create_indexes(conn)
 
+        # Full-text search over locations, cameras, albums and people
+        SchemaMigrator._create_search_index(conn)
+
+        # Revision log consumed by incremental map feeds
+        SchemaMigrator._create_geo_change_log(conn)
+
+        # Directory checkpoints that let interrupted scan jobs resume
+        SchemaMigrator._create_scan_checkpoints(conn)
+
+        # Materialised per-album figures served to the sidebar and dashboard
+        SchemaMigrator._create_album_stats(conn)
+
+        # Per-day counts behind the gallery's year/month/day scrubber
+        SchemaMigrator._create_timeline_buckets(conn)
+
+        # Album uuid → library-relative path, used to resolve restore targets
+        SchemaMigrator._create_album_registry(conn)
+
+        # Person → asset membership behind keyset-paged People galleries
+        SchemaMigrator._create_person_assets(conn)
+
+        # Recently Deleted bookkeeping keyed by deletion time
+        SchemaMigrator._create_trash_ledger(conn)
+
     @staticmethod
     def _migrate_columns(conn: sqlite3.Connection) -> None:
         """Add missing columns to the assets table for schema evolution.
@@ -174,6 +249,8 @@ class SchemaMigrator:
             "w": "ALTER TABLE assets ADD COLUMN w INTEGER",
             "h": "ALTER TABLE assets ADD COLUMN h INTEGER",
             "gps": "ALTER TABLE assets ADD COLUMN gps TEXT",
+            "gps_lat": "ALTER TABLE assets ADD COLUMN gps_lat REAL",
+            "gps_lon": "ALTER TABLE assets ADD COLUMN gps_lon REAL",
             "content_id": "ALTER TABLE assets ADD COLUMN content_id TEXT",
             "frame_rate": "ALTER TABLE assets ADD COLUMN frame_rate REAL",
             "codec": "ALTER TABLE assets ADD COLUMN codec TEXT",
@@ -201,6 +278,8 @@ class SchemaMigrator:
             "index_updated_at_ms": "ALTER TABLE assets ADD COLUMN index_updated_at_ms INTEGER DEFAULT 0",
             "location": "ALTER TABLE assets ADD COLUMN location TEXT",
             "face_status": "ALTER TABLE assets ADD COLUMN face_status TEXT",
+            # Versioned JSON of secondary ExifTool tags read for the info panel
+            "extended_meta": "ALTER TABLE assets ADD COLUMN extended_meta TEXT",
         }
 
         # Add missing columns
@@ -222,6 +301,19 @@ class SchemaMigrator:
             """
         )
         conn.execute("UPDATE assets SET sort_ts = ts WHERE sort_ts IS NULL")
+        # Numeric coordinates let the map feed skip JSON decoding per row.
+        conn.execute(
+            """
+            UPDATE assets
+            SET gps_lat = CAST(json_extract(gps, '$.lat') AS REAL),
+                gps_lon = CAST(json_extract(gps, '$.lon') AS REAL)
+            WHERE gps_lat IS NULL
+                AND gps IS NOT NULL
+                AND json_valid(gps)
+                AND json_type(gps, '$.lat') IN ('integer', 'real')
+                AND json_type(gps, '$.lon') IN ('integer', 'real')
+            """
+        )
         conn.execute(
             """
             UPDATE assets
@@ -385,3 +477,524 @@ class SchemaMigrator:
                 conn.execute(index_sql)
             except sqlite3.OperationalError as exc:
                 logger.warning("Failed to create index: %s", exc)
+
+    @staticmethod
+    def _create_scan_checkpoints(conn: sqlite3.Connection) -> None:
+        """Create the per-job table of fully committed scan directories.
+
+        A directory is only recorded once every row discovered in it has been
+        persisted, so a resumed job can trust the indexed rows beneath it
+        without touching the filesystem again. ``scan_jobs.discovery_cursor``
+        keeps the last checkpointed directory for progress reporting.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        scan_job_columns = {row[1] for row in conn.execute("PRAGMA table_info(scan_jobs)")}
+        if "discovery_cursor" not in scan_job_columns:
+            conn.execute("ALTER TABLE scan_jobs ADD COLUMN discovery_cursor TEXT")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scan_checkpoints (
+                job_id TEXT NOT NULL,
+                rel_dir TEXT NOT NULL,
+                committed_at INTEGER,
+                PRIMARY KEY (job_id, rel_dir)
+            ) WITHOUT ROWID
+            """
+        )
+
+    @staticmethod
+    def _create_album_registry(conn: sqlite3.Connection) -> None:
+        """Create the registry mapping album manifest ids to album paths.
+
+        Restores store the original album's manifest ``id``; the registry
+        lets that id resolve to a library-relative ``album_path`` (``""`` for
+        the library root) with one primary-key lookup.  ``manifest_mtime_ns``
+        lets a refresh skip manifests that did not change since they were
+        last read.  ``cover_rel`` caches the manifest's album-relative cover
+        so the albums dashboard resolves covers without opening manifests;
+        registries created before it existed are marked for a re-read.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS album_registry (
+                album_id TEXT PRIMARY KEY COLLATE NOCASE,
+                album_path TEXT NOT NULL,
+                manifest_mtime_ns INTEGER,
+                updated_at INTEGER,
+                cover_rel TEXT
+            ) WITHOUT ROWID
+            """
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(album_registry)")}
+        if "cover_rel" not in columns:
+            conn.execute("ALTER TABLE album_registry ADD COLUMN cover_rel TEXT")
+            conn.execute("UPDATE album_registry SET manifest_mtime_ns = NULL")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_album_registry_path "
+            "ON album_registry (album_path)"
+        )
+
+    @staticmethod
+    def _create_person_assets(conn: sqlite3.Connection) -> None:
+        """Create the membership table that maps People clusters to assets.
+
+        Unlike ``asset_people``, which only mirrors named people for search,
+        ``person_assets`` lists every cluster, so person and group galleries
+        can filter ``assets`` with one indexed subquery instead of loading
+        their asset ids from the face database first.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS person_assets (
+                person_id TEXT NOT NULL,
+                asset_id TEXT NOT NULL,
+                PRIMARY KEY (person_id, asset_id)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_person_assets_asset "
+            "ON person_assets (asset_id)"
+        )
+
+    @staticmethod
+    def _create_trash_ledger(conn: sqlite3.Connection) -> None:
+        """Create ``trash_ledger`` and the triggers that keep it in sync.
+
+        Every row in Recently Deleted (``is_deleted = 1``) has one ledger
+        entry holding its restore location, when it was deleted and when it
+        expires.  Entries are ordered by ``deleted_at``, so maintenance can
+        walk the trash in bounded windows and restore metadata can be read
+        per ``rel`` instead of loading the whole trash.  A rescanned row that
+        arrives without restore columns keeps the ones already recorded, and
+        re-inserting a row keeps its original deletion time.  ``INSERT OR
+        REPLACE`` fires no delete trigger, so the insert trigger also drops
+        the entry of a row that replaced a trashed one.  A fresh table is
+        filled from the trashed rows already indexed.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trash_ledger'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS trash_ledger (
+                rel TEXT PRIMARY KEY,
+                original_rel_path TEXT,
+                original_album_id TEXT,
+                original_album_subpath TEXT,
+                deleted_at INTEGER NOT NULL,
+                expires_at INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_trash_ledger_deleted "
+            "ON trash_ledger (deleted_at, rel)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_trash_ledger_expires "
+            "ON trash_ledger (expires_at)"
+        )
+
+        record_sql = (
+            "INSERT INTO trash_ledger (rel, original_rel_path, original_album_id, "
+            "original_album_subpath, deleted_at, expires_at) "
+            f"SELECT NEW.rel, NEW.original_rel_path, NEW.original_album_id, "
+            f"NEW.original_album_subpath, {_NOW_MS_SQL}, {_NOW_MS_SQL} + {TRASH_RETENTION_MS} "
+            "WHERE NEW.is_deleted = 1 "
+            "ON CONFLICT(rel) DO UPDATE SET "
+            "original_rel_path = COALESCE(excluded.original_rel_path, original_rel_path), "
+            "original_album_id = COALESCE(excluded.original_album_id, original_album_id), "
+            "original_album_subpath = "
+            "COALESCE(excluded.original_album_subpath, original_album_subpath)"
+        )
+        triggers = {
+            "trash_ledger_after_insert": (
+                "AFTER INSERT ON assets BEGIN "
+                "DELETE FROM trash_ledger WHERE rel = NEW.rel "
+                "AND COALESCE(NEW.is_deleted, 0) != 1; "
+                f"{record_sql}; END"
+            ),
+            "trash_ledger_after_delete": (
+                "AFTER DELETE ON assets WHEN OLD.is_deleted = 1 BEGIN "
+                "DELETE FROM trash_ledger WHERE rel = OLD.rel; END"
+            ),
+            "trash_ledger_after_update": (
+                "AFTER UPDATE OF rel, is_deleted, original_rel_path, original_album_id, "
+                "original_album_subpath ON assets "
+                "WHEN OLD.is_deleted = 1 OR NEW.is_deleted = 1 BEGIN "
+                "DELETE FROM trash_ledger WHERE rel = OLD.rel "
+                "AND (OLD.rel IS NOT NEW.rel OR COALESCE(NEW.is_deleted, 0) != 1); "
+                f"{record_sql}; END"
+            ),
+        }
+        for name, body in triggers.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+        if exists is None:
+            conn.execute(
+                f"""
+                INSERT OR IGNORE INTO trash_ledger (
+                    rel, original_rel_path, original_album_id, original_album_subpath,
+                    deleted_at, expires_at
+                )
+                SELECT rel, original_rel_path, original_album_id, original_album_subpath,
+                    COALESCE(NULLIF(index_updated_at_ms, 0), {_NOW_MS_SQL}),
+                    COALESCE(NULLIF(index_updated_at_ms, 0), {_NOW_MS_SQL})
+                        + {TRASH_RETENTION_MS}
+                FROM assets
+                WHERE is_deleted = 1
+                """
+            )
+
+    @staticmethod
+    def _create_album_stats(conn: sqlite3.Connection) -> None:
+        """Create ``album_stats`` and the triggers that mark albums dirty.
+
+        ``album_stats`` holds one row of direct figures per album.  Triggers
+        on ``assets`` only record the affected album paths in
+        ``album_stats_dirty``; the repository recomputes those albums in one
+        grouped statement before serving the table, so scans pay a single
+        ``INSERT OR IGNORE`` per row instead of arithmetic on shared rows.
+        ``INSERT OR REPLACE`` keeps ``rel`` and therefore the album, so the
+        insert trigger alone covers replaced rows.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'album_stats'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS album_stats (
+                album_path TEXT PRIMARY KEY,
+                asset_count INTEGER NOT NULL DEFAULT 0,
+                photo_count INTEGER NOT NULL DEFAULT 0,
+                video_count INTEGER NOT NULL DEFAULT 0,
+                live_count INTEGER NOT NULL DEFAULT 0,
+                favorite_count INTEGER NOT NULL DEFAULT 0,
+                total_bytes INTEGER NOT NULL DEFAULT 0,
+                first_ts INTEGER,
+                last_ts INTEGER,
+                cover_rel TEXT,
+                cover_dt TEXT,
+                cover_id TEXT,
+                revision INTEGER NOT NULL DEFAULT 0
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS album_stats_dirty (
+                album_path TEXT PRIMARY KEY
+            ) WITHOUT ROWID
+        """)
+
+        # An upsert clause, unlike ``INSERT OR IGNORE``, is not overridden by
+        # the conflict mode of the statement that fired the trigger.
+        mark_sql = (
+            "INSERT INTO album_stats_dirty (album_path) "
+            "SELECT {album} WHERE {album} IS NOT NULL ON CONFLICT DO NOTHING"
+        )
+        tracked_columns = (
+            "rel, id, parent_album_path, dt, sort_ts, bytes, media_type, live_role, "
+            "live_partner_rel, is_favorite"
+        )
+        triggers = {
+            "album_stats_after_insert": (
+                "AFTER INSERT ON assets BEGIN "
+                + mark_sql.format(album="NEW.parent_album_path")
+                + "; END"
+            ),
+            "album_stats_after_delete": (
+                "AFTER DELETE ON assets BEGIN "
+                + mark_sql.format(album="OLD.parent_album_path")
+                + "; END"
+            ),
+            "album_stats_after_update": (
+                f"AFTER UPDATE OF {tracked_columns} ON assets BEGIN "
+                + mark_sql.format(album="OLD.parent_album_path")
+                + "; "
+                + mark_sql.format(album="NEW.parent_album_path")
+                + "; END"
+            ),
+        }
+        for name, body in triggers.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+        if exists is None:
+            conn.execute(
+                "INSERT OR IGNORE INTO album_stats_dirty (album_path) "
+                "SELECT DISTINCT parent_album_path FROM assets "
+                "WHERE parent_album_path IS NOT NULL"
+            )
+
+    @staticmethod
+    def _create_timeline_buckets(conn: sqlite3.Connection) -> None:
+        """Create ``timeline_buckets`` and the triggers that mark days dirty.
+
+        Each bucket counts visible rows of one album and day, split by the
+        columns gallery collections filter on (media type, favorite, trash
+        and thumbnail readiness), so any collection's timeline is one
+        grouped read of this table.  As with ``album_stats``, triggers only
+        record ``(album, day)`` pairs in ``timeline_dirty``; the repository
+        recounts those days before serving buckets.  Days are local calendar
+        days, so ``timeline_zone`` records the UTC offsets they were counted
+        under; a new table, or a machine whose time zone changed since, is
+        refilled with one grouped pass over ``assets``.  Triggers are
+        recreated on every open so older databases pick up the current day
+        expression.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'timeline_buckets'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS timeline_buckets (
+                parent_album_path TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                media_type INTEGER NOT NULL,
+                is_favorite INTEGER NOT NULL,
+                is_deleted INTEGER NOT NULL,
+                thumb_ready INTEGER NOT NULL,
+                asset_count INTEGER NOT NULL,
+                PRIMARY KEY (
+                    parent_album_path, day, media_type, is_favorite, is_deleted, thumb_ready
+                )
+            ) WITHOUT ROWID
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_timeline_buckets_day ON timeline_buckets (day)"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS timeline_dirty (
+                parent_album_path TEXT NOT NULL,
+                day INTEGER NOT NULL,
+                PRIMARY KEY (parent_album_path, day)
+            ) WITHOUT ROWID
+        """)
+
+        mark_sql = (
+            "INSERT INTO timeline_dirty (parent_album_path, day) "
+            "SELECT {row}.parent_album_path, {day} WHERE {row}.parent_album_path IS NOT NULL "
+            "ON CONFLICT DO NOTHING"
+        )
+
+        def mark(row: str) -> str:
+            return mark_sql.format(row=row, day=timeline_day_sql(f"{row}.sort_ts"))
+
+        tracked_columns = (
+            "parent_album_path, sort_ts, live_role, media_type, is_favorite, is_deleted, "
+            "thumbnail_state, thumb_cache_key"
+        )
+        triggers = {
+            "timeline_after_insert": f"AFTER INSERT ON assets BEGIN {mark('NEW')}; END",
+            "timeline_after_delete": f"AFTER DELETE ON assets BEGIN {mark('OLD')}; END",
+            "timeline_after_update": (
+                f"AFTER UPDATE OF {tracked_columns} ON assets BEGIN "
+                f"{mark('OLD')}; {mark('NEW')}; END"
+            ),
+        }
+        for name, body in triggers.items():
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+            conn.execute(f"CREATE TRIGGER {name} {body}")
+
+        conn.execute("CREATE TABLE IF NOT EXISTS timeline_zone (zone TEXT NOT NULL)")
+        zone = conn.execute(TIMELINE_ZONE_SQL).fetchone()[0]
+        stored = conn.execute("SELECT zone FROM timeline_zone LIMIT 1").fetchone()
+        if exists is None or stored is None or stored[0] != zone:
+            conn.execute("DELETE FROM timeline_zone")
+            conn.execute("INSERT INTO timeline_zone (zone) VALUES (?)", (zone,))
+            conn.execute("DELETE FROM timeline_dirty")
+            conn.execute("DELETE FROM timeline_buckets")
+            conn.execute(
+                f"""
+                INSERT INTO timeline_buckets (
+                    parent_album_path, day, media_type, is_favorite, is_deleted,
+                    thumb_ready, asset_count
+                )
+                SELECT parent_album_path, {timeline_day_sql("sort_ts")},
+                    {TIMELINE_BUCKET_COLUMNS_SQL}, COUNT(*)
+                FROM assets
+                WHERE live_role = 0 AND parent_album_path IS NOT NULL
+                GROUP BY 1, 2, 3, 4, 5, 6
+                """
+            )
+
+    @staticmethod
+    def _create_geo_change_log(conn: sqlite3.Connection) -> None:
+        """Create ``geo_changes`` and the triggers that feed it.
+
+        Every insert, delete or relevant update of a geotagged asset stamps
+        its ``rel`` with the next revision so map consumers can ask for the
+        changes since the last revision they saw.  A row that loses its
+        coordinates is still logged because its ``rel`` is already present,
+        which lets readers report it as removed.  ``index_revision`` is not
+        reused because it only tracks thumbnail churn and deleted rows leave
+        no trace in ``assets``.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'geo_changes'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS geo_changes (
+                rel TEXT PRIMARY KEY,
+                revision INTEGER NOT NULL
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_geo_changes_revision ON geo_changes (revision)"
+        )
+
+        log_sql = (
+            "INSERT INTO geo_changes (rel, revision) SELECT {rel}, "
+            "(SELECT COALESCE(MAX(revision), 0) + 1 FROM geo_changes) WHERE {condition} "
+            "ON CONFLICT(rel) DO UPDATE SET revision = excluded.revision"
+        )
+        tracked_columns = (
+            "rel, id, parent_album_path, mime, gps_lat, gps_lon, location, live_role, "
+            "live_partner_rel, still_image_time, dur, is_deleted"
+        )
+        triggers = {
+            "geo_changes_after_insert": (
+                "AFTER INSERT ON assets WHEN NEW.gps_lat IS NOT NULL "
+                "OR EXISTS (SELECT 1 FROM geo_changes WHERE rel = NEW.rel) BEGIN "
+                + log_sql.format(rel="NEW.rel", condition="1")
+                + "; END"
+            ),
+            "geo_changes_after_delete": (
+                "AFTER DELETE ON assets WHEN OLD.gps_lat IS NOT NULL BEGIN "
+                + log_sql.format(rel="OLD.rel", condition="1")
+                + "; END"
+            ),
+            "geo_changes_after_update": (
+                f"AFTER UPDATE OF {tracked_columns} ON assets "
+                "WHEN OLD.gps_lat IS NOT NULL OR NEW.gps_lat IS NOT NULL BEGIN "
+                + log_sql.format(rel="OLD.rel", condition="OLD.rel IS NOT NEW.rel")
+                + "; "
+                + log_sql.format(rel="NEW.rel", condition="1")
+                + "; END"
+            ),
+        }
+        for name, body in triggers.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+        if exists is None:
+            conn.execute(
+                "INSERT OR IGNORE INTO geo_changes (rel, revision) "
+                "SELECT rel, 1 FROM assets WHERE gps_lat IS NOT NULL"
+            )
+
+    @staticmethod
+    def _create_search_index(conn: sqlite3.Connection) -> None:
+        """Create the FTS5 search table and the triggers that keep it in sync.
+
+        ``assets_fts`` shares its rowid with ``assets`` so matches join back
+        through the integer primary key.  ``INSERT OR REPLACE`` removes the
+        previous row without firing delete triggers (recursive triggers are
+        off), so the ``BEFORE INSERT`` trigger drops the stale search entry
+        for the same ``rel`` first.  Person names live in ``asset_people``
+        and are folded into the ``people`` column whenever it changes.
+
+        Args:
+            conn: An active SQLite connection.
+        """
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS asset_people (
+                asset_id TEXT NOT NULL,
+                person_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                PRIMARY KEY (asset_id, person_id)
+            )
+        """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_asset_people_person ON asset_people (person_id)"
+        )
+
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'assets_fts'"
+        ).fetchone()
+        try:
+            conn.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS assets_fts USING fts5(
+                    {", ".join(SEARCH_INDEX_COLUMNS)},
+                    tokenize = 'unicode61 remove_diacritics 2',
+                    prefix = '2 3'
+                )
+            """)
+        except sqlite3.OperationalError as exc:
+            logger.warning("Full-text search is unavailable (FTS5 missing?): %s", exc)
+            return
+
+        people_sql = (
+            "(SELECT group_concat(name, ' ') FROM asset_people "
+            "WHERE asset_people.asset_id = {alias}.id)"
+        )
+        values_sql = (
+            "{alias}.rowid, {alias}.rel, {alias}.parent_album_path, {alias}.location, "
+            "TRIM(COALESCE({alias}.make, '') || ' ' || COALESCE({alias}.model, '')), "
+            "{alias}.lens, " + people_sql
+        )
+        insert_sql = (
+            f"INSERT INTO assets_fts (rowid, {', '.join(SEARCH_INDEX_COLUMNS)}) "
+            "VALUES ({values})"
+        )
+        refresh_people_sql = (
+            "UPDATE assets_fts SET people = (SELECT group_concat(name, ' ') "
+            "FROM asset_people WHERE asset_people.asset_id = {ref}.asset_id) "
+            "WHERE rowid IN (SELECT rowid FROM assets WHERE id = {ref}.asset_id)"
+        )
+        triggers = {
+            "assets_fts_before_insert": (
+                "BEFORE INSERT ON assets BEGIN "
+                "DELETE FROM assets_fts WHERE rowid = "
+                "(SELECT rowid FROM assets WHERE rel = NEW.rel); END"
+            ),
+            "assets_fts_after_insert": (
+                "AFTER INSERT ON assets BEGIN "
+                + insert_sql.format(values=values_sql.format(alias="NEW"))
+                + "; END"
+            ),
+            "assets_fts_after_delete": (
+                "AFTER DELETE ON assets BEGIN "
+                "DELETE FROM assets_fts WHERE rowid = OLD.rowid; END"
+            ),
+            "assets_fts_after_update": (
+                "AFTER UPDATE OF rel, id, parent_album_path, location, make, model, lens "
+                "ON assets BEGIN "
+                "DELETE FROM assets_fts WHERE rowid = OLD.rowid; "
+                + insert_sql.format(values=values_sql.format(alias="NEW"))
+                + "; END"
+            ),
+            "asset_people_after_insert": (
+                "AFTER INSERT ON asset_people BEGIN "
+                + refresh_people_sql.format(ref="NEW")
+                + "; END"
+            ),
+            "asset_people_after_delete": (
+                "AFTER DELETE ON asset_people BEGIN "
+                + refresh_people_sql.format(ref="OLD")
+                + "; END"
+            ),
+        }
+        for name, body in triggers.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+        if exists is None:
+            logger.info("Building full-text search index")
+            conn.execute(
+                f"INSERT INTO assets_fts (rowid, {', '.join(SEARCH_INDEX_COLUMNS)}) "
+                f"SELECT {values_sql.format(alias='assets')} FROM assets"
+            )
@@ -5,15 +5,47 @@ SQL queries, particularly for filtering and cursor-based pagination.
 """
 from __future__ import annotations
 
+import re
+import sqlite3
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from ...config import RECENTLY_DELETED_DIR_NAME
 from ...domain.models.query import CollectionQuery, CollectionType, PageCursor, SortDirection
+from .migrations import SEARCH_INDEX_COLUMNS, timeline_day_sql
 
 ESCAPE_CLAUSE = "ESCAPE '\\'"
 
+# User-facing field prefixes accepted by :func:`parse_search_query`, mapped to
+# ``assets_fts`` columns.
+SEARCH_FIELD_ALIASES: Dict[str, str] = {
+    "path": "rel",
+    "file": "rel",
+    "album": "album",
+    "location": "location",
+    "place": "location",
+    "camera": "camera",
+    "lens": "lens",
+    "person": "people",
+    "people": "people",
+}
+
+# ``bm25`` weights in ``SEARCH_INDEX_COLUMNS`` order: a hit on a person name
+# or place outranks an incidental match inside a file name.
+_SEARCH_COLUMN_WEIGHTS: Dict[str, float] = {
+    "rel": 1.0,
+    "album": 2.0,
+    "location": 4.0,
+    "camera": 3.0,
+    "lens": 2.0,
+    "people": 5.0,
+}
+
+_SEARCH_TOKEN_RE = re.compile(r'(-?)(?:([A-Za-z]+):)?(?:"([^"]*)"?|(\S+))')
+
 
 def normalize_path(path_str: str) -> str:
     """Normalize a path string to use forward slashes (POSIX style).
@@ -39,6 +71,96 @@ def escape_like_pattern(path: str) -> str:
     return path.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+@dataclass(frozen=True)
+class SearchTerm:
+    """One parsed term of a free-text search query."""
+
+    text: str
+    column: Optional[str] = None
+    negated: bool = False
+    phrase: bool = False
+
+    def to_fts(self) -> str:
+        """Render the term as an FTS5 query fragment."""
+
+        quoted = '"' + self.text.replace('"', '""') + '"'
+        if not self.phrase:
+            # Bare words match as prefixes so results appear while typing.
+            quoted += "*"
+        if self.column is not None:
+            return f"{self.column}:{quoted}"
+        return quoted
+
+
+def parse_search_query(text: Optional[str]) -> List[SearchTerm]:
+    """Split *text* into search terms.
+
+    Supported syntax: bare words (prefix match), ``"quoted phrases"``,
+    ``field:value`` with the fields in :data:`SEARCH_FIELD_ALIASES`, and a
+    leading ``-`` to exclude a term.  Unknown field prefixes are searched as
+    plain text.
+    """
+
+    terms: List[SearchTerm] = []
+    if not text:
+        return terms
+    for match in _SEARCH_TOKEN_RE.finditer(text):
+        negated, field, phrase, word = match.groups()
+        column = SEARCH_FIELD_ALIASES.get(field.casefold()) if field else None
+        if field and column is None:
+            word = f"{field}:{word}" if word is not None else word
+            phrase = f"{field} {phrase}" if phrase is not None else phrase
+        value = phrase if phrase is not None else word
+        if not value or not any(char.isalnum() for char in value):
+            continue
+        terms.append(
+            SearchTerm(
+                text=value.strip(),
+                column=column,
+                negated=bool(negated),
+                phrase=phrase is not None,
+            )
+        )
+    return terms
+
+
+def build_fts_match(text: Optional[str]) -> Optional[str]:
+    """Return an FTS5 ``MATCH`` expression for *text* or ``None`` if empty.
+
+    Positive terms are AND-ed together; excluded terms are applied with
+    ``NOT``.  A query consisting only of exclusions yields ``None`` because
+    FTS5 cannot evaluate a bare negation.
+    """
+
+    terms = parse_search_query(text)
+    positive = [term.to_fts() for term in terms if not term.negated]
+    if not positive:
+        return None
+    expression = "(" + " AND ".join(positive) + ")"
+    for term in terms:
+        if term.negated:
+            expression += " NOT " + term.to_fts()
+    return expression
+
+
+@lru_cache(maxsize=1)
+def fts5_available() -> bool:
+    """Return whether the linked SQLite library provides FTS5.
+
+    ``assets_fts`` is only created when it does; search then falls back to
+    matching ``rel`` with ``LIKE``.
+    """
+
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE fts5_probe USING fts5(body)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
 class QueryBuilder:
     """Builds SQL queries with filters, pagination, and sorting.
     
@@ -373,13 +495,168 @@ class QueryBuilder:
             where_clauses.append("sort_ts <= ?")
             params.append(QueryBuilder._datetime_to_microseconds(collection_query.date_to))
 
-        if collection_query.search_text:
+        if collection_query.search_text and not fts5_available():
             pattern = f"%{escape_like_pattern(collection_query.search_text)}%"
             where_clauses.append(f"rel LIKE ? {ESCAPE_CLAUSE}")
             params.append(pattern)
+        elif collection_query.search_text:
+            match = build_fts_match(collection_query.search_text)
+            if match is not None:
+                where_clauses.append(
+                    "rowid IN (SELECT rowid FROM assets_fts WHERE assets_fts MATCH ?)"
+                )
+                params.append(match)
+
+        person_ids = tuple(dict.fromkeys(str(value) for value in collection_query.person_ids))
+        if len(person_ids) == 1:
+            where_clauses.append(
+                "id IN (SELECT asset_id FROM person_assets WHERE person_id = ?)"
+            )
+            params.append(person_ids[0])
+        elif person_ids:
+            # A group shows the assets every member appears in.
+            placeholders = ", ".join(["?"] * len(person_ids))
+            where_clauses.append(
+                "id IN (SELECT asset_id FROM person_assets "
+                f"WHERE person_id IN ({placeholders}) "
+                "GROUP BY asset_id HAVING COUNT(*) = ?)"
+            )
+            params.extend(person_ids)
+            params.append(len(person_ids))
 
         return where_clauses, params
 
+    @staticmethod
+    def build_timeline_query(
+        collection_query: CollectionQuery,
+    ) -> Tuple[str, List[Any], bool]:
+        """Build a per-day ``(day, count)`` query in collection order.
+
+        Collections whose filters are all ``timeline_buckets`` dimensions
+        read the maintained buckets; anything else (GPS, date range, search,
+        People membership, non-date sorts) groups the matching ``assets``
+        rows directly.
+
+        Returns:
+            Tuple of (sql, params, uses_buckets).
+        """
+
+        direction = "ASC" if collection_query.sort_direction == SortDirection.ASC else "DESC"
+        album_path = collection_query.album_path
+        uses_buckets = (
+            QueryBuilder._collection_sort_column(collection_query) == "sort_ts"
+            and collection_query.has_gps is None
+            and collection_query.date_from is None
+            and collection_query.date_to is None
+            and not collection_query.search_text
+            and not collection_query.person_ids
+            and collection_query.min_thumbnail_state in (None, "ready")
+        )
+        if not uses_buckets:
+            query, params = QueryBuilder.build_collection_query(
+                collection_query,
+                select_clause=f"SELECT {timeline_day_sql('sort_ts')} AS day, COUNT(*)",
+                include_order=False,
+            )
+            return f"{query} GROUP BY day ORDER BY day {direction}", params, False
+
+        where_clauses: List[str] = []
+        params = []
+        if album_path != RECENTLY_DELETED_DIR_NAME:
+            where_clauses.append("is_deleted = 0")
+        if collection_query.min_thumbnail_state == "ready":
+            where_clauses.append("thumb_ready = 1")
+        if collection_query.collection_type == CollectionType.ALBUM or album_path:
+            album_where, album_params = QueryBuilder.build_album_filter(
+                album_path,
+                collection_query.include_subalbums,
+            )
+            where_clauses.extend(album_where)
+            params.extend(album_params)
+        if collection_query.collection_type == CollectionType.FAVORITES:
+            where_clauses.append("is_favorite = 1")
+        elif collection_query.is_favorite is not None:
+            where_clauses.append("is_favorite = ?")
+            params.append(1 if collection_query.is_favorite else 0)
+        media_types = tuple(int(value) for value in collection_query.media_types)
+        if collection_query.collection_type == CollectionType.VIDEOS and not media_types:
+            media_types = (1,)
+        if media_types:
+            placeholders = ", ".join(["?"] * len(media_types))
+            where_clauses.append(f"media_type IN ({placeholders})")
+            params.extend(media_types)
+
+        query = "SELECT day, SUM(asset_count) FROM timeline_buckets"
+        if where_clauses:
+            query += " WHERE " + " AND ".join(where_clauses)
+        query += f" GROUP BY day HAVING SUM(asset_count) > 0 ORDER BY day {direction}"
+        return query, params, True
+
+    @staticmethod
+    def build_search_query(
+        collection_query: CollectionQuery,
+        *,
+        select_clause: str = "SELECT assets.*",
+        limit: int | None = None,
+        offset: int = 0,
+        include_order: bool = True,
+    ) -> Tuple[str, List[Any]]:
+        """Build a ranked full-text search over ``assets_fts``.
+
+        The collection filters of *collection_query* (album scope, media
+        types, favorites, dates, ...) still apply; ``search_text`` supplies
+        the ``MATCH`` expression.  Results are ordered by ``bm25`` relevance
+        and then by the collection sort so equal ranks stay deterministic.
+        Without FTS5 the hits are the ``LIKE`` matches of
+        :meth:`build_collection_where` in collection order.
+
+        Raises:
+            ValueError: If ``search_text`` contains no searchable term.
+        """
+
+        match = build_fts_match(collection_query.search_text)
+        if match is None:
+            raise ValueError(f"Empty search query: {collection_query.search_text!r}")
+        if not fts5_available():
+            return QueryBuilder.build_collection_query(
+                collection_query,
+                select_clause=select_clause,
+                limit=limit,
+                offset=offset,
+                include_order=include_order,
+            )
+
+        # ``search_text`` is handled by the ranked join below, not the rowid
+        # sub-select in ``build_collection_where``.
+        filters = replace(collection_query, search_text=None)
+        where_clauses, where_params = QueryBuilder.build_collection_where(filters)
+        weights = ", ".join(str(_SEARCH_COLUMN_WEIGHTS[column]) for column in SEARCH_INDEX_COLUMNS)
+        # ``CROSS JOIN`` pins the FTS hits as the outer loop; otherwise the
+        # planner may walk ``assets`` by index and re-run MATCH per row.
+        query = (
+            f"{select_clause} FROM ("
+            f"SELECT rowid AS hit_rowid, bm25(assets_fts, {weights}) AS search_rank "
+            "FROM assets_fts WHERE assets_fts MATCH ?"
+            ") AS hits CROSS JOIN assets ON assets.rowid = hits.hit_rowid"
+        )
+        params: List[Any] = [match, *where_params]
+        if where_clauses:
+            query += " WHERE " + " AND ".join(where_clauses)
+        if include_order:
+            sort_col = QueryBuilder._collection_sort_column(filters)
+            direction = "ASC" if filters.sort_direction == SortDirection.ASC else "DESC"
+            query += (
+                f" ORDER BY hits.search_rank ASC, {sort_col} {direction}, "
+                f"id {direction}, rel {direction}"
+            )
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(max(0, int(limit)))
+            if offset > 0:
+                query += " OFFSET ?"
+                params.append(max(0, int(offset)))
+        return query, params
+
     @staticmethod
     def build_collection_order(collection_query: CollectionQuery) -> str:
         sort_col = QueryBuilder._collection_sort_column(collection_query)
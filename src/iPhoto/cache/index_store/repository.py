@@ -15,15 +15,33 @@ Architecture:
 """
 from __future__ import annotations
 
+import dataclasses
+import functools
 import json
 import sqlite3
 import threading
 import time
 import unicodedata
+from concurrent.futures import Future
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
-
-from ...domain.models.query import CollectionQuery, PageCursor, PageResult, WindowResult
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from ...domain.models.query import (
+    AlbumFigures,
+    AlbumStats,
+    CollectionQuery,
+    CollectionType,
+    GeoFeedDelta,
+    PageCursor,
+    PageResult,
+    SortDirection,
+    TimelineBucket,
+    TimelineSummary,
+    TrashLedgerEntry,
+    WindowResult,
+)
+from ...domain.models.scan import ScanJobProgress
 from ...infrastructure.services.performance_events import (
     audit_full_scan_query,
     emit_perf_event,
@@ -32,13 +50,22 @@ from ...infrastructure.services.performance_events import (
 )
 from ...people.status import normalize_face_status
 from ...utils.logging import get_logger
+from ...utils.micro_thumbnail import MICRO_THUMBNAIL_MAGIC
 from ...utils.pathutils import ensure_work_dir
 from .engine import DatabaseManager
-from .migrations import SchemaMigrator
-from .queries import QueryBuilder
+from .migrations import (
+    TIMELINE_BUCKET_COLUMNS_SQL,
+    TIMELINE_DAY_US,
+    TIMELINE_UNDATED_DAY,
+    TIMELINE_ZONE_SLACK_US,
+    SchemaMigrator,
+    timeline_day_sql,
+)
+from .queries import QueryBuilder, escape_like_pattern
 from .recovery import RecoveryService
-from .row_mapper import db_row_to_dict, insert_rows, row_to_db_params
+from .row_mapper import db_row_to_dict, gps_coordinates, insert_rows, row_to_db_params
 from .scan_merge import merge_scan_rows as merge_scan_rows_payload
+from .writer import IndexWriter, WritePriority
 
 logger = get_logger()
 
@@ -54,6 +81,38 @@ _DEEP_OFFSET_LIMIT = 5_000
 _DEEP_SEEK_CHUNK_SIZE = 1_024
 _MAX_COLLECTION_ANCHORS_PER_QUERY = 64
 _OMIT_METADATA_VALUE = object()
+_TIMELINE_EPOCH = date(1970, 1, 1)
+
+# Columns ``move_rows`` rewrites; everything else moves with the row as-is.
+_MOVE_COLUMNS = (
+    "rel",
+    "parent_album_path",
+    "is_deleted",
+    "original_rel_path",
+    "original_album_id",
+    "original_album_subpath",
+    "thumbnail_state",
+    "thumb_cache_key",
+    "scan_job_id",
+)
+# Extracted metadata columns ``update_asset_details`` may fill in after a scan.
+_ASSET_DETAIL_COLUMNS = (
+    "make", "model", "lens", "iso", "f_number", "exposure_time",
+    "exposure_compensation", "focal_length", "frame_rate", "codec", "dur",
+)
+# ``TrashLedgerEntry`` fields, in declaration order.
+_TRASH_LEDGER_COLUMNS = (
+    "rel, original_rel_path, original_album_id, original_album_subpath, "
+    "deleted_at, expires_at"
+)
+# Columns needed to build map assets; wide payloads such as micro thumbnails
+# and the JSON ``gps`` text stay in SQLite.  Legacy ``metadata`` JSON is only
+# read for rows without a ``location`` (see ``_geo_feed_select``).
+_GEO_FEED_COLUMNS = (
+    "rel", "id", "parent_album_path", "mime", "media_type", "location",
+    "live_role", "live_partner_rel", "still_image_time", "dur", "is_deleted",
+    "gps_lat", "gps_lon",
+)
 
 # Global singleton instance and lock for thread-safe access
 _global_instance: Optional["AssetRepository"] = None
@@ -96,10 +155,43 @@ def _sanitize_metadata_for_json(metadata: Dict[str, Any]) -> Dict[str, Any]:
     return {}
 
 
+_T = TypeVar("_T")
+
+
+def _collection_filter_columns(query: CollectionQuery) -> frozenset[str]:
+    """Return the narrowly-updated filters whose changes can move *query*'s rows."""
+
+    columns: set[str] = set()
+    if query.min_thumbnail_state:
+        columns.add("thumbnail_state")
+    if query.collection_type == CollectionType.FAVORITES or query.is_favorite is not None:
+        columns.add("is_favorite")
+    if query.has_gps is not None:
+        columns.add("has_gps")
+    if query.search_text:
+        columns.add("search")
+    if query.person_ids:
+        columns.add("people")
+    return frozenset(columns)
+
+
 def _utc_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _queued_write(priority: WritePriority) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Run the decorated repository method as a command on the index writer."""
+
+    def decorate(method: Callable[..., _T]) -> Callable[..., _T]:
+        @functools.wraps(method)
+        def wrapper(self: "AssetRepository", *args: Any, **kwargs: Any) -> _T:
+            return self._write(lambda: method(self, *args, **kwargs), priority)
+
+        return wrapper
+
+    return decorate
+
+
 def get_global_repository(library_root: Path) -> "AssetRepository":
     """Get or create the global AssetRepository singleton for a library.
     
@@ -157,6 +249,12 @@ class AssetRepository:
     - `append_rows`: Uses INSERT OR REPLACE (upsert) to avoid duplicates
     - `upsert_row`: Single-row upsert operation
     - Unique constraint on `rel` (file path) prevents duplicate entries
+
+    Write methods are executed by a dedicated :class:`IndexWriter` thread
+    that group-commits interactive mutations and schedules them ahead of
+    bulk scan merges; the calling thread waits for the commit.  Inside
+    :meth:`transaction` they run inline on the caller's connection.  Reads
+    use a pooled connection per thread.
     
     Note: For the global database singleton, use `get_global_repository()`.
     """
@@ -172,6 +270,7 @@ class AssetRepository:
         self.path = ensure_work_dir(library_root) / GLOBAL_INDEX_DB_NAME
         
         self._db_manager = DatabaseManager(self.path)
+        self._writer = IndexWriter(self._db_manager)
         self._conn: Optional[sqlite3.Connection] = None
         self._collection_anchor_cache: dict[
             CollectionQuery,
@@ -206,12 +305,49 @@ class AssetRepository:
         """
         return self._db_manager.transaction(begin_mode=begin_mode)
 
+    def submit_write(
+        self,
+        fn: Callable[[], _T],
+        *,
+        priority: WritePriority = WritePriority.INTERACTIVE,
+    ) -> "Future[_T]":
+        """Queue *fn* on the index writer without waiting for it to commit.
+
+        Repository write methods called from *fn* join the writer's
+        transaction.  The returned future resolves after the commit.
+        """
+        if self._writer.owns_current_thread() or self._writer.closed:
+            future: Future = Future()
+            try:
+                future.set_result(fn())
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        return self._writer.submit(fn, priority)
+
+    def commit_latency_histograms(self) -> Dict[str, Dict[str, Any]]:
+        """Return submit-to-commit latency histograms keyed by write priority."""
+        return self._writer.commit_latency_histograms()
+
+    def _write(self, fn: Callable[[], _T], priority: WritePriority) -> _T:
+        # Writes already inside a transaction on this thread must join it:
+        # queueing them would deadlock against the lock that transaction holds.
+        if (
+            self._writer.owns_current_thread()
+            or self._writer.closed
+            or self._db_manager._conn is not None
+        ):
+            return fn()
+        return self._writer.submit(fn, priority).result()
+
     def close(self) -> None:
         """Close any active database connections.
         
         This method should be called when the repository is no longer needed,
-        particularly when resetting the global singleton.
+        particularly when resetting the global singleton.  Queued writes are
+        committed before the writer thread stops.
         """
+        self._writer.close()
         self._db_manager.close()
         if self._conn is not None:
             try:
@@ -222,6 +358,7 @@ class AssetRepository:
             finally:
                 self._conn = None
 
+    @_queued_write(WritePriority.BULK)
     def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
         """Rewrite the entire index with *rows*."""
         stamped_rows = self._stamp_rows(rows)
@@ -230,6 +367,7 @@ class AssetRepository:
             self._insert_rows(conn, stamped_rows)
         self._clear_collection_anchor_cache()
 
+    @_queued_write(WritePriority.BULK)
     def append_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
         """Merge *rows* into the index, replacing duplicates by ``rel`` key."""
         stamped_rows = self._stamp_rows(rows)
@@ -237,6 +375,7 @@ class AssetRepository:
             self._insert_rows(conn, stamped_rows)
         self._clear_collection_anchor_cache()
 
+    @_queued_write(WritePriority.BULK)
     def merge_scan_rows(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge scanned rows while preserving persisted library-managed state.
 
@@ -285,6 +424,7 @@ class AssetRepository:
         self._clear_collection_anchor_cache()
         return merged_rows
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def upsert_row(self, rel: str, row: Dict[str, Any]) -> None:
         """Insert or update a single row identified by *rel*."""
         row_data = row.copy()
@@ -303,6 +443,7 @@ class AssetRepository:
             stamped.append(row_data)
         return stamped
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def remove_rows(self, rels: Iterable[str]) -> None:
         """Drop any index rows whose ``rel`` key matches *rels*."""
         removable = list(rels)
@@ -314,6 +455,61 @@ class AssetRepository:
         self._db_manager.execute_in_transaction(query, removable)
         self._clear_collection_anchor_cache()
 
+    @_queued_write(WritePriority.INTERACTIVE)
+    def move_rows(self, moves: Iterable[Dict[str, Any]]) -> int:
+        """Re-key moved rows in place with one set-based ``UPDATE``.
+
+        Each move maps ``old_rel`` to its new ``rel`` and carries the values
+        of the other ``_MOVE_COLUMNS`` for the destination (album path,
+        trash state and restore annotations, thumbnail cache key).  Every
+        other column, metadata and micro thumbnail included, stays on the
+        row untouched.  Unrelated rows already stored under a destination
+        ``rel`` are replaced, matching ``append_rows``.
+
+        Returns:
+            The number of rows re-keyed.
+        """
+        payload = [
+            (str(move["old_rel"]), *(move.get(column) for column in _MOVE_COLUMNS))
+            for move in moves
+            if move.get("old_rel") and move.get("rel")
+        ]
+        if not payload:
+            return 0
+
+        columns = ", ".join(_MOVE_COLUMNS)
+        with self.transaction() as conn:
+            conn.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS moved_rows (old_rel TEXT PRIMARY KEY, {columns})"
+            )
+            conn.execute("DELETE FROM temp.moved_rows")
+            placeholders = ", ".join(["?"] * (len(_MOVE_COLUMNS) + 1))
+            conn.executemany(
+                f"INSERT OR REPLACE INTO temp.moved_rows (old_rel, {columns}) "
+                f"VALUES ({placeholders})",
+                payload,
+            )
+            conn.execute(
+                "DELETE FROM assets WHERE rel IN (SELECT rel FROM temp.moved_rows) "
+                "AND rel NOT IN (SELECT old_rel FROM temp.moved_rows)"
+            )
+            cursor = conn.execute(
+                f"""
+                UPDATE assets SET ({columns}) = (
+                    SELECT {columns} FROM temp.moved_rows
+                    WHERE temp.moved_rows.old_rel = assets.rel
+                ),
+                    index_updated_at_ms = ?,
+                    index_revision = COALESCE(index_revision, 0) + 1
+                WHERE rel IN (SELECT old_rel FROM temp.moved_rows)
+                """,
+                (_utc_ms(),),
+            )
+            moved = cursor.rowcount
+            conn.execute("DELETE FROM temp.moved_rows")
+        self._clear_collection_anchor_cache()
+        return moved
+
     def get_rows_by_rels(self, rels: Iterable[str]) -> Dict[str, Dict[str, Any]]:
         """Return a mapping of ``rel`` → row dict for the given *rels*.
 
@@ -407,6 +603,7 @@ class AssetRepository:
             if should_close:
                 conn.close()
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_face_status(self, asset_id: str, status: str) -> None:
         """Update the ``face_status`` for a single asset row."""
 
@@ -418,6 +615,7 @@ class AssetRepository:
             (normalized, asset_id),
         )
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_face_statuses(self, asset_ids: Iterable[str], status: str) -> None:
         """Update the ``face_status`` for multiple assets."""
 
@@ -503,21 +701,118 @@ class AssetRepository:
                 conn.close()
 
     def read_geotagged(self) -> Iterator[Dict[str, Any]]:
-        """Yield only rows that contain GPS metadata."""
+        """Yield only rows that contain GPS metadata.
+
+        Rows carry the map-facing columns only, with ``gps`` rebuilt from the
+        numeric ``gps_lat``/``gps_lon`` columns.
+        """
         conn = self._db_manager.get_connection()
         should_close = (conn != self._db_manager._conn)
 
         try:
-            query = "SELECT * FROM assets WHERE gps IS NOT NULL"
+            query = (
+                f"SELECT {self._geo_feed_select(conn)} FROM assets "
+                "WHERE gps_lat IS NOT NULL AND gps_lon IS NOT NULL"
+            )
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute(query)
             for row in cursor:
-                yield self._db_row_to_dict(row)
+                yield self._geo_row_to_dict(row)
+        finally:
+            if should_close:
+                conn.close()
+
+    def geo_revision(self) -> int:
+        """Return the latest revision recorded in the geotagged change log."""
+
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            row = conn.execute(
+                "SELECT COALESCE(MAX(revision), 0) FROM geo_changes"
+            ).fetchone()
+            return int(row[0] if row else 0)
+        finally:
+            if should_close:
+                conn.close()
+
+    def read_geotagged_changes(self, since_revision: int) -> GeoFeedDelta:
+        """Return geotagged rows changed after *since_revision*.
+
+        Rows that were deleted or lost their coordinates are reported in
+        ``removed_rels``; everything else comes back in the same shape as
+        :meth:`read_geotagged`.
+        """
+
+        started = monotonic_ms()
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            select_columns = self._geo_feed_select(conn, table="assets")
+            conn.row_factory = sqlite3.Row
+            revision = int(since_revision)
+            rows: List[Dict[str, Any]] = []
+            removed: List[str] = []
+            cursor = conn.execute(
+                f"SELECT geo_changes.rel AS change_rel, geo_changes.revision AS change_revision, "
+                f"{select_columns} FROM geo_changes "
+                "LEFT JOIN assets ON assets.rel = geo_changes.rel "
+                "WHERE geo_changes.revision > ? ORDER BY geo_changes.revision",
+                (revision,),
+            )
+            for db_row in cursor:
+                revision = max(revision, int(db_row["change_revision"]))
+                if db_row["gps_lat"] is None or db_row["gps_lon"] is None:
+                    removed.append(str(db_row["change_rel"]))
+                    continue
+                rows.append(self._geo_row_to_dict(db_row))
+            emit_perf_event(
+                "geo_feed_delta",
+                elapsed_ms=round(monotonic_ms() - started, 3),
+                since_revision=int(since_revision),
+                revision=revision,
+                rows=len(rows),
+                removed=len(removed),
+            )
+            return GeoFeedDelta(revision=revision, rows=rows, removed_rels=tuple(removed))
         finally:
             if should_close:
                 conn.close()
 
+    @staticmethod
+    def _geo_feed_select(conn: sqlite3.Connection, table: str | None = None) -> str:
+        """Return the geo feed select list for the ``assets`` schema of *conn*.
+
+        Databases that still carry a ``metadata`` column expose it for rows
+        without a ``location`` so the ``metadata["location"]`` fallback of
+        :func:`geotagged_asset_from_row` keeps working.
+        """
+
+        prefix = f"{table}." if table else ""
+        columns = [f"{prefix}{column}" for column in _GEO_FEED_COLUMNS]
+        table_columns = {str(row[1]) for row in conn.execute("PRAGMA table_info(assets)")}
+        if "metadata" in table_columns:
+            columns.append(
+                f"CASE WHEN TRIM(COALESCE({prefix}location, '')) = '' "
+                f"THEN {prefix}metadata END AS metadata"
+            )
+        return ", ".join(columns)
+
+    @staticmethod
+    def _geo_row_to_dict(db_row: sqlite3.Row) -> Dict[str, Any]:
+        row = {column: db_row[column] for column in _GEO_FEED_COLUMNS}
+        row["gps"] = {"lat": row.pop("gps_lat"), "lon": row.pop("gps_lon")}
+        metadata = db_row["metadata"] if "metadata" in db_row.keys() else None
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except json.JSONDecodeError:
+                metadata = None
+        if isinstance(metadata, dict):
+            row["metadata"] = metadata
+        return row
+
     def get_assets_page(
         self,
         cursor_dt: Optional[str] = None,
@@ -784,6 +1079,210 @@ class AssetRepository:
             if should_close:
                 conn.close()
 
+    def search_assets(
+        self,
+        query: CollectionQuery,
+        first: int = 0,
+        limit: int = 100,
+    ) -> WindowResult:
+        """Return one page of full-text search results ranked by relevance.
+
+        ``query.search_text`` is parsed with
+        :func:`~iPhoto.cache.index_store.queries.parse_search_query`; the
+        remaining collection filters narrow the hits.  An empty or
+        exclusion-only query yields an empty window.
+        """
+
+        first = max(0, int(first))
+        limit = max(0, int(limit))
+        try:
+            sql, params = QueryBuilder.build_search_query(query, limit=limit, offset=first)
+            count_sql, count_params = QueryBuilder.build_search_query(
+                query,
+                select_clause="SELECT COUNT(*)",
+                include_order=False,
+            )
+        except ValueError:
+            return WindowResult(first=first, rows=[], total_count=0, collection_revision=0)
+
+        started = monotonic_ms()
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            conn.row_factory = sqlite3.Row
+            rows = [self._db_row_to_dict(row) for row in conn.execute(sql, params)]
+            total_row = conn.execute(count_sql, count_params).fetchone()
+            total_count = int(total_row[0] if total_row else 0)
+            revision_row = conn.execute(
+                "SELECT COALESCE(MAX(index_revision), 0) FROM assets"
+            ).fetchone()
+            emit_perf_event(
+                "search_query",
+                elapsed_ms=round(monotonic_ms() - started, 3),
+                rows=len(rows),
+                total_count=total_count,
+                first=first,
+                limit=limit,
+                query_plan=self._explain_query_plan(conn, sql, params),
+            )
+            return WindowResult(
+                first=first,
+                rows=rows,
+                total_count=total_count,
+                collection_revision=int(revision_row[0] if revision_row else 0),
+            )
+        finally:
+            if should_close:
+                conn.close()
+
+    @_queued_write(WritePriority.BULK)
+    def replace_asset_people(
+        self,
+        rows: Iterable[Tuple[str, str, str]],
+        *,
+        person_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Replace the searchable ``(asset_id, person_id, name)`` memberships.
+
+        With *person_ids* only the memberships of those people are replaced.
+        Only rows that actually changed are deleted or inserted so the
+        ``asset_people`` triggers refresh the minimum number of search
+        entries.
+        """
+
+        scope = (
+            tuple(dict.fromkeys(str(person_id) for person_id in person_ids if person_id))
+            if person_ids is not None
+            else None
+        )
+        if scope is not None and not scope:
+            return
+        desired = {
+            (str(asset_id), str(person_id)): str(name)
+            for asset_id, person_id, name in rows
+            if asset_id and person_id and name and (scope is None or str(person_id) in scope)
+        }
+        with self.transaction() as conn:
+            if scope is None:
+                cursors = [conn.execute("SELECT asset_id, person_id, name FROM asset_people")]
+            else:
+                cursors = []
+                for start in range(0, len(scope), 900):
+                    chunk = scope[start : start + 900]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    cursors.append(
+                        conn.execute(
+                            "SELECT asset_id, person_id, name FROM asset_people "
+                            f"WHERE person_id IN ({placeholders})",
+                            chunk,
+                        )
+                    )
+            current = {
+                (str(asset_id), str(person_id)): str(name)
+                for cursor in cursors
+                for asset_id, person_id, name in cursor
+            }
+            stale = [key for key, name in current.items() if desired.get(key) != name]
+            fresh = [
+                (asset_id, person_id, name)
+                for (asset_id, person_id), name in desired.items()
+                if current.get((asset_id, person_id)) != name
+            ]
+            conn.executemany(
+                "DELETE FROM asset_people WHERE asset_id = ? AND person_id = ?",
+                stale,
+            )
+            conn.executemany(
+                "INSERT INTO asset_people (asset_id, person_id, name) VALUES (?, ?, ?)",
+                fresh,
+            )
+        if stale or fresh:
+            self._invalidate_collection_caches({"search"})
+
+    def get_asset_ids_for_persons(self, person_ids: Iterable[str]) -> List[str]:
+        """Return ids of the indexed assets showing every one of *person_ids*."""
+
+        members = tuple(dict.fromkeys(str(person_id) for person_id in person_ids if person_id))
+        if not members:
+            return []
+        where_clauses, params = QueryBuilder.build_collection_where(
+            CollectionQuery(
+                collection_type=CollectionType.PEOPLE,
+                person_ids=members,
+                min_thumbnail_state=None,
+            )
+        )
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            rows = conn.execute(
+                f"SELECT id FROM assets WHERE {' AND '.join(where_clauses)}",
+                params,
+            ).fetchall()
+            return [str(row[0]) for row in rows]
+        finally:
+            if should_close:
+                conn.close()
+
+    @_queued_write(WritePriority.BULK)
+    def replace_person_assets(
+        self,
+        rows: Iterable[Tuple[str, str]],
+        *,
+        person_ids: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Replace the ``(asset_id, person_id)`` People cluster memberships.
+
+        With *person_ids* only the memberships of those people are replaced
+        and the rest of the table is left alone.  Only the pairs that changed
+        are written, and only collections that filter on People membership
+        lose their cached counts and anchors.
+        """
+
+        scope = (
+            tuple(dict.fromkeys(str(person_id) for person_id in person_ids if person_id))
+            if person_ids is not None
+            else None
+        )
+        if scope is not None and not scope:
+            return
+        desired = {
+            (str(person_id), str(asset_id))
+            for asset_id, person_id in rows
+            if asset_id and person_id and (scope is None or str(person_id) in scope)
+        }
+        with self.transaction() as conn:
+            current: set[Tuple[str, str]] = set()
+            if scope is None:
+                cursors = [conn.execute("SELECT person_id, asset_id FROM person_assets")]
+            else:
+                cursors = []
+                for start in range(0, len(scope), 900):
+                    chunk = scope[start : start + 900]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    cursors.append(
+                        conn.execute(
+                            "SELECT person_id, asset_id FROM person_assets "
+                            f"WHERE person_id IN ({placeholders})",
+                            chunk,
+                        )
+                    )
+            for cursor in cursors:
+                current.update((str(person_id), str(asset_id)) for person_id, asset_id in cursor)
+            stale = sorted(current - desired)
+            fresh = sorted(desired - current)
+            conn.executemany(
+                "DELETE FROM person_assets WHERE person_id = ? AND asset_id = ?",
+                stale,
+            )
+            conn.executemany(
+                "INSERT INTO person_assets (person_id, asset_id) VALUES (?, ?)",
+                fresh,
+            )
+        if stale or fresh:
+            self._invalidate_collection_caches({"people"})
+
+    @_queued_write(WritePriority.INTERACTIVE)
     def create_scan_job(
         self,
         *,
@@ -809,6 +1308,7 @@ class AssetRepository:
                 [job_id, root, scope, status, stage, now, now],
             )
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_scan_job_stage(
         self,
         job_id: str,
@@ -846,6 +1346,7 @@ class AssetRepository:
                 params,
             )
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def append_scan_event(
         self,
         job_id: str,
@@ -897,6 +1398,144 @@ class AssetRepository:
             if should_close:
                 conn.close()
 
+    @_queued_write(WritePriority.INTERACTIVE)
+    def resume_scan_job(self, job_id: str) -> set[str]:
+        """Reopen an interrupted scan job and return its committed directories.
+
+        The job keeps its id, checkpoints and event history so throughput
+        figures can continue from where the previous run stopped.
+        """
+
+        now = _utc_ms()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE scan_jobs
+                SET status = 'running', finished_at = NULL, updated_at = ?
+                WHERE job_id = ?
+                """,
+                [now, job_id],
+            )
+            rows = conn.execute(
+                "SELECT rel_dir FROM scan_checkpoints WHERE job_id = ?",
+                [job_id],
+            ).fetchall()
+        return {str(row[0]) for row in rows}
+
+    @_queued_write(WritePriority.INTERACTIVE)
+    def record_scan_checkpoint(
+        self,
+        job_id: str,
+        rel_dirs: Iterable[str],
+        *,
+        found_count: int | None = None,
+        processed_count: int | None = None,
+    ) -> None:
+        """Record directories whose scan rows have all been committed.
+
+        ``discovery_cursor`` advances to the last directory in *rel_dirs*,
+        which follows the scanner's sorted walk order.
+        """
+
+        dirs = list(dict.fromkeys(rel_dirs))
+        now = _utc_ms()
+        assignments = ["updated_at = ?"]
+        params: list[Any] = [now]
+        if dirs:
+            assignments.append("discovery_cursor = ?")
+            params.append(dirs[-1])
+        for column, value in (
+            ("found_count", found_count),
+            ("processed_count", processed_count),
+        ):
+            if value is not None:
+                assignments.append(f"{column} = ?")
+                params.append(value)
+        params.append(job_id)
+        with self.transaction() as conn:
+            if dirs:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO scan_checkpoints (job_id, rel_dir, committed_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    [(job_id, rel_dir, now) for rel_dir in dirs],
+                )
+            conn.execute(
+                f"UPDATE scan_jobs SET {', '.join(assignments)} WHERE job_id = ?",
+                params,
+            )
+
+    def scan_job_progress(self, job_id: str) -> ScanJobProgress | None:
+        """Return throughput and ETA figures for one scan job.
+
+        The rate only covers ``batch_committed`` events of the current run
+        (after the latest ``resumed`` event), so the idle time between an
+        interruption and its resume does not drag the average down.
+        """
+
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            job = conn.execute(
+                """
+                SELECT status, found_count, processed_count, started_at,
+                       discovery_cursor,
+                       (SELECT COUNT(*) FROM scan_checkpoints WHERE job_id = scan_jobs.job_id)
+                FROM scan_jobs
+                WHERE job_id = ?
+                """,
+                [job_id],
+            ).fetchone()
+            if job is None:
+                return None
+            status, found, processed, started_at, cursor, checkpointed = job
+            resumed = conn.execute(
+                """
+                SELECT event_id, created_at FROM scan_events
+                WHERE job_id = ? AND event_type = 'resumed'
+                ORDER BY event_id DESC LIMIT 1
+                """,
+                [job_id],
+            ).fetchone()
+            after_event_id, segment_started_at = resumed or (0, started_at)
+            committed_rows, last_committed_at = conn.execute(
+                """
+                SELECT COALESCE(SUM(json_extract(payload_json, '$.rows')), 0),
+                       MAX(created_at)
+                FROM scan_events
+                WHERE job_id = ? AND event_type = 'batch_committed' AND event_id > ?
+                """,
+                [job_id, after_event_id],
+            ).fetchone()
+        finally:
+            if should_close:
+                conn.close()
+
+        found_count = int(found or 0)
+        processed_count = int(processed or 0)
+        rows_per_second: float | None = None
+        if committed_rows and last_committed_at and segment_started_at:
+            elapsed_s = (int(last_committed_at) - int(segment_started_at)) / 1000
+            if elapsed_s > 0:
+                rows_per_second = round(int(committed_rows) / elapsed_s, 3)
+        eta_seconds: float | None = None
+        if status in ("scanned", "completed"):
+            eta_seconds = 0.0
+        elif rows_per_second:
+            remaining = max(0, found_count - processed_count)
+            eta_seconds = round(remaining / rows_per_second, 1)
+        return ScanJobProgress(
+            job_id=job_id,
+            status=str(status or ""),
+            found_count=found_count,
+            processed_count=processed_count,
+            checkpointed_dirs=int(checkpointed or 0),
+            discovery_cursor=cursor,
+            rows_per_second=rows_per_second,
+            eta_seconds=eta_seconds,
+        )
+
     def read_collection_page(
         self,
         query: CollectionQuery,
@@ -1341,21 +1980,9 @@ class AssetRepository:
         query: CollectionQuery,
         state: str,
     ) -> CollectionQuery:
-        return CollectionQuery(
-            collection_type=query.collection_type,
-            album_path=query.album_path,
-            include_subalbums=query.include_subalbums,
-            media_types=query.media_types,
-            is_favorite=query.is_favorite,
-            has_gps=query.has_gps,
-            date_from=query.date_from,
-            date_to=query.date_to,
-            search_text=query.search_text,
-            sort_key=query.sort_key,
-            sort_direction=query.sort_direction,
-            min_thumbnail_state=state,
-        )
+        return dataclasses.replace(query, min_thumbnail_state=state)
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_thumbnail_ready(
         self,
         rel: str,
@@ -1367,6 +1994,7 @@ class AssetRepository:
         """Update thumbnail readiness for a single asset row."""
 
         normalized_rel = unicodedata.normalize("NFC", str(rel))
+        was_listed = self._thumbnail_is_listed(normalized_rel)
         if error:
             self._db_manager.execute_in_transaction(
                 """
@@ -1395,26 +2023,108 @@ class AssetRepository:
                 """,
                 [micro_thumbnail, thumb_cache_key, _utc_ms(), normalized_rel],
             )
-        self._clear_collection_anchor_cache()
+        # Regenerating an already-listed thumbnail leaves every collection's
+        # membership untouched, so keyset anchors survive; only ready-state
+        # transitions move rows.  ``index_revision`` moved either way.
+        membership_changed = was_listed is not None and was_listed != (error is None)
+        self._invalidate_collection_caches(
+            {"thumbnail_state"} if membership_changed else (),
+            revision_changed=True,
+        )
 
-    def _cursor_for_collection_offset(
-        self,
-        conn: sqlite3.Connection,
-        query: CollectionQuery,
-        offset: int,
-    ) -> PageCursor | None:
-        """Return the keyset cursor immediately before *offset* without deep OFFSET."""
+    def _thumbnail_is_listed(self, rel: str) -> bool | None:
+        """Return whether *rel* currently passes the ready-thumbnail filter."""
 
-        if offset <= 0:
-            return None
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            row = conn.execute(
+                "SELECT thumbnail_state = 'ready' AND TRIM(COALESCE(thumb_cache_key, '')) != '' "
+                "FROM assets WHERE rel = ?",
+                (rel,),
+            ).fetchone()
+            return None if row is None else bool(row[0])
+        finally:
+            if should_close:
+                conn.close()
 
-        anchors = self._collection_anchor_cache.setdefault(query, {0: None})
-        anchor_index = max(index for index in anchors if index <= offset)
-        cursor = anchors[anchor_index]
+    def read_legacy_micro_thumbnails(
+        self,
+        after_rel: str | None = None,
+        limit: int = 256,
+    ) -> list[tuple[str, bytes]]:
+        """Return ``(rel, blob)`` pairs whose micro thumbnail predates the raw format.
 
-        while anchor_index < offset:
-            step = min(_DEEP_SEEK_CHUNK_SIZE, offset - anchor_index)
-            sql, params = QueryBuilder.build_collection_query(
+        Rows come back in ``rel`` order after *after_rel*, so a migration can
+        walk the table once with a keyset cursor.
+        """
+
+        limit = max(0, int(limit))
+        if limit <= 0:
+            return []
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            rows = conn.execute(
+                """
+                SELECT rel, micro_thumbnail FROM assets
+                WHERE rel > ?
+                  AND micro_thumbnail IS NOT NULL
+                  AND substr(micro_thumbnail, 1, 4) != ?
+                ORDER BY rel
+                LIMIT ?
+                """,
+                (after_rel or "", MICRO_THUMBNAIL_MAGIC, limit),
+            ).fetchall()
+            return [(str(row[0]), bytes(row[1])) for row in rows]
+        finally:
+            if should_close:
+                conn.close()
+
+    @_queued_write(WritePriority.BULK)
+    def replace_micro_thumbnails(
+        self,
+        updates: Iterable[tuple[str, bytes, bytes | None]],
+    ) -> int:
+        """Swap micro thumbnails given as ``(rel, expected, replacement)``.
+
+        Rows whose blob changed since it was read are left alone.  A ``None``
+        replacement clears the micro layer so thumbnail backfill regenerates
+        it.  Returns the number of rows updated.
+        """
+
+        params = [
+            (replacement, str(rel), expected)
+            for rel, expected, replacement in updates
+        ]
+        if not params:
+            return 0
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE assets SET micro_thumbnail = ? WHERE rel = ? AND micro_thumbnail = ?",
+                params,
+            )
+            return conn.total_changes - before
+
+    def _cursor_for_collection_offset(
+        self,
+        conn: sqlite3.Connection,
+        query: CollectionQuery,
+        offset: int,
+    ) -> PageCursor | None:
+        """Return the keyset cursor immediately before *offset* without deep OFFSET."""
+
+        if offset <= 0:
+            return None
+
+        anchors = self._collection_anchor_cache.setdefault(query, {0: None})
+        anchor_index = max(index for index in anchors if index <= offset)
+        cursor = anchors[anchor_index]
+
+        while anchor_index < offset:
+            step = min(_DEEP_SEEK_CHUNK_SIZE, offset - anchor_index)
+            sql, params = QueryBuilder.build_collection_query(
                 query,
                 cursor=cursor,
                 limit=step,
@@ -1507,6 +2217,80 @@ class AssetRepository:
             if should_close:
                 conn.close()
 
+    def read_live_pair_candidates(
+        self,
+        album_path: Optional[str],
+        *,
+        content_ids: Iterable[str] = (),
+        sort_ts_windows: Iterable[Tuple[int, int]] = (),
+    ) -> List[Dict[str, Any]]:
+        """Return unpaired rows that could complete a Live Photo with new files.
+
+        A row qualifies when it has no ``live_partner_rel`` and either shares
+        one of *content_ids* or has a ``sort_ts`` inside one of the inclusive
+        *sort_ts_windows*.  The lookup is scoped like :meth:`read_album_assets`
+        with sub-albums included, so pairing freshly imported files never
+        needs to read the rest of the album.
+        """
+
+        cids = sorted({str(cid) for cid in content_ids if cid})
+        windows = sorted(
+            (int(start), int(stop)) for start, stop in sort_ts_windows if start <= stop
+        )
+        merged: List[Tuple[int, int]] = []
+        for start, stop in windows:
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+            else:
+                merged.append((start, stop))
+        if not cids and not merged:
+            return []
+
+        album_where, album_params = QueryBuilder.build_album_filter(album_path, True)
+        scope_sql = " AND ".join(["live_partner_rel IS NULL", *album_where])
+        statements: List[Tuple[str, List[Any]]] = []
+        for offset in range(0, len(cids), _SQLITE_PARAM_CHUNK_SIZE):
+            chunk = cids[offset : offset + _SQLITE_PARAM_CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            statements.append(
+                (
+                    f"SELECT * FROM assets WHERE {scope_sql} "
+                    f"AND content_id IN ({placeholders})",
+                    [*album_params, *chunk],
+                )
+            )
+        for start, stop in merged:
+            statements.append(
+                (
+                    f"SELECT * FROM assets WHERE {scope_sql} "
+                    "AND sort_ts BETWEEN ? AND ?",
+                    [*album_params, start, stop],
+                )
+            )
+
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        started = monotonic_ms()
+        rows: Dict[str, Dict[str, Any]] = {}
+        try:
+            conn.row_factory = sqlite3.Row
+            for sql, params in statements:
+                for row in conn.execute(sql, params):
+                    data = self._db_row_to_dict(row)
+                    rows.setdefault(str(data.get("rel")), data)
+            return list(rows.values())
+        finally:
+            emit_perf_event(
+                "read_live_pair_candidates",
+                elapsed_ms=round(monotonic_ms() - started, 3),
+                rows=len(rows),
+                content_ids=len(cids),
+                windows=len(merged),
+            )
+            if should_close:
+                conn.close()
+
+    @_queued_write(WritePriority.INTERACTIVE)
     def set_favorite_status(self, rel: str, is_favorite: bool) -> None:
         """Toggle the favorite status for a single asset efficiently."""
         val = 1 if is_favorite else 0
@@ -1514,8 +2298,9 @@ class AssetRepository:
             "UPDATE assets SET is_favorite = ? WHERE rel = ?",
             (val, rel),
         )
-        self._clear_collection_anchor_cache()
+        self._invalidate_collection_caches({"is_favorite"})
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def sync_favorites(self, featured_rels: Iterable[str]) -> None:
         """Synchronise the DB 'is_favorite' column with the provided list."""
         featured_rels_list = list(featured_rels)
@@ -1562,15 +2347,48 @@ class AssetRepository:
                     "UPDATE assets SET is_favorite = 1 WHERE rel = ?",
                     [(r,) for r in to_add_original],
                 )
-        self._clear_collection_anchor_cache()
+        self._invalidate_collection_caches({"is_favorite"})
 
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_location(self, rel: str, location: str) -> None:
         """Update the location string for a single asset."""
         self._db_manager.execute_in_transaction(
             "UPDATE assets SET location = ? WHERE rel = ?",
             (location, rel),
         )
+        self._invalidate_collection_caches({"search"})
 
+    @_queued_write(WritePriority.BULK)
+    def update_asset_details(
+        self,
+        rel: str,
+        details: Dict[str, Any],
+        extended_meta: str,
+    ) -> bool:
+        """Fill extracted detail columns of *rel* and store its extended metadata.
+
+        Only ``_ASSET_DETAIL_COLUMNS`` with a value in *details* are written,
+        so a late extraction never blanks what the scan already recorded.
+        Returns whether the row exists.
+        """
+
+        values = {
+            column: details[column]
+            for column in _ASSET_DETAIL_COLUMNS
+            if details.get(column) is not None
+        }
+        assignments = [f"{column} = ?" for column in values] + ["extended_meta = ?"]
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE assets SET {', '.join(assignments)} WHERE rel = ?",
+                [*values.values(), extended_meta, rel],
+            )
+            updated = cursor.rowcount > 0
+        if updated and values:
+            self._invalidate_collection_caches({"search"})
+        return updated
+
+    @_queued_write(WritePriority.INTERACTIVE)
     def update_asset_geodata(
         self,
         rel: str,
@@ -1583,9 +2401,12 @@ class AssetRepository:
 
         gps_payload = json.dumps(gps) if gps is not None else None
         has_gps = 1 if gps is not None else 0
+        gps_lat, gps_lon = gps_coordinates(gps)
         with self.transaction() as conn:
-            update_parts = ["gps = ?", "has_gps = ?", "location = ?"]
-            params: list[Any] = [gps_payload, has_gps, location]
+            update_parts = [
+                "gps = ?", "gps_lat = ?", "gps_lon = ?", "has_gps = ?", "location = ?",
+            ]
+            params: list[Any] = [gps_payload, gps_lat, gps_lon, has_gps, location]
 
             columns = {
                 str(row[1])
@@ -1635,8 +2456,9 @@ class AssetRepository:
                 f"UPDATE assets SET {', '.join(update_parts)} WHERE rel = ?",
                 params,
             )
-        self._clear_collection_anchor_cache()
+        self._invalidate_collection_caches({"has_gps", "search"})
 
+    @_queued_write(WritePriority.BULK)
     def apply_live_role_updates(
         self,
         updates: List[Tuple[str, int, Optional[str]]],
@@ -1660,6 +2482,7 @@ class AssetRepository:
             conn.executemany(query, params)
         self._clear_collection_anchor_cache()
 
+    @_queued_write(WritePriority.BULK)
     def apply_live_role_updates_for_prefix(
         self,
         prefix: str,
@@ -1679,22 +2502,467 @@ class AssetRepository:
             conn.executemany(query, params)
         self._clear_collection_anchor_cache()
 
+    @_queued_write(WritePriority.BULK)
+    def assign_live_roles(
+        self,
+        updates: List[Tuple[str, int, Optional[str]]],
+    ) -> None:
+        """Set live_role/live_partner_rel for the listed rels only.
+
+        Unlike :meth:`apply_live_role_updates_for_prefix` no other row is
+        reset, which lets an import attach new pairs without touching the
+        roles already stored for the rest of the album.
+        """
+        if not updates:
+            return
+        with self.transaction() as conn:
+            conn.executemany(
+                "UPDATE assets SET live_role = ?, live_partner_rel = ? WHERE rel = ?",
+                [(role, partner, rel) for rel, role, partner in updates],
+            )
+        self._clear_collection_anchor_cache()
+
+    def find_album_path_by_id(self, album_id: str) -> Optional[str]:
+        """Return the registered library-relative path for *album_id*.
+
+        ``""`` denotes the library root; ``None`` means the id is unknown.
+        Ids compare case-insensitively like manifest lookups elsewhere.
+        """
+
+        if not album_id:
+            return None
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            row = conn.execute(
+                "SELECT album_path FROM album_registry WHERE album_id = ?",
+                (album_id.strip(),),
+            ).fetchone()
+            return str(row[0]) if row is not None else None
+        finally:
+            if should_close:
+                conn.close()
+
+    def read_album_registry(self) -> Dict[str, Tuple[str, Optional[int]]]:
+        """Return ``album_path`` → ``(album_id, manifest_mtime_ns)``."""
+
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            return {
+                str(album_path): (str(album_id), mtime_ns)
+                for album_id, album_path, mtime_ns in conn.execute(
+                    "SELECT album_id, album_path, manifest_mtime_ns FROM album_registry"
+                )
+            }
+        finally:
+            if should_close:
+                conn.close()
+
+    def read_album_covers(self) -> Dict[str, Optional[str]]:
+        """Return ``album_path`` → manifest cover (album-relative) of registered albums."""
+
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            return {
+                str(album_path): cover_rel or None
+                for album_path, cover_rel in conn.execute(
+                    "SELECT album_path, cover_rel FROM album_registry"
+                )
+            }
+        finally:
+            if should_close:
+                conn.close()
+
+    @_queued_write(WritePriority.INTERACTIVE)
+    def update_album_registry(
+        self,
+        entries: Iterable[Tuple[str, str, Optional[int], Optional[str]]],
+        *,
+        removed_paths: Iterable[str] = (),
+    ) -> None:
+        """Record ``(album_id, album_path, manifest_mtime_ns, cover_rel)`` registrations.
+
+        An album path maps to exactly one id, so registering a path drops any
+        other id previously stored for it.  *removed_paths* are forgotten.
+        """
+
+        now = _utc_ms()
+        with self.transaction() as conn:
+            conn.executemany(
+                "DELETE FROM album_registry WHERE album_path = ?",
+                [(str(path),) for path in removed_paths],
+            )
+            for album_id, album_path, mtime_ns, cover_rel in entries:
+                conn.execute(
+                    "DELETE FROM album_registry WHERE album_path = ? AND album_id != ?",
+                    (album_path, album_id),
+                )
+                conn.execute(
+                    """
+                    INSERT INTO album_registry (
+                        album_id, album_path, manifest_mtime_ns, updated_at, cover_rel
+                    ) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT(album_id) DO UPDATE SET
+                        album_path = excluded.album_path,
+                        manifest_mtime_ns = excluded.manifest_mtime_ns,
+                        updated_at = excluded.updated_at,
+                        cover_rel = excluded.cover_rel
+                    """,
+                    (album_id, album_path, mtime_ns, now, cover_rel),
+                )
+
+    def read_trash_entries(self, rels: Iterable[str]) -> Dict[str, TrashLedgerEntry]:
+        """Return the trash ledger entries recorded for *rels*."""
+
+        rels_list = list(dict.fromkeys(str(rel) for rel in rels))
+        if not rels_list:
+            return {}
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            entries: Dict[str, TrashLedgerEntry] = {}
+            for offset in range(0, len(rels_list), _SQLITE_PARAM_CHUNK_SIZE):
+                chunk = rels_list[offset : offset + _SQLITE_PARAM_CHUNK_SIZE]
+                placeholders = ", ".join(["?"] * len(chunk))
+                cursor = conn.execute(
+                    f"SELECT {_TRASH_LEDGER_COLUMNS} FROM trash_ledger "
+                    f"WHERE rel IN ({placeholders})",
+                    chunk,
+                )
+                for values in cursor:
+                    entry = TrashLedgerEntry(*values)
+                    entries[entry.rel] = entry
+            return entries
+        finally:
+            if should_close:
+                conn.close()
+
+    def read_trash_window(
+        self,
+        after: Optional[Tuple[int, str]] = None,
+        limit: int = 256,
+        *,
+        expired_before: Optional[int] = None,
+    ) -> List[TrashLedgerEntry]:
+        """Return up to *limit* ledger entries, oldest deletion first.
+
+        *after* is the ``(deleted_at, rel)`` key of the last entry of the
+        previous window, so callers walk the trash with keyset paging.  With
+        *expired_before* only entries whose ``expires_at`` is not later are
+        returned.
+        """
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if after is not None:
+            clauses.append("(deleted_at, rel) > (?, ?)")
+            params.extend(after)
+        if expired_before is not None:
+            clauses.append("expires_at <= ?")
+            params.append(int(expired_before))
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        params.append(max(0, int(limit)))
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            cursor = conn.execute(
+                f"SELECT {_TRASH_LEDGER_COLUMNS} FROM trash_ledger {where}"
+                "ORDER BY deleted_at, rel LIMIT ?",
+                params,
+            )
+            return [TrashLedgerEntry(*values) for values in cursor]
+        finally:
+            if should_close:
+                conn.close()
+
     def list_albums(self) -> List[str]:
         """Return a list of distinct album paths in the index."""
+        self._ensure_album_stats()
         conn = self._db_manager.get_connection()
         should_close = (conn != self._db_manager._conn)
 
         try:
             cursor = conn.execute(
-                "SELECT DISTINCT parent_album_path FROM assets "
-                "WHERE parent_album_path IS NOT NULL "
-                "ORDER BY parent_album_path"
+                "SELECT album_path FROM album_stats ORDER BY album_path"
             )
             return [row[0] for row in cursor if row[0]]
         finally:
             if should_close:
                 conn.close()
 
+    def read_album_stats(self) -> Dict[str, AlbumStats]:
+        """Return materialised figures for every album, keyed by album path.
+
+        Counts cover visible rows only (hidden Live Photo motion components
+        are excluded), matching ``count_album_assets(filter_hidden=True)``.
+        Recursive figures roll sub-albums into every ancestor; ancestors
+        without assets of their own are included with empty direct figures.
+        """
+        started = monotonic_ms()
+        self._ensure_album_stats()
+        conn = self._db_manager.get_connection()
+        should_close = (conn != self._db_manager._conn)
+        try:
+            rows = conn.execute(
+                "SELECT album_path, asset_count, photo_count, video_count, live_count, "
+                "favorite_count, total_bytes, first_ts, last_ts, cover_rel, cover_dt, "
+                "cover_id, revision FROM album_stats ORDER BY album_path"
+            ).fetchall()
+        finally:
+            if should_close:
+                conn.close()
+
+        direct: Dict[str, tuple] = {row[0]: row for row in rows}
+        totals: Dict[str, List[Any]] = {}
+        for album_path, *figures in rows:
+            path_parts = album_path.split("/") if album_path else [""]
+            for depth in range(1, len(path_parts) + 1):
+                ancestor = "/".join(path_parts[:depth])
+                total = totals.get(ancestor)
+                if total is None:
+                    totals[ancestor] = list(figures)
+                    continue
+                for index in range(6):
+                    total[index] += figures[index]
+                total[6] = self._min_optional(total[6], figures[6])
+                total[7] = self._max_optional(total[7], figures[7])
+                if figures[8] is not None and (
+                    total[8] is None
+                    or self._cover_key(figures[9], figures[10])
+                    > self._cover_key(total[9], total[10])
+                ):
+                    total[8:11] = figures[8:11]
+                total[11] = max(total[11], figures[11])
+
+        stats = {
+            album_path: AlbumStats(
+                album_path=album_path,
+                direct=(
+                    self._album_figures(direct[album_path][1:])
+                    if album_path in direct
+                    else AlbumFigures()
+                ),
+                recursive=self._album_figures(total),
+                revision=int(total[11]),
+            )
+            for album_path, total in sorted(totals.items())
+        }
+        emit_perf_event(
+            "album_stats_read",
+            elapsed_ms=round(monotonic_ms() - started, 3),
+            albums=len(stats),
+        )
+        return stats
+
+    @staticmethod
+    def _album_figures(values: Any) -> AlbumFigures:
+        return AlbumFigures(
+            asset_count=int(values[0]),
+            photo_count=int(values[1]),
+            video_count=int(values[2]),
+            live_count=int(values[3]),
+            favorite_count=int(values[4]),
+            total_bytes=int(values[5]),
+            first_ts=values[6],
+            last_ts=values[7],
+            cover_rel=values[8],
+        )
+
+    @staticmethod
+    def _cover_key(dt: Any, asset_id: Any) -> tuple:
+        # Mirrors ``ORDER BY dt DESC NULLS LAST, id DESC`` of album listings.
+        return (dt is not None, dt or "", asset_id or "")
+
+    @staticmethod
+    def _min_optional(left: Any, right: Any) -> Any:
+        if left is None or right is None:
+            return right if left is None else left
+        return min(left, right)
+
+    @staticmethod
+    def _max_optional(left: Any, right: Any) -> Any:
+        if left is None or right is None:
+            return right if left is None else left
+        return max(left, right)
+
+    def _ensure_album_stats(self) -> None:
+        conn = self._db_manager.get_connection()
+        should_close = (conn != self._db_manager._conn)
+        try:
+            dirty = conn.execute("SELECT 1 FROM album_stats_dirty LIMIT 1").fetchone()
+        finally:
+            if should_close:
+                conn.close()
+        if dirty is not None:
+            self._refresh_album_stats()
+
+    @_queued_write(WritePriority.INTERACTIVE)
+    def _refresh_album_stats(self) -> None:
+        """Recompute the ``album_stats`` rows of albums marked dirty by triggers."""
+        with self.transaction() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(revision), 0) FROM album_stats").fetchone()
+            revision = int(row[0] if row else 0) + 1
+            conn.execute(
+                "DELETE FROM album_stats "
+                "WHERE album_path IN (SELECT album_path FROM album_stats_dirty)"
+            )
+            conn.execute(
+                """
+                INSERT INTO album_stats (
+                    album_path, asset_count, photo_count, video_count, live_count,
+                    favorite_count, total_bytes, first_ts, last_ts, revision
+                )
+                SELECT
+                    assets.parent_album_path,
+                    COALESCE(SUM(assets.live_role = 0), 0),
+                    COALESCE(SUM(assets.live_role = 0 AND assets.media_type = 0), 0),
+                    COALESCE(SUM(assets.live_role = 0 AND assets.media_type = 1), 0),
+                    COALESCE(SUM(
+                        assets.live_role = 0 AND assets.live_partner_rel IS NOT NULL
+                    ), 0),
+                    COALESCE(SUM(assets.live_role = 0 AND assets.is_favorite = 1), 0),
+                    COALESCE(SUM(CASE WHEN assets.live_role = 0 THEN assets.bytes END), 0),
+                    MIN(CASE WHEN assets.live_role = 0 THEN assets.sort_ts END),
+                    MAX(CASE WHEN assets.live_role = 0 THEN assets.sort_ts END),
+                    ?
+                FROM album_stats_dirty
+                JOIN assets ON assets.parent_album_path = album_stats_dirty.album_path
+                GROUP BY assets.parent_album_path
+                """,
+                (revision,),
+            )
+            conn.execute(
+                """
+                UPDATE album_stats SET (cover_rel, cover_dt, cover_id) = (
+                    SELECT rel, dt, id FROM assets
+                    WHERE assets.parent_album_path = album_stats.album_path
+                        AND assets.live_role = 0
+                    ORDER BY dt DESC NULLS LAST, id DESC
+                    LIMIT 1
+                )
+                WHERE album_path IN (SELECT album_path FROM album_stats_dirty)
+                """
+            )
+            conn.execute("DELETE FROM album_stats_dirty")
+
+    def read_timeline(self, query: CollectionQuery) -> TimelineSummary:
+        """Return per-day buckets of *query* in collection order.
+
+        Days are local calendar days of ``sort_ts``.  Each bucket carries the
+        collection offset of its first row, so a scrubber can map a scroll
+        position to a date and a date back to a window offset without
+        reading asset rows.
+        """
+
+        started = monotonic_ms()
+        sql, params, uses_buckets = QueryBuilder.build_timeline_query(query)
+        if uses_buckets:
+            self._ensure_timeline_buckets()
+        conn = self._db_manager.get_connection()
+        should_close = conn != self._db_manager._conn
+        try:
+            day_counts = conn.execute(sql, params).fetchall()
+            _count, collection_revision = self._collection_count_and_revision(conn, query)
+            buckets: list[TimelineBucket] = []
+            first_row = 0
+            for day, count in day_counts:
+                count = int(count or 0)
+                if day is None or int(day) == TIMELINE_UNDATED_DAY:
+                    buckets.append(TimelineBucket(None, None, None, count, first_row))
+                else:
+                    bucket_date = _TIMELINE_EPOCH + timedelta(days=int(day))
+                    buckets.append(
+                        TimelineBucket(
+                            bucket_date.year, bucket_date.month, bucket_date.day,
+                            count, first_row,
+                        )
+                    )
+                first_row += count
+            emit_perf_event(
+                "timeline_read",
+                collection=query.collection_type.value,
+                elapsed_ms=round(monotonic_ms() - started, 3),
+                buckets=len(buckets),
+                source="buckets" if uses_buckets else "assets",
+                query_plan=self._explain_query_plan(conn, sql, params),
+            )
+            return TimelineSummary(
+                buckets=buckets,
+                total_count=first_row,
+                collection_revision=collection_revision,
+                descending=query.sort_direction != SortDirection.ASC,
+            )
+        finally:
+            if should_close:
+                conn.close()
+
+    def _ensure_timeline_buckets(self) -> None:
+        conn = self._db_manager.get_connection()
+        should_close = (conn != self._db_manager._conn)
+        try:
+            dirty = conn.execute("SELECT 1 FROM timeline_dirty LIMIT 1").fetchone()
+        finally:
+            if should_close:
+                conn.close()
+        if dirty is not None:
+            self._refresh_timeline_buckets()
+
+    @_queued_write(WritePriority.INTERACTIVE)
+    def _refresh_timeline_buckets(self) -> None:
+        """Recount the ``timeline_buckets`` days marked dirty by triggers.
+
+        Dated days are read as ``sort_ts`` ranges, widened by the largest
+        UTC offset, through the album collection index, so each recount
+        touches only the rows around that day.
+        """
+        bucket_columns = (
+            "parent_album_path, day, media_type, is_favorite, is_deleted, "
+            "thumb_ready, asset_count"
+        )
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM timeline_buckets WHERE (parent_album_path, day) IN "
+                "(SELECT parent_album_path, day FROM timeline_dirty)"
+            )
+            conn.execute(
+                f"""
+                INSERT INTO timeline_buckets ({bucket_columns})
+                SELECT timeline_dirty.parent_album_path, timeline_dirty.day,
+                    {TIMELINE_BUCKET_COLUMNS_SQL}, COUNT(*)
+                FROM timeline_dirty
+                JOIN assets ON assets.parent_album_path = timeline_dirty.parent_album_path
+                    AND assets.live_role = 0
+                    AND assets.is_deleted IN (0, 1)
+                    AND assets.sort_ts >= timeline_dirty.day * ? - ?
+                    AND assets.sort_ts < (timeline_dirty.day + 1) * ? + ?
+                    AND {timeline_day_sql("assets.sort_ts")} = timeline_dirty.day
+                WHERE timeline_dirty.day != ?
+                GROUP BY 1, 2, 3, 4, 5, 6
+                """,
+                (
+                    TIMELINE_DAY_US, TIMELINE_ZONE_SLACK_US,
+                    TIMELINE_DAY_US, TIMELINE_ZONE_SLACK_US,
+                    TIMELINE_UNDATED_DAY,
+                ),
+            )
+            conn.execute(
+                f"""
+                INSERT INTO timeline_buckets ({bucket_columns})
+                SELECT timeline_dirty.parent_album_path, timeline_dirty.day,
+                    {TIMELINE_BUCKET_COLUMNS_SQL}, COUNT(*)
+                FROM timeline_dirty
+                JOIN assets ON assets.parent_album_path = timeline_dirty.parent_album_path
+                    AND assets.live_role = 0
+                    AND assets.sort_ts IS NULL
+                WHERE timeline_dirty.day = ?
+                GROUP BY 1, 2, 3, 4, 5, 6
+                """,
+                (TIMELINE_UNDATED_DAY,),
+            )
+            conn.execute("DELETE FROM timeline_dirty")
+
     def count_album_assets(
         self,
         album_path: str,
@@ -1711,11 +2979,31 @@ class AssetRepository:
         Returns:
             The number of assets matching the criteria.
         """
-        return self.count(
-            filter_hidden=filter_hidden,
-            album_path=album_path,
-            include_subalbums=include_subalbums,
-        )
+        if not filter_hidden:
+            return self.count(
+                filter_hidden=filter_hidden,
+                album_path=album_path,
+                include_subalbums=include_subalbums,
+            )
+        self._ensure_album_stats()
+        conn = self._db_manager.get_connection()
+        should_close = (conn != self._db_manager._conn)
+        try:
+            if include_subalbums:
+                row = conn.execute(
+                    "SELECT COALESCE(SUM(asset_count), 0) FROM album_stats "
+                    "WHERE album_path = ? OR album_path LIKE ? ESCAPE '\\'",
+                    (album_path, f"{escape_like_pattern(album_path)}/%"),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT asset_count FROM album_stats WHERE album_path = ?",
+                    (album_path,),
+                ).fetchone()
+            return int(row[0] if row else 0)
+        finally:
+            if should_close:
+                conn.close()
 
     def _collection_revision(
         self,
@@ -1784,9 +3072,53 @@ class AssetRepository:
             anchors.pop(index, None)
 
     def _clear_collection_anchor_cache(self) -> None:
+        # Writes call this inside their transaction; clearing before COMMIT
+        # would let a concurrent reader refill the caches from the old data.
+        self._db_manager.call_after_commit(self._drop_collection_caches)
+
+    def _drop_collection_caches(self) -> None:
         self._collection_anchor_cache.clear()
         self._collection_meta_cache.clear()
 
+    def _invalidate_collection_caches(
+        self,
+        changed: Iterable[str],
+        *,
+        revision_changed: bool = False,
+    ) -> None:
+        """Drop cached counts and anchors only for queries filtering on *changed*.
+
+        Writes that only touch one filter column leave the sort order intact,
+        so collections that do not filter on it keep their keyset anchors.
+        Writes that bump ``index_revision`` also retire every cached
+        count/revision pair.  Inside a transaction the caches are dropped
+        once it commits.
+        """
+
+        self._db_manager.call_after_commit(
+            functools.partial(
+                self._drop_stale_collection_caches,
+                frozenset(changed),
+                revision_changed,
+            )
+        )
+
+    def _drop_stale_collection_caches(
+        self,
+        changed: frozenset[str],
+        revision_changed: bool,
+    ) -> None:
+        if revision_changed:
+            self._collection_meta_cache.clear()
+        changed_filters = set(changed)
+        cached = [*self._collection_anchor_cache, *self._collection_meta_cache]
+        stale = [
+            query for query in cached if changed_filters & _collection_filter_columns(query)
+        ]
+        for query in stale:
+            self._collection_anchor_cache.pop(query, None)
+            self._collection_meta_cache.pop(query, None)
+
     @staticmethod
     def _page_cursor_from_row(
         query: CollectionQuery,
@@ -41,14 +41,14 @@ def _asset_insert_columns(conn: sqlite3.Connection) -> list[str]:
     columns = [
         "rel", "id", "parent_album_path", "dt", "ts", "sort_ts", "bytes", "mime",
         "make", "model", "lens", "iso", "f_number", "exposure_time",
-        "exposure_compensation", "focal_length", "w", "h", "gps",
+        "exposure_compensation", "focal_length", "w", "h", "gps", "gps_lat", "gps_lon",
         "content_id", "frame_rate", "codec", "still_image_time", "dur",
         "original_rel_path", "original_album_id", "original_album_subpath",
         "live_role", "live_partner_rel", "aspect_ratio", "year", "month",
         "media_type", "is_favorite", "is_deleted", "has_gps", "thumbnail_state",
         "location", "micro_thumbnail", "thumb_cache_key", "thumb_updated_at",
         "thumb_error", "scan_job_id", "index_revision", "index_updated_at_ms",
-        "face_status"
+        "face_status", "extended_meta"
     ]
     table_columns = {str(row[1]) for row in conn.execute("PRAGMA table_info(assets)")}
     if "metadata" in table_columns:
@@ -60,6 +60,7 @@ def row_to_db_params(row: dict[str, Any], *, include_metadata: bool = False) ->
     """Map a dictionary row to a list of values for the DB."""
     gps_val = row.get("gps")
     gps_str = json.dumps(gps_val) if gps_val is not None else None
+    gps_lat, gps_lon = gps_coordinates(gps_val)
     has_gps = row.get("has_gps")
     if has_gps is None:
         has_gps = 1 if gps_val is not None else 0
@@ -103,6 +104,8 @@ def row_to_db_params(row: dict[str, Any], *, include_metadata: bool = False) ->
         row.get("w"),
         row.get("h"),
         gps_str,
+        gps_lat,
+        gps_lon,
         row.get("content_id"),
         row.get("frame_rate"),
         row.get("codec"),
@@ -130,12 +133,27 @@ def row_to_db_params(row: dict[str, Any], *, include_metadata: bool = False) ->
         row.get("index_revision", 0),
         row.get("index_updated_at_ms", 0),
         row.get("face_status"),
+        row.get("extended_meta"),
     ]
     if include_metadata:
         params.append(_metadata_to_json(row.get("metadata")))
     return params
 
 
+def gps_coordinates(gps: Any) -> tuple[float | None, float | None]:
+    """Return numeric ``(lat, lon)`` from a GPS payload, or ``(None, None)``."""
+
+    if not isinstance(gps, dict):
+        return None, None
+    lat = gps.get("lat")
+    lon = gps.get("lon")
+    if isinstance(lat, bool) or isinstance(lon, bool):
+        return None, None
+    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        return None, None
+    return float(lat), float(lon)
+
+
 def _thumbnail_state_for_row(row: dict[str, Any]) -> str:
     state = str(row.get("thumbnail_state") or "").strip().lower()
     if not state:
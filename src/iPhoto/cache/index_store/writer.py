@@ -0,0 +1,301 @@
+"""Dedicated writer thread serving the index store's write commands.
+
+Every mutation of the global index is queued here and executed by a single
+thread that owns the only write connection.  Small interactive mutations
+(thumbnail readiness, favorites, face status) that arrive together are
+group-committed in one transaction, each under its own savepoint so one
+failing command does not undo its neighbours.  Bulk scan merges run one per
+transaction and always yield to queued interactive writes, so the gallery
+no longer waits behind scan chunks on SQLite's write lock.
+"""
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, List, TypeVar
+
+from ...infrastructure.services.performance_events import emit_perf_event
+from ...utils.logging import get_logger
+from .engine import DatabaseManager
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+_MAX_GROUP_SIZE = 64
+# The writer thread exits after this long without work and restarts lazily.
+_IDLE_TIMEOUT_S = 5.0
+# Upper bounds (milliseconds) of the latency histogram buckets; a final
+# overflow bucket collects everything slower.
+_LATENCY_BUCKETS_MS = tuple(float(2**exponent) for exponent in range(0, 14))
+
+
+class WritePriority(IntEnum):
+    """Scheduling class of a queued write."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+class CommitLatencyHistogram:
+    """Log2-bucketed histogram of submit-to-commit latency in milliseconds."""
+
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+        self._total = 0
+        self._sum_ms = 0.0
+        self._max_ms = 0.0
+
+    def record(self, latency_ms: float) -> None:
+        latency_ms = max(0.0, float(latency_ms))
+        index = len(_LATENCY_BUCKETS_MS)
+        for position, bound in enumerate(_LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                index = position
+                break
+        self._counts[index] += 1
+        self._total += 1
+        self._sum_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return counts per bucket upper bound (``None`` for overflow)."""
+
+        bounds: List[float | None] = [*_LATENCY_BUCKETS_MS, None]
+        return {
+            "count": self._total,
+            "mean_ms": round(self._sum_ms / self._total, 3) if self._total else 0.0,
+            "max_ms": round(self._max_ms, 3),
+            "buckets": [
+                (bound, count)
+                for bound, count in zip(bounds, self._counts, strict=True)
+                if count
+            ],
+        }
+
+
+@dataclass
+class _WriteCommand:
+    fn: Callable[[], Any]
+    priority: WritePriority
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+class IndexWriter:
+    """Serve queued write commands on one thread with one connection.
+
+    While a command runs, the writer connection is installed as the
+    database manager's connection for the writer thread, so repository
+    methods executed as commands take their nested-transaction path and
+    never open a competing connection.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        *,
+        max_group_size: int = _MAX_GROUP_SIZE,
+        idle_timeout: float = _IDLE_TIMEOUT_S,
+    ) -> None:
+        self._db_manager = db_manager
+        self._max_group_size = max(1, int(max_group_size))
+        self._idle_timeout = idle_timeout
+        self._queues: Dict[WritePriority, Deque[_WriteCommand]] = {
+            priority: deque() for priority in WritePriority
+        }
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._local = threading.local()
+        self._closed = False
+        self._histograms = {priority: CommitLatencyHistogram() for priority in WritePriority}
+        self._groups_committed = 0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def owns_current_thread(self) -> bool:
+        return getattr(self._local, "is_writer", False)
+
+    def submit(
+        self,
+        fn: Callable[[], T],
+        priority: WritePriority = WritePriority.INTERACTIVE,
+    ) -> "Future[T]":
+        """Queue *fn* and return a future resolved once its transaction commits."""
+
+        command = _WriteCommand(fn, WritePriority(priority))
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("index writer is closed")
+            self._queues[command.priority].append(command)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"IndexWriter-{self._db_manager.db_path.name}",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._condition.notify()
+        return command.future
+
+    def close(self, timeout: float | None = None) -> None:
+        """Finish queued commands, then stop the writer thread."""
+
+        with self._condition:
+            self._closed = True
+            thread = self._thread
+            self._condition.notify_all()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def commit_latency_histograms(self) -> Dict[str, Dict[str, Any]]:
+        with self._condition:
+            return {
+                priority.name.lower(): histogram.snapshot()
+                for priority, histogram in self._histograms.items()
+            }
+
+    def _next_group(self) -> List[_WriteCommand] | None:
+        with self._condition:
+            while True:
+                interactive = self._queues[WritePriority.INTERACTIVE]
+                bulk = self._queues[WritePriority.BULK]
+                if interactive:
+                    count = min(len(interactive), self._max_group_size)
+                    return [interactive.popleft() for _ in range(count)]
+                if bulk:
+                    return [bulk.popleft()]
+                if self._closed:
+                    self._thread = None
+                    return None
+                if not self._condition.wait(self._idle_timeout) and not (
+                    interactive or bulk or self._closed
+                ):
+                    self._thread = None
+                    return None
+
+    def _run(self) -> None:
+        self._local.is_writer = True
+        try:
+            conn = self._db_manager.create_writer_connection()
+        except sqlite3.Error as exc:
+            logger.error("Index writer could not open %s: %s", self._db_manager.db_path, exc)
+            self._fail_pending(exc)
+            return
+        self._db_manager._conn = conn
+        try:
+            while True:
+                group = self._next_group()
+                if group is None:
+                    break
+                try:
+                    self._run_group(conn, group)
+                except Exception as exc:
+                    logger.error("Index writer failed to apply a write group: %s", exc)
+                    if conn.in_transaction:
+                        conn.rollback()
+                    for command in group:
+                        if not command.future.done():
+                            command.future.set_exception(exc)
+        finally:
+            self._db_manager._conn = None
+            try:
+                conn.close()
+            except sqlite3.Error as exc:
+                logger.warning("Error while closing index writer connection: %s", exc)
+
+    def _run_group(self, conn: sqlite3.Connection, group: List[_WriteCommand]) -> None:
+        group = [command for command in group if command.future.set_running_or_notify_cancel()]
+        if not group:
+            return
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+        except sqlite3.Error as exc:
+            for command in group:
+                command.future.set_exception(exc)
+            return
+
+        outcomes: List[tuple[_WriteCommand, bool, Any]] = []
+        # Post-commit callbacks (cache invalidation) registered by the commands
+        # run only once the group is durable, and only for commands that kept
+        # their changes.
+        with self._db_manager.collect_commit_hooks() as hooks:
+            for command in group:
+                hook_mark = len(hooks)
+                conn.execute("SAVEPOINT index_write")
+                try:
+                    value = command.fn()
+                except BaseException as exc:  # noqa: BLE001 - forwarded to the caller
+                    del hooks[hook_mark:]
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK TO index_write")
+                        conn.execute("RELEASE index_write")
+                    outcomes.append((command, False, exc))
+                else:
+                    conn.execute("RELEASE index_write")
+                    outcomes.append((command, True, value))
+                finally:
+                    conn.row_factory = None
+                if not conn.in_transaction:
+                    # SQLite aborted the whole transaction (e.g. disk full), so
+                    # nothing queued in this group so far can be committed.
+                    self._fail_lost(outcomes)
+                    outcomes = []
+                    hooks.clear()
+                    conn.execute("BEGIN IMMEDIATE")
+
+        try:
+            conn.execute("COMMIT")
+        except sqlite3.Error as exc:
+            if conn.in_transaction:
+                conn.rollback()
+            for command, _succeeded, _value in outcomes:
+                command.future.set_exception(exc)
+            return
+        self._db_manager.run_commit_hooks(hooks)
+
+        committed_at = time.perf_counter()
+        with self._condition:
+            self._groups_committed += 1
+            for command, _succeeded, _value in outcomes:
+                self._histograms[command.priority].record(
+                    (committed_at - command.enqueued_at) * 1000.0
+                )
+        emit_perf_event(
+            "index_write_group_commit",
+            commands=len(outcomes),
+            priority=min(command.priority for command, _, _ in outcomes).name.lower()
+            if outcomes
+            else None,
+        )
+        for command, succeeded, value in outcomes:
+            if succeeded:
+                command.future.set_result(value)
+            else:
+                command.future.set_exception(value)
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        with self._condition:
+            pending = [command for queue in self._queues.values() for command in queue]
+            for queue in self._queues.values():
+                queue.clear()
+            self._thread = None
+        for command in pending:
+            if command.future.set_running_or_notify_cancel():
+                command.future.set_exception(exc)
+
+    @staticmethod
+    def _fail_lost(outcomes: List[tuple[_WriteCommand, bool, Any]]) -> None:
+        lost = sqlite3.OperationalError("index write transaction was rolled back")
+        for command, succeeded, value in outcomes:
+            command.future.set_exception(lost if succeeded else value)
+
+
+__all__ = ["CommitLatencyHistogram", "IndexWriter", "WritePriority"]
@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 from functools import wraps
+import json
+import os
 from pathlib import Path
+import signal
 import sys
+from typing import Optional
 
 import typer
 from rich import print
+from rich.markup import escape
 
 if __package__ in (None, ""):
     package_root = Path(__file__).resolve().parent.parent
@@ -75,21 +80,132 @@ def init(album_dir: Path = typer.Argument(Path.cwd(), exists=False)) -> None:
 
 @app.command()
 @_handle_errors
-def scan(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
+def scan(
+    album_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the last interrupted scan of this folder from its checkpoint",
+    ),
+) -> None:
     """Scan files and update the index cache."""
 
     session = create_headless_library_session(album_dir)
     try:
         scan_service = _require_scan_service(session)
-        result = scan_service.scan_album(album_dir, persist_chunks=False)
+        # Chunks are committed as the scan runs so an interrupted job leaves
+        # directory checkpoints behind for ``--resume``.
+        result = scan_service.scan_album(album_dir, persist_chunks=True, resume=resume)
         scan_service.finalize_scan(album_dir, result.rows)
         _require_lifecycle_service(session).reconcile_missing_scan_rows(
             album_dir,
             result.rows,
         )
+        progress = scan_service.scan_progress(album_dir)
     finally:
         session.shutdown()
     print(f"[green]Indexed {len(result.rows)} assets")
+    if progress is not None and progress.rows_per_second:
+        print(f"[dim]{progress.rows_per_second:.1f} assets/s")
+
+
+@app.command("scan-status")
+@_handle_errors
+def scan_status(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
+    """Show progress, throughput and ETA of the latest scan of a folder."""
+
+    session = create_headless_library_session(album_dir)
+    try:
+        progress = _require_scan_service(session).scan_progress(album_dir)
+    finally:
+        session.shutdown()
+    if progress is None:
+        print("[yellow]No scan job recorded for this folder")
+        return
+    print(f"Job: {progress.job_id} ({progress.status})")
+    print(f"Processed: {progress.processed_count}/{progress.found_count} discovered")
+    print(f"Checkpointed folders: {progress.checkpointed_dirs}")
+    if progress.discovery_cursor is not None:
+        print(f"Cursor: {escape(progress.discovery_cursor or '.')}")
+    if progress.rows_per_second is not None:
+        print(f"Throughput: {progress.rows_per_second:.1f} assets/s")
+    if progress.eta_seconds is not None:
+        print(f"ETA: {_format_duration(progress.eta_seconds)}")
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours}h {minutes:02d}m"
+    if minutes:
+        return f"{minutes}m {secs:02d}s"
+    return f"{secs}s"
+
+
+@app.command()
+@_handle_errors
+def index(
+    library_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    workers: int = typer.Option(
+        max(1, (os.cpu_count() or 2) - 1),
+        "--workers",
+        "-j",
+        min=1,
+        help="Processes used for metadata and thumbnail extraction",
+    ),
+    faces: bool = typer.Option(False, "--faces/--no-faces", help="Run face detection"),
+    resume: bool = typer.Option(
+        False,
+        "--resume",
+        help="Continue the last interrupted index run from its checkpoint",
+    ),
+    report_path: Optional[Path] = typer.Option(
+        None,
+        "--report",
+        help="Write the JSON performance report here instead of stdout",
+    ),
+) -> None:
+    """Index a library headlessly and emit a JSON performance report.
+
+    SIGTERM and SIGINT stop the run at the next checkpoint; rerun with
+    ``--resume`` to continue.
+    """
+
+    from .bootstrap.library_index_runner import LibraryIndexRunner
+
+    session = create_headless_library_session(library_dir)
+    runner = LibraryIndexRunner(
+        session,
+        workers=workers,
+        detect_faces=faces,
+        resume=resume,
+    )
+    received: list[int] = []
+
+    def _stop(signum, _frame) -> None:
+        received.append(signum)
+        runner.cancel()
+
+    previous_handlers = {
+        signum: signal.signal(signum, _stop) for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    try:
+        report = runner.run()
+    finally:
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+        session.shutdown()
+
+    payload = json.dumps(report.as_dict(), indent=2)
+    if report_path is None:
+        typer.echo(payload)
+    else:
+        report_path.write_text(payload + "\n", encoding="utf-8")
+        print(f"[green]Wrote index report to {escape(str(report_path))}")
+    if received:
+        typer.echo("Index run interrupted; rerun with --resume to continue.", err=True)
+        raise typer.Exit(128 + received[0])
 
 
 @app.command()
@@ -106,6 +222,44 @@ def pair(album_dir: Path = typer.Argument(Path.cwd(), exists=True)) -> None:
     print(f"[green]Paired {len(groups)} Live Photos")
 
 
+@app.command()
+@_handle_errors
+def search(
+    query: str = typer.Argument(..., help="Words, \"phrases\", field:value or -exclusions"),
+    library_dir: Path = typer.Argument(Path.cwd(), exists=True),
+    limit: int = typer.Option(20, "--limit", "-n", min=1, help="Results per page"),
+    page: int = typer.Option(1, "--page", "-p", min=1, help="1-based result page"),
+) -> None:
+    """Search indexed assets by location, camera, lens, album, path or person."""
+
+    session = create_headless_library_session(library_dir)
+    try:
+        query_service = session.asset_queries
+        if query_service is None:
+            raise IPhotoError("Library asset query service is unavailable.")
+        window = query_service.search_assets(
+            query,
+            first=(page - 1) * limit,
+            limit=limit,
+        )
+    finally:
+        session.shutdown()
+    for row in window.rows:
+        camera = " ".join(str(row[key]) for key in ("make", "model") if row.get(key))
+        details = " · ".join(
+            str(value) for value in (row.get("location"), camera, row.get("lens")) if value
+        )
+        line = escape(str(row.get("rel")))
+        if details:
+            line += f"  [dim]{escape(details)}[/dim]"
+        print(line)
+    shown_to = window.first + len(window.rows)
+    if window.rows:
+        print(f"[green]{window.first + 1}-{shown_to} of {window.total_count} matches")
+    else:
+        print(f"[yellow]No matches ({window.total_count} total)")
+
+
 @cover_app.command("set")
 @_handle_errors
 def cover_set(album_dir: Path, rel: str) -> None:
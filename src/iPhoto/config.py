@@ -10,6 +10,9 @@ from typing import Final
 # the library root so assets removed from any album end up in a single
 # collection, mirroring the behaviour users expect from other photo managers.
 RECENTLY_DELETED_DIR_NAME: Final[str] = ".Trash"
+# Days an item stays in Recently Deleted before the trash ledger marks it
+# as expired.
+RECENTLY_DELETED_RETENTION_DAYS: Final[int] = 30
 WORK_DIR_NAME: Final[str] = ".iPhoto"
 LEGACY_WORK_DIR_NAMES: Final[tuple[str, ...]] = (".iphoto",)
 ALL_WORK_DIR_NAMES: Final[tuple[str, ...]] = (WORK_DIR_NAME, *LEGACY_WORK_DIR_NAMES)
@@ -9,6 +9,7 @@ The public surface is intentionally small:
 
 * :func:`is_raw_extension` – check if a suffix belongs to a RAW format.
 * :func:`load_raw_to_pil` – decode a RAW file to a :class:`PIL.Image.Image`.
+* :func:`load_raw_preview_to_pil` – read the camera's embedded JPEG preview.
 * :data:`RAW_EXTENSIONS` – the set of recognized RAW suffixes.
 """
 
@@ -120,8 +121,47 @@ def load_raw_to_pil(
         return None
 
 
+def load_raw_preview_to_pil(
+    path: Path,
+) -> Optional[Tuple["PIL.Image.Image", Tuple[int, int]]]:  # type: ignore[name-defined]  # noqa: F821
+    """Return the embedded JPEG preview of a RAW file and the developed size.
+
+    Reading the preview skips demosaicing entirely.  The second element is the
+    oriented ``(width, height)`` a full :func:`load_raw_to_pil` decode would
+    produce, so coordinates measured on the preview can be scaled back.  The
+    image is returned undecoded so callers can still draft it at a smaller
+    DCT scale.  Returns *None* when rawpy is unavailable, the file has no JPEG
+    preview, or decoding fails.
+    """
+    rawpy = _import_rawpy()
+    if rawpy is None:
+        return None
+
+    try:
+        import io
+
+        from PIL import Image
+    except ImportError:
+        return None
+
+    try:
+        with rawpy.imread(str(path)) as raw:
+            width, height = raw.sizes.width, raw.sizes.height
+            if raw.sizes.flip in (5, 6):
+                width, height = height, width
+            thumb = raw.extract_thumb()
+        if thumb.format != rawpy.ThumbFormat.JPEG:
+            return None
+        image = Image.open(io.BytesIO(thumb.data))
+        return image, (int(width), int(height))
+    except Exception:
+        _LOGGER.debug("Failed to read embedded preview of %s", path, exc_info=True)
+        return None
+
+
 __all__ = [
     "RAW_EXTENSIONS",
     "is_raw_extension",
+    "load_raw_preview_to_pil",
     "load_raw_to_pil",
 ]
@@ -1,3 +1,3 @@
 from .core import *
 from .query import AssetQuery, SortOrder, ThumbnailReadyResult, ThumbnailState
-from .scan import ScanBatchCommitted, ScanJob, ScanStage
+from .scan import ScanBatchCommitted, ScanJob, ScanJobProgress, ScanStage
@@ -1,3 +1,4 @@
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -28,6 +29,12 @@ class SortDirection(str, Enum):
     DESC = "DESC"
 
 
+class TimelineGranularity(str, Enum):
+    YEAR = "year"
+    MONTH = "month"
+    DAY = "day"
+
+
 class ThumbnailState(str, Enum):
     READY = "ready"
     PENDING = "pending"
@@ -54,6 +61,9 @@ class CollectionQuery:
     date_from: datetime | None = None
     date_to: datetime | None = None
     search_text: str | None = None
+    # Assets showing every listed People cluster (one id for a person, the
+    # members for a group).
+    person_ids: tuple[str, ...] = ()
     sort_key: str = "sort_ts"
     sort_direction: SortDirection = SortDirection.DESC
     min_thumbnail_state: str | None = ThumbnailState.READY.value
@@ -82,11 +92,170 @@ class WindowResult:
     total_count: int
     collection_revision: int
 
+
+@dataclass(frozen=True)
+class AlbumFigures:
+    """Asset figures of an album, counting only visible (non-motion) rows."""
+
+    asset_count: int = 0
+    photo_count: int = 0
+    video_count: int = 0
+    live_count: int = 0
+    favorite_count: int = 0
+    total_bytes: int = 0
+    first_ts: int | None = None
+    last_ts: int | None = None
+    cover_rel: str | None = None
+
+
+@dataclass(frozen=True)
+class AlbumStats:
+    """Materialised figures for one album, direct and including sub-albums.
+
+    ``cover_rel`` is library-relative and names the newest asset, the same
+    row an album listing sorted by date would show first.
+    """
+
+    album_path: str
+    direct: AlbumFigures
+    recursive: AlbumFigures
+    revision: int
+
+
+@dataclass(frozen=True)
+class AlbumDashboardEntry:
+    """One albums-dashboard card resolved from cached index state.
+
+    ``cover_rel`` is library-relative: the manifest cover when it names an
+    existing file, else the album's newest asset.  ``cover_thumb_key`` is the
+    disk-cache key of the cover's ready thumbnail, if any.  ``registered`` is
+    False when the album's manifest is not in the album registry, so its
+    cover could only be the newest asset.
+    """
+
+    album_path: str
+    asset_count: int
+    cover_rel: str | None = None
+    cover_thumb_key: str | None = None
+    registered: bool = True
+
+
+@dataclass(frozen=True)
+class GeoFeedDelta:
+    """Geotagged rows changed after a geo revision, plus removed ``rel`` keys."""
+
+    revision: int
+    rows: list[dict]
+    removed_rels: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class TrashLedgerEntry:
+    """Recently Deleted bookkeeping for one trashed row.
+
+    ``deleted_at`` and ``expires_at`` are epoch milliseconds.  The restore
+    fields mirror the row's ``original_*`` columns.
+    """
+
+    rel: str
+    original_rel_path: str | None
+    original_album_id: str | None
+    original_album_subpath: str | None
+    deleted_at: int
+    expires_at: int
+
+
+@dataclass(frozen=True)
+class TimelineBucket:
+    """A contiguous run of collection rows sharing one calendar date.
+
+    ``first_row`` is the collection offset of the run's first row.  Undated
+    rows form one bucket whose date fields are all ``None``.
+    """
+
+    year: int | None
+    month: int | None
+    day: int | None
+    count: int
+    first_row: int
+
+    @property
+    def date_key(self) -> tuple[int, ...] | None:
+        if self.year is None:
+            return None
+        return tuple(part for part in (self.year, self.month, self.day) if part is not None)
+
+
+@dataclass(frozen=True)
+class TimelineSummary:
+    """Day buckets of a collection in gallery order, mapping rows to dates and back."""
+
+    buckets: list[TimelineBucket]
+    total_count: int
+    collection_revision: int
+    descending: bool = True
+
+    def rollup(self, granularity: TimelineGranularity) -> list[TimelineBucket]:
+        """Return the buckets merged to *granularity*, keeping gallery order."""
+
+        if granularity == TimelineGranularity.DAY:
+            return list(self.buckets)
+        merged: list[TimelineBucket] = []
+        for bucket in self.buckets:
+            month = bucket.month if granularity == TimelineGranularity.MONTH else None
+            previous = merged[-1] if merged else None
+            if previous is not None and (previous.year, previous.month) == (bucket.year, month):
+                merged[-1] = TimelineBucket(
+                    previous.year, previous.month, None,
+                    previous.count + bucket.count, previous.first_row,
+                )
+            else:
+                merged.append(
+                    TimelineBucket(bucket.year, month, None, bucket.count, bucket.first_row)
+                )
+        return merged
+
+    def bucket_at(
+        self,
+        row: int,
+        granularity: TimelineGranularity = TimelineGranularity.DAY,
+    ) -> TimelineBucket | None:
+        """Return the bucket containing collection offset *row*."""
+
+        if row < 0 or row >= self.total_count:
+            return None
+        buckets = self.rollup(granularity)
+        index = bisect_right([bucket.first_row for bucket in buckets], row) - 1
+        return buckets[index] if index >= 0 else None
+
+    def row_for_date(self, year: int, month: int | None = None, day: int | None = None) -> int:
+        """Return the offset of the first row on or past the given date.
+
+        "Past" follows gallery order: in a descending timeline a missing
+        date lands on the next older bucket.  Dates beyond every dated row
+        return the offset where dated rows end.
+        """
+
+        target = tuple(part for part in (year, month, day) if part is not None)
+        undated: TimelineBucket | None = None
+        for bucket in self.buckets:
+            key = bucket.date_key
+            if key is None:
+                undated = bucket
+                continue
+            key = key[: len(target)]
+            if (key <= target) if self.descending else (key >= target):
+                return bucket.first_row
+        if self.descending and undated is not None:
+            return undated.first_row
+        return self.total_count
+
 @dataclass
 class AssetQuery:
     """Asset query object - Fluent API for building query conditions"""
 
     asset_ids: List[str] = field(default_factory=list)
+    person_ids: List[str] = field(default_factory=list)
     album_id: Optional[str] = None
     album_path: Optional[str] = None
     include_subalbums: bool = False
@@ -29,6 +29,20 @@ class ScanJob:
     failed_count: int = 0
 
 
+@dataclass(frozen=True)
+class ScanJobProgress:
+    """Throughput snapshot for one scan job derived from its committed batches."""
+
+    job_id: str
+    status: str
+    found_count: int = 0
+    processed_count: int = 0
+    checkpointed_dirs: int = 0
+    discovery_cursor: str | None = None
+    rows_per_second: float | None = None
+    eta_seconds: float | None = None
+
+
 @dataclass(frozen=True)
 class ScanBatchCommitted:
     job_id: str
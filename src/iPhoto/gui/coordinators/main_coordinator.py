@@ -19,6 +19,7 @@ from PySide6.QtCore import (
     QThreadPool,
 )
 from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QAbstractItemView
 
 from iPhoto.application.contracts.runtime_entry_contract import RuntimeEntryContract
 from iPhoto.config import RECENTLY_DELETED_DIR_NAME
@@ -349,6 +350,7 @@ class MainCoordinator(QObject):
             export_callback=window.ui.export_selected_action.trigger,
             prepare_paths_for_mutation=self._prepare_paths_for_mutation,
             gallery_viewmodel=self._gallery_vm,
+            skip_duplicates_provider=window.ui.skip_duplicate_imports_action.isChecked,
             parent=self,
         )
 
@@ -505,6 +507,7 @@ class MainCoordinator(QObject):
         # Grid interactions
         ui.grid_view.itemClicked.connect(self._on_asset_clicked)
         ui.grid_view.viewportStateChanged.connect(self._asset_list_vm.update_viewport)
+        self._gallery_store.scroll_restored.connect(self._restore_gallery_scroll)
 
         # Filmstrip clicks are now handled by PlaybackCoordinator
 
@@ -541,6 +544,9 @@ class MainCoordinator(QObject):
         ui.favorite_button.clicked.connect(self._detail_vm.toggle_favorite)
         ui.toggle_face_names_action.toggled.connect(self._handle_face_name_toggle_changed)
         ui.toggle_hidden_people_action.toggled.connect(self._handle_hidden_people_toggle_changed)
+        ui.skip_duplicate_imports_action.toggled.connect(
+            self._handle_skip_duplicate_imports_toggle_changed
+        )
 
         # Info Button
         if hasattr(ui, "info_button"):
@@ -920,6 +926,12 @@ class MainCoordinator(QObject):
     def _on_favorite_clicked(self, index: QModelIndex):
         self._gallery_vm.toggle_favorite_row(index.row())
 
+    def _restore_gallery_scroll(self, row: int) -> None:
+        """Return a revisited gallery view to where the user left it."""
+        idx = self._asset_list_vm.index(row, 0)
+        if idx.isValid():
+            self._window.ui.grid_view.scrollTo(idx, QAbstractItemView.PositionAtTop)
+
     def _sync_selection(self, row: int):
         """Syncs grid view selection when playback asset changes."""
         idx = self._asset_list_vm.index(row, 0)
@@ -948,7 +960,7 @@ class MainCoordinator(QObject):
 
     def _on_people_cluster_activated(self, person_id: str) -> None:
         query = self._window.ui.people_page.build_cluster_query(person_id)
-        if not query.asset_ids:
+        if not (query.asset_ids or query.person_ids):
             return
         self._gallery_vm.open_people_cluster_gallery(
             query,
@@ -959,7 +971,7 @@ class MainCoordinator(QObject):
 
     def _on_people_group_activated(self, group_id: str) -> None:
         query = self._window.ui.people_page.build_group_query(group_id)
-        if not query.asset_ids:
+        if not (query.asset_ids or query.person_ids):
             return
         self._gallery_vm.open_people_cluster_gallery(
             query,
@@ -1036,6 +1048,13 @@ class MainCoordinator(QObject):
         if hasattr(ui, "people_page"):
             ui.people_page.set_show_hidden_people(show_hidden_people)
 
+        stored_skip_duplicates = settings.get("ui.skip_duplicate_imports", False)
+        if isinstance(stored_skip_duplicates, str):
+            skip_duplicates = stored_skip_duplicates.strip().lower() in {"1", "true", "yes", "on"}
+        else:
+            skip_duplicates = bool(stored_skip_duplicates)
+        ui.skip_duplicate_imports_action.setChecked(skip_duplicates)
+
         # 2. Volume / Mute
         stored_volume = settings.get("ui.volume", 75)
         try:
@@ -1093,6 +1112,10 @@ class MainCoordinator(QObject):
         if hasattr(self._window.ui, "people_page"):
             self._window.ui.people_page.set_show_hidden_people(checked)
 
+    def _handle_skip_duplicate_imports_toggle_changed(self, checked: bool) -> None:
+        if self._context.settings.get("ui.skip_duplicate_imports") != checked:
+            self._context.settings.set("ui.skip_duplicate_imports", checked)
+
     def _prepare_paths_for_mutation(self, paths: list[Path]) -> None:
         """Release preview/player handles before mutating files on disk."""
 
@@ -117,7 +117,7 @@ class NavigationCoordinator(QObject):
                     exc_info=True,
                 )
                 return
-            if not query.asset_ids and not entity_exists:
+            if not (query.asset_ids or query.person_ids) and not entity_exists:
                 self._handle_missing_pinned_item(
                     pinned_item,
                     library_root=library_root,
@@ -143,7 +143,7 @@ class NavigationCoordinator(QObject):
                     exc_info=True,
                 )
                 return
-            if not query.asset_ids and not entity_exists:
+            if not (query.asset_ids or query.person_ids) and not entity_exists:
                 self._handle_missing_pinned_item(
                     pinned_item,
                     library_root=library_root,
@@ -1720,7 +1720,12 @@ class PlaybackCoordinator(QObject):
             return
         self._info_panel_metadata_inflight.add(path_key)
 
-        worker = InfoPanelMetadataWorker(path, is_video=is_video)
+        store = getattr(self._asset_model, "store", None)
+        worker = InfoPanelMetadataWorker(
+            path,
+            is_video=is_video,
+            details_source=getattr(store, "asset_query_service", None),
+        )
         worker.signals.ready.connect(self._handle_info_panel_metadata_ready)
         worker.signals.error.connect(self._handle_info_panel_metadata_error)
         worker.signals.finished.connect(self._handle_info_panel_metadata_finished)
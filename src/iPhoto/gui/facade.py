@@ -347,6 +347,7 @@ class AppFacade(QObject):
         *,
         destination: Optional[Path] = None,
         mark_featured: bool = False,
+        skip_duplicates: bool = False,
     ) -> None:
         """Import *sources* asynchronously and refresh the destination album."""
 
@@ -354,6 +355,7 @@ class AppFacade(QObject):
             sources,
             destination=destination,
             mark_featured=mark_featured,
+            skip_duplicates=skip_duplicates,
         )
 
     def move_assets(self, sources: Iterable[Path], destination: Path) -> bool:
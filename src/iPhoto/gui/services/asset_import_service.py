@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import shutil
 import uuid
 from pathlib import Path
 from typing import Callable, Iterable, List, Optional, Sequence
@@ -10,7 +9,8 @@ from typing import Callable, Iterable, List, Optional, Sequence
 from PySide6.QtCore import QObject, Signal, Slot
 
 from ..background_task_manager import BackgroundTaskManager
-from ..ui.tasks.import_worker import ImportSignals, ImportWorker
+from ...utils.hashutils import copy_with_file_id
+from ..ui.tasks.import_worker import ImportedFile, ImportSignals, ImportWorker
 from .album_metadata_service import AlbumMetadataService
 from .library_update_service import LibraryUpdateService
 from .session_service_resolver import (
@@ -64,8 +64,13 @@ class AssetImportService(QObject):
         *,
         destination: Optional[Path] = None,
         mark_featured: bool = False,
+        skip_duplicates: bool = False,
     ) -> None:
-        """Normalise *sources* and import them into the selected destination."""
+        """Normalise *sources* and import them into the selected destination.
+
+        With *skip_duplicates* files whose content is already indexed in the
+        library are not kept.
+        """
 
         normalized = self._normalise_sources(sources)
         if not normalized:
@@ -91,6 +96,7 @@ class AssetImportService(QObject):
             target_root,
             self._copy_into_album,
             signals,
+            skip_duplicates=skip_duplicates,
             library_root=service_root,
             scan_service=scan_service,
             asset_lifecycle_service=lifecycle_service,
@@ -187,8 +193,12 @@ class AssetImportService(QObject):
             "LibrarySession target."
         )
 
-    def _copy_into_album(self, source: Path, destination: Path) -> Path:
-        """Copy *source* into *destination* using collision-safe filenames."""
+    def _copy_into_album(self, source: Path, destination: Path) -> ImportedFile:
+        """Copy *source* into *destination* using collision-safe filenames.
+
+        The asset id is hashed from the copied bytes so duplicate detection
+        does not read the file a second time.
+        """
 
         base_name = source.name
         target = destination / base_name
@@ -199,7 +209,8 @@ class AssetImportService(QObject):
             target = destination / f"{stem} ({counter}){suffix}"
             counter += 1
         destination.mkdir(parents=True, exist_ok=True)
-        return Path(shutil.copy2(source, target)).resolve()
+        file_id = copy_with_file_id(source, target)
+        return ImportedFile(target.resolve(), f"as_{file_id}")
 
     def _handle_import_finished(
         self,
@@ -55,6 +55,7 @@ class ContextMenuController(QObject):
         export_callback: Callable[[], None],
         prepare_paths_for_mutation: Callable[[list[Path]], None] | None = None,
         gallery_viewmodel: GalleryViewModel | None = None,
+        skip_duplicates_provider: Callable[[], bool] | None = None,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
@@ -69,6 +70,7 @@ class ContextMenuController(QObject):
         self._export_callback = export_callback
         self._prepare_paths_for_mutation = prepare_paths_for_mutation
         self._gallery_viewmodel = gallery_viewmodel
+        self._skip_duplicates_provider = skip_duplicates_provider
 
         self._grid_view.customContextMenuRequested.connect(self._handle_context_menu)
 
@@ -292,7 +294,14 @@ class ContextMenuController(QObject):
         # Delegate importing to the facade so that all deduplication and bookkeeping logic is
         # reused. The toast provides quick feedback because importing can take a noticeable
         # amount of time on large selections.
-        self._facade.import_files(files, destination=album.root)
+        skip_duplicates = bool(
+            self._skip_duplicates_provider and self._skip_duplicates_provider()
+        )
+        self._facade.import_files(
+            files,
+            destination=album.root,
+            skip_duplicates=skip_duplicates,
+        )
         self._toast.show_toast(tr("GalleryContextMenu", "Pasting files..."))
 
     def _open_current_folder(self) -> None:
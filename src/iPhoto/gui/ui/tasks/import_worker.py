@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Iterable, List
+from typing import Any, Callable, Iterable, List
 import time
 
 from PySide6.QtCore import QObject, QRunnable, Signal
@@ -17,6 +19,14 @@ MAX_UPDATES_PER_SEC = 10
 CHUNK_SIZE = 20
 
 
+@dataclass(frozen=True)
+class ImportedFile:
+    """A copied file plus the asset id hashed while it was being copied."""
+
+    path: Path
+    asset_id: str | None = None
+
+
 class ImportSignals(QObject):
     """Qt signal container used by :class:`ImportWorker` to report progress."""
 
@@ -27,15 +37,22 @@ class ImportSignals(QObject):
 
 
 class ImportWorker(QRunnable):
-    """Copy media files on a worker thread and rebuild the album index."""
+    """Copy media files on a worker thread and index them as they land.
+
+    Copying and indexing overlap: every ``CHUNK_SIZE`` copied files are
+    handed to a single indexing thread while the next chunk is copied.  Once
+    everything is indexed only the imported rows are paired, so an import
+    never rescans the destination album unless an incremental chunk failed.
+    """
 
     def __init__(
         self,
         sources: Iterable[Path],
         destination: Path,
-        copier: Callable[[Path, Path], Path],
+        copier: Callable[[Path, Path], Path | ImportedFile],
         signals: ImportSignals,
         *,
+        skip_duplicates: bool = False,
         library_root: Path | None = None,
         scan_service: LibraryScanService | None = None,
         asset_lifecycle_service: LibraryAssetLifecycleService | None = None,
@@ -50,7 +67,9 @@ class ImportWorker(QRunnable):
         self._library_root = library_root
         self._scan_service = scan_service
         self._asset_lifecycle_service = asset_lifecycle_service
+        self._skip_duplicates = skip_duplicates
         self._had_incremental_error = False
+        self._seen_asset_ids: set[str] = set()
 
     @property
     def signals(self) -> ImportSignals:
@@ -86,7 +105,7 @@ class ImportWorker(QRunnable):
         self._is_cancelled = True
 
     def run(self) -> None:  # pragma: no cover - executed on a worker thread
-        """Copy files and rebuild the index while emitting progress updates."""
+        """Copy files and index them while emitting progress updates."""
 
         total = len(self._sources)
         self._signals.started.emit(self._destination)
@@ -95,41 +114,52 @@ class ImportWorker(QRunnable):
             return
 
         imported: List[Path] = []
-        pending_batch: List[Path] = []
+        pending_batch: List[ImportedFile] = []
+        chunks: List[Future] = []
         last_emit_time = 0.0
         min_interval = 1.0 / MAX_UPDATES_PER_SEC
 
-        for index, source in enumerate(self._sources, start=1):
-            if self._is_cancelled:
-                break
-            try:
-                copied = self._copier(source, self._destination)
-            except OSError as exc:
-                # Propagate filesystem issues (permissions, disk space, …) to the UI.
-                self._signals.error.emit(f"Could not import '{source}': {exc}")
-            except Exception as exc:  # pragma: no cover - defensive fallback
-                self._signals.error.emit(str(exc))
-            else:
-                imported.append(copied)
-                pending_batch.append(copied)
-            finally:
-                # Throttled progress emission
-                now = time.monotonic()
-                if now - last_emit_time >= min_interval or index == total:
-                    self._signals.progress.emit(self._destination, index, total)
-                    last_emit_time = now
-
-            # Process chunk if ready
-            if len(pending_batch) >= CHUNK_SIZE:
-                self._process_chunk(pending_batch)
-                pending_batch.clear()
-
-        # Process any remaining files in the final chunk
-        if pending_batch:
-            self._process_chunk(pending_batch)
-            pending_batch.clear()
-
-        # Final full rescan/link check if not cancelled
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="import-index") as indexer:
+            for index, source in enumerate(self._sources, start=1):
+                if self._is_cancelled:
+                    break
+                try:
+                    copied = self._copier(source, self._destination)
+                except OSError as exc:
+                    # Propagate filesystem issues (permissions, disk space, …) to the UI.
+                    self._signals.error.emit(f"Could not import '{source}': {exc}")
+                except Exception as exc:  # pragma: no cover - defensive fallback
+                    self._signals.error.emit(str(exc))
+                else:
+                    if not isinstance(copied, ImportedFile):
+                        copied = ImportedFile(Path(copied))
+                    pending_batch.append(copied)
+                finally:
+                    # Throttled progress emission
+                    now = time.monotonic()
+                    if now - last_emit_time >= min_interval or index == total:
+                        self._signals.progress.emit(self._destination, index, total)
+                        last_emit_time = now
+
+                # Hand the chunk to the indexer and keep copying
+                if len(pending_batch) >= CHUNK_SIZE:
+                    self._submit_chunk(indexer, pending_batch, imported, chunks)
+                    pending_batch = []
+
+            # Index any remaining files in the final chunk
+            if pending_batch:
+                self._submit_chunk(indexer, pending_batch, imported, chunks)
+
+            indexed_rows: List[dict[str, Any]] = []
+            for chunk in chunks:
+                try:
+                    indexed_rows.extend(chunk.result())
+                except Exception as exc:
+                    # Log error but don't fail the whole import; final rescan might fix it
+                    self._had_incremental_error = True
+                    self._signals.error.emit(f"Incremental scan failed: {exc}")
+
+        # Pair only the imported rows; fall back to a full rescan after errors
         rescan_success = False
 
         if imported and not self._is_cancelled:
@@ -137,7 +167,7 @@ class ImportWorker(QRunnable):
                 if self._had_incremental_error:
                     self._full_rescan()
                 else:
-                    self.scan_service.pair_album(self._destination)
+                    self.scan_service.pair_imported_files(self._destination, indexed_rows)
             except Exception as exc:  # pragma: no cover - defensive fallback
                 self._signals.error.emit(str(exc))
                 try:
@@ -151,16 +181,63 @@ class ImportWorker(QRunnable):
 
         self._signals.finished.emit(self._destination, imported, rescan_success)
 
-    def _process_chunk(self, batch: List[Path]) -> None:
-        """Update the index for a batch of imported files."""
-        if not batch or self._is_cancelled:
-            return
+    def _submit_chunk(
+        self,
+        indexer: ThreadPoolExecutor,
+        batch: List[ImportedFile],
+        imported: List[Path],
+        chunks: List[Future],
+    ) -> None:
+        """Drop duplicate copies from *batch* and queue the rest for indexing."""
+
+        kept = self._without_duplicates(batch)
+        if kept:
+            imported.extend(item.path for item in kept)
+            chunks.append(indexer.submit(self._process_chunk, kept))
+
+    def _without_duplicates(self, batch: List[ImportedFile]) -> List[ImportedFile]:
+        """Return *batch* minus copies whose content is already in the library.
+
+        The asset ids were hashed during the copy, so one id lookup per chunk
+        is all duplicate detection costs.  Skipped copies are removed again.
+        """
+
+        if not self._skip_duplicates:
+            return batch
+        asset_ids = [item.asset_id for item in batch if item.asset_id]
         try:
-            self.scan_service.scan_specific_files(self._destination, batch)
-        except Exception as exc:
-            # Log error but don't fail the whole import; final rescan might fix it
-            self._had_incremental_error = True
-            self._signals.error.emit(f"Incremental scan failed: {exc}")
+            known = self.scan_service.indexed_asset_ids(asset_ids) if asset_ids else set()
+        except Exception as exc:  # pragma: no cover - defensive fallback
+            self._signals.error.emit(f"Duplicate check failed: {exc}")
+            known = set()
+        kept: List[ImportedFile] = []
+        for item in batch:
+            if item.asset_id and (
+                item.asset_id in known or item.asset_id in self._seen_asset_ids
+            ):
+                item.path.unlink(missing_ok=True)
+                continue
+            if item.asset_id:
+                self._seen_asset_ids.add(item.asset_id)
+            kept.append(item)
+        return kept
+
+    def _process_chunk(self, batch: List[ImportedFile]) -> List[dict[str, Any]]:
+        """Update the index for a batch of imported files on the indexing thread.
+
+        Asset ids hashed during the copy are handed to the scanner so the
+        files are not read again.  Failures propagate through the chunk's
+        future so they are reported from the worker thread that owns the
+        signals.
+        """
+        if not batch or self._is_cancelled:
+            return []
+        rows = self.scan_service.scan_specific_files(
+            self._destination,
+            [item.path for item in batch],
+            asset_ids={item.path: item.asset_id for item in batch if item.asset_id},
+        )
+        return list(rows or [])
 
     def _full_rescan(self) -> None:
         """Rebuild the destination index scope through the session scan service."""
@@ -1,4 +1,9 @@
-"""Background worker that enriches sparse metadata for the detail info panel."""
+"""Background worker that enriches sparse metadata for the detail info panel.
+
+Metadata is read from the index first.  Only rows indexed before extended
+metadata was persisted fall back to ExifTool, and the result is written back
+so the next visit stays in the index.
+"""
 
 from __future__ import annotations
 
@@ -10,7 +15,8 @@ from typing import Any
 from PySide6.QtCore import QObject, QRunnable, Signal
 
 from iPhoto.errors import ExternalToolError
-from iPhoto.io.metadata import read_image_meta, read_video_meta
+from iPhoto.io.extended_metadata import extract_extended_metadata
+from iPhoto.io.metadata import read_image_meta_with_exiftool, read_video_meta
 from iPhoto.utils.exiftool import get_metadata_batch
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,11 +44,20 @@ class InfoPanelMetadataSignals(QObject):
 class InfoPanelMetadataWorker(QRunnable):
     """Extract missing info-panel metadata off the GUI thread."""
 
-    def __init__(self, path: Path, *, is_video: bool) -> None:
+    def __init__(
+        self,
+        path: Path,
+        *,
+        is_video: bool,
+        details_source: Any | None = None,
+    ) -> None:
         super().__init__()
         self.setAutoDelete(True)
         self._path = Path(path)
         self._is_video = bool(is_video)
+        # Provides ``read_asset_details``/``store_asset_details`` (the
+        # library asset query service); None skips the index entirely.
+        self._details_source = details_source
         self.signals = InfoPanelMetadataSignals()
 
     def run(self) -> None:  # pragma: no cover - exercised through coordinator tests
@@ -63,19 +78,46 @@ class InfoPanelMetadataWorker(QRunnable):
             self.signals.finished.emit(path_key)
 
     def _read_metadata(self) -> dict[str, Any]:
+        stored = self._read_stored_details()
+        if stored is not None:
+            return stored
+
+        exif_payload = None
+        try:
+            exif_batch = get_metadata_batch([self._path])
+            exif_payload = exif_batch[0] if exif_batch else None
+        except (ExternalToolError, OSError):
+            _LOGGER.debug(
+                "ExifTool metadata fetch failed for %s",
+                self._path,
+                exc_info=True,
+            )
         if self._is_video:
-            exif_payload = None
-            try:
-                exif_batch = get_metadata_batch([self._path])
-                exif_payload = exif_batch[0] if exif_batch else None
-            except (ExternalToolError, OSError):
-                _LOGGER.debug(
-                    "ExifTool metadata fetch failed for %s",
-                    self._path,
-                    exc_info=True,
-                )
-            return read_video_meta(self._path, exif_payload)
-        return read_image_meta(self._path)
+            metadata = read_video_meta(self._path, exif_payload)
+        else:
+            metadata = read_image_meta_with_exiftool(self._path, exif_payload)
+        if exif_payload:
+            self._store_details(metadata, extract_extended_metadata(exif_payload, metadata))
+        return metadata
+
+    def _read_stored_details(self) -> dict[str, Any] | None:
+        reader = getattr(self._details_source, "read_asset_details", None)
+        if not callable(reader):
+            return None
+        try:
+            return reader(self._path)
+        except Exception:  # noqa: BLE001 - the index is only a shortcut here
+            _LOGGER.debug("Indexed metadata lookup failed for %s", self._path, exc_info=True)
+            return None
+
+    def _store_details(self, metadata: dict[str, Any], extended: dict[str, Any]) -> None:
+        writer = getattr(self._details_source, "store_asset_details", None)
+        if not callable(writer):
+            return
+        try:
+            writer(self._path, metadata, extended)
+        except Exception:  # noqa: BLE001 - persisting is best-effort
+            _LOGGER.debug("Failed to persist metadata for %s", self._path, exc_info=True)
 
 
 __all__ = [
@@ -0,0 +1,363 @@
+"""In-process trim-strip decoding backed by a persisted keyframe index.
+
+The trim bar samples a handful of evenly spaced times across a clip.  Rather
+than running ffmpeg over the whole stream, the service demuxes the video once
+(no decoding) to record where its keyframes are and persists that index.  A
+strip then seeks straight to the keyframe nearest each sample time, decodes
+only that frame and scales it down in the decoder's output conversion.
+
+Decoded strips are cached on disk as raw RGB under a byte budget; reads
+refresh an entry's modification time so eviction drops the least recently
+used strips first.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+from ....utils.logging import get_logger
+
+_CACHE_DIR = Path.home() / ".iPhoto" / "cache" / "video_trim"
+_STRIP_CACHE_BUDGET_BYTES = 256 * 1024 * 1024
+_INDEX_CACHE_BUDGET_BYTES = 16 * 1024 * 1024
+_KEYFRAME_INDEX_VERSION = 1
+_MEMORY_INDEX_LIMIT = 32
+_STRIP_HEADER = struct.Struct("<III")
+_LOGGER = get_logger().getChild("video_trim.scrub")
+_OPTIONAL_MODULE_UNSET = object()
+av: Any = _OPTIONAL_MODULE_UNSET
+
+
+def _load_av() -> Any | None:
+    """Import PyAV only when a strip actually needs decoding."""
+
+    global av
+    if av is None:
+        return None
+    if av is not _OPTIONAL_MODULE_UNSET:
+        return av
+    try:  # pragma: no cover - optional dependency detection
+        import av as imported_av  # type: ignore
+    except Exception:  # pragma: no cover - PyAV not available or broken
+        av = None
+        return None
+    av = imported_av
+    return imported_av
+
+
+@dataclass(frozen=True)
+class KeyframeIndex:
+    """Presentation timestamps of a video stream's keyframes."""
+
+    time_base: Fraction
+    start_pts: int
+    keyframes: tuple[int, ...]
+
+    def nearest(self, seconds: float) -> int:
+        """Return the keyframe pts closest to *seconds* into the stream."""
+
+        target = self.start_pts + int(round(seconds / self.time_base))
+        position = bisect.bisect_left(self.keyframes, target)
+        candidates = self.keyframes[max(position - 1, 0):position + 1]
+        return min(candidates, key=lambda pts: abs(pts - target))
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "v": _KEYFRAME_INDEX_VERSION,
+                "time_base": [self.time_base.numerator, self.time_base.denominator],
+                "start_pts": self.start_pts,
+                "keyframes": list(self.keyframes),
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, payload: str) -> KeyframeIndex | None:
+        try:
+            data = json.loads(payload)
+            if data.get("v") != _KEYFRAME_INDEX_VERSION:
+                return None
+            numerator, denominator = data["time_base"]
+            keyframes = tuple(int(pts) for pts in data["keyframes"])
+            if not keyframes or int(numerator) <= 0 or int(denominator) <= 0:
+                return None
+            return cls(
+                time_base=Fraction(int(numerator), int(denominator)),
+                start_pts=int(data["start_pts"]),
+                keyframes=keyframes,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+
+class VideoScrubService:
+    """Decode trim strips at keyframes and cache them under an LRU budget."""
+
+    def __init__(
+        self,
+        cache_dir: Path = _CACHE_DIR,
+        *,
+        strip_budget_bytes: int = _STRIP_CACHE_BUDGET_BYTES,
+        index_budget_bytes: int = _INDEX_CACHE_BUDGET_BYTES,
+    ) -> None:
+        self._cache_dir = Path(cache_dir)
+        self._index_dir = self._cache_dir / "keyframes"
+        self._strip_budget = max(int(strip_budget_bytes), 0)
+        self._index_budget = max(int(index_budget_bytes), 0)
+        self._indexes: OrderedDict[str, KeyframeIndex] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def keyframe_index(self, source: Path) -> KeyframeIndex | None:
+        """Return the keyframe index of *source*, building it on first use."""
+
+        key = _source_key(source)
+        if not key:
+            return None
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None:
+                self._indexes.move_to_end(key)
+                return index
+
+        path = self._index_dir / f"{key}.json"
+        index = None
+        try:
+            index = KeyframeIndex.from_json(path.read_text(encoding="utf-8"))
+            _touch(path)
+        except OSError:
+            pass
+        if index is None:
+            index = _build_keyframe_index(source)
+            if index is None:
+                return None
+            try:
+                self._index_dir.mkdir(parents=True, exist_ok=True)
+                path.write_text(index.to_json(), encoding="utf-8")
+                _evict_lru(self._index_dir, self._index_budget)
+            except OSError:
+                pass
+
+        with self._lock:
+            self._indexes[key] = index
+            while len(self._indexes) > _MEMORY_INDEX_LIMIT:
+                self._indexes.popitem(last=False)
+        return index
+
+    def read_strip(
+        self,
+        source: Path,
+        sample_times: Sequence[float],
+        size: tuple[int, int],
+        *,
+        rotation: int = 0,
+        on_frame: Callable[[bytes], None] | None = None,
+    ) -> list[bytes] | None:
+        """Return one RGB888 frame of *size* per ascending sample time, or None.
+
+        *size* is the displayed ``(width, height)``; *rotation* is the
+        clockwise rotation applied to decoded frames.  Sample times that land
+        on the same keyframe share one decode, and *on_frame* receives every
+        frame as soon as it is ready so callers can show the strip
+        progressively.
+        """
+
+        av_module = _load_av()
+        if av_module is None or not sample_times:
+            return None
+        index = self.keyframe_index(source)
+        if index is None:
+            return None
+
+        width, height = size
+        quarter_turns = (int(rotation) // 90) % 4
+        decode_size = (height, width) if quarter_turns % 2 else (width, height)
+        decoded: dict[int, bytes | None] = {}
+        frames: list[bytes] = []
+        try:
+            with av_module.open(str(source)) as container:
+                stream = container.streams.video[0]
+                stream.thread_type = "AUTO"
+                codec_context = stream.codec_context
+                codec_context.skip_frame = "NONKEY"
+                # Deblocking artefacts are invisible at strip sizes.
+                codec_context.options = {"skip_loop_filter": "all"}
+                for seconds in sample_times:
+                    pts = index.nearest(seconds)
+                    if pts not in decoded:
+                        frame = _decode_keyframe(container, stream, pts)
+                        decoded[pts] = (
+                            _frame_rgb(frame, decode_size, quarter_turns) if frame is not None else None
+                        )
+                    rgb = decoded[pts]
+                    if rgb is None:
+                        continue
+                    frames.append(rgb)
+                    if on_frame is not None:
+                        on_frame(rgb)
+        except Exception as exc:
+            _LOGGER.debug("[video-scrub] decode failed | source=%s, error=%s", source, exc)
+        return frames or None
+
+    def cached_strip(
+        self,
+        source: Path,
+        thumb_h: int,
+        count: int,
+    ) -> tuple[int, int, int, bytes] | None:
+        """Return ``(width, height, count, rgb)`` of a cached strip, or None."""
+
+        key = _strip_key(source, thumb_h, count)
+        if not key:
+            return None
+        path = self._cache_dir / key
+        try:
+            with path.open("rb") as handle:
+                header = handle.read(_STRIP_HEADER.size)
+                if len(header) < _STRIP_HEADER.size:
+                    return None
+                width, height, actual_count = _STRIP_HEADER.unpack(header)
+                expected = width * height * 3 * actual_count
+                data = handle.read(expected)
+        except OSError:
+            return None
+        if len(data) != expected:
+            return None
+        _touch(path)
+        return (width, height, actual_count, data)
+
+    def store_strip(
+        self,
+        source: Path,
+        thumb_w: int,
+        thumb_h: int,
+        count: int,
+        data: bytes,
+    ) -> None:
+        """Cache *count* RGB frames of ``thumb_w x thumb_h`` for *source*."""
+
+        key = _strip_key(source, thumb_h, count)
+        if not key:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with (self._cache_dir / key).open("wb") as handle:
+                handle.write(_STRIP_HEADER.pack(thumb_w, thumb_h, count))
+                handle.write(data)
+            _evict_lru(self._cache_dir, self._strip_budget)
+        except OSError:
+            return
+
+
+def _build_keyframe_index(source: Path) -> KeyframeIndex | None:
+    av_module = _load_av()
+    if av_module is None:
+        return None
+    try:
+        with av_module.open(str(source)) as container:
+            if not container.streams.video:
+                return None
+            stream = container.streams.video[0]
+            keyframes = sorted(
+                {
+                    packet.pts
+                    for packet in container.demux(stream)
+                    if packet.is_keyframe and packet.pts is not None
+                }
+            )
+            time_base = stream.time_base
+            start_pts = stream.start_time
+    except Exception as exc:
+        _LOGGER.debug("[video-scrub] index failed | source=%s, error=%s", source, exc)
+        return None
+    if not keyframes or not time_base:
+        return None
+    return KeyframeIndex(
+        time_base=Fraction(time_base),
+        start_pts=int(start_pts) if start_pts is not None else keyframes[0],
+        keyframes=tuple(keyframes),
+    )
+
+
+def _decode_keyframe(container: Any, stream: Any, pts: int) -> Any | None:
+    container.seek(pts, stream=stream, backward=True, any_frame=False)
+    for frame in container.decode(stream):
+        return frame
+    return None
+
+
+def _frame_rgb(frame: Any, size: tuple[int, int], quarter_turns: int) -> bytes:
+    width, height = size
+    pixels = frame.to_ndarray(width=width, height=height, format="rgb24", interpolation="AREA")
+    if quarter_turns:
+        import numpy as np
+
+        pixels = np.ascontiguousarray(np.rot90(pixels, k=-quarter_turns))
+    return pixels.tobytes()
+
+
+def _source_key(source: Path) -> str:
+    try:
+        stat = source.stat()
+        resolved = source.resolve()
+    except OSError:
+        return ""
+    blob = f"{resolved}\x00{stat.st_size}\x00{stat.st_mtime_ns}"
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _strip_key(source: Path, thumb_h: int, count: int) -> str:
+    try:
+        stat = source.stat()
+        resolved = source.resolve()
+    except OSError:
+        return ""
+    blob = f"{resolved}\x00{stat.st_size}\x00{stat.st_mtime_ns}\x00{thumb_h}\x00{count}"
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _touch(path: Path) -> None:
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _evict_lru(directory: Path, budget_bytes: int) -> None:
+    """Delete the least recently used files of *directory* beyond *budget_bytes*."""
+
+    entries: list[tuple[int, int, Path]] = []
+    total = 0
+    with os.scandir(directory) as scan:
+        for entry in scan:
+            if not entry.is_file():
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, Path(entry.path)))
+            total += stat.st_size
+    if total <= budget_bytes:
+        return
+    for _mtime, size, path in sorted(entries):
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= budget_bytes:
+            break
+
+
+__all__ = ["KeyframeIndex", "VideoScrubService"]
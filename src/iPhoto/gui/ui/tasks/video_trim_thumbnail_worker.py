@@ -1,11 +1,13 @@
 """Background worker that generates timeline thumbnails for the trim bar.
 
-This worker reuses the extraction strategy from ``demo/video``:
+Extraction cascades through:
 
 1. Disk cache of previously generated RGB strips.
-2. ffmpeg contact-sheet extraction (tile=Nx1).
-3. ffmpeg single-pass rawvideo pipe.
-4. Per-frame fallback via the shared frame grabber.
+2. In-process PyAV decoding of the keyframes nearest each sample time, via
+   :class:`VideoScrubService` and its persisted keyframe index.
+3. ffmpeg contact-sheet extraction (tile=Nx1).
+4. ffmpeg single-pass rawvideo pipe.
+5. Per-frame fallback via the shared frame grabber.
 
 When available, the contact-sheet strip is split through the demo's optional
 native ``fast_thumb`` helper for the same behavior as the demo.
@@ -13,9 +15,7 @@ native ``fast_thumb`` helper for the same behavior as the demo.
 
 from __future__ import annotations
 
-import hashlib
 import os
-import struct
 import subprocess
 from pathlib import Path
 
@@ -26,9 +26,10 @@ from ....errors import ExternalToolError
 from ....utils.ffmpeg import probe_media, probe_video_rotation
 from ....utils.logging import get_logger
 from .video_frame_grabber import grab_video_frame
+from .video_scrub_service import VideoScrubService
 from .video_trim_native import split_strip_bgra, split_strip_bgra_to_rgb
 
-_CACHE_DIR = Path.home() / ".iPhoto" / "cache" / "video_trim"
+_SCRUB_SERVICE = VideoScrubService()
 _FFMPEG_BELOW_NORMAL = 0x00004000
 _LOGGER = get_logger().getChild("video_trim.worker")
 
@@ -57,10 +58,12 @@ class VideoTrimThumbnailWorker(QRunnable):
         target_height: int,
         target_width: int,
         count: int = 10,
+        scrub_service: VideoScrubService | None = None,
     ) -> None:
         super().__init__()
         self.setAutoDelete(True)
         self._source = source
+        self._scrub = scrub_service if scrub_service is not None else _SCRUB_SERVICE
         self._generation = int(generation)
         self._duration_sec = duration_sec
         self._target_height = max(int(target_height), 48)
@@ -80,6 +83,8 @@ class VideoTrimThumbnailWorker(QRunnable):
                 count=self._count,
             )
             images = self._load_cached_images()
+            if not images:
+                images = self._extract_keyframe_strip(duration_sec)
             if not images:
                 images = self._extract_contact_sheet(duration_sec)
             if not images:
@@ -153,7 +158,7 @@ class VideoTrimThumbnailWorker(QRunnable):
 
     def _load_cached_images(self) -> list[QImage]:
         thumb_w, thumb_h = self._contact_sheet_size()
-        cached = _cache_get(self._source, thumb_h, self._count)
+        cached = self._scrub.cached_strip(self._source, thumb_h, self._count)
         if cached is None:
             self._diag("cache_miss", generation=self._generation, thumb_h=thumb_h, count=self._count)
             return []
@@ -177,6 +182,39 @@ class VideoTrimThumbnailWorker(QRunnable):
             self.signals.thumbnail.emit(QImage(image), self._generation)
         return images
 
+    def _extract_keyframe_strip(self, duration: float | None) -> list[QImage]:
+        sample_times = self._sample_times(duration)
+        if not sample_times:
+            self._diag("keyframe_skip", generation=self._generation, reason="invalid_duration", duration=duration)
+            return []
+
+        thumb_w, thumb_h = self._contact_sheet_size()
+        rotation, _raw_w, _raw_h = probe_video_rotation(self._source)
+        images: list[QImage] = []
+
+        def _emit(frame: bytes) -> None:
+            image = _qimage_from_rgb(frame, thumb_w, thumb_h)
+            if image is None:
+                return
+            images.append(image)
+            self.signals.thumbnail.emit(QImage(image), self._generation)
+
+        frames = self._scrub.read_strip(
+            self._source,
+            sample_times,
+            (thumb_w, thumb_h),
+            rotation=rotation,
+            on_frame=_emit,
+        )
+        if not frames:
+            self._diag("keyframe_fail", generation=self._generation)
+            return []
+
+        self._diag("keyframe_ok", generation=self._generation, image_count=len(images))
+        if len(images) == len(sample_times):
+            self._scrub.store_strip(self._source, thumb_w, thumb_h, len(frames), b"".join(frames))
+        return images
+
     def _extract_contact_sheet(self, duration: float | None) -> list[QImage]:
         if duration is None or duration <= 0.0:
             self._diag("contact_skip", generation=self._generation, reason="invalid_duration", duration=duration)
@@ -228,7 +266,7 @@ class VideoTrimThumbnailWorker(QRunnable):
 
             if images:
                 try:
-                    _cache_put(
+                    self._scrub.store_strip(
                         self._source,
                         thumb_w,
                         strip_h,
@@ -564,49 +602,4 @@ def _make_even(value: int) -> int:
     return max(clamped, 2)
 
 
-def _cache_get(source: Path, thumb_h: int, count: int) -> tuple[int, int, int, bytes] | None:
-    key = _cache_key(source, thumb_h, count)
-    if not key:
-        return None
-    path = _CACHE_DIR / key
-    if not path.exists():
-        return None
-    try:
-        with path.open("rb") as handle:
-            header = handle.read(12)
-            if len(header) < 12:
-                return None
-            width, height, actual_count = struct.unpack("<III", header)
-            expected = width * height * 3 * actual_count
-            data = handle.read(expected)
-            if len(data) != expected:
-                return None
-            return (width, height, actual_count, data)
-    except OSError:
-        return None
-
-
-def _cache_put(source: Path, thumb_w: int, thumb_h: int, count: int, data: bytes) -> None:
-    key = _cache_key(source, thumb_h, count)
-    if not key:
-        return
-    try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        path = _CACHE_DIR / key
-        with path.open("wb") as handle:
-            handle.write(struct.pack("<III", thumb_w, thumb_h, count))
-            handle.write(data)
-    except OSError:
-        return
-
-
-def _cache_key(source: Path, thumb_h: int, count: int) -> str:
-    try:
-        stat = source.stat()
-    except OSError:
-        return ""
-    blob = f"{source.resolve()}\x00{stat.st_size}\x00{stat.st_mtime_ns}\x00{thumb_h}\x00{count}"
-    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
-
-
 __all__ = ["VideoTrimThumbnailWorker", "VideoTrimThumbnailSignals"]
@@ -161,6 +161,7 @@ class Ui_MainWindow(QObject):
         self.toggle_filmstrip_action = self.main_header.toggle_filmstrip_action
         self.toggle_face_names_action = self.main_header.toggle_face_names_action
         self.toggle_hidden_people_action = self.main_header.toggle_hidden_people_action
+        self.skip_duplicate_imports_action = self.main_header.skip_duplicate_imports_action
         self.export_all_edited_action = self.main_header.export_all_edited_action
         self.export_selected_action = self.main_header.export_selected_action
         self.export_destination_group = self.main_header.export_destination_group
@@ -10,10 +10,13 @@ from PySide6.QtCore import (
     QEvent,
     QObject,
     QPoint,
+    QRect,
     QRunnable,
     QSize,
     Qt,
+    QThread,
     QThreadPool,
+    QTimer,
     Signal,
 )
 from PySide6.QtGui import (
@@ -60,6 +63,10 @@ if TYPE_CHECKING:
     from ....library.runtime_controller import LibraryRuntimeController
     from ....library.tree import AlbumNode
 
+# Cover thumbnails decode on a private low-priority pool of this size.
+_COVER_THREAD_COUNT = 2
+_COVER_JOB_PRIORITY = -1
+
 
 class RoundedImageView(QWidget):
     """Widget that draws a pixmap clipped to a rounded shape (left side only)."""
@@ -334,6 +341,7 @@ class DashboardLoaderSignals(QObject):
     """Signals for the dashboard data loader."""
 
     albumReady = Signal(object, int, object, object, int)  # node, count, cover_path, album_root, generation
+    coverCached = Signal(object, object, int)  # album_root, thumbnail cache file, generation
 
 
 class AlbumDataWorker(QRunnable):
@@ -379,23 +387,114 @@ class AlbumDataWorker(QRunnable):
             pass
 
         # 2. Determine cover path
-        cover_path: Path | None = None
-        try:
-            album = Album.open(self.node.path)
-            cover_rel = album.manifest.get("cover")
-            if cover_rel:
-                candidate = self.node.path / cover_rel
-                if candidate.exists():
-                    cover_path = candidate
-        except Exception:
-            pass
+        fallback = self.node.path / first_rel if first_rel else None
+        cover_path = _album_cover_path(self.node, fallback)
+
+        self.signals.albumReady.emit(self.node, count, cover_path, self.node.path, self.generation)
+
+
+class AlbumStatsWorker(QRunnable):
+    """Background worker resolving every album card from one dashboard feed.
+
+    Counts, covers and cover thumbnail keys come from the query service's
+    batched feed over the index's cached album stats and album registry;
+    sessions without it fall back to the per-album queries of
+    :class:`AlbumDataWorker`.
+    """
+
+    def __init__(
+        self,
+        nodes: list[AlbumNode],
+        signals: DashboardLoaderSignals,
+        generation: int,
+        library_root: Optional[Path] = None,
+        asset_query_service: LibraryAssetQueryService | None = None,
+    ) -> None:
+        super().__init__()
+        self.nodes = nodes
+        self.signals = signals
+        self.generation = generation
+        self._library_root = library_root
+        self._asset_query_service = asset_query_service
 
-        if cover_path is None and first_rel:
-            candidate = self.node.path / first_rel
+    def run(self) -> None:
+        query_service = self._asset_query_service
+        read_feed = getattr(query_service, "read_album_dashboard_feed", None)
+        feed = None
+        if callable(read_feed):
+            try:
+                feed = read_feed([node.path for node in self.nodes])
+            except Exception:
+                feed = None
+        if not isinstance(feed, dict):
+            feed = None
+
+        for node in self.nodes:
+            entry = feed.get(node.path) if feed is not None else None
+            if entry is None:
+                AlbumDataWorker(
+                    node,
+                    self.signals,
+                    self.generation,
+                    library_root=self._library_root,
+                    asset_query_service=query_service,
+                ).run()
+                continue
+            feed_cover = None
+            if entry.cover_rel and self._library_root:
+                feed_cover = self._library_root / entry.cover_rel
+            # Registered albums already had their manifest cover resolved.
+            cover_path = feed_cover if entry.registered else _album_cover_path(node, feed_cover)
+            if entry.cover_thumb_key and cover_path is not None and cover_path == feed_cover:
+                self.signals.coverCached.emit(
+                    node.path,
+                    query_service.thumbnail_cache_file(entry.cover_thumb_key),
+                    self.generation,
+                )
+            self.signals.albumReady.emit(
+                node, entry.asset_count, cover_path, node.path, self.generation
+            )
+
+
+def _album_cover_path(node: AlbumNode, fallback: Path | None) -> Path | None:
+    """Return the manifest cover of *node*, else *fallback* when it exists."""
+
+    try:
+        album = Album.open(node.path)
+        cover_rel = album.manifest.get("cover")
+        if cover_rel:
+            candidate = node.path / cover_rel
             if candidate.exists():
-                cover_path = candidate
+                return candidate
+    except Exception:
+        pass
+
+    if fallback is not None and fallback.exists():
+        return fallback
+    return None
 
-        self.signals.albumReady.emit(self.node, count, cover_path, self.node.path, self.generation)
+
+class _CachedCoverJob(QRunnable):
+    """Read an existing library thumbnail for a dashboard card off the GUI thread."""
+
+    def __init__(
+        self,
+        loader: DashboardThumbnailLoader,
+        album_root: Path,
+        image_path: Path,
+        size: QSize,
+        cached_file: Path,
+    ) -> None:
+        super().__init__()
+        self._loader = loader
+        self._album_root = album_root
+        self._image_path = image_path
+        self._size = QSize(size)
+        self._cached_file = cached_file
+
+    def run(self) -> None:
+        image = QImage(str(self._cached_file))
+        self._loader._cachedDelivered.emit(self._album_root, self._image_path, self._size, image)
 
 
 class DashboardThumbnailLoader(QObject):
@@ -403,17 +502,36 @@ class DashboardThumbnailLoader(QObject):
 
     thumbnailReady = Signal(Path, Path, QPixmap)  # album_root, source_path, pixmap
     _delivered = Signal(tuple, QImage, str)  # key (album_root_str, rel, width, height, stamp), image, rel
+    _cachedDelivered = Signal(Path, Path, QSize, QImage)  # album_root, source_path, size, image
 
     def __init__(self, parent: QObject | None = None, library_root: Optional[Path] = None) -> None:
         super().__init__(parent)
-        self._pool = QThreadPool.globalInstance()
+        # A small private pool keeps cover decoding from competing with
+        # gallery thumbnails on the global pool.
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(_COVER_THREAD_COUNT)
+        self._pool.setThreadPriority(QThread.Priority.LowPriority)
         self._delivered.connect(self._handle_result)
+        self._cachedDelivered.connect(self._handle_cached_result)
         # Map base keys (album_root_str, rel, width, height) to queued album root Paths
         self._key_to_root: dict[tuple[str, str, int, int], deque[Path]] = {}
         self._resolved_roots: dict[Path, str] = {}
         self._library_root = library_root
 
-    def request_with_absolute_key(self, album_root: Path, image_path: Path, size: QSize) -> None:
+    def request_with_absolute_key(
+        self,
+        album_root: Path,
+        image_path: Path,
+        size: QSize,
+        cached_file: Path | None = None,
+    ) -> None:
+        # *cached_file* is the library thumbnail cache entry of *image_path*,
+        # which spares decoding the source when the gallery already did.
+        if cached_file is not None:
+            job = _CachedCoverJob(self, album_root, image_path, size, cached_file)
+            self._pool.start(job, _COVER_JOB_PRIORITY)
+            return
+
         # To avoid rel collision across albums, we use the absolute path string as the 'rel' identifier
         # passed to ThumbnailJob. This ensures the key emitted back is unique.
         unique_rel = str(image_path)
@@ -478,7 +596,18 @@ class DashboardThumbnailLoader(QObject):
             # The old code calculated real_rel.
             # Let's pass None as it's not needed for the path generation anymore.
         )
-        self._pool.start(job)
+        self._pool.start(job, _COVER_JOB_PRIORITY)
+
+    def _handle_cached_result(
+        self, album_root: Path, image_path: Path, size: QSize, image: QImage
+    ) -> None:
+        if image.isNull():
+            # The cache entry vanished or is unreadable; decode the source instead.
+            self.request_with_absolute_key(album_root, image_path, size)
+            return
+        pixmap = QPixmap.fromImage(image)
+        if not pixmap.isNull():
+            self.thumbnailReady.emit(album_root, image_path, pixmap)
 
     def _handle_result(
         self, full_key: tuple[str, str, int, int, int], image: Optional[QImage], rel: str
@@ -525,6 +654,10 @@ class AlbumsDashboard(QWidget):
         self._cards: dict[Path, AlbumCard] = {}
         self._album_nodes: dict[Path, AlbumNode] = {}
         self._requested_cover_paths: dict[Path, Path] = {}
+        # Covers resolved by the loader but not yet requested because their
+        # card is outside the viewport, and ready library thumbnails for them.
+        self._pending_covers: dict[Path, Path] = {}
+        self._cover_cache_files: dict[Path, Path] = {}
         # Track refresh generation to prevent race conditions
         # Python integers can grow arbitrarily large, so overflow is not a concern
         self._current_generation = 0
@@ -532,6 +665,7 @@ class AlbumsDashboard(QWidget):
         # Setup loader
         self._loader_signals = DashboardLoaderSignals()
         self._loader_signals.albumReady.connect(self._on_album_data_ready)
+        self._loader_signals.coverCached.connect(self._on_cover_cached)
 
         self._thumb_loader = DashboardThumbnailLoader(self, library_root=self._library.root())
         self._thumb_loader.thumbnailReady.connect(self._on_thumbnail_ready)
@@ -570,6 +704,7 @@ class AlbumsDashboard(QWidget):
         self.scroll_content.setLayout(self.flow_layout)
 
         self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._request_visible_covers)
         self.main_layout.addWidget(self.scroll_area)
 
         # Empty state placeholder
@@ -586,6 +721,14 @@ class AlbumsDashboard(QWidget):
             self._apply_theme()
         super().changeEvent(event)
 
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        QTimer.singleShot(0, self._request_visible_covers)
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._request_visible_covers()
+
     def refresh(self) -> None:
         # Increment generation to invalidate pending workers from previous refresh
         self._current_generation += 1
@@ -598,6 +741,8 @@ class AlbumsDashboard(QWidget):
         self._cards.clear()
         self._album_nodes.clear()
         self._requested_cover_paths.clear()
+        self._pending_covers.clear()
+        self._cover_cache_files.clear()
 
         albums = self._library.list_albums()
 
@@ -622,19 +767,19 @@ class AlbumsDashboard(QWidget):
             self._cards[album.path] = card
             self._album_nodes[album.path] = album
 
-            # Fetch data with the current session query surface when available.
-            worker = AlbumDataWorker(
-                album,
-                self._loader_signals,
-                current_gen,
-                library_root=library_root,
-                asset_query_service=getattr(
-                    self._library,
-                    "asset_query_service",
-                    None,
-                ),
-            )
-            pool.start(worker)
+        # Fetch every card's figures from one read of the session's album stats.
+        worker = AlbumStatsWorker(
+            list(albums),
+            self._loader_signals,
+            current_gen,
+            library_root=library_root,
+            asset_query_service=getattr(
+                self._library,
+                "asset_query_service",
+                None,
+            ),
+        )
+        pool.start(worker)
 
     def retranslate_ui(self) -> None:
         """Refresh translated dashboard text."""
@@ -657,10 +802,39 @@ class AlbumsDashboard(QWidget):
         # Update count
         card.set_count(count)
 
-        # Load cover
+        # Load the cover once its card scrolls near the viewport
         if cover_path:
             self._requested_cover_paths[root] = cover_path
-            self._thumb_loader.request_with_absolute_key(root, cover_path, QSize(512, 512))
+            self._pending_covers[root] = cover_path
+            self._request_visible_covers()
+
+    def _on_cover_cached(self, root: Path, cache_file: Path, generation: int) -> None:
+        if generation == self._current_generation:
+            self._cover_cache_files[root] = cache_file
+
+    def _request_visible_covers(self) -> None:
+        """Request covers of cards within one viewport height of the visible area."""
+
+        if not self._pending_covers or not self.isVisible():
+            return
+        viewport = self.scroll_area.viewport()
+        origin = self.scroll_content.mapFrom(viewport, QPoint(0, 0))
+        margin = viewport.height()
+        visible = QRect(origin, viewport.size()).adjusted(0, -margin, 0, margin)
+        for root, cover_path in list(self._pending_covers.items()):
+            card = self._cards.get(root)
+            if card is None:
+                self._pending_covers.pop(root, None)
+                continue
+            if not card.geometry().intersects(visible):
+                continue
+            self._pending_covers.pop(root, None)
+            self._thumb_loader.request_with_absolute_key(
+                root,
+                cover_path,
+                QSize(512, 512),
+                self._cover_cache_files.pop(root, None),
+            )
 
     def _on_thumbnail_ready(self, album_root: Path, source_path: Path, pixmap: QPixmap) -> None:
         expected = self._requested_cover_paths.get(album_root)
@@ -694,6 +868,8 @@ class AlbumsDashboard(QWidget):
         if card is None or not cover_path.exists():
             return
         self._requested_cover_paths[card.path] = cover_path
+        self._pending_covers.pop(card.path, None)
+        self._cover_cache_files.pop(card.path, None)
         pixmap = QPixmap(str(cover_path))
         if not pixmap.isNull():
             card.set_cover_image(pixmap)
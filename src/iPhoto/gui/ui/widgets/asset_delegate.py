@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtCore import QRect, QRectF, QSize, Qt
 from PySide6.QtGui import (
     QColor,
     QImage,
@@ -75,9 +75,14 @@ class AssetGridDelegate(QStyledItemDelegate):
         base_color = option.palette.color(QPalette.Base)
         corner_radius = 8.0 if self._filmstrip_mode else 0.0
 
+        micro_cell: QRect | None = None
         if tile_snapshot is not None:
             pixmap = tile_snapshot.full_pixmap
             micro_thumb = tile_snapshot.micro_image
+            if tile_snapshot.micro_atlas is not None and tile_snapshot.micro_atlas_rect is not None:
+                # Paint straight from the shared atlas: no per-tile image.
+                micro_thumb = tile_snapshot.micro_atlas
+                micro_cell = tile_snapshot.micro_atlas_rect
         else:
             pixmap = index.data(Qt.DecorationRole)
             micro_thumb = None
@@ -112,7 +117,10 @@ class AssetGridDelegate(QStyledItemDelegate):
             painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
 
             # Simple scaling to fill the thumb_rect, using center crop logic
-            source_rect = calculate_center_crop(micro_thumb.size(), thumb_rect.size())
+            micro_size = micro_cell.size() if micro_cell is not None else micro_thumb.size()
+            source_rect = calculate_center_crop(micro_size, thumb_rect.size())
+            if micro_cell is not None:
+                source_rect.translate(micro_cell.x(), micro_cell.y())
             if not source_rect.isEmpty():
                 # We can draw QImage directly. QPainter handles scaling.
                 # Since it's a tiny image, SmoothPixmapTransform (bilinear) is important.
@@ -21,6 +21,7 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import QCompleter, QLabel, QLineEdit, QListView, QToolTip, QWidget
 
 from iPhoto.gui.i18n import tr
+from iPhoto.people.face_crop_store import read_face_crop_bytes
 from iPhoto.people.records import PersonSummary
 from iPhoto.people.repository import AssetFaceAnnotation
 
@@ -124,7 +125,7 @@ class _FaceNameEditor(QLineEdit):
         self._model.clear()
         for suggestion in self._suggestions:
             item = QStandardItem(suggestion.name)
-            if suggestion.thumbnail_path is not None and suggestion.thumbnail_path.exists():
+            if suggestion.thumbnail_path is not None:
                 icon = _icon_for_thumbnail(suggestion.thumbnail_path)
                 if not icon.isNull():
                     item.setIcon(icon)
@@ -795,8 +796,9 @@ def _distance(left: QPointF, right: QPointF) -> float:
 
 
 def _icon_for_thumbnail(path: Path) -> QIcon:
-    pixmap = QPixmap(str(path))
-    if pixmap.isNull():
+    data = read_face_crop_bytes(path)
+    pixmap = QPixmap()
+    if data is None or not pixmap.loadFromData(data) or pixmap.isNull():
         return QIcon()
     size = 34
     scaled = pixmap.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
@@ -30,6 +30,7 @@ from PySide6.QtWidgets import (
 )
 
 from iPhoto.gui.i18n import formatters, tr
+from iPhoto.people.face_crop_store import face_crop_signature, read_face_crop_bytes
 from iPhoto.people.repository import AssetFaceAnnotation, PersonSummary
 from ....application.ports import MapRuntimePort
 
@@ -58,7 +59,7 @@ _LENS_SPEC_RE = re.compile(
 _PLUS_CIRCLE_ICON_PATH = Path(__file__).resolve().parents[1] / "icon" / "plus.circle.svg"
 _FACE_AVATAR_DIAMETER = 48
 _AVATAR_PIXMAP_CACHE_MAX = 128
-_AVATAR_PIXMAP_CACHE: dict[tuple[str, int, int, int], QPixmap] = {}
+_AVATAR_PIXMAP_CACHE: dict[tuple[str, str, int], QPixmap] = {}
 
 
 def _parse_svg_dimension(value: str) -> float:
@@ -1859,23 +1860,22 @@ class InfoPanel(QWidget):
 
 
 def _avatar_pixmap(path: Path | None) -> QPixmap | None:
-    if path is None or not path.exists():
+    if path is None:
         return None
-    try:
-        stat = path.stat()
-    except OSError:
+    signature = face_crop_signature(path)
+    if signature is None:
         return None
     cache_key = (
         str(path.resolve()),
-        int(stat.st_mtime_ns),
-        int(stat.st_size),
+        signature,
         _FACE_AVATAR_DIAMETER,
     )
     cached = _AVATAR_PIXMAP_CACHE.get(cache_key)
     if cached is not None and not cached.isNull():
         return QPixmap(cached)
-    source = QPixmap(str(path))
-    if source.isNull():
+    data = read_face_crop_bytes(path)
+    source = QPixmap()
+    if data is None or not source.loadFromData(data) or source.isNull():
         return None
     size = _FACE_AVATAR_DIAMETER
     scaled = source.scaled(
@@ -100,6 +100,10 @@ class MainHeaderWidget(QWidget):
             "", main_window, checkable=True
         )
         self.toggle_hidden_people_action.setChecked(False)
+        self.skip_duplicate_imports_action = QAction(
+            "", main_window, checkable=True
+        )
+        self.skip_duplicate_imports_action.setChecked(False)
 
         self.share_action_group = QActionGroup(main_window)
         self.share_action_copy_file = QAction("", main_window, checkable=True)
@@ -190,6 +194,7 @@ class MainHeaderWidget(QWidget):
         self.settings_menu = self._add_menu()
         self.settings_menu.addAction(self.bind_library_action)
         self.settings_menu.addAction(self.download_map_extension_action)
+        self.settings_menu.addAction(self.skip_duplicate_imports_action)
         self.settings_menu.addSeparator()
 
         self.appearance_menu = self._add_submenu(self.settings_menu)
@@ -255,6 +260,9 @@ class MainHeaderWidget(QWidget):
         self.toggle_filmstrip_action.setText(tr("MainWindow", "Show Filmstrip", None))
         self.toggle_face_names_action.setText(tr("MainHeader", "Show face names", None))
         self.toggle_hidden_people_action.setText(tr("MainHeader", "Show Hidden People", None))
+        self.skip_duplicate_imports_action.setText(
+            tr("MainHeader", "Skip Duplicate Imports", None)
+        )
 
         self.export_all_edited_action.setText(tr("MainHeader", "Export All Edited", None))
         self.export_selected_action.setText(tr("MainHeader", "Export Selected", None))
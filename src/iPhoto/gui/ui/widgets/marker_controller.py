@@ -7,6 +7,7 @@ import math
 from pathlib import Path
 from typing import Callable, Dict, Iterable, Optional, Sequence
 
+import numpy as np
 from PySide6.QtCore import QObject, QPointF, QRectF, QSize, QThread, QTimer, Signal
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QApplication
@@ -110,6 +111,7 @@ class _ClusterWorker(QObject):
         self,
         request_id: int,
         assets: Sequence[GeotaggedAsset],
+        coordinates: np.ndarray,
         width: int,
         height: int,
         center_x: float,
@@ -119,7 +121,12 @@ class _ClusterWorker(QObject):
         cell_size: int,
         margin: int,
     ) -> None:
-        """Project *assets* and aggregate them into clusters in screen space."""
+        """Project *assets* and aggregate them into clusters in screen space.
+
+        *coordinates* is the ``(n, 2)`` lon/lat array parallel to *assets*;
+        projection and viewport culling run vectorised so only on-screen
+        assets reach the Python clustering loop.
+        """
 
         self._interrupted = False
 
@@ -134,31 +141,26 @@ class _ClusterWorker(QObject):
         top_left_y = center_py - height / 2.0
         half_world = world_size / 2.0
 
+        screen = self._project_array_to_screen(
+            coordinates, top_left_x, top_left_y, center_px, world_size, half_world
+        )
+        visible = np.flatnonzero(
+            np.isfinite(screen).all(axis=1)
+            & (screen[:, 0] >= -margin)
+            & (screen[:, 1] >= -margin)
+            & (screen[:, 0] <= width + margin)
+            & (screen[:, 1] <= height + margin)
+        )
+
         grid: Dict[tuple[int, int], list[_MarkerCluster]] = {}
         clusters: list[_MarkerCluster] = []
 
-        for asset in assets:
+        for index in visible.tolist():
             if self._interrupted:
                 return
 
-            point = self._project_to_screen(
-                asset.longitude,
-                asset.latitude,
-                top_left_x,
-                top_left_y,
-                center_px,
-                center_py,
-                world_size,
-                half_world,
-            )
-
-            if point is None:
-                continue
-
-            if point.x() < -margin or point.y() < -margin:
-                continue
-            if point.x() > width + margin or point.y() > height + margin:
-                continue
+            asset = assets[index]
+            point = QPointF(float(screen[index, 0]), float(screen[index, 1]))
 
             cell_x = int(point.x() // cell_size)
             cell_y = int(point.y() // cell_size)
@@ -202,54 +204,35 @@ class _ClusterWorker(QObject):
         if not self._interrupted:
             self.finished.emit(request_id, clusters)
 
-    def _project_to_screen(
+    def _project_array_to_screen(
         self,
-        lon: float,
-        lat: float,
+        coordinates: np.ndarray,
         top_left_x: float,
         top_left_y: float,
         center_px: float,
-        center_py: float,
         world_size: float,
         half_world: float,
-    ) -> Optional[QPointF]:
-        """Convert a geographic coordinate into widget-relative screen space."""
-
-        world_position = self._lonlat_to_world(lon, lat, world_size)
-        if world_position is None:
-            return None
-
-        world_x, world_y = world_position
+    ) -> np.ndarray:
+        """Project ``(n, 2)`` lon/lat rows to widget-relative screen space."""
+
+        lon = coordinates[:, 0]
+        lat = np.clip(coordinates[:, 1], -self.MERCATOR_LAT_BOUND, self.MERCATOR_LAT_BOUND)
+        world_x = (lon + 180.0) / 360.0 * world_size
+        sin_lat = np.sin(np.radians(lat))
+        world_y = (
+            0.5 - np.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+        ) * world_size
         delta_x = world_x - center_px
-        if delta_x > half_world:
-            world_x -= world_size
-        elif delta_x < -half_world:
-            world_x += world_size
-
-        screen_x = world_x - top_left_x
-        screen_y = world_y - top_left_y
-        return QPointF(screen_x, screen_y)
+        world_x = np.where(
+            delta_x > half_world,
+            world_x - world_size,
+            np.where(delta_x < -half_world, world_x + world_size, world_x),
+        )
+        return np.column_stack((world_x - top_left_x, world_y - top_left_y))
 
     def _world_size(self, zoom: float) -> float:
         return float(self.TILE_SIZE * (2.0 ** float(zoom)))
 
-    def _lonlat_to_world(
-        self, lon: float, lat: float, world_size: float
-    ) -> Optional[tuple[float, float]]:
-        try:
-            lon = float(lon)
-            lat = float(lat)
-        except (TypeError, ValueError):
-            return None
-
-        lat = max(min(lat, self.MERCATOR_LAT_BOUND), -self.MERCATOR_LAT_BOUND)
-        x = (lon + 180.0) / 360.0 * world_size
-        sin_lat = math.sin(math.radians(lat))
-        y = (
-            0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
-        ) * world_size
-        return x, y
-
 
 class MarkerController(QObject):
     """Encapsulates marker state, clustering and event handling."""
@@ -259,7 +242,9 @@ class MarkerController(QObject):
     markerActivated = Signal(list)
     thumbnailUpdated = Signal(str, QPixmap)
     thumbnailsInvalidated = Signal()
-    _clustering_requested = Signal(int, object, int, int, float, float, float, float, int, int)
+    _clustering_requested = Signal(
+        int, object, object, int, int, float, float, float, float, int, int
+    )
 
     # ``CITY_LABEL_FETCH_LEVEL`` mirrors the map renderer's tile pyramid.  When
     # the integer fetch level meets or exceeds this constant (i.e. zooming to
@@ -285,6 +270,7 @@ class MarkerController(QObject):
         self._thumbnail_size = int(thumbnail_size)
         self._provides_place_labels = bool(provides_place_labels)
         self._assets: list[GeotaggedAsset] = []
+        self._coordinates = _empty_coordinates()
         self._library_root: Optional[Path] = None
         self._clusters: list[_MarkerCluster] = []
         self._city_annotations: list[CityAnnotation] = []
@@ -315,7 +301,13 @@ class MarkerController(QObject):
         self._cluster_request_id = 0
 
     def set_assets(self, assets: Iterable[GeotaggedAsset], library_root: Path) -> None:
-        """Replace the asset catalogue shown on the map."""
+        """Replace the asset catalogue shown on the map.
+
+        Within the same library root the incoming list is diffed against the
+        current one by object identity: coordinates of unchanged assets are
+        reused and cached thumbnails survive, so a delta from the location
+        feed only costs the rows that actually changed.
+        """
 
         normalized_assets = [asset for asset in assets if isinstance(asset, GeotaggedAsset)]
         same_root = self._library_root == library_root
@@ -333,21 +325,49 @@ class MarkerController(QObject):
 
         if not self._pending_click_survives_asset_update(normalized_assets, same_root):
             self._clear_pending_click()
+        if same_root:
+            self._coordinates = self._patched_coordinates(normalized_assets)
+        else:
+            self._coordinates = _coordinates_for(normalized_assets)
         self._assets = normalized_assets
         self._library_root = library_root
-        self._city_annotations = []
         if not same_root:
+            self._city_annotations = []
             self._thumbnail_loader.reset_for_album(library_root)
-        self.thumbnailsInvalidated.emit()
-        self.citiesUpdated.emit([])
+            self.thumbnailsInvalidated.emit()
+            self.citiesUpdated.emit([])
         self._schedule_cluster_update()
 
+    def _patched_coordinates(self, incoming: Sequence[GeotaggedAsset]) -> np.ndarray:
+        """Reuse cached rows for assets already on the map; project only new ones."""
+
+        previous = self._current_coordinates()
+        previous_index = {id(asset): index for index, asset in enumerate(self._assets)}
+        kept = np.fromiter(
+            (previous_index.get(id(asset), -1) for asset in incoming),
+            dtype=np.int64,
+            count=len(incoming),
+        )
+        coordinates = np.empty((len(incoming), 2), dtype=np.float64)
+        reused = kept >= 0
+        coordinates[reused] = previous[kept[reused]]
+        fresh = np.flatnonzero(~reused)
+        if fresh.size:
+            coordinates[fresh] = _coordinates_for([incoming[index] for index in fresh.tolist()])
+        return coordinates
+
+    def _current_coordinates(self) -> np.ndarray:
+        if len(self._coordinates) != len(self._assets):
+            self._coordinates = _coordinates_for(self._assets)
+        return self._coordinates
+
     def clear(self) -> None:
         """Remove all markers and cancel outstanding work."""
 
         self._cluster_worker.interrupt()
         self._cluster_request_id += 1
         self._assets = []
+        self._coordinates = _empty_coordinates()
         self._clusters = []
         self._city_annotations = []
         self._library_root = None
@@ -631,6 +651,7 @@ class MarkerController(QObject):
         self._clustering_requested.emit(
             request_id,
             self._assets,
+            self._current_coordinates(),
             width,
             height,
             self._view_center_x,
@@ -791,4 +812,22 @@ class MarkerController(QObject):
 
         return math.hypot(a.x() - b.x(), a.y() - b.y())
 
+
+def _empty_coordinates() -> np.ndarray:
+    return np.empty((0, 2), dtype=np.float64)
+
+
+def _coordinates_for(assets: Sequence[GeotaggedAsset]) -> np.ndarray:
+    """Return the ``(n, 2)`` lon/lat array for *assets*; bad values become NaN."""
+
+    coordinates = np.full((len(assets), 2), np.nan, dtype=np.float64)
+    for index, asset in enumerate(assets):
+        try:
+            coordinates[index, 0] = float(asset.longitude)
+            coordinates[index, 1] = float(asset.latitude)
+        except (TypeError, ValueError):
+            continue
+    return coordinates
+
+
 __all__ = ["MarkerController", "_MarkerCluster"]
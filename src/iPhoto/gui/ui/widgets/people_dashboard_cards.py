@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 from PySide6.QtCore import QPoint, QRectF, Qt, Signal
 from PySide6.QtGui import QColor, QFont, QLinearGradient, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import QGraphicsDropShadowEffect, QWidget
 
 from iPhoto.gui.i18n.font_policy import language_font
-from iPhoto.people.image_utils import load_image_rgb
+from iPhoto.people.face_crop_store import face_crop_signature, load_face_crops
 from iPhoto.people.repository import PeopleGroupSummary, PersonSummary
 
 from .people_dashboard_shared import (
@@ -436,25 +434,30 @@ class GroupCard(QWidget):
         cell_w = max(1, width // columns)
         cell_h = max(1, height // rows)
 
+        member_images = load_face_crops(
+            member.thumbnail_path for member in members if member.thumbnail_path is not None
+        )
         for index, member in enumerate(members):
             x = (index % columns) * cell_w
             y = (index // columns) * cell_h
-            member_image = self._member_cover_image(member.thumbnail_path, (cell_w, cell_h))
+            member_image = self._member_cover_image(
+                member_images.get(member.thumbnail_path) if member.thumbnail_path else None,
+                (cell_w, cell_h),
+            )
             if member_image is None:
                 continue
             collage.alpha_composite(member_image, (x, y))
         return qimage_from_cover_image(collage, (width, height))
 
-    def _member_cover_image(self, thumbnail_path: Path | None, size: tuple[int, int]):
+    def _member_cover_image(self, image, size: tuple[int, int]):
         from PIL import Image
 
-        if thumbnail_path is not None and thumbnail_path.exists():
-            try:
-                image = load_image_rgb(thumbnail_path)
-                return image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
-            except Exception:
-                return None
-        return None
+        if image is None:
+            return None
+        try:
+            return image.convert("RGBA").resize(size, Image.Resampling.LANCZOS)
+        except Exception:
+            return None
 
     def _collage_signature_parts(self) -> list[str]:
         parts = [self.group_id]
@@ -463,12 +466,11 @@ class GroupCard(QWidget):
             if thumbnail_path is None:
                 parts.append("missing")
                 continue
-            try:
-                stat = thumbnail_path.stat()
-            except OSError:
+            signature = face_crop_signature(thumbnail_path)
+            if signature is None:
                 parts.append(str(thumbnail_path))
                 continue
-            parts.append(f"{thumbnail_path}:{stat.st_mtime_ns}:{stat.st_size}")
+            parts.append(f"{thumbnail_path}:{signature}")
         return parts
 
     def paintEvent(self, _event) -> None:  # noqa: N802
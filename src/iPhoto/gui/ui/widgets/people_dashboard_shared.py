@@ -104,6 +104,10 @@ def request_cover_pixmap(image_path: Path | None, size: tuple[int, int]) -> tupl
     return _PEOPLE_COVER_CACHE.get_thumbnail(image_path, size)
 
 
+def prefetch_cover_pixmaps(image_paths: Iterable[Path | None], size: tuple[int, int]) -> None:
+    _PEOPLE_COVER_CACHE.prefetch_thumbnails(image_paths, size)
+
+
 def request_rendered_cover_pixmap(
     *,
     cache_id: str,
@@ -32,8 +32,11 @@ from .people_dashboard_board import GroupBoard, PeopleBoard
 from .people_dashboard_cards import GroupCard, PeopleCard
 from .people_dashboard_dialogs import GroupPeopleDialog, MergeConfirmDialog
 from .people_dashboard_shared import (
+    CARD_HEIGHT,
+    CARD_WIDTH,
     _widget_uses_dark_theme,
     configure_people_cover_cache,
+    prefetch_cover_pixmaps,
 )
 
 
@@ -395,6 +398,10 @@ class PeopleDashboardWidget(QWidget):
             self._cards[summary.person_id] = card
             cards.append(card)
         self._board.set_cards(cards)
+        prefetch_cover_pixmaps(
+            (summary.thumbnail_path for summary in self._summaries),
+            (CARD_WIDTH * 2, CARD_HEIGHT * 2),
+        )
         for card in cards:
             card.load_cover_artwork()
 
@@ -185,10 +185,7 @@ def to_dto(asset: Asset, library_root: Optional[Path]) -> AssetDTO:
             if size_bytes is None or size_bytes > 1 * 1024 * 1024:
                 is_pano = True
 
-    micro_thumbnail = metadata.get("micro_thumbnail")
-    micro_thumbnail_image = None
-    if isinstance(micro_thumbnail, (bytes, bytearray, memoryview)):
-        micro_thumbnail_image = image_loader.qimage_from_bytes(bytes(micro_thumbnail))
+    micro_thumbnail_image = _decode_micro_thumbnail(metadata.get("micro_thumbnail"))
 
     width_value = (
         _coerce_positive_number(asset.width)
@@ -366,7 +363,11 @@ def _decode_micro_thumbnail(value: object) -> Optional[QImage]:
     if isinstance(value, QImage):
         return value if not value.isNull() else None
     if isinstance(value, (bytes, bytearray, memoryview)):
-        image = image_loader.qimage_from_bytes(bytes(value))
+        # Raw micro payloads are wrapped in place; only rows not yet migrated
+        # from the JPEG format pay for a decode.
+        image = image_loader.qimage_from_micro_thumbnail(value)
+        if image is None:
+            image = image_loader.qimage_from_bytes(bytes(value))
         if image is not None and not image.isNull():
             return image
     return None
@@ -6,6 +6,7 @@ import copy
 import os
 import time
 from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Dict, Iterable, List, Optional, Protocol
 
@@ -101,6 +102,18 @@ def _ranges_intersect(first_a: int, last_a: int, first_b: int, last_b: int) -> b
     return first_a <= last_b and first_b <= last_a
 
 
+@dataclass(slots=True)
+class _CollectionSnapshot:
+    """Rows and position of a query view the user navigated away from."""
+
+    root: Optional[Path]
+    query: AssetQuery
+    total_count: int
+    rows: Dict[int, AssetDTO]
+    visible_range: tuple[int, int]
+    collection_revision: int
+
+
 class GalleryCollectionStore:
     """Pure Python gallery data store with viewport-aware caching."""
 
@@ -111,6 +124,7 @@ class GalleryCollectionStore:
     LOOKBEHIND_SCREENS = 1
     LOOKAHEAD_SCREENS = 2
     HYSTERESIS_RATIO = 0.25
+    SNAPSHOT_LIMIT = 8
 
     def __init__(
         self,
@@ -123,6 +137,7 @@ class GalleryCollectionStore:
         self.row_changed = Signal()
         self.row_loaded = Signal()
         self.thumbnail_backfill_scheduled = Signal()
+        self.scroll_restored = Signal()
 
         self._asset_query_service = asset_query_service
         self._library_root = library_root or getattr(asset_query_service, "library_root", None)
@@ -152,11 +167,13 @@ class GalleryCollectionStore:
         self._pending_window_generations: set[int] = set()
         self._window_request_handler: Callable[[GalleryWindowRequest], None] | None = None
         self._pending_row_loads: set[int] = set()
+        self._snapshots: OrderedDict[tuple[Optional[str], str], _CollectionSnapshot] = OrderedDict()
 
     def set_library_root(self, root: Optional[Path]) -> None:
         if self._library_root == root:
             return
         self._library_root = root
+        self._snapshots.clear()
         self._reset_window_state(clear_pending=True)
         self.data_changed.emit()
 
@@ -167,6 +184,7 @@ class GalleryCollectionStore:
         if self._asset_query_service is asset_query_service:
             return
         self._asset_query_service = asset_query_service
+        self._snapshots.clear()
         self._reset_window_state()
         self.data_changed.emit()
 
@@ -218,9 +236,10 @@ class GalleryCollectionStore:
         if has_query == has_direct_assets:
             raise ValueError("Exactly one of query or direct_assets must be provided.")
 
+        self._remember_snapshot()
         self.set_active_root(active_root)
         if query is not None:
-            self._load_query(query)
+            self._load_query(query, restore_snapshot=True)
             return
 
         resolved_library_root = library_root or self._library_root or active_root
@@ -238,14 +257,22 @@ class GalleryCollectionStore:
         if self._selection_query is not None:
             self._load_query(self._selection_query)
 
-    def _load_query(self, query: AssetQuery) -> None:
+    def _load_query(self, query: AssetQuery, *, restore_snapshot: bool = False) -> None:
         old_total = self._total_count
+        snapshot = self._snapshots.pop(self._snapshot_key(query), None)
         self._selection_query = self._clone_query(query)
         self._selection_direct_assets = None
         self._selection_library_root = self._library_root
         self._current_query = self._clone_query(query)
         self._direct_mode = False
         self._reset_window_state()
+        if (
+            restore_snapshot
+            and snapshot is not None
+            and self._window_request_handler is not None
+        ):
+            self._restore_snapshot(snapshot, old_total)
+            return
         if self._window_request_handler is None:
             self._load_initial_window()
         else:
@@ -257,6 +284,89 @@ class GalleryCollectionStore:
             )
         self._emit_refresh(old_total)
 
+    def _snapshot_key(self, query: AssetQuery) -> tuple[Optional[str], str]:
+        root = self._active_root or self._library_root
+        return (str(root) if root is not None else None, repr(self._count_query(query)))
+
+    def _remember_snapshot(self) -> None:
+        """Keep the current query view so revisiting it paints from memory."""
+
+        if (
+            self._direct_mode
+            or self._current_query is None
+            or self._total_count <= 0
+            or self._pending_moves
+        ):
+            return
+        visible = self._visible_range or (0, max(0, self.INITIAL_VISIBLE_ROWS - 1))
+        first, last = self._compute_target_window(*visible, self._total_count)
+        rows = {row: dto for row, dto in self._row_cache.items() if first <= row <= last}
+        if not rows:
+            return
+        key = self._snapshot_key(self._current_query)
+        self._snapshots[key] = _CollectionSnapshot(
+            root=self._active_root or self._library_root,
+            query=self._clone_query(self._current_query),
+            total_count=self._total_count,
+            rows=rows,
+            visible_range=visible,
+            collection_revision=self._collection_revision,
+        )
+        self._snapshots.move_to_end(key)
+        while len(self._snapshots) > self.SNAPSHOT_LIMIT:
+            self._snapshots.popitem(last=False)
+
+    def _restore_snapshot(self, snapshot: _CollectionSnapshot, old_total: int) -> None:
+        """Publish *snapshot* immediately, then revalidate it in the background."""
+
+        self._row_cache = OrderedDict(sorted(snapshot.rows.items()))
+        self._total_count = snapshot.total_count
+        self._visible_range = snapshot.visible_range
+        self._window_range = self._cache_window_range()
+        self._collection_revision = max(self._collection_revision, snapshot.collection_revision)
+        emit_perf_event(
+            "gallery_snapshot_restored",
+            rows=len(snapshot.rows),
+            total_count=snapshot.total_count,
+            first_visible=snapshot.visible_range[0],
+        )
+        self._request_async_window(*snapshot.visible_range)
+        self._emit_refresh(old_total)
+        self.scroll_restored.emit(snapshot.visible_range[0])
+
+    def _forget_snapshots(self, predicate: Callable[[AssetQuery], bool]) -> None:
+        for key, snapshot in list(self._snapshots.items()):
+            if predicate(snapshot.query):
+                del self._snapshots[key]
+
+    def _forget_snapshots_for_scan(self, scan_root: Path, rows: List[dict]) -> None:
+        """Drop remembered views whose root contains any of the scanned *rows*."""
+
+        if not self._snapshots or not rows:
+            return
+        try:
+            scan_root_resolved = scan_root.resolve()
+        except OSError:
+            self._snapshots.clear()
+            return
+        rels = [row.get("rel") for row in rows]
+        for key, snapshot in list(self._snapshots.items()):
+            if snapshot.root is None:
+                del self._snapshots[key]
+                continue
+            try:
+                view_root = snapshot.root.resolve()
+            except OSError:
+                del self._snapshots[key]
+                continue
+            if any(
+                isinstance(rel, str)
+                and rel
+                and self._resolve_view_rel(rel, scan_root_resolved, view_root) is not None
+                for rel in rels
+            ):
+                del self._snapshots[key]
+
     def _load_direct_assets(self, assets: list, library_root: Path) -> None:
         old_total = self._total_count
         stored_assets = list(assets)
@@ -405,6 +515,7 @@ class GalleryCollectionStore:
         if dto is None:
             return
         dto.is_favorite = is_favorite
+        self._forget_snapshots(lambda snapshot_query: snapshot_query.is_favorite is not None)
         self.row_changed.emit(row)
 
     def update_asset_metadata(self, row: int, metadata: Dict[str, object]) -> None:
@@ -437,6 +548,7 @@ class GalleryCollectionStore:
 
         old_total = self._total_count
         removed_set = set(removed)
+        self._snapshots.clear()
         new_cache: Dict[int, AssetDTO] = {}
         removed_before = 0
         removed_index = 0
@@ -476,6 +588,8 @@ class GalleryCollectionStore:
     ) -> tuple[list[int], list[AssetDTO]]:
         if not paths:
             return [], []
+        # Moved assets leave and join other collections; their snapshots are stale.
+        self._snapshots.clear()
         destination_album_path = self._album_path_for_root(destination_root)
         removed_rows: list[int] = []
         inserted_dtos: list[AssetDTO] = []
@@ -976,6 +1090,7 @@ class GalleryCollectionStore:
             ):
                 self._pending_scan_refresh = False
             return False
+        self._forget_snapshots_for_scan(Path(root), list(rows))
         return self._record_scan_rows(Path(root), list(rows))
 
     def handle_scan_finished(self, root: Path, success: bool) -> None:
@@ -44,6 +44,7 @@ from .gallery_thumbnail_hint_loader import (
 )
 from .gallery_tile import GalleryTileRecord, GalleryTileSnapshot
 from .gallery_window_loader import GalleryWindowLoader, GalleryWindowResult
+from .micro_thumbnail_atlas import MicroThumbnailAtlas
 
 
 class GalleryListModelAdapter(QAbstractListModel):
@@ -69,6 +70,7 @@ class GalleryListModelAdapter(QAbstractListModel):
         self._last_selection_signature: tuple[str, str, str] | None = None
         self._last_window_identity_signature: tuple[str, ...] | None = None
         self._duration_cache: dict[Path, float] = {}
+        self._micro_atlas = MicroThumbnailAtlas()
         self._pending_prioritize_range: tuple[int, int] | None = None
         self._viewport_generation = 0
         self._viewport_demand: GalleryViewportDemand | None = None
@@ -183,13 +185,19 @@ class GalleryListModelAdapter(QAbstractListModel):
         if role_int == Roles.TILE_SNAPSHOT:
             full = self._thumbnails.peek_full_thumbnail(asset.abs_path, self._thumb_size)
             micro = asset.micro_thumbnail if isinstance(asset.micro_thumbnail, QImage) else None
+            has_full = isinstance(full, QPixmap) and not full.isNull()
             loading_state = (
                 "full"
-                if isinstance(full, QPixmap) and not full.isNull()
+                if has_full
                 else "micro"
                 if micro is not None and not micro.isNull()
                 else "placeholder"
             )
+            micro_atlas_rect = (
+                self._micro_atlas.rect_for(str(asset.id), micro)
+                if loading_state == "micro"
+                else None
+            )
             return GalleryTileSnapshot(
                 record=GalleryTileRecord(
                     asset_id=str(asset.id),
@@ -205,6 +213,8 @@ class GalleryListModelAdapter(QAbstractListModel):
                 full_pixmap=full if isinstance(full, QPixmap) else None,
                 loading_state=loading_state,
                 is_current=row == self._current_row,
+                micro_atlas=self._micro_atlas.image if micro_atlas_rect is not None else None,
+                micro_atlas_rect=micro_atlas_rect,
             )
         if role_int == Qt.DecorationRole:
             return self._thumbnails.peek_full_thumbnail(asset.abs_path, self._thumb_size)
@@ -393,6 +403,7 @@ class GalleryListModelAdapter(QAbstractListModel):
         self._last_selection_signature = None
         self._last_window_identity_signature = None
         self._duration_cache.clear()
+        self._micro_atlas.clear()
         self._demand_coordinator.reset()
         self._thumbnail_hint_request_id += 1
         self._thumbnail_hint_loader.cancel_pending()
@@ -432,6 +443,7 @@ class GalleryListModelAdapter(QAbstractListModel):
             rows = sorted(set(removed_rows), reverse=True)
             for row in rows:
                 self.beginRemoveRows(QModelIndex(), row, row)
+                self._discard_micro_atlas_rows([row])
                 self._store.remove_rows([row], emit=False)
                 self.endRemoveRows()
         if inserted_dtos:
@@ -459,10 +471,19 @@ class GalleryListModelAdapter(QAbstractListModel):
             return False
         rows = list(range(row, row + count))
         self.beginRemoveRows(parent, row, row + count - 1)
+        self._discard_micro_atlas_rows(rows)
         self._store.remove_rows(rows, emit=False)
         self.endRemoveRows()
         return True
 
+    def _discard_micro_atlas_rows(self, rows: list[int]) -> None:
+        """Free the atlas cells of *rows* so removed assets stop holding them."""
+
+        for row in rows:
+            asset = self._store.asset_at(row)
+            if asset is not None:
+                self._micro_atlas.discard(str(asset.id))
+
     def set_current_row(self, row: int) -> None:
         if self._current_row == row:
             return
@@ -551,6 +572,8 @@ class GalleryListModelAdapter(QAbstractListModel):
         )
         if collection_revision_changed:
             self._demand_coordinator.hint_candidates_by_row.clear()
+        if old_selection_signature != current_selection_signature:
+            self._micro_atlas.clear()
         if (
             old_snapshot is not None
             and old_selection_signature == current_selection_signature
@@ -6,6 +6,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal
 
+from PySide6.QtCore import QRect
 from PySide6.QtGui import QImage, QPixmap
 
 GalleryLoadingState = Literal["placeholder", "micro", "full"]
@@ -34,6 +35,9 @@ class GalleryTileSnapshot:
     full_pixmap: QPixmap | None
     loading_state: GalleryLoadingState
     is_current: bool = False
+    # Placeholder cell in the shared micro atlas; preferred over micro_image.
+    micro_atlas: QImage | None = None
+    micro_atlas_rect: QRect | None = None
 
 
 __all__ = ["GalleryLoadingState", "GalleryTileRecord", "GalleryTileSnapshot"]
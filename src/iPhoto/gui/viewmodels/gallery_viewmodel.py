@@ -374,7 +374,7 @@ class GalleryViewModel(BaseViewModel):
         else:
             query = service.build_group_query(current_id)
 
-        if not query.asset_ids:
+        if not (query.asset_ids or query.person_ids):
             self.return_from_cluster_gallery()
             return
 
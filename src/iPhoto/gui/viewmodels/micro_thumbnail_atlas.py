@@ -0,0 +1,108 @@
+"""Shared atlas image holding the gallery's micro thumbnail placeholders."""
+
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from PySide6.QtCore import QRect
+from PySide6.QtGui import QImage
+
+from iPhoto.gui.gallery_demand import MICRO_WARM_LIMIT
+from iPhoto.utils.micro_thumbnail import MICRO_THUMBNAIL_SIZE
+
+_ATLAS_COLUMNS = 64
+_ATLAS_FORMAT = QImage.Format.Format_RGB16
+# Each cell carries a one-pixel border copied from its edge pixels so that
+# bilinear sampling at the cell boundary never blends in a neighbour.
+_CELL_PITCH = MICRO_THUMBNAIL_SIZE + 2
+
+
+@dataclass(slots=True)
+class _AtlasSlot:
+    index: int
+    source_key: int
+    rect: QRect
+
+
+class MicroThumbnailAtlas:
+    """Pack micro thumbnails into fixed-size cells of one RGB565 image.
+
+    Tiles paint their placeholder as a sub-rectangle of the shared image, so
+    fast scrolling neither converts nor allocates anything per tile.  Cells
+    are recycled least-recently-used once every slot is taken; a cell is
+    rewritten when the asset's micro image changes.
+    """
+
+    def __init__(self, capacity: int = MICRO_WARM_LIMIT) -> None:
+        self._capacity = max(1, int(capacity))
+        rows = math.ceil(self._capacity / _ATLAS_COLUMNS)
+        columns = min(self._capacity, _ATLAS_COLUMNS)
+        self._image = QImage(columns * _CELL_PITCH, rows * _CELL_PITCH, _ATLAS_FORMAT)
+        self._image.fill(0)
+        self._columns = columns
+        self._slots: OrderedDict[str, _AtlasSlot] = OrderedDict()
+        self._free = list(range(self._capacity - 1, -1, -1))
+
+    @property
+    def image(self) -> QImage:
+        return self._image
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def rect_for(self, key: str, micro: QImage) -> QRect | None:
+        """Return the atlas rectangle holding *micro* for *key*, packing it if needed."""
+
+        if micro.isNull():
+            return None
+        source_key = micro.cacheKey()
+        slot = self._slots.get(key)
+        if slot is not None:
+            self._slots.move_to_end(key)
+            if slot.source_key == source_key:
+                return slot.rect
+            index = slot.index
+        elif self._free:
+            index = self._free.pop()
+        else:
+            _evicted, oldest = self._slots.popitem(last=False)
+            index = oldest.index
+        rect = self._write(index, micro)
+        self._slots[key] = _AtlasSlot(index, source_key, rect)
+        return rect
+
+    def discard(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is not None:
+            self._free.append(slot.index)
+
+    def clear(self) -> None:
+        self._slots.clear()
+        self._free = list(range(self._capacity - 1, -1, -1))
+
+    def _write(self, index: int, micro: QImage) -> QRect:
+        if micro.format() != _ATLAS_FORMAT:
+            # Only micro images not stored as RGB565 pay for a conversion.
+            micro = micro.convertToFormat(_ATLAS_FORMAT)
+        width = min(micro.width(), MICRO_THUMBNAIL_SIZE)
+        height = min(micro.height(), MICRO_THUMBNAIL_SIZE)
+        source = np.frombuffer(micro.constBits(), dtype=np.uint16).reshape(
+            micro.height(),
+            micro.bytesPerLine() // 2,
+        )[:height, :width]
+        # ``bits`` is requested per write: it detaches the atlas if a paint
+        # engine still shares it, rather than scribbling on shared pixels.
+        atlas = np.frombuffer(self._image.bits(), dtype=np.uint16).reshape(
+            self._image.height(),
+            self._image.bytesPerLine() // 2,
+        )
+        left = (index % self._columns) * _CELL_PITCH
+        top = (index // self._columns) * _CELL_PITCH
+        atlas[top:top + height + 2, left:left + width + 2] = np.pad(source, 1, mode="edge")
+        return QRect(left + 1, top + 1, width, height)
+
+
+__all__ = ["MicroThumbnailAtlas"]
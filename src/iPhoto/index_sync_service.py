@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import asdict
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from .cache.lock import FileLock
-from .config import RECENTLY_DELETED_DIR_NAME
+from .config import (
+    ALBUM_MANIFEST_NAMES,
+    ALL_WORK_DIR_NAMES,
+    EXPORT_DIR_NAME,
+    RECENTLY_DELETED_DIR_NAME,
+)
 from .core.pairing import pair_live
-from .errors import IndexCorruptedError, ManifestInvalidError
+from .errors import IndexCorruptedError, IPhotoError, ManifestInvalidError
 from .domain.models.core import LiveGroup
 from .path_normalizer import compute_album_path, normalise_rel_key
 from .utils.jsonio import read_json, write_json
@@ -189,15 +195,85 @@ def sync_live_roles_to_db(
         groups: List of LiveGroup objects to sync.
         library_root: If provided, use this as the database root (global database).
     """
-    updates: List[Tuple[str, int, Optional[str]]] = []
-    
-    # Compute album path for library-relative paths
-    album_prefix = ""
+    album_prefix = _album_prefix(root, library_root)
+    updates = _live_role_updates(groups, album_prefix)
+
+    if album_prefix:
+        repository.apply_live_role_updates_for_prefix(album_prefix, updates)
+    else:
+        repository.apply_live_role_updates(updates)
+
+
+def link_new_rows(
+    root: Path,
+    new_rows: List[dict],
+    candidate_rows: List[dict],
+    library_root: Optional[Path] = None,
+    *,
+    repository: "AssetRepositoryPort",
+) -> List[LiveGroup]:
+    """Pair *new_rows* against *candidate_rows* without re-pairing the album.
+
+    Only groups that contain at least one new row are kept; their roles are
+    written without resetting the rest of the scope and they are merged into
+    the existing ``links.json`` snapshot.  All rows are album-relative.
+    """
+    new_rels = {row.get("rel") for row in new_rows}
+    groups = [
+        group
+        for group in pair_live([*new_rows, *candidate_rows])
+        if group.still in new_rels or group.motion in new_rels
+    ]
+    if not groups:
+        return []
+    repository.assign_live_roles(
+        _live_role_updates(groups, _album_prefix(root, library_root))
+    )
+
+    links_path = ensure_work_dir(root) / "links.json"
+    existing: Dict[str, object] = {}
+    if links_path.exists():
+        try:
+            existing = read_json(links_path)
+        except ManifestInvalidError:
+            existing = {}
+    if not isinstance(existing, dict):
+        existing = {}
+    claimed = {rel for group in groups for rel in (group.still, group.motion)}
+    kept = [
+        entry
+        for entry in existing.get("live_groups") or []
+        if isinstance(entry, dict)
+        and entry.get("still") not in claimed
+        and entry.get("motion") not in claimed
+    ]
+    payload: Dict[str, object] = {
+        "schema": "iPhoto/links@1",
+        "live_groups": kept + [asdict(group) for group in groups],
+        "clips": existing.get("clips") or [],
+    }
+    try:
+        write_links(root, payload)
+    except Exception as exc:  # pragma: no cover - derived snapshot failure must not break runtime state
+        LOGGER.warning("Failed to update derived links.json for %s: %s", root, exc)
+    return groups
+
+
+def _album_prefix(root: Path, library_root: Optional[Path]) -> str:
+    """Return the ``album/`` prefix that turns album rels into library rels."""
+
     if library_root:
         rel = compute_album_path(root, library_root)
         if rel:
-            album_prefix = f"{rel}/"
+            return f"{rel}/"
+    return ""
+
 
+def _live_role_updates(
+    groups: Iterable[LiveGroup],
+    album_prefix: str,
+) -> List[Tuple[str, int, Optional[str]]]:
+    updates: List[Tuple[str, int, Optional[str]]] = []
     for group in groups:
         if not group.still or not group.motion:
             continue
@@ -209,11 +285,91 @@ def sync_live_roles_to_db(
 
         # Motion component: Role 1 (Hidden), Partner = Still
         updates.append((motion_rel, 1, still_rel))
+    return updates
 
-    if album_prefix:
-        repository.apply_live_role_updates_for_prefix(album_prefix, updates)
-    else:
-        repository.apply_live_role_updates(updates)
+
+# Directories that never hold user albums, matching the album tree's filter.
+_NON_ALBUM_DIR_NAMES = frozenset(
+    name.casefold() for name in (*ALL_WORK_DIR_NAMES, RECENTLY_DELETED_DIR_NAME, EXPORT_DIR_NAME)
+)
+# First path component of each manifest name, e.g. ``.iPhoto`` for
+# ``.iPhoto/manifest.json``.
+_MANIFEST_ENTRY_NAMES = frozenset(name.split("/", 1)[0] for name in ALBUM_MANIFEST_NAMES)
+
+
+def iter_album_roots(root: Path) -> Iterator[Path]:
+    """Yield *root* and every directory below it that may hold an album manifest.
+
+    Only directory listings are read; :func:`sync_album_registry` stats and
+    parses the manifests themselves.
+    """
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        if _MANIFEST_ENTRY_NAMES.intersection(filenames) or _MANIFEST_ENTRY_NAMES.intersection(
+            dirnames
+        ):
+            yield Path(dirpath)
+        dirnames[:] = [name for name in dirnames if name.casefold() not in _NON_ALBUM_DIR_NAMES]
+
+
+def sync_album_registry(
+    library_root: Path,
+    album_roots: Iterable[Path],
+    *,
+    repository: "AssetRepositoryPort",
+    prune: bool = False,
+) -> int:
+    """Register the manifest ids and covers of *album_roots* in the album registry.
+
+    Manifests whose modification time matches the stored registration are
+    not parsed again.  With *prune*, *album_roots* is the complete set of
+    albums and registrations for any other path are dropped.  Returns the
+    number of albums whose registration was written.
+    """
+    registered = repository.read_album_registry()
+    entries: List[Tuple[str, str, Optional[int], Optional[str]]] = []
+    seen: set[str] = set()
+    for album_root in album_roots:
+        try:
+            album_path = Path(os.path.relpath(album_root, library_root)).as_posix()
+        except ValueError:
+            continue
+        if album_path.startswith(".."):
+            continue
+        album_path = "" if album_path == "." else album_path
+        for manifest_name in ALBUM_MANIFEST_NAMES:
+            manifest_path = Path(album_root) / manifest_name
+            try:
+                mtime_ns = manifest_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            seen.add(album_path)
+            stored = registered.get(album_path)
+            if stored is not None and stored[1] == mtime_ns:
+                break
+            try:
+                manifest = read_json(manifest_path)
+            except IPhotoError:
+                break
+            if not isinstance(manifest, dict):
+                break
+            album_id = manifest.get("id")
+            cover_rel = manifest.get("cover")
+            if isinstance(album_id, str) and album_id.strip():
+                entries.append(
+                    (
+                        album_id.strip(),
+                        album_path,
+                        mtime_ns,
+                        cover_rel if isinstance(cover_rel, str) and cover_rel else None,
+                    )
+                )
+            break
+
+    removed = sorted(set(registered) - seen) if prune else []
+    if entries or removed:
+        repository.update_album_registry(entries, removed_paths=removed)
+    return len(entries)
 
 
 def prune_index_scope(
@@ -306,8 +462,11 @@ def _row_modified_after_scan_start_by_other_job(
 __all__ = [
     "compute_links_payload",
     "ensure_links",
+    "link_new_rows",
     "load_incremental_index_cache",
+    "iter_album_roots",
     "prune_index_scope",
+    "sync_album_registry",
     "sync_live_roles_to_db",
     "update_index_snapshot",
     "write_links",
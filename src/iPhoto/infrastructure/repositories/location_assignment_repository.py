@@ -62,9 +62,11 @@ class IndexStoreLocationAssignmentRepository:
             if row is None:
                 raise ValueError(f"Asset is not indexed in this library: {asset_rel}")
 
-            update_parts = ["gps = ?", "has_gps = ?", "location = ?"]
+            update_parts = ["gps = ?", "gps_lat = ?", "gps_lon = ?", "has_gps = ?", "location = ?"]
             params: list[Any] = [
                 json.dumps(normalized_gps, ensure_ascii=False),
+                normalized_gps["lat"],
+                normalized_gps["lon"],
                 1,
                 normalized_location,
             ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -13,8 +13,14 @@ from ...io.scanner_adapter import scan_album
 class FilesystemMediaScanner(MediaScannerPort):
     """Adapter around the existing filesystem scanner implementation."""
 
-    def __init__(self, *, thumbnail_cache_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        thumbnail_cache_dir: Path | None = None,
+        workers: int = 1,
+    ) -> None:
         self._thumbnail_cache_dir = thumbnail_cache_dir
+        self._workers = max(1, int(workers))
 
     def scan(
         self,
@@ -24,6 +30,8 @@ class FilesystemMediaScanner(MediaScannerPort):
         *,
         existing_index: dict[str, dict[str, Any]] | None = None,
         progress_callback: Callable[[int, int], None] | None = None,
+        completed_dirs: Collection[str] | None = None,
+        directory_callback: Callable[[str], None] | None = None,
     ) -> Iterator[dict[str, Any]]:
         scanner = scan_album(
             root,
@@ -32,6 +40,9 @@ class FilesystemMediaScanner(MediaScannerPort):
             existing_index=existing_index,
             progress_callback=progress_callback,
             thumbnail_cache_dir=self._thumbnail_cache_dir,
+            completed_dirs=completed_dirs,
+            directory_callback=directory_callback,
+            workers=self._workers,
         )
         try:
             yield from scanner
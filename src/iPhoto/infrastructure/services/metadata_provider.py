@@ -7,6 +7,7 @@ import logging
 
 from iPhoto.application.interfaces import IMetadataProvider
 from iPhoto.utils.exiftool import get_metadata_batch
+from iPhoto.io.extended_metadata import encode_extended_metadata, extract_extended_metadata
 from iPhoto.io.metadata import read_image_meta_with_exiftool, read_video_meta
 from iPhoto.people import initial_face_status
 from iPhoto.utils.hashutils import compute_file_id
@@ -25,9 +26,19 @@ class ExifToolMetadataProvider(IMetadataProvider):
             logger.error(f"Failed to get metadata batch: {e}")
             return []
 
-    def normalize_metadata(self, root: Path, file_path: Path, raw_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_metadata(
+        self,
+        root: Path,
+        file_path: Path,
+        raw_metadata: Dict[str, Any],
+        *,
+        asset_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
         Normalize raw metadata using logic similar to the legacy scanner.
+
+        *asset_id* is used instead of hashing the file again when the caller
+        already knows it (imports hash while copying).
         """
         stat = file_path.stat()
         rel = file_path.relative_to(root).as_posix()
@@ -38,7 +49,7 @@ class ExifToolMetadataProvider(IMetadataProvider):
             "bytes": stat.st_size,
             "dt": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).isoformat().replace("+00:00", "Z"),
             "ts": int(stat.st_mtime * 1_000_000),
-            "id": f"as_{compute_file_id(file_path)}",
+            "id": asset_id or f"as_{compute_file_id(file_path)}",
             "mime": mimetypes.guess_type(file_path.name)[0],
         }
 
@@ -104,6 +115,13 @@ class ExifToolMetadataProvider(IMetadataProvider):
             else:
                 row["media_type"] = None
 
+        # Keep the secondary tags ExifTool already returned so the info panel
+        # never has to run it again for this file.
+        if raw_metadata and (suffix in self._IMAGE_EXTENSIONS or suffix in self._VIDEO_EXTENSIONS):
+            row["extended_meta"] = encode_extended_metadata(
+                extract_extended_metadata(raw_metadata, row)
+            )
+
         row["face_status"] = initial_face_status(row)
 
         return row
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import hashlib
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Optional
 
 from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 from PySide6.QtGui import QImage, QPixmap
 
-from iPhoto.people.image_utils import create_cover_thumbnail, load_image_rgb
+from iPhoto.people.face_crop_store import face_crop_signature, load_face_crops
+from iPhoto.people.image_utils import create_cover_thumbnail
 
 
 class PeopleCoverWorkerSignals(QObject):
@@ -37,9 +38,42 @@ class PeopleCoverRenderTask(QRunnable):
         self._signals.result.emit(self._cache_key, image)
 
 
+class PeopleCoverBatchRenderTask(QRunnable):
+    """Decode many face crops in one pass and emit each rendered cover."""
+
+    def __init__(
+        self,
+        *,
+        requests: list[tuple[str, Path]],
+        size: tuple[int, int],
+        signals: PeopleCoverWorkerSignals,
+    ) -> None:
+        super().__init__()
+        self._requests = requests
+        self._size = size
+        self._signals = signals
+
+    def run(self) -> None:
+        try:
+            images = load_face_crops(path for _key, path in self._requests)
+        except Exception:
+            images = {}
+        for cache_key, path in self._requests:
+            image = images.get(path)
+            cover = QImage()
+            if image is not None:
+                try:
+                    cover = _qimage_cover(image, self._size) or QImage()
+                except Exception:
+                    cover = QImage()
+            self._signals.result.emit(cache_key, cover)
+
+
 class PeopleCoverCacheService(QObject):
     coverReady = Signal(str)
 
+    BATCH_SIZE = 64
+
     def __init__(self, disk_cache_path: Path, memory_limit_items: int = 512) -> None:
         super().__init__()
         self._disk_cache_path = Path(disk_cache_path)
@@ -67,16 +101,46 @@ class PeopleCoverCacheService(QObject):
     def get_thumbnail(self, path: Path, size: tuple[int, int]) -> tuple[str | None, Optional[QPixmap]]:
         if self._is_shutting_down:
             return None, None
-        signature = self._path_signature(path)
-        if signature is None:
+        key = self._thumbnail_key(path, size)
+        if key is None:
             return None, None
-        key = self._cache_key("path", str(path.resolve()), signature, self._size_key(size))
         pixmap = self._get_or_start(
             key,
             lambda: self._render_path_thumbnail(path, size),
         )
         return key, pixmap
 
+    def prefetch_thumbnails(self, paths: Iterable[Path | None], size: tuple[int, int]) -> None:
+        """Start batched renders for covers that are not cached yet.
+
+        Later :meth:`get_thumbnail` calls for the same paths find the render
+        pending and wait for ``coverReady`` like a single request would.
+        """
+
+        if self._is_shutting_down:
+            return
+        misses: list[tuple[str, Path]] = []
+        for path in paths:
+            if path is None:
+                continue
+            key = self._thumbnail_key(path, size)
+            if key is None or key in self._memory_cache or key in self._pending_tasks:
+                continue
+            if self._disk_file(key).exists():
+                continue
+            self._pending_tasks.add(key)
+            misses.append((key, path))
+        for start in range(0, len(misses), self.BATCH_SIZE):
+            worker_signals = PeopleCoverWorkerSignals()
+            worker_signals.result.connect(self._handle_render_result)
+            self._thread_pool.start(
+                PeopleCoverBatchRenderTask(
+                    requests=misses[start : start + self.BATCH_SIZE],
+                    size=size,
+                    signals=worker_signals,
+                )
+            )
+
     def get_rendered_cover(
         self,
         *,
@@ -143,21 +207,16 @@ class PeopleCoverCacheService(QObject):
         self._memory_cache[cache_key] = pixmap
 
     def _render_path_thumbnail(self, path: Path, size: tuple[int, int]) -> Optional[QImage]:
-        if not path.exists():
+        image = load_face_crops([path]).get(path)
+        if image is None:
             return None
-        width, height = int(size[0]), int(size[1])
-        if width <= 0 or height <= 0:
+        return _qimage_cover(image, size)
+
+    def _thumbnail_key(self, path: Path, size: tuple[int, int]) -> str | None:
+        signature = self._path_signature(path)
+        if signature is None:
             return None
-        image = load_image_rgb(path)
-        cover = create_cover_thumbnail(image, (width, height))
-        data = cover.tobytes("raw", "RGBA")
-        return QImage(
-            data,
-            width,
-            height,
-            width * 4,
-            QImage.Format.Format_RGBA8888,
-        ).copy()
+        return self._cache_key("path", str(path.resolve()), signature, self._size_key(size))
 
     def _disk_file(self, cache_key: str) -> Path:
         return self._disk_cache_path / f"{cache_key}.png"
@@ -173,8 +232,19 @@ class PeopleCoverCacheService(QObject):
 
     @staticmethod
     def _path_signature(path: Path) -> str | None:
-        try:
-            stat = path.stat()
-        except OSError:
-            return None
-        return f"{stat.st_mtime_ns}:{stat.st_size}"
+        return face_crop_signature(path)
+
+
+def _qimage_cover(image, size: tuple[int, int]) -> Optional[QImage]:
+    width, height = int(size[0]), int(size[1])
+    if width <= 0 or height <= 0:
+        return None
+    cover = create_cover_thumbnail(image, (width, height))
+    data = cover.tobytes("raw", "RGBA")
+    return QImage(
+        data,
+        width,
+        height,
+        width * 4,
+        QImage.Format.Format_RGBA8888,
+    ).copy()
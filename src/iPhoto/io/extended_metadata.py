@@ -0,0 +1,142 @@
+"""Compact, versioned extended-metadata payloads persisted with index rows.
+
+The scanner already runs ExifTool over every file; beyond the normalised
+``assets`` columns it keeps a small JSON payload of secondary tags (lens
+make, exposure program, bit rate, GPS altitude, ...).  The payload carries a
+version so readers can tell rows scanned before a field existed apart from
+rows whose file simply lacks the tag, and only re-extract the former.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Optional
+
+from .metadata_extractors import _coerce_decimal, _coerce_fractional, _extract_group, _pick_string
+
+EXTENDED_METADATA_VERSION = 1
+
+# ``assets`` columns shown by the info panel.  Rows with a current payload
+# have had these extracted too, so a missing value means the file lacks it.
+DETAIL_FIELDS = (
+    "make",
+    "model",
+    "lens",
+    "iso",
+    "f_number",
+    "exposure_time",
+    "exposure_compensation",
+    "focal_length",
+    "frame_rate",
+    "codec",
+    "dur",
+)
+
+# Payload key -> (kind, tag, preferred ExifTool ``-g1`` groups).  Tags absent
+# from the preferred groups are looked up in every other group.
+_EXTENDED_TAGS: Dict[str, tuple[str, str, tuple[str, ...]]] = {
+    "lens_make": ("text", "LensMake", ("ExifIFD", "XMP-exifEX")),
+    "software": ("text", "Software", ("IFD0", "Keys", "QuickTime")),
+    "exposure_program": ("int", "ExposureProgram", ("ExifIFD",)),
+    "metering_mode": ("int", "MeteringMode", ("ExifIFD",)),
+    "flash": ("int", "Flash", ("ExifIFD",)),
+    "white_balance": ("int", "WhiteBalance", ("ExifIFD",)),
+    "focal_length_35mm": ("number", "FocalLengthIn35mmFormat", ("ExifIFD", "Composite")),
+    "color_space": ("int", "ColorSpace", ("ExifIFD",)),
+    "orientation": ("int", "Orientation", ("IFD0",)),
+    "rotation": ("int", "Rotation", ("Composite", "Track1")),
+    "gps_altitude": ("number", "GPSAltitude", ("GPS", "Composite", "XMP-exif")),
+    "gps_direction": ("number", "GPSImgDirection", ("GPS", "XMP-exif")),
+    "gps_speed": ("number", "GPSSpeed", ("GPS", "XMP-exif")),
+    "gps_accuracy": ("number", "GPSHPositioningError", ("GPS", "Keys")),
+    "bit_rate": ("number", "AvgBitrate", ("Composite",)),
+    "audio_format": ("text", "AudioFormat", ("Track2", "Track3", "QuickTime")),
+    "audio_channels": ("int", "AudioChannels", ("Track2", "Track3", "QuickTime")),
+    "audio_sample_rate": ("number", "AudioSampleRate", ("Track2", "Track3", "QuickTime")),
+}
+
+
+def extract_extended_metadata(
+    metadata: Optional[Mapping[str, Any]],
+    info: Optional[Mapping[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Return the extended fields found in an ExifTool ``-n -g1`` payload.
+
+    *info* holds the already normalised row, used to derive a bit rate from
+    size and duration when the container does not report one.
+    """
+
+    extended: Dict[str, Any] = {}
+    if isinstance(metadata, Mapping):
+        payload = dict(metadata)
+        for key, (kind, tag, groups) in _EXTENDED_TAGS.items():
+            value = _coerce_tag(kind, _find_tag(payload, tag, groups))
+            if value is not None:
+                extended[key] = value
+    if "bit_rate" not in extended and isinstance(info, Mapping):
+        size = _coerce_decimal(info.get("bytes"))
+        duration = _coerce_decimal(info.get("dur"))
+        if size and duration and size > 0 and duration > 0:
+            extended["bit_rate"] = round(size * 8 / duration)
+    return extended
+
+
+def encode_extended_metadata(extended: Mapping[str, Any]) -> str:
+    """Serialise *extended* into the compact payload stored on index rows."""
+
+    payload = {key: value for key, value in extended.items() if value is not None}
+    payload["v"] = EXTENDED_METADATA_VERSION
+    return json.dumps(payload, separators=(",", ":"), sort_keys=True, ensure_ascii=False)
+
+
+def decode_extended_metadata(value: Any) -> Optional[Dict[str, Any]]:
+    """Return the fields of a stored payload, or None when missing or outdated."""
+
+    if isinstance(value, (bytes, bytearray)):
+        value = bytes(value).decode("utf-8", errors="replace")
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        payload = json.loads(value)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict) or payload.get("v") != EXTENDED_METADATA_VERSION:
+        return None
+    payload.pop("v")
+    return payload
+
+
+def _find_tag(metadata: Dict[str, Any], tag: str, groups: tuple[str, ...]) -> Any:
+    for group_name in groups:
+        group = _extract_group(metadata, group_name)
+        if group and group.get(tag) not in (None, ""):
+            return group[tag]
+    for key, group in metadata.items():
+        if isinstance(group, Mapping) and group.get(tag) not in (None, ""):
+            return group[tag]
+        if isinstance(key, str) and key.endswith(f":{tag}") and group not in (None, ""):
+            return group
+    return None
+
+
+def _coerce_tag(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "text":
+        return _pick_string(value)
+    numeric = _coerce_fractional(value)
+    if numeric is None:
+        return None
+    if kind == "int":
+        return int(round(numeric))
+    return round(numeric, 6)
+
+
+__all__ = [
+    "DETAIL_FIELDS",
+    "EXTENDED_METADATA_VERSION",
+    "decode_extended_metadata",
+    "encode_extended_metadata",
+    "extract_extended_metadata",
+]
@@ -1,11 +1,14 @@
 """Adapter to bridge legacy scanner calls to the new infrastructure."""
 
 from pathlib import Path
-from typing import Iterator, Dict, Any, List, Optional, Callable, Iterable
-from io import BytesIO
+from typing import Iterator, Dict, Any, List, Optional, Callable, Collection, Iterable, Mapping
+from dataclasses import dataclass
+import multiprocessing
 import os
 import queue
 import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 import unicodedata
 from datetime import datetime, timezone
 import logging
@@ -26,7 +29,8 @@ from ..infrastructure.services.thumbnail_generator import PillowThumbnailGenerat
 from ..people import initial_face_status
 from ..utils.hashutils import compute_file_id
 from ..utils.media_access import media_access
-from ..utils.pathutils import ensure_work_dir, should_include
+from ..utils.micro_thumbnail import encode_micro_thumbnail
+from ..utils.pathutils import compile_path_matcher, ensure_work_dir
 from ..config import (
     ALL_WORK_DIR_NAMES,
     DEFAULT_EXCLUDE,
@@ -119,11 +123,7 @@ def _generate_micro_from_full_cache(cache_file: Path) -> bytes | None:
     try:
         with Image.open(cache_file) as image:
             image.thumbnail((16, 16), Image.Resampling.BICUBIC)
-            if image.mode != "RGB":
-                image = image.convert("RGB")
-            payload = BytesIO()
-            image.save(payload, format="JPEG", quality=75)
-            return payload.getvalue()
+            return encode_micro_thumbnail(image)
     except (OSError, ValueError):
         LOGGER.debug("Failed to derive micro thumbnail from %s", cache_file, exc_info=True)
         return None
@@ -203,12 +203,17 @@ class FileDiscoveryThread(threading.Thread):
         queue_obj: queue.Queue,
         include: list[str] | None = None,
         exclude: list[str] | None = None,
+        *,
+        skip_dirs: Collection[str] = (),
+        report_directories: bool = False,
     ) -> None:
         super().__init__(name=f"ScannerDiscovery-{root.name}")
         self._root = Path(root)
         self._queue = queue_obj
         self._include = include or list(DEFAULT_INCLUDE)
         self._exclude = exclude or list(DEFAULT_EXCLUDE)
+        self._skip_dirs = frozenset(skip_dirs)
+        self._report_directories = report_directories
         self._stop_event = threading.Event()
         self.total_found = 0
         self.daemon = True
@@ -219,24 +224,35 @@ class FileDiscoveryThread(threading.Thread):
                 *[name.casefold() for name in ALL_WORK_DIR_NAMES],
                 EXPORT_DIR_NAME.casefold(),
             }
+            matcher = compile_path_matcher(self._include, self._exclude)
+            root_text = os.fspath(self._root)
+            # Walk in sorted order so the committed-directory checkpoints of an
+            # interrupted job describe a stable prefix of the tree.
             for dirpath, dirnames, filenames in os.walk(self._root):
                 if self._stop_event.is_set():
                     break
-                dirnames[:] = [
-                    name for name in dirnames if name.casefold() not in reserved_names
-                ]
-                for name in filenames:
+                # Derive relative paths with string slicing instead of
+                # ``Path.relative_to`` so the per-file cost stays at one
+                # matcher call on very large trees.
+                rel_dir = _relative_dir(root_text, dirpath)
+                prefix = f"{rel_dir}/" if rel_dir else ""
+                dirnames[:] = sorted(
+                    name
+                    for name in dirnames
+                    if name.casefold() not in reserved_names
+                    and not matcher.prunes_dir(prefix + name)
+                )
+                if rel_dir in self._skip_dirs:
+                    continue
+                for name in sorted(filenames):
                     if self._stop_event.is_set():
                         break
-                    candidate = Path(dirpath) / name
-                    if should_include(
-                        candidate,
-                        self._include,
-                        self._exclude,
-                        root=self._root,
-                    ):
-                        self._queue.put(candidate)
+                    if matcher.matches_rel(prefix + name):
+                        self._queue.put(Path(dirpath) / name)
                         self.total_found += 1
+                else:
+                    if self._report_directories:
+                        self._queue.put(DirectoryCompleted(rel_dir))
         finally:
             self._queue.put(None)
 
@@ -244,7 +260,29 @@ class FileDiscoveryThread(threading.Thread):
         self._stop_event.set()
 
 
-def _fallback_row_for_path(root: Path, path: Path) -> Dict[str, Any]:
+@dataclass(frozen=True)
+class DirectoryCompleted:
+    """Queue marker sent once every file of *rel_dir* has been discovered."""
+
+    rel_dir: str
+
+
+def _relative_dir(root_text: str, dirpath: str) -> str:
+    """Return *dirpath* relative to *root_text* as a POSIX string."""
+
+    if dirpath == root_text:
+        return ""
+    # ``os.walk`` joins every yielded directory onto the original top path,
+    # so the relative part is always a plain suffix.
+    rel = dirpath[len(root_text):].lstrip(os.sep)
+    return rel.replace(os.sep, "/") if os.sep != "/" else rel
+
+
+def _fallback_row_for_path(
+    root: Path,
+    path: Path,
+    asset_id: Optional[str] = None,
+) -> Dict[str, Any]:
     """Build a minimal index row when rich metadata extraction fails."""
 
     stat = path.stat()
@@ -264,7 +302,7 @@ def _fallback_row_for_path(root: Path, path: Path) -> Dict[str, Any]:
         "bytes": stat.st_size,
         "dt": dt_obj.isoformat().replace("+00:00", "Z"),
         "ts": int(stat.st_mtime * 1_000_000),
-        "id": f"as_{compute_file_id(path)}",
+        "id": asset_id or f"as_{compute_file_id(path)}",
         "mime": mime,
         "media_type": media_type,
         "aspect_ratio": None,
@@ -280,8 +318,13 @@ def process_media_paths(
     video_paths: List[Path],
     *,
     thumbnail_cache_dir: Path | None = None,
+    asset_ids: Mapping[Path, str] | None = None,
 ) -> Iterator[Dict[str, Any]]:
-    """Yield populated index rows for the provided media paths."""
+    """Yield populated index rows for the provided media paths.
+
+    *asset_ids* maps paths whose asset id is already known (hashed during an
+    import copy) so they are not read again to compute it.
+    """
 
     all_paths = image_paths + video_paths
     if not all_paths:
@@ -306,6 +349,7 @@ def process_media_paths(
                 meta_lookup[unicodedata.normalize('NFD', src)] = m
 
         for path in batch:
+            known_id = asset_ids.get(path) if asset_ids else None
             try:
                 raw_meta = meta_lookup.get(path.as_posix())
                 if not raw_meta:
@@ -314,10 +358,15 @@ def process_media_paths(
                     raw_meta = meta_lookup.get(unicodedata.normalize('NFD', path.as_posix()))
 
                 # Normalize
-                row = _metadata_provider.normalize_metadata(root, path, raw_meta or {})
+                if known_id:
+                    row = _metadata_provider.normalize_metadata(
+                        root, path, raw_meta or {}, asset_id=known_id
+                    )
+                else:
+                    row = _metadata_provider.normalize_metadata(root, path, raw_meta or {})
             except Exception as exc:
                 try:
-                    row = _fallback_row_for_path(root, path)
+                    row = _fallback_row_for_path(root, path, known_id)
                 except OSError as os_exc:
                     LOGGER.warning(
                         "Skipping %s because metadata extraction failed (%s) and no fallback row could be built (%s)",
@@ -357,9 +406,21 @@ def scan_album(
     existing_index: Optional[Dict[str, Dict[str, Any]]] = None,
     progress_callback: Optional[Callable[[int, int], None]] = None,
     thumbnail_cache_dir: Path | None = None,
+    completed_dirs: Collection[str] | None = None,
+    directory_callback: Optional[Callable[[str], None]] = None,
+    workers: int = 1,
 ) -> Iterator[Dict[str, Any]]:
-    """Yield index rows for all matching assets in *root*, scanning in parallel."""
+    """Yield index rows for all matching assets in *root*, scanning in parallel.
+
+    Directories listed in *completed_dirs* were fully committed by an earlier
+    run of the same scan job: their files are not revisited and the matching
+    *existing_index* rows are replayed as-is. *directory_callback* receives
+    each root-relative directory once all of its rows have been yielded.
+    With *workers* above one, metadata and thumbnail extraction for uncached
+    files runs in a process pool while discovery continues.
+    """
 
+    skip_dirs = frozenset(completed_dirs or ())
     path_queue = queue.Queue(maxsize=1000)
     # FileDiscoveryThread expects list, ensure we pass lists
     discoverer = FileDiscoveryThread(
@@ -367,6 +428,8 @@ def scan_album(
         path_queue,
         include=list(include_globs),
         exclude=list(exclude_globs),
+        skip_dirs=skip_dirs,
+        report_directories=directory_callback is not None,
     )
     discoverer.start()
 
@@ -374,9 +437,15 @@ def scan_album(
     BATCH_SIZE = 50
     total_processed = 0
     resolved_thumbnail_cache_dir = thumbnail_cache_dir or _default_thumbnail_cache_dir(root)
+    executor = _create_process_pool(workers) if workers > 1 else None
+    # Batches handed to the pool, oldest first, with the directories whose
+    # rows are complete once that batch (and every earlier one) is yielded.
+    inflight: deque[tuple[Optional[Future], int, List[str]]] = deque()
+    max_inflight = max(1, workers) * 2
 
-    def process_batch_rows(paths: List[Path]) -> Iterator[Dict[str, Any]]:
+    def partition_batch(paths: List[Path]) -> tuple[List[Dict[str, Any]], List[Path]]:
         # Check cache first to avoid expensive metadata extraction
+        cached_rows: List[Dict[str, Any]] = []
         paths_to_process = []
         for p in paths:
             rel = p.relative_to(root).as_posix()
@@ -403,18 +472,25 @@ def scan_album(
                             cached,
                             resolved_thumbnail_cache_dir,
                         ):
-                            yield cached
+                            cached_rows.append(cached)
                         else:
-                            yield _refresh_cached_thumbnail(
-                                p,
-                                cached,
-                                resolved_thumbnail_cache_dir,
+                            cached_rows.append(
+                                _refresh_cached_thumbnail(
+                                    p,
+                                    cached,
+                                    resolved_thumbnail_cache_dir,
+                                )
                             )
                         continue
                 except OSError:
                     pass
 
             paths_to_process.append(p)
+        return cached_rows, paths_to_process
+
+    def process_batch_rows(paths: List[Path]) -> Iterator[Dict[str, Any]]:
+        cached_rows, paths_to_process = partition_batch(paths)
+        yield from cached_rows
 
         # Process remaining
         if paths_to_process:
@@ -426,10 +502,69 @@ def scan_album(
                 thumbnail_cache_dir=resolved_thumbnail_cache_dir,
             )
 
+    replayed = 0
+    # Directories whose files are all queued but whose rows are still waiting
+    # in ``batch``; they are reported once that batch has been yielded.
+    pending_dirs: List[str] = []
+
+    def report_dirs(rel_dirs: List[str]) -> None:
+        if directory_callback is not None:
+            for rel_dir in rel_dirs:
+                directory_callback(rel_dir)
+
+    def report_pending_dirs() -> None:
+        report_dirs(pending_dirs)
+        pending_dirs.clear()
+
+    def drain_inflight(limit: int) -> Iterator[Dict[str, Any]]:
+        nonlocal total_processed
+        while len(inflight) > limit:
+            future, size, rel_dirs = inflight.popleft()
+            if future is not None:
+                yield from future.result()
+            total_processed += size
+            if progress_callback:
+                progress_callback(total_processed, replayed + discoverer.total_found)
+            report_dirs(rel_dirs)
+
+    def flush_batch(paths: List[Path]) -> Iterator[Dict[str, Any]]:
+        nonlocal total_processed
+        if executor is None:
+            yield from process_batch_rows(paths)
+            total_processed += len(paths)
+            if progress_callback:
+                progress_callback(total_processed, replayed + discoverer.total_found)
+            report_pending_dirs()
+            return
+        cached_rows, paths_to_process = partition_batch(paths)
+        yield from cached_rows
+        future = (
+            executor.submit(
+                _process_media_batch,
+                root,
+                paths_to_process,
+                resolved_thumbnail_cache_dir,
+            )
+            if paths_to_process
+            else None
+        )
+        inflight.append((future, len(paths), list(pending_dirs)))
+        pending_dirs.clear()
+        yield from drain_inflight(max_inflight)
+
     try:
         if progress_callback:
             progress_callback(0, 0)
 
+        if skip_dirs and existing_index:
+            for rel, cached in existing_index.items():
+                if rel.rpartition("/")[0] in skip_dirs:
+                    replayed += 1
+                    yield cached
+            total_processed = replayed
+            if progress_callback:
+                progress_callback(total_processed, replayed)
+
         while True:
             try:
                 path = path_queue.get(timeout=0.5)
@@ -441,21 +576,31 @@ def scan_album(
             if path is None:
                 break
 
+            if isinstance(path, DirectoryCompleted):
+                if batch:
+                    pending_dirs.append(path.rel_dir)
+                elif inflight:
+                    inflight[-1][2].append(path.rel_dir)
+                else:
+                    report_dirs([path.rel_dir])
+                continue
+
             batch.append(path)
             if len(batch) >= BATCH_SIZE:
-                yield from process_batch_rows(batch)
-                total_processed += len(batch)
-                if progress_callback:
-                    progress_callback(total_processed, discoverer.total_found)
+                yield from flush_batch(batch)
                 batch = []
 
         if batch:
-            yield from process_batch_rows(batch)
-            total_processed += len(batch)
-            if progress_callback:
-                progress_callback(total_processed, discoverer.total_found)
+            yield from flush_batch(batch)
+        yield from drain_inflight(0)
+        report_pending_dirs()
 
     finally:
+        if executor is not None:
+            # Let running batches finish their atomic thumbnail writes but
+            # drop queued ones, so an interrupted scan exits promptly.
+            executor.shutdown(wait=True, cancel_futures=True)
+
         # Cleanup logic similar to original scanner
         discoverer.stop()
 
@@ -470,6 +615,27 @@ def scan_album(
         discoverer.join(timeout=1.0)
 
 
+def _process_media_batch(
+    root: Path,
+    paths: List[Path],
+    thumbnail_cache_dir: Path,
+) -> List[Dict[str, Any]]:
+    """Process-pool entry point: extract metadata and thumbnails for *paths*."""
+
+    return list(
+        process_media_paths(root, paths, [], thumbnail_cache_dir=thumbnail_cache_dir)
+    )
+
+
+def _create_process_pool(workers: int) -> ProcessPoolExecutor:
+    # ``spawn`` keeps workers independent of the discovery thread and of any
+    # Qt state in the parent, and behaves the same on every platform.
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
 def _cached_thumbnail_ready(
     path: Path,
     cached: Dict[str, Any],
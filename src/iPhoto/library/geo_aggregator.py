@@ -58,13 +58,23 @@ class GeoAggregatorMixin:
             return []
         from ..bootstrap.library_location_service import LibraryLocationService
 
-        service = LibraryLocationService(root, query_service=query_service)
+        # Keep one service per root and query surface so a dropped cache is
+        # refreshed from the geotagged change log instead of rebuilt.
+        service = getattr(self, "_geotagged_location_service", None)
+        if (
+            service is None
+            or service.library_root != root
+            or getattr(service, "_query_service", None) is not query_service
+        ):
+            service = LibraryLocationService(root, query_service=query_service)
+            self._geotagged_location_service = service
+        else:
+            service.invalidate_cache()
         assets = service.list_geotagged_assets()
-        setattr(self, "_geotagged_assets_cache_root", root)
-        setattr(self, "_geotagged_assets_cache", list(assets))
+        self._geotagged_assets_cache_root = root
+        self._geotagged_assets_cache = list(assets)
         return list(assets)
 
-
 __all__ = [
     "GeoAggregatorMixin",
     "GeotaggedAsset",
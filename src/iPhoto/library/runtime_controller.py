@@ -15,7 +15,16 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional
 
-from PySide6.QtCore import QFileSystemWatcher, QObject, Qt, QTimer, Signal, QThreadPool, QMutex
+from PySide6.QtCore import (
+    QFileSystemWatcher,
+    QMutex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 
 from ..errors import LibraryUnavailableError
 from ..utils.logging import get_logger
@@ -39,6 +48,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from .workers.face_scan_worker import FaceScanWorker
     from .workers.scanner_worker import ScannerWorker
     from ..application.ports import (
+        AssetRepositoryPort,
         AssetStateServicePort,
         EditServicePort,
         LocationAssetServicePort,
@@ -49,6 +59,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from ..bootstrap.library_asset_lifecycle_service import LibraryAssetLifecycleService
     from ..bootstrap.library_asset_operation_service import LibraryAssetOperationService
     from ..bootstrap.library_asset_query_service import LibraryAssetQueryService
+    from ..bootstrap.library_location_service import LibraryLocationService
     from ..bootstrap.library_session import LibrarySession
     from ..bootstrap.library_scan_service import LibraryScanService
     from ..application.ports import LibraryStateRepositoryPort
@@ -104,12 +115,17 @@ class LibraryRuntimeController(
         self._current_face_scanner: Optional[FaceScanWorker] = None
         self._cancelled_scanner_workers: set[int] = set()
         self._scan_thread_pool = QThreadPool.globalInstance()
+        # Registry syncs each walk the whole library; run them one at a time
+        # on a pool that ``shutdown`` can drain.
+        self._album_registry_pool = QThreadPool(self)
+        self._album_registry_pool.setMaxThreadCount(1)
         self._live_scan_buffer: List[Dict] = []
         self._live_scan_root: Optional[Path] = None
         self._deferred_scan_queue: list[tuple[Path, list[str], list[str]]] = []
         self._scan_buffer_lock = QMutex()
         self._geotagged_assets_cache: Optional[List[GeotaggedAsset]] = None
         self._geotagged_assets_cache_root: Optional[Path] = None
+        self._geotagged_location_service: "LibraryLocationService | None" = None
         self._face_scan_status_message: Optional[str] = None
         self._people_index_coordinator: PeopleIndexCoordinator | None = None
         self._library_session: "LibrarySession | None" = None
@@ -138,6 +154,8 @@ class LibraryRuntimeController(
 
         self._geotagged_assets_cache = None
         self._geotagged_assets_cache_root = None
+        if self._geotagged_location_service is not None:
+            self._geotagged_location_service.invalidate_cache()
         location_service = getattr(self, "location_service", None)
         invalidate_cache = getattr(location_service, "invalidate_cache", None)
         if callable(invalidate_cache):
@@ -244,6 +262,8 @@ class LibraryRuntimeController(
         """Stop background workers and watchers during application shutdown."""
 
         self.stop_scanning(wait=True)
+        if not self._album_registry_pool.waitForDone(2000):
+            LOGGER.warning("Album registry sync did not finish within 2000 ms; continuing teardown.")
         self._debounce.stop()
         if self._watcher.directories():
             self._watcher.removePaths(self._watcher.directories())
@@ -255,6 +275,7 @@ class LibraryRuntimeController(
         self._watch_scan_queue.clear()
         self._geotagged_assets_cache = None
         self._geotagged_assets_cache_root = None
+        self._geotagged_location_service = None
         self._unbind_people_index_coordinator()
 
     def face_scan_status_message(self) -> str | None:
@@ -315,6 +336,7 @@ class LibraryRuntimeController(
         """Bind the current library session scan command surface."""
 
         self._scan_service = scan_service
+        self._sync_album_registry()
 
     @property
     def scan_service(self) -> "LibraryScanService | None":
@@ -565,8 +587,52 @@ class LibraryRuntimeController(
         self._nodes = new_nodes
         self._geotagged_assets_cache = None
         self._geotagged_assets_cache_root = None
+        self._sync_album_registry()
         self._rebuild_watches()
         self.treeUpdated.emit()
 
+    def _sync_album_registry(self) -> None:
+        """Mirror the library's albums into the index's album id registry.
+
+        The sidebar tree only covers two levels, so creates, renames and
+        moves are picked up by a full manifest walk on the thread pool.
+        """
+
+        root = self._root
+        scan_service = self._scan_service
+        if root is None or not callable(getattr(scan_service, "sync_library_album_registry", None)):
+            return
+        try:
+            if Path(scan_service.library_root).resolve() != root:
+                return
+        except OSError:
+            return
+        # Resolved here: the worker may run after another library is bound.
+        repository = scan_service.repository()
+        self._album_registry_pool.start(_AlbumRegistryWorker(scan_service, repository))
+
+
+class _AlbumRegistryWorker(QRunnable):
+    """Refresh the album id registry off the main thread."""
+
+    def __init__(
+        self,
+        scan_service: "LibraryScanService",
+        repository: "AssetRepositoryPort",
+    ) -> None:
+        super().__init__()
+        self._scan_service = scan_service
+        self._repository = repository
+
+    def run(self) -> None:
+        try:
+            self._scan_service.sync_library_album_registry(self._repository)
+        except Exception as exc:  # noqa: BLE001 - registry is a derived lookup
+            LOGGER.warning(
+                "Failed to refresh the album registry for %s: %s",
+                self._scan_service.library_root,
+                exc,
+            )
+
 
 __all__ = ["GeotaggedAsset", "LibraryRuntimeController"]
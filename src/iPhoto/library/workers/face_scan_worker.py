@@ -8,6 +8,7 @@ from typing import Iterable
 
 from PySide6.QtCore import QThread, Signal
 
+from ...people.face_crop_store import open_face_crop_store
 from ...people.index_coordinator import (
     PeopleIndexCoordinator,
     PeopleSnapshotCommittedError,
@@ -32,7 +33,7 @@ class FaceScanWorker(QThread):
     peopleIndexUpdated = Signal()
     statusChanged = Signal(str)
 
-    BATCH_SIZE = 4
+    BATCH_SIZE = 8
     QUEUE_TARGET_SIZE = 16
 
     def __init__(
@@ -86,6 +87,23 @@ class FaceScanWorker(QThread):
             self.statusChanged.emit("Face scanning is unavailable for this library.")
             return
 
+        _migrate_loose_face_crops(paths.thumbnail_dir)
+        try:
+            self._consume(coordinator, pipeline, paths.thumbnail_dir)
+        finally:
+            _close_pipeline(pipeline)
+        if not self._cancelled:
+            # Re-clustering and rescans replace face rows; drop their crops.
+            collect_face_crop_garbage = getattr(coordinator, "collect_face_crop_garbage", None)
+            if callable(collect_face_crop_garbage):
+                collect_face_crop_garbage()
+
+    def _consume(
+        self,
+        coordinator: PeopleIndexCoordinator,
+        pipeline: FaceClusterPipeline,
+        thumbnail_dir: Path,
+    ) -> None:
         while not self._cancelled:
             self._top_up_pending_rows()
             batch = self._next_batch()
@@ -101,7 +119,7 @@ class FaceScanWorker(QThread):
                     batch,
                     coordinator,
                     pipeline,
-                    paths.thumbnail_dir,
+                    thumbnail_dir,
                 )
                 for asset_id in [str(row.get("id") or "") for row in batch if row.get("id")]:
                     self._queued_ids.discard(asset_id)
@@ -269,3 +287,31 @@ class FaceScanWorker(QThread):
         if store is None:
             return
         store.update_face_statuses(asset_ids, status)
+
+
+def _migrate_loose_face_crops(thumbnail_dir: Path) -> None:
+    """Pack per-face PNGs written by earlier versions into the crop store."""
+
+    try:
+        store = open_face_crop_store(thumbnail_dir, create=True)
+        store.migrate_loose_files()
+    except Exception as exc:
+        LOGGER.warning("Face thumbnail migration failed for %s: %s", thumbnail_dir, exc)
+
+
+def _close_pipeline(pipeline: FaceClusterPipeline) -> None:
+    """Log per-stage detection throughput and stop the engine threads."""
+
+    face_scan_stats = getattr(pipeline, "face_scan_stats", None)
+    if callable(face_scan_stats):
+        for stage, stats in face_scan_stats().items():
+            if stats.images_per_sec is not None:
+                LOGGER.info(
+                    "face scan %s: %d images at %.1f images/s",
+                    stage,
+                    stats.images,
+                    stats.images_per_sec,
+                )
+    close = getattr(pipeline, "close", None)
+    if callable(close):
+        close()
@@ -0,0 +1,494 @@
+"""Packed storage for People face-crop thumbnails.
+
+Face crops used to be written as one PNG per face.  They now live in a single
+append-only pack file of JPEG payloads next to a small SQLite offset table, so
+a large library keeps two files instead of one per face and cover loads are
+memory-mapped slices instead of file opens.
+
+Face records keep their ``thumbnails/<face_id>.png`` style paths; the path is a
+logical key whose parent names the store directory and whose stem names the
+crop.  Readers fall back to a loose file at that path until the one-time
+migration has packed it.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import mmap
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Iterable
+
+from PIL import Image
+
+from .image_utils import crop_face_thumbnail, load_image_rgb
+
+_LOGGER = logging.getLogger(__name__)
+
+INDEX_FILENAME = "face_crops.db"
+_PACK_PREFIX = "face_crops-"
+_PACK_SUFFIX = ".pack"
+_JPEG_QUALITY = 90
+# Compact once dead payloads outweigh live ones.
+_COMPACTION_DEAD_RATIO = 0.5
+_GC_GRACE_SECONDS = 600.0
+
+
+class FaceCropStore:
+    """Append-only pack of encoded face crops keyed by face id.
+
+    Writers serialise on SQLite's write lock, so the scan worker, the GUI and
+    a headless ``iphoto index`` process can share one store.  Compaction
+    writes a new pack generation instead of rewriting in place; readers map
+    the generation recorded in the same snapshot as the offsets they read.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self._directory / INDEX_FILENAME,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS face_crops (
+                face_id TEXT PRIMARY KEY,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL,
+                width INTEGER NOT NULL,
+                height INTEGER NOT NULL,
+                stored_at REAL NOT NULL
+            ) WITHOUT ROWID
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS store_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            )
+            """)
+        self._mapped_generation: int | None = None
+        self._mapped: mmap.mmap | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    def close(self) -> None:
+        with self._lock:
+            self._unmap()
+            self._conn.close()
+
+    def put(self, face_id: str, image: Image.Image) -> None:
+        self.put_many([(face_id, image)])
+
+    def put_many(self, items: Iterable[tuple[str, Image.Image]]) -> int:
+        """Encode and append *items*, replacing earlier crops for the same ids."""
+
+        encoded = [
+            (str(face_id), _encode_crop(image), image.size)
+            for face_id, image in items
+            if face_id
+        ]
+        if not encoded:
+            return 0
+        with self._lock, self._write_transaction() as conn:
+            generation = _read_generation(conn)
+            stored_at = time.time()
+            with open(self._pack_path(generation), "ab") as pack:
+                offset = pack.seek(0, os.SEEK_END)
+                rows = []
+                for face_id, payload, (width, height) in encoded:
+                    pack.write(payload)
+                    rows.append((face_id, offset, len(payload), width, height, stored_at))
+                    offset += len(payload)
+            conn.executemany(
+                """
+                INSERT INTO face_crops (face_id, offset, length, width, height, stored_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(face_id) DO UPDATE SET
+                    offset = excluded.offset,
+                    length = excluded.length,
+                    width = excluded.width,
+                    height = excluded.height,
+                    stored_at = excluded.stored_at
+                """,
+                rows,
+            )
+        return len(encoded)
+
+    def contains(self, face_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM face_crops WHERE face_id = ?",
+                (face_id,),
+            ).fetchone()
+        return row is not None
+
+    def signature(self, face_id: str) -> str | None:
+        """Return a token that changes whenever *face_id*'s crop is rewritten."""
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                generation = _read_generation(self._conn)
+                row = self._conn.execute(
+                    "SELECT offset, length FROM face_crops WHERE face_id = ?",
+                    (face_id,),
+                ).fetchone()
+            finally:
+                self._conn.execute("COMMIT")
+        if row is None:
+            return None
+        return f"pack:{generation}:{row[0]}:{row[1]}"
+
+    def read_bytes(self, face_id: str) -> bytes | None:
+        return self.read_many([face_id]).get(face_id)
+
+    def read_many(self, face_ids: Iterable[str]) -> dict[str, bytes]:
+        """Return encoded payloads for the stored subset of *face_ids*.
+
+        Slices are read in pack order so a dashboard page of covers costs one
+        mostly sequential pass over the mapping.
+        """
+
+        wanted = sorted({str(face_id) for face_id in face_ids if face_id})
+        if not wanted:
+            return {}
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                generation = _read_generation(self._conn)
+                rows: list[tuple[str, int, int]] = []
+                for start in range(0, len(wanted), 500):
+                    chunk = wanted[start : start + 500]
+                    placeholders = ",".join("?" for _ in chunk)
+                    rows.extend(
+                        self._conn.execute(
+                            "SELECT face_id, offset, length FROM face_crops "
+                            f"WHERE face_id IN ({placeholders})",
+                            chunk,
+                        ).fetchall()
+                    )
+            finally:
+                self._conn.execute("COMMIT")
+            if not rows:
+                return {}
+            mapped = self._map(generation)
+            if mapped is None:
+                return {}
+            payloads: dict[str, bytes] = {}
+            for face_id, offset, length in sorted(rows, key=lambda row: row[1]):
+                if offset + length <= len(mapped):
+                    payloads[face_id] = mapped[offset : offset + length]
+            return payloads
+
+    def load(self, face_id: str) -> Image.Image | None:
+        return self.load_many([face_id]).get(face_id)
+
+    def load_many(self, face_ids: Iterable[str]) -> dict[str, Image.Image]:
+        """Decode the stored subset of *face_ids* to RGB images."""
+
+        images: dict[str, Image.Image] = {}
+        for face_id, payload in self.read_many(face_ids).items():
+            try:
+                with Image.open(io.BytesIO(payload)) as image:
+                    images[face_id] = image.convert("RGB")
+            except OSError:
+                _LOGGER.warning("Skipping unreadable packed face crop %s", face_id)
+        return images
+
+    def discard(self, face_ids: Iterable[str]) -> int:
+        """Drop index entries for *face_ids*; space is reclaimed on compaction."""
+
+        ids = [(str(face_id),) for face_id in face_ids if face_id]
+        if not ids:
+            return 0
+        with self._lock, self._write_transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("DELETE FROM face_crops WHERE face_id = ?", ids)
+            return conn.total_changes - before
+
+    def collect_garbage(
+        self,
+        live_face_ids: Iterable[str],
+        *,
+        grace_seconds: float = _GC_GRACE_SECONDS,
+    ) -> int:
+        """Drop crops not in *live_face_ids* and compact a mostly dead pack.
+
+        Crops younger than *grace_seconds* are kept: the scanner stores a crop
+        before the coordinator commits its face row.  Returns the number of
+        crops removed.
+        """
+
+        live = {str(face_id) for face_id in live_face_ids if face_id}
+        cutoff = time.time() - max(0.0, float(grace_seconds))
+        with self._lock, self._write_transaction() as conn:
+            stored = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT face_id FROM face_crops WHERE stored_at <= ?",
+                    (cutoff,),
+                )
+            ]
+            dead = [(face_id,) for face_id in stored if face_id not in live]
+            conn.executemany("DELETE FROM face_crops WHERE face_id = ?", dead)
+            self._compact_if_sparse(conn)
+        if dead:
+            _LOGGER.info("Removed %d orphaned face crops from %s", len(dead), self._directory)
+        return len(dead)
+
+    def migrate_loose_files(self) -> int:
+        """Pack ``<face_id>.png`` files left by earlier versions, once.
+
+        Loose files are deleted only after their crop has been committed.
+        Returns the number of files migrated.
+        """
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM store_meta WHERE key = 'loose_files_migrated'"
+            ).fetchone()
+        if row is not None:
+            return 0
+        migrated = 0
+        loose_files = sorted(self._directory.glob("*.png"))
+        for start in range(0, len(loose_files), 256):
+            chunk = loose_files[start : start + 256]
+            items: list[tuple[str, Image.Image]] = []
+            for path in chunk:
+                try:
+                    items.append((path.stem, load_image_rgb(path)))
+                except Exception:
+                    _LOGGER.warning("Skipping unreadable face thumbnail %s", path)
+            self.put_many(items)
+            for face_id, _image in items:
+                (self._directory / f"{face_id}.png").unlink(missing_ok=True)
+            migrated += len(items)
+        with self._lock, self._write_transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO store_meta (key, value) "
+                "VALUES ('loose_files_migrated', '1')"
+            )
+        if migrated:
+            _LOGGER.info("Packed %d face thumbnails into %s", migrated, self._directory)
+        return migrated
+
+    def _compact_if_sparse(self, conn: sqlite3.Connection) -> None:
+        generation = _read_generation(conn)
+        pack_path = self._pack_path(generation)
+        try:
+            pack_size = pack_path.stat().st_size
+        except FileNotFoundError:
+            return
+        live_bytes = conn.execute("SELECT COALESCE(SUM(length), 0) FROM face_crops").fetchone()[0]
+        if pack_size == 0 or (pack_size - live_bytes) / pack_size <= _COMPACTION_DEAD_RATIO:
+            return
+
+        next_generation = generation + 1
+        next_path = self._pack_path(next_generation)
+        rows = conn.execute(
+            "SELECT face_id, offset, length FROM face_crops ORDER BY offset"
+        ).fetchall()
+        moved: list[tuple[int, str]] = []
+        with open(pack_path, "rb") as source, open(next_path, "wb") as target:
+            for face_id, offset, length in rows:
+                source.seek(offset)
+                moved.append((target.tell(), face_id))
+                target.write(source.read(length))
+        conn.executemany("UPDATE face_crops SET offset = ? WHERE face_id = ?", moved)
+        conn.execute(
+            "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('generation', ?)",
+            (str(next_generation),),
+        )
+        # Readers that still hold the old snapshot keep their mapping; new
+        # snapshots name the new pack, so the old file can go immediately.
+        self._unmap()
+        self._remove_stale_packs(next_generation)
+        _LOGGER.info(
+            "Compacted face crop pack %s: %d -> %d bytes",
+            self._directory,
+            pack_size,
+            live_bytes,
+        )
+
+    def _remove_stale_packs(self, current_generation: int) -> None:
+        for path in self._directory.glob(f"{_PACK_PREFIX}*{_PACK_SUFFIX}"):
+            if path == self._pack_path(current_generation):
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                # Windows refuses while another process still maps the file;
+                # the next compaction retries.
+                _LOGGER.debug("Deferred removal of face crop pack %s", path)
+
+    def _write_transaction(self):
+        return _ImmediateTransaction(self._conn)
+
+    def _pack_path(self, generation: int) -> Path:
+        return self._directory / f"{_PACK_PREFIX}{generation}{_PACK_SUFFIX}"
+
+    def _map(self, generation: int) -> mmap.mmap | None:
+        pack_path = self._pack_path(generation)
+        mapped = self._mapped
+        if mapped is not None and self._mapped_generation == generation:
+            try:
+                if pack_path.stat().st_size <= len(mapped):
+                    return mapped
+            except FileNotFoundError:
+                return None
+        self._unmap()
+        try:
+            with open(pack_path, "rb") as pack:
+                if os.fstat(pack.fileno()).st_size == 0:
+                    return None
+                mapped = mmap.mmap(pack.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return None
+        self._mapped = mapped
+        self._mapped_generation = generation
+        return mapped
+
+    def _unmap(self) -> None:
+        if self._mapped is not None:
+            self._mapped.close()
+        self._mapped = None
+        self._mapped_generation = None
+
+
+class _ImmediateTransaction:
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn.execute("BEGIN IMMEDIATE")
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._conn.execute("ROLLBACK" if exc_type is not None else "COMMIT")
+
+
+_STORES: dict[Path, FaceCropStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def open_face_crop_store(directory: Path, *, create: bool = False) -> FaceCropStore | None:
+    """Return the shared store for *directory*.
+
+    Readers pass ``create=False`` so resolving an arbitrary thumbnail path
+    never creates files; ``None`` then means the directory has no pack yet.
+    """
+
+    key = Path(directory).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            if not create and not (key / INDEX_FILENAME).exists():
+                return None
+            store = FaceCropStore(key)
+            _STORES[key] = store
+        return store
+
+
+def close_face_crop_stores() -> None:
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+        _STORES.clear()
+    for store in stores:
+        store.close()
+
+
+def store_face_crop(
+    image: Image.Image,
+    bbox: tuple[int, int, int, int],
+    thumbnail_path: Path,
+) -> Path:
+    """Crop *bbox* from *image* into the store named by *thumbnail_path*."""
+
+    store = open_face_crop_store(thumbnail_path.parent, create=True)
+    store.put(thumbnail_path.stem, crop_face_thumbnail(image, bbox))
+    return thumbnail_path
+
+
+def read_face_crop_bytes(thumbnail_path: Path) -> bytes | None:
+    """Return the encoded crop for *thumbnail_path* from disk or the pack."""
+
+    if thumbnail_path.is_file():
+        try:
+            return thumbnail_path.read_bytes()
+        except OSError:
+            return None
+    store = open_face_crop_store(thumbnail_path.parent)
+    return store.read_bytes(thumbnail_path.stem) if store is not None else None
+
+
+def load_face_crop(thumbnail_path: Path) -> Image.Image | None:
+    return load_face_crops([thumbnail_path]).get(thumbnail_path)
+
+
+def load_face_crops(thumbnail_paths: Iterable[Path]) -> dict[Path, Image.Image]:
+    """Decode many face crops, batching packed reads per store directory."""
+
+    images: dict[Path, Image.Image] = {}
+    packed: dict[Path, list[Path]] = {}
+    for path in thumbnail_paths:
+        if path.is_file():
+            try:
+                images[path] = load_image_rgb(path)
+            except Exception:
+                _LOGGER.warning("Skipping unreadable face thumbnail %s", path)
+            continue
+        packed.setdefault(path.parent, []).append(path)
+    for directory, paths in packed.items():
+        store = open_face_crop_store(directory)
+        if store is None:
+            continue
+        loaded = store.load_many(path.stem for path in paths)
+        for path in paths:
+            image = loaded.get(path.stem)
+            if image is not None:
+                images[path] = image
+    return images
+
+
+def face_crop_signature(thumbnail_path: Path) -> str | None:
+    """Return a cache signature for *thumbnail_path*, or ``None`` if missing."""
+
+    try:
+        stat = thumbnail_path.stat()
+    except OSError:
+        store = open_face_crop_store(thumbnail_path.parent)
+        return store.signature(thumbnail_path.stem) if store is not None else None
+    return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _read_generation(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT value FROM store_meta WHERE key = 'generation'").fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def _encode_crop(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.convert("RGB").save(buffer, format="JPEG", quality=_JPEG_QUALITY)
+    return buffer.getvalue()
+
+
+__all__ = [
+    "FaceCropStore",
+    "close_face_crop_stores",
+    "face_crop_signature",
+    "load_face_crop",
+    "load_face_crops",
+    "open_face_crop_store",
+    "read_face_crop_bytes",
+    "store_face_crop",
+]
@@ -7,7 +7,7 @@ import sqlite3
 from collections import defaultdict
 from contextlib import closing
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import numpy as np
 
@@ -16,17 +16,21 @@ from .records import (
     FaceRecord,
     ManualFaceRecord,
     PeopleGroupRecord,
+    PersonProfile,
     PersonRecord,
     PersonSummary,
 )
 from .repository_utils import (
     _deserialize_embedding,
+    _deserialize_embedding_sum,
     _key_face_sort_key,
     _normalize_name,
     _serialize_embedding,
+    _serialize_embedding_sum,
     _unique_person_ids,
     _utc_now_iso,
     compute_cluster_center,
+    normalize_vector,
     profile_state_for_sample_count,
 )
 from .state_repository import FaceStateRepository
@@ -41,6 +45,14 @@ class FaceMutationResult:
     group_redirects: dict[str, str | None] = field(default_factory=dict)
 
 
+def _moved_face_deltas(
+    face: FaceRecord,
+    target_person_id: str,
+) -> dict[str, tuple[np.ndarray, int]]:
+    embedding = face.embedding.astype(np.float64)
+    return {str(face.person_id): (-embedding, -1), target_person_id: (embedding, 1)}
+
+
 class FaceRepository:
     def __init__(self, db_path: Path, state_db_path: Path | None = None) -> None:
         self._db_path = Path(db_path)
@@ -72,9 +84,17 @@ class FaceRepository:
         with closing(self._connect()) as conn:
             conn.execute("DELETE FROM persons")
             conn.execute("DELETE FROM faces")
+            embedding_sums: dict[str, np.ndarray] = {}
+            for face in faces:
+                if not face.person_id or face.embedding.size == 0:
+                    continue
+                vector = normalize_vector(face.embedding).astype(np.float64)
+                previous = embedding_sums.get(face.person_id)
+                embedding_sums[face.person_id] = vector if previous is None else previous + vector
             person_rows = []
             for person in persons:
                 sample_count = max(int(person.sample_count), int(person.face_count))
+                embedding_sum = embedding_sums.get(person.person_id)
                 person_rows.append(
                     (
                         person.person_id,
@@ -86,6 +106,7 @@ class FaceRepository:
                         person.updated_at,
                         sample_count,
                         profile_state_for_sample_count(sample_count),
+                        _serialize_embedding_sum(embedding_sum) if embedding_sum is not None else None,
                     )
                 )
             conn.executemany(
@@ -122,8 +143,8 @@ class FaceRepository:
                 """
                 INSERT INTO persons (
                     person_id, name, key_face_id, face_count, center_embedding,
-                    created_at, updated_at, sample_count, profile_state
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    created_at, updated_at, sample_count, profile_state, embedding_sum
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 person_rows,
             )
@@ -136,6 +157,7 @@ class FaceRepository:
             return
         self._sync_person_cover_defaults()
         self.refresh_all_group_assets()
+        self.refresh_person_dashboard()
 
     def get_all_faces(self) -> list[FaceRecord]:
         self.initialize()
@@ -185,6 +207,19 @@ class FaceRepository:
             if row["face_key"] not in rejected_face_keys
         ]
 
+    def referenced_thumbnail_paths(self) -> set[str]:
+        """Return every face-crop path a face, manual face or cover points at."""
+
+        self.initialize()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT thumbnail_path FROM faces WHERE thumbnail_path IS NOT NULL"
+            ).fetchall()
+        paths = {str(row["thumbnail_path"]) for row in rows if row["thumbnail_path"]}
+        if self._state_repo is not None:
+            paths.update(self._state_repo.referenced_thumbnail_paths())
+        return paths
+
     def get_all_person_records(self) -> list[PersonRecord]:
         self.initialize()
         with closing(self._connect()) as conn:
@@ -220,10 +255,14 @@ class FaceRepository:
         if not clauses:
             return
 
+        deltas: dict[str, tuple[np.ndarray | None, int]] = {}
+        profiles: dict[str, PersonProfile | None] = {}
+        manual_faces: dict[str, list[ManualFaceRecord]] = defaultdict(list)
+        written_persons: dict[str, tuple[str | None, str, np.ndarray, int] | None] = {}
         with closing(self._connect()) as conn:
             matched_faces = conn.execute(
                 f"""
-                SELECT face_id, person_id
+                SELECT face_id, asset_id, person_id, embedding, embedding_dim
                 FROM faces
                 WHERE {' OR '.join(clauses)}
                 """,
@@ -232,78 +271,175 @@ class FaceRepository:
             if not matched_faces:
                 return
 
-            affected_person_ids = [
-                str(row["person_id"]) for row in matched_faces if row["person_id"]
-            ]
-            if affected_person_ids:
-                placeholders = ", ".join(["?"] * len(affected_person_ids))
-                # Runtime person rows are fully rebuilt after rescans, so remove
-                # affected clusters first to avoid dangling key_face_id references.
-                conn.execute(
-                    f"DELETE FROM persons WHERE person_id IN ({placeholders})",
-                    affected_person_ids,
-                )
+            for row in matched_faces:
+                person_id = row["person_id"]
+                if not person_id:
+                    continue
+                embedding = _deserialize_embedding(row["embedding"], int(row["embedding_dim"]))
+                previous = deltas.get(person_id)
+                if previous is None:
+                    deltas[person_id] = (embedding.astype(np.float64), 1)
+                    continue
+                removed_sum, removed_count = previous
+                if removed_sum is not None and removed_sum.shape == embedding.shape:
+                    removed_sum = removed_sum + embedding
+                else:
+                    removed_sum = None
+                deltas[person_id] = (removed_sum, removed_count + 1)
+            if self._state_repo is not None and deltas:
+                for face in self._state_repo.get_manual_faces_for_persons(deltas):
+                    manual_faces[face.person_id].append(face)
+                profiles = {
+                    person_id: self._state_repo.get_profile(person_id) for person_id in deltas
+                }
 
+            # Key faces may be among the removed rows; the affected person rows
+            # are rewritten below, before the foreign keys are checked at commit.
+            conn.execute("PRAGMA defer_foreign_keys = ON")
             face_ids = [str(row["face_id"]) for row in matched_faces if row["face_id"]]
             placeholders = ", ".join(["?"] * len(face_ids))
             conn.execute(
                 f"DELETE FROM faces WHERE face_id IN ({placeholders})",
                 face_ids,
             )
-            orphaned = {row[0] for row in conn.execute("""
-                    SELECT person_id
-                    FROM persons
-                    WHERE person_id NOT IN (
-                        SELECT DISTINCT person_id FROM faces WHERE person_id IS NOT NULL
-                    )
-                    """).fetchall()}
-            if orphaned:
-                placeholders = ", ".join(["?"] * len(orphaned))
-                conn.execute(
-                    f"DELETE FROM persons WHERE person_id IN ({placeholders})", list(orphaned)
+            for person_id, (removed_sum, removed_count) in deltas.items():
+                written_persons[person_id] = self._write_runtime_person(
+                    conn,
+                    person_id,
+                    embedding_delta=-removed_sum if removed_sum is not None else None,
+                    count_delta=-removed_count,
+                    profile=profiles.get(person_id),
+                    manual_faces=manual_faces.get(person_id, []),
                 )
             conn.commit()
-        if self._state_repo is not None:
-            self._sync_person_cover_defaults()
-            self.refresh_all_group_assets()
+
+        if self._state_repo is None:
+            return
+        active_person_ids: list[str] = []
+        for person_id, written in written_persons.items():
+            if written is None:
+                continue
+            active_person_ids.append(person_id)
+            name, created_at, center_embedding, sample_count = written
+            self._state_repo.upsert_person_profile(
+                person_id,
+                name_or_none=name,
+                created_at=created_at,
+                center_embedding=center_embedding,
+                sample_count=sample_count,
+            )
+            self._repair_person_cover(person_id)
+        self._sync_person_cover_defaults(active_person_ids)
+        self._prune_group_assets(
+            self._state_repo.list_group_ids_for_people(deltas),
+            {str(row["asset_id"]) for row in matched_faces},
+        )
+        self.refresh_person_dashboard(deltas)
 
     def get_person_summaries(self, *, include_hidden: bool = False) -> list[PersonSummary]:
         self.initialize()
+        order_map: dict[str, int] = {}
+        if self._state_repo is None:
+            summaries = [
+                self._summary_from_dashboard_row(row)
+                for row in sorted(
+                    self._compute_person_dashboard_rows(),
+                    key=lambda row: (-row[3], row[5], row[0]),
+                )
+            ]
+        else:
+            records = self._state_repo.read_person_dashboard()
+            if records is None:
+                self.refresh_person_dashboard()
+                records = self._state_repo.read_person_dashboard() or []
+            summaries = []
+            for record in records:
+                summaries.append(
+                    self._summary_from_dashboard_row(
+                        (
+                            record.person_id,
+                            record.name,
+                            record.key_face_id,
+                            record.face_count,
+                            record.thumbnail_path,
+                            record.created_at,
+                        ),
+                        is_hidden=record.is_hidden,
+                    )
+                )
+                if record.sort_order is not None:
+                    order_map[record.person_id] = record.sort_order
+        if order_map:
+            fallback_order = {summary.person_id: index for index, summary in enumerate(summaries)}
+            summaries.sort(
+                key=lambda summary: (
+                    order_map.get(summary.person_id, len(order_map) + fallback_order[summary.person_id]),
+                    fallback_order[summary.person_id],
+                )
+            )
+        if not include_hidden:
+            summaries = [summary for summary in summaries if not summary.is_hidden]
+        return summaries
+
+    def refresh_person_dashboard(self, person_ids: Iterable[str] | None = None) -> None:
+        """Rebuild the materialised People cards of *person_ids*, or all of them."""
+
+        if self._state_repo is None:
+            return
+        unique_ids = None if person_ids is None else _unique_person_ids(person_ids)
+        if unique_ids is not None and not unique_ids:
+            return
+        self._state_repo.replace_person_dashboard(
+            self._compute_person_dashboard_rows(unique_ids),
+            person_ids=unique_ids,
+        )
+
+    def _compute_person_dashboard_rows(
+        self,
+        person_ids: tuple[str, ...] | None = None,
+    ) -> list[tuple[str, str | None, str, int, str | None, str]]:
+        """Merge runtime clusters with manual faces, profiles and covers into cards."""
+
+        self.initialize()
+        where = ""
+        params: list[str] = []
+        if person_ids is not None:
+            where = f"WHERE persons.person_id IN ({', '.join(['?'] * len(person_ids))})"
+            params = list(person_ids)
         with closing(self._connect()) as conn:
-            rows = conn.execute("""
+            rows = conn.execute(
+                f"""
                 SELECT
                     persons.person_id,
                     persons.name,
                     persons.key_face_id,
                     persons.face_count,
                     persons.created_at,
-                    faces.face_id,
-                    faces.face_key,
-                    faces.asset_id,
                     faces.thumbnail_path
                 FROM persons
                 LEFT JOIN faces ON faces.face_id = persons.key_face_id
-                ORDER BY persons.face_count DESC, persons.created_at ASC
-                """).fetchall()
+                {where}
+                """,
+                params,
+            ).fetchall()
         auto_rows_by_person_id = {str(row["person_id"]): row for row in rows if row["person_id"]}
         manual_faces_by_person_id: dict[str, list[ManualFaceRecord]] = defaultdict(list)
         profile_map = {}
-        order_map: dict[str, int] = {}
-        hidden_map: dict[str, bool] = {}
+        cover_paths: dict[str, str] = {}
         if self._state_repo is not None:
-            for face in self._state_repo.get_manual_faces():
+            manual_faces = (
+                self._state_repo.get_manual_faces()
+                if person_ids is None
+                else self._state_repo.get_manual_faces_for_persons(person_ids)
+            )
+            for face in manual_faces:
                 manual_faces_by_person_id[face.person_id].append(face)
             profile_map = {profile.person_id: profile for profile in self._state_repo.get_profiles()}
-        person_ids = set(auto_rows_by_person_id) | set(manual_faces_by_person_id)
-        cover_paths: dict[str, str] = {}
-        if self._state_repo is not None and person_ids:
-            cover_paths = self._state_repo.get_person_cover_thumbnail_map(
-                person_ids
-            )
-            order_map = self._state_repo.get_person_order_map(person_ids)
-            hidden_map = self._state_repo.get_person_hidden_map(person_ids)
-        summaries: list[PersonSummary] = []
-        for person_id in person_ids:
+        all_person_ids = set(auto_rows_by_person_id) | set(manual_faces_by_person_id)
+        if self._state_repo is not None and all_person_ids:
+            cover_paths = self._state_repo.get_person_cover_thumbnail_map(all_person_ids)
+        dashboard_rows: list[tuple[str, str | None, str, int, str | None, str]] = []
+        for person_id in all_person_ids:
             row = auto_rows_by_person_id.get(person_id)
             manual_faces = manual_faces_by_person_id.get(person_id, [])
             profile = profile_map.get(person_id)
@@ -329,40 +465,40 @@ class FaceRepository:
                 thumbnail_path = row["thumbnail_path"]
             if not thumbnail_path and manual_faces:
                 thumbnail_path = manual_faces[0].thumbnail_path
-            resolved_thumbnail: Path | None = None
-            if thumbnail_path:
-                resolved_thumbnail = (self._db_path.parent / thumbnail_path).resolve()
-            summaries.append(
-                PersonSummary(
-                    person_id=person_id,
-                    name=name,
-                    key_face_id=key_face_id,
-                    face_count=face_count,
-                    thumbnail_path=resolved_thumbnail,
-                    created_at=str(created_at),
-                    is_hidden=bool(hidden_map.get(person_id, False)),
-                )
-            )
-        summaries.sort(key=lambda summary: (-summary.face_count, summary.created_at, summary.person_id))
-        if order_map:
-            fallback_order = {summary.person_id: index for index, summary in enumerate(summaries)}
-            summaries.sort(
-                key=lambda summary: (
-                    order_map.get(summary.person_id, len(order_map) + fallback_order[summary.person_id]),
-                    fallback_order[summary.person_id],
-                )
+            dashboard_rows.append(
+                (person_id, name, key_face_id, face_count, thumbnail_path or None, str(created_at))
             )
-        if not include_hidden:
-            summaries = [summary for summary in summaries if not summary.is_hidden]
-        return summaries
+        return dashboard_rows
+
+    def _summary_from_dashboard_row(
+        self,
+        row: tuple[str, str | None, str, int, str | None, str],
+        *,
+        is_hidden: bool = False,
+    ) -> PersonSummary:
+        person_id, name, key_face_id, face_count, thumbnail_path, created_at = row
+        resolved_thumbnail: Path | None = None
+        if thumbnail_path:
+            resolved_thumbnail = (self._db_path.parent / thumbnail_path).resolve()
+        return PersonSummary(
+            person_id=person_id,
+            name=name,
+            key_face_id=key_face_id,
+            face_count=face_count,
+            thumbnail_path=resolved_thumbnail,
+            created_at=created_at,
+            is_hidden=is_hidden,
+        )
 
     def is_person_hidden(self, person_id: str) -> bool:
         if self._state_repo is None:
             return False
         return self._state_repo.is_person_hidden(person_id)
 
-    def set_person_hidden(self, person_id: str, hidden: bool) -> bool:
-        if self._state_repo is None or not person_id:
+    def has_person(self, person_id: str) -> bool:
+        """Return whether *person_id* still owns detected or manual faces."""
+
+        if not person_id:
             return False
         self.initialize()
         with closing(self._connect()) as conn:
@@ -370,7 +506,16 @@ class FaceRepository:
                 "SELECT 1 FROM persons WHERE person_id = ?",
                 (person_id,),
             ).fetchone()
-        if row is None and not self._state_repo.get_manual_faces_for_persons([person_id]):
+        if row is not None:
+            return True
+        if self._state_repo is None:
+            return False
+        return bool(self._state_repo.get_manual_faces_for_persons([person_id]))
+
+    def set_person_hidden(self, person_id: str, hidden: bool) -> bool:
+        if self._state_repo is None or not person_id:
+            return False
+        if not self.has_person(person_id):
             return False
         self._state_repo.set_person_hidden(person_id, hidden)
         return True
@@ -403,6 +548,82 @@ class FaceRepository:
         ordered = sorted(ordered, key=lambda item: item[1], reverse=True)
         return [asset_id for asset_id, _last_seen in ordered]
 
+    def get_named_person_asset_rows(
+        self,
+        person_ids: Iterable[str] | None = None,
+    ) -> list[tuple[str, str, str]]:
+        """Return ``(asset_id, person_id, name)`` for every visible named person.
+
+        *person_ids* restricts the rows to those people.
+        """
+
+        scope = set(_unique_person_ids(person_ids)) if person_ids is not None else None
+        if scope is not None and not scope:
+            return []
+        names = {
+            summary.person_id: summary.name.strip()
+            for summary in self.get_person_summaries()
+            if summary.name
+            and summary.name.strip()
+            and (scope is None or summary.person_id in scope)
+        }
+        if not names:
+            return []
+        return [
+            (asset_id, person_id, names[person_id])
+            for asset_id, person_id in self.get_person_asset_rows(names)
+        ]
+
+    def get_person_asset_rows(
+        self,
+        person_ids: Iterable[str] | None = None,
+    ) -> list[tuple[str, str]]:
+        """Return ``(asset_id, person_id)`` for every cluster, manual faces included.
+
+        *person_ids* restricts the rows to those clusters.
+        """
+
+        scope = _unique_person_ids(person_ids) if person_ids is not None else None
+        if scope is not None and not scope:
+            return []
+        self.initialize()
+        rows: list[sqlite3.Row] = []
+        with closing(self._connect()) as conn:
+            if scope is None:
+                rows = conn.execute(
+                    "SELECT DISTINCT asset_id, person_id FROM faces WHERE person_id IS NOT NULL"
+                ).fetchall()
+            else:
+                chunk_size = 900
+                for start in range(0, len(scope), chunk_size):
+                    chunk = scope[start : start + chunk_size]
+                    placeholders = ", ".join(["?"] * len(chunk))
+                    rows.extend(
+                        conn.execute(
+                            f"""
+                            SELECT DISTINCT asset_id, person_id
+                            FROM faces
+                            WHERE person_id IN ({placeholders})
+                            """,
+                            chunk,
+                        ).fetchall()
+                    )
+        pairs = {
+            (str(row["asset_id"]), str(row["person_id"]))
+            for row in rows
+            if row["asset_id"] and row["person_id"]
+        }
+        if self._state_repo is not None:
+            manual_faces = (
+                self._state_repo.get_manual_faces()
+                if scope is None
+                else self._state_repo.get_manual_faces_for_persons(scope)
+            )
+            for face in manual_faces:
+                if face.asset_id and face.person_id:
+                    pairs.add((face.asset_id, face.person_id))
+        return sorted(pairs)
+
     def get_person_ids_for_asset_ids(self, asset_ids: Iterable[str]) -> list[str]:
         ids = [str(asset_id) for asset_id in asset_ids if asset_id]
         if not ids:
@@ -543,6 +764,7 @@ class FaceRepository:
             conn.commit()
         if self._state_repo is not None:
             self._state_repo.rename_person(person_id, normalized_name)
+            self.refresh_person_dashboard((person_id,))
 
     def set_person_cover(self, person_id: str, face_id: str) -> bool:
         if self._state_repo is None or not person_id or not face_id:
@@ -568,6 +790,7 @@ class FaceRepository:
                 asset_id=manual_face.asset_id,
                 thumbnail_path=manual_face.thumbnail_path,
             )
+            self.refresh_person_dashboard((person_id,))
             return True
         self._state_repo.set_person_cover(
             person_id,
@@ -576,6 +799,7 @@ class FaceRepository:
             asset_id=row["asset_id"],
             thumbnail_path=row["thumbnail_path"],
         )
+        self.refresh_person_dashboard((person_id,))
         return True
 
     def set_person_order(self, person_ids: Iterable[str]) -> None:
@@ -699,15 +923,14 @@ class FaceRepository:
             updated_at = _utc_now_iso()
             if merged_faces:
                 key_face = max(merged_faces, key=_key_face_sort_key)
-                center_embedding = compute_cluster_center(
-                    np.stack([face.embedding for face in merged_faces], axis=0)
-                )
+                merged_embeddings = np.stack([face.embedding for face in merged_faces], axis=0)
+                center_embedding = compute_cluster_center(merged_embeddings)
                 conn.execute(
                     """
                     INSERT INTO persons (
                         person_id, name, key_face_id, face_count, center_embedding,
-                        created_at, updated_at, sample_count, profile_state
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        created_at, updated_at, sample_count, profile_state, embedding_sum
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ON CONFLICT(person_id) DO UPDATE SET
                         name = excluded.name,
                         key_face_id = excluded.key_face_id,
@@ -715,7 +938,8 @@ class FaceRepository:
                         center_embedding = excluded.center_embedding,
                         updated_at = excluded.updated_at,
                         sample_count = excluded.sample_count,
-                        profile_state = excluded.profile_state
+                        profile_state = excluded.profile_state,
+                        embedding_sum = excluded.embedding_sum
                     """,
                     (
                         target_person_id,
@@ -727,6 +951,7 @@ class FaceRepository:
                         updated_at,
                         len(merged_faces),
                         profile_state_for_sample_count(len(merged_faces)),
+                        _serialize_embedding_sum(merged_embeddings.astype(np.float64).sum(axis=0)),
                     ),
                 )
             else:
@@ -746,6 +971,7 @@ class FaceRepository:
             )
             self._sync_person_cover_defaults()
             self.refresh_all_group_assets()
+            self.refresh_person_dashboard((source_person_id, target_person_id))
         return True, group_redirects
 
     def delete_face(self, face_id: str) -> FaceMutationResult | None:
@@ -779,6 +1005,8 @@ class FaceRepository:
                 return self._finalize_face_mutation(
                     changed_asset_ids=(face.asset_id,),
                     changed_person_ids=(face.person_id,),
+                    face_deltas={face.person_id: (-face.embedding.astype(np.float64), -1)},
+                    removal_only=True,
                 )
 
         if self._state_repo is None:
@@ -790,6 +1018,7 @@ class FaceRepository:
         return self._finalize_face_mutation(
             changed_asset_ids=(manual_face.asset_id,),
             changed_person_ids=(manual_face.person_id,),
+            removal_only=True,
         )
 
     def move_face_to_person(
@@ -831,6 +1060,7 @@ class FaceRepository:
                 return self._finalize_face_mutation(
                     changed_asset_ids=(face.asset_id,),
                     changed_person_ids=(face.person_id, target_person_id),
+                    face_deltas=_moved_face_deltas(face, target_person_id),
                 )
 
         if self._state_repo is None:
@@ -894,6 +1124,7 @@ class FaceRepository:
                 return self._finalize_face_mutation(
                     changed_asset_ids=(face.asset_id,),
                     changed_person_ids=(face.person_id, new_person_id),
+                    face_deltas=_moved_face_deltas(face, new_person_id),
                 )
 
         if self._state_repo is None:
@@ -1042,12 +1273,21 @@ class FaceRepository:
         for group in self._state_repo.list_groups():
             self.refresh_group_assets(group.group_id)
 
-    def _sync_person_cover_defaults(self) -> None:
+    def _sync_person_cover_defaults(self, person_ids: Iterable[str] | None = None) -> None:
         if self._state_repo is None:
             return
+        scoped_ids = _unique_person_ids(person_ids) if person_ids is not None else None
+        if scoped_ids is not None and not scoped_ids:
+            return
         self.initialize()
+        where_clause = ""
+        params: tuple[str, ...] = ()
+        if scoped_ids is not None:
+            where_clause = f"WHERE persons.person_id IN ({', '.join(['?'] * len(scoped_ids))})"
+            params = scoped_ids
         with closing(self._connect()) as conn:
-            rows = conn.execute("""
+            rows = conn.execute(
+                f"""
                 SELECT
                     persons.person_id,
                     faces.face_id,
@@ -1056,8 +1296,11 @@ class FaceRepository:
                     faces.thumbnail_path
                 FROM persons
                 LEFT JOIN faces ON faces.face_id = persons.key_face_id
+                {where_clause}
                 ORDER BY persons.created_at ASC, persons.person_id ASC
-                """).fetchall()
+                """,
+                params,
+            ).fetchall()
         self._state_repo.sync_person_cover_defaults(
             (
                 (
@@ -1071,39 +1314,106 @@ class FaceRepository:
             )
         )
 
+    def _prune_group_assets(self, group_ids: Iterable[str], asset_ids: Iterable[str]) -> None:
+        """Drop *asset_ids* from groups whose members no longer all appear on them."""
+
+        if self._state_repo is None:
+            return
+        touched_asset_ids = sorted({str(asset_id) for asset_id in asset_ids if asset_id})
+        group_ids = sorted({str(group_id) for group_id in group_ids if group_id})
+        if not touched_asset_ids or not group_ids:
+            return
+
+        self.initialize()
+        people_by_asset_id: dict[str, set[str]] = defaultdict(set)
+        chunk_size = 900
+        with closing(self._connect()) as conn:
+            for start in range(0, len(touched_asset_ids), chunk_size):
+                chunk = touched_asset_ids[start : start + chunk_size]
+                placeholders = ", ".join(["?"] * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT DISTINCT asset_id, person_id
+                    FROM faces
+                    WHERE asset_id IN ({placeholders}) AND person_id IS NOT NULL
+                    """,
+                    chunk,
+                ).fetchall()
+                for row in rows:
+                    people_by_asset_id[str(row["asset_id"])].add(str(row["person_id"]))
+        for asset_id in touched_asset_ids:
+            people_by_asset_id[asset_id].update(
+                face.person_id for face in self._state_repo.get_manual_faces_for_asset(asset_id)
+            )
+
+        for group_id in group_ids:
+            group = self._state_repo.get_group(group_id)
+            if group is None:
+                continue
+            if not self._state_repo.has_group_asset_cache(group_id):
+                self.refresh_group_assets(group_id)
+                continue
+            members = set(group.member_person_ids)
+            self._state_repo.remove_group_assets(
+                group_id,
+                [
+                    asset_id
+                    for asset_id in touched_asset_ids
+                    if not members.issubset(people_by_asset_id[asset_id])
+                ],
+            )
+
     def _finalize_face_mutation(
         self,
         *,
         changed_asset_ids: Iterable[str],
         changed_person_ids: Iterable[str],
+        face_deltas: Mapping[str, tuple[np.ndarray, int]] | None = None,
+        removal_only: bool = False,
     ) -> FaceMutationResult:
         person_ids = tuple(dict.fromkeys(person_id for person_id in changed_person_ids if person_id))
-        asset_ids = set(asset_id for asset_id in changed_asset_ids if asset_id)
+        mutated_asset_ids = set(asset_id for asset_id in changed_asset_ids if asset_id)
+        asset_ids = set(mutated_asset_ids)
+        deltas = face_deltas or {}
         group_redirects: dict[str, str | None] = {}
         changed_group_ids: set[str] = set()
+        regrouped_ids: set[str] = set()
         active_person_ids: list[str] = []
 
         if self._state_repo is not None and person_ids:
             changed_group_ids.update(self._state_repo.list_group_ids_for_people(person_ids))
 
         for person_id in person_ids:
-            if self._rebuild_runtime_person(person_id):
+            embedding_delta, count_delta = deltas.get(person_id, (None, 0))
+            if self._update_runtime_person(
+                person_id,
+                embedding_delta=embedding_delta,
+                count_delta=count_delta,
+            ):
                 active_person_ids.append(person_id)
                 continue
             if self._state_repo is not None:
+                regrouped_ids.update(self._state_repo.list_group_ids_for_people((person_id,)))
                 group_redirects.update(self._state_repo.remove_person_from_groups(person_id))
                 self._state_repo.delete_person_state(person_id)
 
         if self._state_repo is not None:
             for person_id in active_person_ids:
                 self._repair_person_cover(person_id)
-            self._sync_person_cover_defaults()
+            self._sync_person_cover_defaults(active_person_ids)
             remaining_group_ids = set(self._state_repo.list_group_ids_for_people(active_person_ids))
             changed_group_ids.update(remaining_group_ids)
-            changed_group_ids.update(group_redirects)
-            changed_group_ids.update(group_id for group_id in group_redirects.values() if group_id)
-            for group_id in changed_group_ids:
+            regrouped_ids.update(group_redirects)
+            regrouped_ids.update(group_id for group_id in group_redirects.values() if group_id)
+            changed_group_ids.update(regrouped_ids)
+            # Faces only left their people, so groups with unchanged members can
+            # at most lose the touched assets; new memberships are rebuilt.
+            rebuilt_group_ids = regrouped_ids if removal_only else changed_group_ids
+            for group_id in sorted(rebuilt_group_ids):
                 self.refresh_group_assets(group_id)
+            if removal_only:
+                self._prune_group_assets(changed_group_ids - rebuilt_group_ids, mutated_asset_ids)
+            self.refresh_person_dashboard(person_ids)
 
         for person_id in active_person_ids:
             asset_ids.update(self.get_asset_ids_by_person(person_id))
@@ -1115,7 +1425,13 @@ class FaceRepository:
             group_redirects=group_redirects,
         )
 
-    def _rebuild_runtime_person(self, person_id: str) -> bool:
+    def _update_runtime_person(
+        self,
+        person_id: str,
+        *,
+        embedding_delta: np.ndarray | None = None,
+        count_delta: int = 0,
+    ) -> bool:
         if not person_id:
             return False
 
@@ -1127,80 +1443,20 @@ class FaceRepository:
             profile = self._state_repo.get_profile(person_id)
 
         with closing(self._connect()) as conn:
-            rows = conn.execute(
-                """
-                SELECT
-                    face_id, face_key, asset_id, asset_rel, box_x, box_y, box_w, box_h,
-                    confidence, embedding, embedding_dim, thumbnail_path, person_id,
-                    detected_at, image_width, image_height
-                FROM faces
-                WHERE person_id = ?
-                ORDER BY detected_at ASC, face_id ASC
-                """,
-                (person_id,),
-            ).fetchall()
-            auto_faces = [self._face_from_row(row) for row in rows]
-            existing_person = conn.execute(
-                """
-                SELECT person_id, name, created_at
-                FROM persons
-                WHERE person_id = ?
-                """,
-                (person_id,),
-            ).fetchone()
-
-            if not auto_faces:
-                conn.execute("DELETE FROM persons WHERE person_id = ?", (person_id,))
-                conn.commit()
-                return bool(manual_faces)
-
-            name = existing_person["name"] if existing_person is not None else None
-            if name is None and profile is not None:
-                name = profile.name
-            created_at = existing_person["created_at"] if existing_person is not None else None
-            if created_at is None and profile is not None:
-                created_at = profile.created_at
-            if created_at is None and manual_faces:
-                created_at = min(face.created_at for face in manual_faces)
-            if created_at is None:
-                created_at = min(face.detected_at for face in auto_faces)
-
-            key_face = max(auto_faces, key=_key_face_sort_key)
-            center_embedding = compute_cluster_center(
-                np.stack([face.embedding for face in auto_faces], axis=0)
-            )
-            sample_count = len(auto_faces)
-            updated_at = _utc_now_iso()
-            conn.execute(
-                """
-                INSERT INTO persons (
-                    person_id, name, key_face_id, face_count, center_embedding,
-                    created_at, updated_at, sample_count, profile_state
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(person_id) DO UPDATE SET
-                    name = excluded.name,
-                    key_face_id = excluded.key_face_id,
-                    face_count = excluded.face_count,
-                    center_embedding = excluded.center_embedding,
-                    updated_at = excluded.updated_at,
-                    sample_count = excluded.sample_count,
-                    profile_state = excluded.profile_state
-                """,
-                (
-                    person_id,
-                    _normalize_name(name),
-                    key_face.face_id,
-                    sample_count,
-                    _serialize_embedding(center_embedding),
-                    created_at,
-                    updated_at,
-                    sample_count,
-                    profile_state_for_sample_count(sample_count),
-                ),
+            written = self._write_runtime_person(
+                conn,
+                person_id,
+                embedding_delta=embedding_delta,
+                count_delta=count_delta,
+                profile=profile,
+                manual_faces=manual_faces,
             )
             conn.commit()
 
+        if written is None:
+            return bool(manual_faces)
         if self._state_repo is not None:
+            name, created_at, center_embedding, sample_count = written
             self._state_repo.upsert_person_profile(
                 person_id,
                 name_or_none=name,
@@ -1210,6 +1466,130 @@ class FaceRepository:
             )
         return True
 
+    def _write_runtime_person(
+        self,
+        conn: sqlite3.Connection,
+        person_id: str,
+        *,
+        embedding_delta: np.ndarray | None,
+        count_delta: int,
+        profile: PersonProfile | None,
+        manual_faces: list[ManualFaceRecord],
+    ) -> tuple[str | None, str, np.ndarray, int] | None:
+        """Fold a membership change into the runtime row of *person_id*.
+
+        The faces table must already reflect the change.  *embedding_delta*
+        and *count_delta* are the signed embedding sum and face count of the
+        faces that joined or left, so the row is updated without reading the
+        person's other faces; rows without a running sum are rebuilt once.
+        Returns ``(name, created_at, center, sample_count)``, or None when the
+        person has no auto faces left and its row was deleted.
+        """
+
+        key_face_id = self._key_face_id(conn, person_id)
+        if key_face_id is None:
+            conn.execute("DELETE FROM persons WHERE person_id = ?", (person_id,))
+            return None
+
+        existing_person = conn.execute(
+            """
+            SELECT person_id, name, created_at, face_count, embedding_sum
+            FROM persons
+            WHERE person_id = ?
+            """,
+            (person_id,),
+        ).fetchone()
+        face_count = 0
+        embedding_sum = None
+        if existing_person is not None:
+            face_count = int(existing_person["face_count"]) + int(count_delta)
+            embedding_sum = _deserialize_embedding_sum(existing_person["embedding_sum"])
+            if embedding_sum is not None and count_delta:
+                if embedding_delta is not None and embedding_delta.shape == embedding_sum.shape:
+                    embedding_sum = embedding_sum + embedding_delta
+                else:
+                    embedding_sum = None
+        if embedding_sum is None or face_count <= 0:
+            face_count, embedding_sum = self._person_embedding_aggregate(conn, person_id)
+
+        name = existing_person["name"] if existing_person is not None else None
+        if name is None and profile is not None:
+            name = profile.name
+        created_at = existing_person["created_at"] if existing_person is not None else None
+        if created_at is None and profile is not None:
+            created_at = profile.created_at
+        if created_at is None and manual_faces:
+            created_at = min(face.created_at for face in manual_faces)
+        if created_at is None:
+            row = conn.execute(
+                "SELECT MIN(detected_at) AS created_at FROM faces WHERE person_id = ?",
+                (person_id,),
+            ).fetchone()
+            created_at = str(row["created_at"])
+
+        center_embedding = normalize_vector(embedding_sum)
+        updated_at = _utc_now_iso()
+        conn.execute(
+            """
+            INSERT INTO persons (
+                person_id, name, key_face_id, face_count, center_embedding,
+                created_at, updated_at, sample_count, profile_state, embedding_sum
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(person_id) DO UPDATE SET
+                name = excluded.name,
+                key_face_id = excluded.key_face_id,
+                face_count = excluded.face_count,
+                center_embedding = excluded.center_embedding,
+                updated_at = excluded.updated_at,
+                sample_count = excluded.sample_count,
+                profile_state = excluded.profile_state,
+                embedding_sum = excluded.embedding_sum
+            """,
+            (
+                person_id,
+                _normalize_name(name),
+                key_face_id,
+                face_count,
+                _serialize_embedding(center_embedding),
+                created_at,
+                updated_at,
+                face_count,
+                profile_state_for_sample_count(face_count),
+                _serialize_embedding_sum(embedding_sum),
+            ),
+        )
+        return name, created_at, center_embedding, face_count
+
+    @staticmethod
+    def _key_face_id(conn: sqlite3.Connection, person_id: str) -> str | None:
+        # Mirrors ``_key_face_sort_key`` with the scan order as tie-break and is
+        # answered by ``idx_faces_person_key_face`` without a sort.
+        row = conn.execute(
+            """
+            SELECT face_id
+            FROM faces
+            WHERE person_id = ?
+            ORDER BY confidence DESC, (box_w * box_h) DESC, detected_at ASC, face_id ASC
+            LIMIT 1
+            """,
+            (person_id,),
+        ).fetchone()
+        return str(row["face_id"]) if row is not None else None
+
+    @staticmethod
+    def _person_embedding_aggregate(
+        conn: sqlite3.Connection,
+        person_id: str,
+    ) -> tuple[int, np.ndarray]:
+        rows = conn.execute(
+            "SELECT embedding, embedding_dim FROM faces WHERE person_id = ?",
+            (person_id,),
+        ).fetchall()
+        vectors = [_deserialize_embedding(row["embedding"], int(row["embedding_dim"])) for row in rows]
+        if not vectors:
+            return 0, np.empty((0,), dtype=np.float64)
+        return len(vectors), np.stack(vectors, axis=0).astype(np.float64).sum(axis=0)
+
     def _repair_person_cover(self, person_id: str) -> None:
         if self._state_repo is None or not person_id:
             return
@@ -1315,7 +1695,18 @@ class FaceRepository:
             "profile_state",
             "TEXT NOT NULL DEFAULT 'unstable'",
         )
+        # Unnormalised sum of the member embeddings.  Together with
+        # ``face_count`` it lets face removals update the cluster centre
+        # without re-reading every face of the person; NULL marks legacy
+        # rows that are backfilled on their next mutation.
+        FaceRepository._ensure_column(conn, "persons", "embedding_sum", "BLOB")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_faces_person_id ON faces(person_id)")
+        # Key-face candidates per person in ``_key_face_sort_key`` order, so the
+        # next cover is one index probe when the current key face goes away.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_faces_person_key_face ON faces("
+            "person_id, confidence DESC, (box_w * box_h) DESC, detected_at ASC, face_id ASC)"
+        )
         conn.execute("CREATE INDEX IF NOT EXISTS idx_faces_face_key ON faces(face_key)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_faces_asset_id ON faces(asset_id)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_faces_asset_rel ON faces(asset_rel)")
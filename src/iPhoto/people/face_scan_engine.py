@@ -0,0 +1,327 @@
+"""Pipelined face detection for People scans.
+
+Images move through three overlapping stages: a prefetch pool decodes upcoming
+assets at the detector's working resolution, a dedicated inference thread runs
+the detector, and the calling thread maps boxes back to the original image,
+crops face thumbnails out of the decoded buffer into the packed face-crop
+store and builds face records.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+import numpy as np
+from PIL import Image
+
+from .face_crop_store import open_face_crop_store
+from .image_utils import (
+    PeopleImageLoadError,
+    crop_face_thumbnail,
+    load_image_rgb_for_detection,
+    pil_image_to_bgr,
+)
+from .pipeline import (
+    DetectedAssetFaces,
+    _extract_embedding,
+    _normalize_bbox,
+    _utc_now_iso,
+    build_face_key,
+)
+from .repository import FaceRecord
+
+_LOGGER = logging.getLogger(__name__)
+
+# The detector resizes its input to 640px; decoding at twice that keeps small
+# faces large enough for the 112px recognition crop without paying for the
+# full-resolution frame.
+DEFAULT_WORKING_SIZE = 1280
+FACE_SCAN_STAGES = ("decode", "detect", "crop")
+
+
+@dataclass(frozen=True)
+class FaceScanStageStats:
+    """Cumulative images and busy seconds of one engine stage."""
+
+    images: int = 0
+    seconds: float = 0.0
+
+    @property
+    def images_per_sec(self) -> float | None:
+        if self.seconds <= 0 or not self.images:
+            return None
+        return self.images / self.seconds
+
+
+@dataclass(frozen=True)
+class _DecodedImage:
+    image: Image.Image
+    image_bgr: np.ndarray
+    source_size: tuple[int, int]
+
+
+@dataclass(frozen=True)
+class _ScanJob:
+    asset_id: str
+    asset_rel: str
+    image_path: Path
+
+
+class FaceScanEngine:
+    """Detect faces for asset rows with decode prefetch and async inference.
+
+    *detector* only needs a ``get(image_bgr)`` method returning objects with
+    ``bbox``, ``det_score`` and ``embedding`` attributes, the shape of an
+    insightface ``FaceAnalysis`` app.  Results keep the order of the input
+    rows and use original-image coordinates for boxes and image sizes.
+    """
+
+    def __init__(
+        self,
+        detector: Any,
+        *,
+        min_face_size: int = 40,
+        working_size: int = DEFAULT_WORKING_SIZE,
+        decode_workers: int | None = None,
+        prefetch_depth: int | None = None,
+    ) -> None:
+        self._detector = detector
+        self._min_face_size = int(min_face_size)
+        self._working_size = max(1, int(working_size))
+        if decode_workers is None:
+            decode_workers = min(2, os.cpu_count() or 1)
+        self._decode_workers = max(1, int(decode_workers))
+        self._prefetch_depth = max(1, int(prefetch_depth or self._decode_workers * 2))
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=self._decode_workers,
+            thread_name_prefix="face-decode",
+        )
+        # Detection runs on one thread: the model is not re-entrant and the
+        # runtime already parallelises inside a single call.
+        self._inference = ThreadPoolExecutor(max_workers=1, thread_name_prefix="face-detect")
+        self._stats_lock = threading.Lock()
+        self._stats = {stage: FaceScanStageStats() for stage in FACE_SCAN_STAGES}
+
+    @property
+    def detector(self) -> Any:
+        return self._detector
+
+    def stage_stats(self) -> dict[str, FaceScanStageStats]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        self._decode_pool.shutdown(wait=True, cancel_futures=True)
+        self._inference.shutdown(wait=True, cancel_futures=True)
+
+    def detect(
+        self,
+        rows: Sequence[dict],
+        *,
+        library_root: Path,
+        thumbnail_dir: Path,
+        is_cancelled: Callable[[], bool] | None = None,
+    ) -> list[DetectedAssetFaces]:
+        cancellation_requested = is_cancelled or (lambda: False)
+        jobs = [_scan_job(row, library_root) for row in rows]
+        decodes: deque[Future[_DecodedImage]] = deque()
+        next_decode = 0
+
+        def prefetch() -> None:
+            nonlocal next_decode
+            while next_decode < len(jobs) and len(decodes) < self._prefetch_depth:
+                decodes.append(self._decode_pool.submit(self._decode, jobs[next_decode].image_path))
+                next_decode += 1
+
+        # Each entry is either a finished result or a detection still running
+        # on the inference thread; the head is collected while the next image
+        # is being detected so cropping overlaps inference.
+        pending: deque[DetectedAssetFaces | tuple[_ScanJob, _DecodedImage, Future]] = deque()
+        results: list[DetectedAssetFaces] = []
+
+        def collect(keep: int) -> bool:
+            while len(pending) > keep or (pending and isinstance(pending[0], DetectedAssetFaces)):
+                head = pending[0]
+                if not isinstance(head, DetectedAssetFaces):
+                    if cancellation_requested():
+                        return False
+                    head = self._collect(thumbnail_dir, *head)
+                pending.popleft()
+                results.append(head)
+            return True
+
+        try:
+            for job in jobs:
+                if cancellation_requested():
+                    return results
+                prefetch()
+                try:
+                    decoded = decodes.popleft().result()
+                except PeopleImageLoadError as exc:
+                    if cancellation_requested():
+                        return results
+                    reason = str(exc).strip() or exc.__class__.__name__
+                    _LOGGER.warning(
+                        "Skipping face detection for unreadable image %s: %s",
+                        job.image_path,
+                        reason,
+                    )
+                    pending.append(_failed(job, reason))
+                except Exception as exc:
+                    if cancellation_requested():
+                        return results
+                    _LOGGER.exception("Face detection failed for %s", job.image_path)
+                    pending.append(_failed(job, str(exc)))
+                else:
+                    pending.append((job, decoded, self._inference.submit(self._detect, decoded)))
+                if not collect(keep=1):
+                    return results
+            collect(keep=0)
+            return results
+        finally:
+            for future in decodes:
+                future.cancel()
+            for entry in pending:
+                if isinstance(entry, tuple):
+                    entry[2].cancel()
+
+    def _decode(self, image_path: Path) -> _DecodedImage:
+        started = time.perf_counter()
+        image, source_size = load_image_rgb_for_detection(
+            image_path,
+            max_side=self._working_size,
+        )
+        decoded = _DecodedImage(image, pil_image_to_bgr(image), source_size)
+        self._record("decode", started)
+        return decoded
+
+    def _detect(self, decoded: _DecodedImage) -> list:
+        started = time.perf_counter()
+        detected = list(self._detector.get(decoded.image_bgr))
+        self._record("detect", started)
+        return detected
+
+    def _collect(
+        self,
+        thumbnail_dir: Path,
+        job: _ScanJob,
+        decoded: _DecodedImage,
+        future: Future,
+    ) -> DetectedAssetFaces:
+        try:
+            detected_faces = future.result()
+        except Exception as exc:
+            _LOGGER.exception("Face detection failed for %s", job.image_path)
+            return _failed(job, str(exc))
+
+        started = time.perf_counter()
+        working_width, working_height = decoded.image.size
+        image_width, image_height = decoded.source_size
+        scale_x = image_width / working_width
+        scale_y = image_height / working_height
+        faces: list[FaceRecord] = []
+        crops: list[tuple[str, Image.Image]] = []
+        for detected in detected_faces:
+            working_bbox = _normalize_bbox(
+                detected.bbox,
+                image_width=working_width,
+                image_height=working_height,
+            )
+            bbox = _scale_bbox(
+                working_bbox,
+                scale_x=scale_x,
+                scale_y=scale_y,
+                image_width=image_width,
+                image_height=image_height,
+            )
+            if bbox[2] < self._min_face_size or bbox[3] < self._min_face_size:
+                continue
+
+            embedding = _extract_embedding(detected)
+            if embedding is None:
+                continue
+
+            face_id = uuid.uuid4().hex
+            thumbnail_path = thumbnail_dir / f"{face_id}.png"
+            crops.append((face_id, crop_face_thumbnail(decoded.image, working_bbox)))
+            faces.append(
+                FaceRecord(
+                    face_id=face_id,
+                    face_key=build_face_key(
+                        asset_id=job.asset_id,
+                        bbox=bbox,
+                        image_width=image_width,
+                        image_height=image_height,
+                    ),
+                    asset_id=job.asset_id,
+                    asset_rel=job.asset_rel,
+                    box_x=bbox[0],
+                    box_y=bbox[1],
+                    box_w=bbox[2],
+                    box_h=bbox[3],
+                    confidence=float(getattr(detected, "det_score", 0.0)),
+                    embedding=embedding,
+                    embedding_dim=int(embedding.shape[0]),
+                    thumbnail_path=thumbnail_path.relative_to(thumbnail_dir.parent).as_posix(),
+                    person_id=None,
+                    detected_at=_utc_now_iso(),
+                    image_width=image_width,
+                    image_height=image_height,
+                )
+            )
+        if crops:
+            open_face_crop_store(thumbnail_dir, create=True).put_many(crops)
+        self._record("crop", started)
+        return DetectedAssetFaces(asset_id=job.asset_id, asset_rel=job.asset_rel, faces=faces)
+
+    def _record(self, stage: str, started: float) -> None:
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            current = self._stats[stage]
+            self._stats[stage] = FaceScanStageStats(current.images + 1, current.seconds + elapsed)
+
+
+def _scan_job(row: dict, library_root: Path) -> _ScanJob:
+    asset_rel = Path(str(row.get("rel") or "")).as_posix()
+    return _ScanJob(
+        asset_id=str(row.get("id") or ""),
+        asset_rel=asset_rel,
+        image_path=(library_root / asset_rel).resolve(),
+    )
+
+
+def _failed(job: _ScanJob, reason: str) -> DetectedAssetFaces:
+    return DetectedAssetFaces(
+        asset_id=job.asset_id,
+        asset_rel=job.asset_rel,
+        faces=[],
+        error=reason,
+    )
+
+
+def _scale_bbox(
+    bbox: tuple[int, int, int, int],
+    *,
+    scale_x: float,
+    scale_y: float,
+    image_width: int,
+    image_height: int,
+) -> tuple[int, int, int, int]:
+    x, y, width, height = bbox
+    return _normalize_bbox(
+        (x * scale_x, y * scale_y, (x + width) * scale_x, (y + height) * scale_y),
+        image_width=image_width,
+        image_height=image_height,
+    )
+
+
+__all__ = ["DEFAULT_WORKING_SIZE", "FaceScanEngine", "FaceScanStageStats"]
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Callable, TypeVar
 
 import numpy as np
 from PIL import Image, ImageDraw, ImageFile, ImageOps, UnidentifiedImageError
 
+from ..core.raw_processor import is_raw_extension, load_raw_preview_to_pil
+
+_T = TypeVar("_T")
+
 _HEIF_REGISTERED = False
 
 
@@ -28,9 +33,31 @@ def ensure_pillow_image_plugins() -> None:
 
 
 def load_image_rgb(image_path: Path) -> Image.Image:
+    return _load_with_truncated_retry(lambda: _load_image_rgb(image_path))
+
+
+def load_image_rgb_for_detection(
+    image_path: Path,
+    *,
+    max_side: int,
+) -> tuple[Image.Image, tuple[int, int]]:
+    """Decode *image_path* no larger than *max_side* on its long edge.
+
+    JPEGs are decoded with DCT scaling and RAW files fall back to their
+    embedded preview, so the full-resolution pixels are never materialised.
+    Returns the oriented RGB image together with the oriented size of the
+    original asset, which callers use to map coordinates back.
+    """
+
+    return _load_with_truncated_retry(
+        lambda: _load_image_rgb_for_detection(image_path, max_side=max_side)
+    )
+
+
+def _load_with_truncated_retry(loader: Callable[[], _T]) -> _T:
     ensure_pillow_image_plugins()
     try:
-        return _load_image_rgb(image_path)
+        return loader()
     except OSError as exc:
         if not _is_truncated_image_error(exc):
             raise PeopleImageLoadError(str(exc)) from exc
@@ -38,7 +65,7 @@ def load_image_rgb(image_path: Path) -> Image.Image:
     previous_truncated_setting = ImageFile.LOAD_TRUNCATED_IMAGES
     ImageFile.LOAD_TRUNCATED_IMAGES = True
     try:
-        return _load_image_rgb(image_path)
+        return loader()
     except (OSError, UnidentifiedImageError) as exc:
         raise PeopleImageLoadError(str(exc)) from exc
     finally:
@@ -54,6 +81,44 @@ def _load_image_rgb(image_path: Path) -> Image.Image:
         raise PeopleImageLoadError(str(exc)) from exc
 
 
+def _load_image_rgb_for_detection(
+    image_path: Path,
+    *,
+    max_side: int,
+) -> tuple[Image.Image, tuple[int, int]]:
+    if is_raw_extension(image_path.suffix):
+        preview = load_raw_preview_to_pil(image_path)
+        if preview is not None:
+            preview_image, source_size = preview
+            return _downscale_oriented(
+                preview_image,
+                max_side=max_side,
+                source_size=source_size,
+            )
+    try:
+        with Image.open(image_path) as image:
+            return _downscale_oriented(image, max_side=max_side)
+    except UnidentifiedImageError as exc:
+        raise PeopleImageLoadError(str(exc)) from exc
+
+
+def _downscale_oriented(
+    image: Image.Image,
+    *,
+    max_side: int,
+    source_size: tuple[int, int] | None = None,
+) -> tuple[Image.Image, tuple[int, int]]:
+    source_width, source_height = source_size or image.size
+    # ``thumbnail`` drafts JPEGs at a DCT scale first and only resamples the
+    # remainder, so the decoder never produces the full-resolution frame.
+    image.thumbnail((max_side, max_side), Image.Resampling.BILINEAR, reducing_gap=2.0)
+    stored_size = image.size
+    corrected = ImageOps.exif_transpose(image)
+    if source_size is None and corrected.size != stored_size:
+        source_width, source_height = source_height, source_width
+    return corrected.convert("RGB"), (source_width, source_height)
+
+
 def _is_truncated_image_error(exc: OSError) -> bool:
     return "image file is truncated" in str(exc).lower()
 
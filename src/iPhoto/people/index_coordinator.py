@@ -14,6 +14,7 @@ from iPhoto.application.ports import PeopleAssetRepositoryPort
 from iPhoto.utils.logging import get_logger
 from iPhoto.utils.pathutils import ensure_work_dir
 
+from .face_crop_store import open_face_crop_store
 from .pipeline import DetectedAssetFaces
 from .repository import FaceRepository, ManualFaceRecord, PeopleGroupRecord
 from .scan_session import FaceScanSession
@@ -58,6 +59,8 @@ class PeopleIndexCoordinator(QObject):
         self._lock = threading.RLock()
         self._revision = 0
         self._shutdown_requested = False
+        self._person_assets_synced_ids: set[str] = set()
+        self._search_people_synced = False
         # QueuedConnection ensures _fire_snapshot() runs on the coordinator's
         # own thread regardless of which thread calls _emit_snapshot().
         self._scheduleEmit.connect(self._fire_snapshot, Qt.ConnectionType.QueuedConnection)
@@ -77,8 +80,26 @@ class PeopleIndexCoordinator(QObject):
         """Bind the current library asset-index adapter."""
 
         with self._lock:
+            if asset_repository is not self._asset_repository:
+                self._person_assets_synced_ids.clear()
+                self._search_people_synced = False
             self._asset_repository = asset_repository
 
+    def ensure_person_assets(self, person_ids: Iterable[str]) -> bool:
+        """Mirror the memberships of *person_ids* into the asset index once per binding.
+
+        Returns whether the index can serve galleries of these people; later
+        snapshots keep their mirror current.
+        """
+
+        with self._lock:
+            pending = tuple(
+                person_id
+                for person_id in dict.fromkeys(person_ids)
+                if person_id and person_id not in self._person_assets_synced_ids
+            )
+            return self._sync_person_assets(pending)
+
     def submit_detected_batch(
         self,
         detected_results: Iterable[DetectedAssetFaces],
@@ -224,6 +245,9 @@ class PeopleIndexCoordinator(QObject):
                             thumbnail_file.unlink(missing_ok=True)
                         except OSError:
                             LOGGER.warning("Failed to remove orphaned thumbnail: %s", thumbnail_file)
+                        crop_store = open_face_crop_store(thumbnail_file.parent)
+                        if crop_store is not None:
+                            crop_store.discard([thumbnail_file.stem])
                 raise
             changed_group_ids = tuple(
                 group.group_id
@@ -246,6 +270,7 @@ class PeopleIndexCoordinator(QObject):
             result = repository.delete_face(face_id)
             if result is None:
                 return None
+            self._collect_face_crop_garbage(repository)
             return self._emit_snapshot(
                 changed_asset_ids=result.changed_asset_ids,
                 changed_person_ids=result.changed_person_ids,
@@ -402,6 +427,28 @@ class PeopleIndexCoordinator(QObject):
             )
             return True
 
+    def collect_face_crop_garbage(self) -> int:
+        """Drop packed face crops no face, manual face or cover references."""
+
+        with self._lock:
+            if self._shutdown_requested:
+                return 0
+            return self._collect_face_crop_garbage(self._repository())
+
+    def _collect_face_crop_garbage(self, repository: FaceRepository) -> int:
+        faces_root = ensure_work_dir(self._library_root) / "faces"
+        crop_store = open_face_crop_store(faces_root / "thumbnails")
+        if crop_store is None:
+            return 0
+        try:
+            live_ids = {
+                Path(path).stem for path in repository.referenced_thumbnail_paths()
+            }
+            return crop_store.collect_garbage(live_ids)
+        except Exception as exc:
+            LOGGER.warning("Face crop cleanup failed for %s: %s", self._library_root, exc)
+            return 0
+
     def _repository(self) -> FaceRepository:
         faces_root = ensure_work_dir(self._library_root) / "faces"
         return FaceRepository(
@@ -437,8 +484,73 @@ class PeopleIndexCoordinator(QObject):
             group_redirects=dict(group_redirects or {}),
         )
         self._scheduleEmit.emit(event)
+        if event.changed_person_ids or event.person_redirects:
+            affected = (
+                *event.changed_person_ids,
+                *event.person_redirects,
+                *event.person_redirects.values(),
+            )
+            self._sync_search_people(affected)
+            self._sync_person_assets(affected)
         return event
 
+    def _sync_search_people(self, person_ids: Iterable[str]) -> None:
+        """Mirror the names of *person_ids* into the asset index's full-text search table.
+
+        The first sync after binding an asset index mirrors every named person.
+        """
+
+        store = self._asset_repository
+        replace_asset_people = getattr(store, "replace_asset_people", None)
+        if not callable(replace_asset_people):
+            return
+        scope = (
+            tuple(dict.fromkeys(person_id for person_id in person_ids if person_id))
+            if self._search_people_synced
+            else None
+        )
+        if scope is not None and not scope:
+            return
+        try:
+            replace_asset_people(
+                self._repository().get_named_person_asset_rows(scope),
+                person_ids=scope,
+            )
+            self._search_people_synced = True
+        except Exception as exc:
+            LOGGER.warning(
+                "Failed to refresh People search names for %s: %s",
+                self._library_root,
+                exc,
+            )
+
+    def _sync_person_assets(self, person_ids: Iterable[str]) -> bool:
+        """Mirror the assets of *person_ids* into the asset index's membership table."""
+
+        scope = tuple(dict.fromkeys(person_id for person_id in person_ids if person_id))
+        store = self._asset_repository
+        replace_person_assets = getattr(store, "replace_person_assets", None)
+        if not callable(replace_person_assets):
+            self._person_assets_synced_ids.clear()
+            return False
+        if not scope:
+            return True
+        try:
+            replace_person_assets(
+                self._repository().get_person_asset_rows(scope),
+                person_ids=scope,
+            )
+        except Exception as exc:
+            self._person_assets_synced_ids.difference_update(scope)
+            LOGGER.warning(
+                "Failed to refresh People memberships for %s: %s",
+                self._library_root,
+                exc,
+            )
+            return False
+        self._person_assets_synced_ids.update(scope)
+        return True
+
     def _mark_done_asset_ids(self, done_ids: list[str]) -> None:
         if not done_ids:
             return
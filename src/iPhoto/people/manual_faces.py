@@ -5,7 +5,8 @@ from __future__ import annotations
 import uuid
 from pathlib import Path
 
-from .image_utils import load_image_rgb, save_face_thumbnail
+from .face_crop_store import store_face_crop
+from .image_utils import load_image_rgb
 from .records import ManualFaceRecord
 from .repository_utils import _utc_now_iso
 
@@ -46,7 +47,7 @@ def build_manual_face_record(
 
     face_id = uuid.uuid4().hex
     thumbnail_path = thumbnail_dir / f"{face_id}.png"
-    save_face_thumbnail(image, (x, y, width, height), thumbnail_path)
+    store_face_crop(image, (x, y, width, height), thumbnail_path)
     return ManualFaceRecord(
         face_id=face_id,
         asset_id=asset_id,
@@ -14,16 +14,10 @@ from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, Sequence
+from typing import TYPE_CHECKING, Callable, Sequence
 
 import numpy as np
 
-from .image_utils import (
-    PeopleImageLoadError,
-    load_image_rgb,
-    pil_image_to_bgr,
-    save_face_thumbnail,
-)
 from .repository import (
     FaceRecord,
     FaceStateRepository,
@@ -34,6 +28,9 @@ from .repository import (
 )
 from .repository_utils import profile_state_for_sample_count
 
+if TYPE_CHECKING:
+    from .face_scan_engine import FaceScanEngine, FaceScanStageStats
+
 _LOGGER = logging.getLogger(__name__)
 _REQUIRED_FACE_MODULES = ("detection", "recognition")
 
@@ -62,6 +59,7 @@ class FaceClusterPipeline:
         self._min_samples = int(min_samples)
         self._min_face_size = int(min_face_size)
         self._analysis_app = None
+        self._scan_engine: FaceScanEngine | None = None
 
     @property
     def distance_threshold(self) -> float:
@@ -82,106 +80,40 @@ class FaceClusterPipeline:
         if not rows:
             return []
 
-        face_app = self._ensure_face_analysis()
-        cancellation_requested = is_cancelled or (lambda: False)
-        results: list[DetectedAssetFaces] = []
-        for row in rows:
-            if cancellation_requested():
-                break
-            asset_id = str(row.get("id") or "")
-            asset_rel = Path(str(row.get("rel") or "")).as_posix()
-            image_path = (library_root / asset_rel).resolve()
-            try:
-                image = load_image_rgb(image_path)
-                image_bgr = pil_image_to_bgr(image)
-                detected_faces = face_app.get(image_bgr)
-            except PeopleImageLoadError as exc:
-                if cancellation_requested():
-                    break
-                reason = str(exc).strip() or exc.__class__.__name__
-                _LOGGER.warning(
-                    "Skipping face detection for unreadable image %s: %s",
-                    image_path,
-                    reason,
-                )
-                results.append(
-                    DetectedAssetFaces(
-                        asset_id=asset_id,
-                        asset_rel=asset_rel,
-                        faces=[],
-                        error=reason,
-                    )
-                )
-                continue
-            except Exception as exc:
-                if cancellation_requested():
-                    break
-                _LOGGER.exception("Face detection failed for %s", image_path)
-                results.append(
-                    DetectedAssetFaces(
-                        asset_id=asset_id,
-                        asset_rel=asset_rel,
-                        faces=[],
-                        error=str(exc),
-                    )
-                )
-                continue
+        engine = self._ensure_scan_engine()
+        return engine.detect(
+            rows,
+            library_root=library_root,
+            thumbnail_dir=thumbnail_dir,
+            is_cancelled=is_cancelled,
+        )
 
-            if cancellation_requested():
-                break
-
-            image_width, image_height = image.size
-            faces: list[FaceRecord] = []
-            for detected in detected_faces:
-                bbox = _normalize_bbox(
-                    detected.bbox,
-                    image_width=image_width,
-                    image_height=image_height,
-                )
-                if bbox[2] < self._min_face_size or bbox[3] < self._min_face_size:
-                    continue
-
-                embedding = _extract_embedding(detected)
-                if embedding is None:
-                    continue
-
-                face_id = uuid.uuid4().hex
-                thumbnail_path = thumbnail_dir / f"{face_id}.png"
-                save_face_thumbnail(image, bbox, thumbnail_path)
-                faces.append(
-                    FaceRecord(
-                        face_id=face_id,
-                        face_key=build_face_key(
-                            asset_id=asset_id,
-                            bbox=bbox,
-                            image_width=image_width,
-                            image_height=image_height,
-                        ),
-                        asset_id=asset_id,
-                        asset_rel=asset_rel,
-                        box_x=bbox[0],
-                        box_y=bbox[1],
-                        box_w=bbox[2],
-                        box_h=bbox[3],
-                        confidence=float(getattr(detected, "det_score", 0.0)),
-                        embedding=embedding,
-                        embedding_dim=int(embedding.shape[0]),
-                        thumbnail_path=thumbnail_path.relative_to(thumbnail_dir.parent).as_posix(),
-                        person_id=None,
-                        detected_at=_utc_now_iso(),
-                        image_width=image_width,
-                        image_height=image_height,
-                    )
-                )
-
-            results.append(
-                DetectedAssetFaces(
-                    asset_id=asset_id,
-                    asset_rel=asset_rel,
-                    faces=faces,
-                )
-            )
-        return results
+    def face_scan_stats(self) -> dict[str, FaceScanStageStats]:
+        """Return per-stage throughput of the detection engine so far."""
+
+        if self._scan_engine is None:
+            return {}
+        return self._scan_engine.stage_stats()
+
+    def close(self) -> None:
+        """Stop the detection engine's decode and inference threads."""
+
+        engine, self._scan_engine = self._scan_engine, None
+        if engine is not None:
+            engine.close()
+
+    def _ensure_scan_engine(self) -> FaceScanEngine:
+        face_app = self._ensure_face_analysis()
+        engine = self._scan_engine
+        if engine is not None and engine.detector is face_app:
+            return engine
+        from .face_scan_engine import FaceScanEngine
+
+        if engine is not None:
+            engine.close()
+        engine = FaceScanEngine(face_app, min_face_size=self._min_face_size)
+        self._scan_engine = engine
+        return engine
 
     def _ensure_face_analysis(self):
         if self._analysis_app is not None:
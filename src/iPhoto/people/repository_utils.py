@@ -46,6 +46,19 @@ def _deserialize_embedding(blob: bytes | None, embedding_dim: int) -> np.ndarray
     return np.frombuffer(blob, dtype=np.float32, count=embedding_dim).copy()
 
 
+def _serialize_embedding_sum(embedding_sum: np.ndarray) -> sqlite3.Binary:
+    # Running sums are kept unnormalised in float64 so repeated add/subtract
+    # cycles do not drift away from the true cluster mean.
+    vector = np.asarray(embedding_sum, dtype=np.float64).flatten()
+    return sqlite3.Binary(vector.tobytes())
+
+
+def _deserialize_embedding_sum(blob: bytes | None) -> np.ndarray | None:
+    if blob is None:
+        return None
+    return np.frombuffer(blob, dtype=np.float64).copy()
+
+
 def _normalize_name(name_or_none: str | None) -> str | None:
     if name_or_none is None:
         return None
@@ -5,6 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 import os
 from pathlib import Path
+from typing import Iterable
 import uuid
 
 from iPhoto.application.ports import PeopleAssetRepositoryPort
@@ -339,6 +340,13 @@ class PeopleService:
         return self._valid_asset_ids(asset_ids)
 
     def build_cluster_query(self, person_id: str) -> AssetQuery:
+        repository = self.repository()
+        if (
+            repository is not None
+            and repository.has_person(person_id)
+            and self._serves_membership_queries((person_id,))
+        ):
+            return AssetQuery(person_ids=[person_id])
         return AssetQuery(asset_ids=self.cluster_asset_ids(person_id))
 
     def has_cluster(self, person_id: str) -> bool:
@@ -355,6 +363,14 @@ class PeopleService:
         return self._valid_asset_ids(asset_ids)
 
     def build_group_query(self, group_id: str) -> AssetQuery:
+        repository = self.repository()
+        group = repository.get_group(group_id) if repository is not None else None
+        if (
+            group is not None
+            and len(group.member_person_ids) >= 2
+            and self._serves_membership_queries(group.member_person_ids)
+        ):
+            return AssetQuery(person_ids=list(group.member_person_ids))
         return AssetQuery(asset_ids=self.group_asset_ids(group_id))
 
     def has_group(self, group_id: str) -> bool:
@@ -544,6 +560,14 @@ class PeopleService:
             summaries.append(summary)
         return summaries
 
+    def _serves_membership_queries(self, person_ids: Iterable[str]) -> bool:
+        """Return whether galleries of *person_ids* can page from the asset index."""
+
+        if self._library_root is None or self._asset_repository is None:
+            return False
+        coordinator = self.coordinator
+        return coordinator is not None and coordinator.ensure_person_assets(person_ids)
+
     def _valid_asset_ids(self, asset_ids: list[str]) -> list[str]:
         if self._library_root is None or not asset_ids:
             return []
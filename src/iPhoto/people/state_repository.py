@@ -39,6 +39,18 @@ class PersonCoverRecord:
     is_custom: bool
 
 
+@dataclass(frozen=True)
+class PersonDashboardRecord:
+    person_id: str
+    name: str | None
+    key_face_id: str
+    face_count: int
+    thumbnail_path: str | None
+    created_at: str
+    sort_order: int | None
+    is_hidden: bool
+
+
 class FaceStateRepository:
     def __init__(self, db_path: Path) -> None:
         self._db_path = Path(db_path)
@@ -554,6 +566,105 @@ class FaceStateRepository:
                 conn.execute("DELETE FROM hidden_people WHERE person_id = ?", (person_id,))
             conn.commit()
 
+    def read_person_dashboard(self) -> list[PersonDashboardRecord] | None:
+        """Return every materialised person card, or None before the first build.
+
+        Cards come back by face count, then creation time; custom order and
+        hidden state are joined in from their own tables.
+        """
+
+        self.initialize()
+        with closing(self._connect()) as conn:
+            if conn.execute("SELECT 1 FROM people_dashboard_state").fetchone() is None:
+                return None
+            rows = conn.execute(
+                """
+                SELECT
+                    people_dashboard.person_id,
+                    people_dashboard.name,
+                    people_dashboard.key_face_id,
+                    people_dashboard.face_count,
+                    people_dashboard.thumbnail_path,
+                    people_dashboard.created_at,
+                    person_card_orders.sort_order,
+                    hidden_people.person_id IS NOT NULL AS is_hidden
+                FROM people_dashboard
+                LEFT JOIN person_card_orders
+                    ON person_card_orders.person_id = people_dashboard.person_id
+                LEFT JOIN hidden_people
+                    ON hidden_people.person_id = people_dashboard.person_id
+                ORDER BY
+                    people_dashboard.face_count DESC,
+                    people_dashboard.created_at ASC,
+                    people_dashboard.person_id ASC
+                """
+            ).fetchall()
+        return [
+            PersonDashboardRecord(
+                person_id=str(row["person_id"]),
+                name=row["name"],
+                key_face_id=str(row["key_face_id"]),
+                face_count=int(row["face_count"]),
+                thumbnail_path=str(row["thumbnail_path"]) if row["thumbnail_path"] else None,
+                created_at=str(row["created_at"]),
+                sort_order=int(row["sort_order"]) if row["sort_order"] is not None else None,
+                is_hidden=bool(row["is_hidden"]),
+            )
+            for row in rows
+        ]
+
+    def replace_person_dashboard(
+        self,
+        rows: Iterable[tuple[str, str | None, str, int, str | None, str]],
+        *,
+        person_ids: Iterable[str] | None = None,
+    ) -> None:
+        """Replace materialised person cards in one transaction.
+
+        *rows* are ``(person_id, name, key_face_id, face_count, thumbnail_path,
+        created_at)``.  With *person_ids* only those cards are replaced, and
+        ids without a row are dropped; otherwise the whole table is rebuilt.
+        """
+
+        self.initialize()
+        updated_at = _utc_now_iso()
+        with closing(self._connect()) as conn:
+            if person_ids is None:
+                conn.execute("DELETE FROM people_dashboard")
+                conn.execute(
+                    """
+                    INSERT INTO people_dashboard_state (singleton, built_at)
+                    VALUES (1, ?)
+                    ON CONFLICT(singleton) DO UPDATE SET built_at = excluded.built_at
+                    """,
+                    (updated_at,),
+                )
+            else:
+                unique_ids = _unique_person_ids(person_ids)
+                if unique_ids:
+                    placeholders = ", ".join(["?"] * len(unique_ids))
+                    conn.execute(
+                        f"DELETE FROM people_dashboard WHERE person_id IN ({placeholders})",
+                        unique_ids,
+                    )
+            conn.executemany(
+                """
+                INSERT INTO people_dashboard (
+                    person_id, name, key_face_id, face_count, thumbnail_path,
+                    created_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(person_id) DO UPDATE SET
+                    name = excluded.name,
+                    key_face_id = excluded.key_face_id,
+                    face_count = excluded.face_count,
+                    thumbnail_path = excluded.thumbnail_path,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at
+                """,
+                [(*row, updated_at) for row in rows],
+            )
+            conn.commit()
+
     def get_face_key_map(self, face_keys: Iterable[str]) -> dict[str, str]:
         unique_face_keys = [face_key for face_key in dict.fromkeys(face_keys) if face_key]
         if not unique_face_keys:
@@ -1002,6 +1113,20 @@ class FaceStateRepository:
             if row["person_id"] and row["thumbnail_path"]
         }
 
+    def referenced_thumbnail_paths(self) -> set[str]:
+        """Return face-crop paths still used by manual faces or person covers."""
+
+        self.initialize()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                """
+                SELECT thumbnail_path FROM manual_faces WHERE thumbnail_path IS NOT NULL
+                UNION
+                SELECT thumbnail_path FROM person_covers WHERE thumbnail_path IS NOT NULL
+                """
+            ).fetchall()
+        return {str(row["thumbnail_path"]) for row in rows if row["thumbnail_path"]}
+
     def get_person_cover(self, person_id: str) -> PersonCoverRecord | None:
         if not person_id:
             return None
@@ -1313,6 +1438,67 @@ class FaceStateRepository:
             )
             conn.commit()
 
+    def remove_group_assets(self, group_id: str, asset_ids: Iterable[str]) -> None:
+        unique_ids = tuple(dict.fromkeys(str(asset_id) for asset_id in asset_ids if asset_id))
+        if not group_id or not unique_ids:
+            return
+
+        self.initialize()
+        timestamp = _utc_now_iso()
+        chunk_size = 900
+        removed_count = 0
+        with closing(self._connect()) as conn:
+            for start in range(0, len(unique_ids), chunk_size):
+                chunk = unique_ids[start : start + chunk_size]
+                placeholders = ", ".join(["?"] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    DELETE FROM people_group_assets
+                    WHERE group_id = ? AND asset_id IN ({placeholders})
+                    """,
+                    (group_id, *chunk),
+                )
+                removed_count += max(int(cursor.rowcount), 0)
+            if not removed_count:
+                return
+            existing_cache = conn.execute(
+                """
+                SELECT cover_asset_id, cover_is_custom
+                FROM people_group_asset_cache
+                WHERE group_id = ?
+                """,
+                (group_id,),
+            ).fetchone()
+            if existing_cache is not None:
+                cover_asset_id = existing_cache["cover_asset_id"]
+                cover_is_custom = int(existing_cache["cover_is_custom"])
+                if not cover_asset_id or str(cover_asset_id) in unique_ids:
+                    # Same fallback as ``replace_group_assets``: the first asset.
+                    first_row = conn.execute(
+                        """
+                        SELECT asset_id
+                        FROM people_group_assets
+                        WHERE group_id = ?
+                        ORDER BY position ASC
+                        LIMIT 1
+                        """,
+                        (group_id,),
+                    ).fetchone()
+                    cover_asset_id = first_row["asset_id"] if first_row is not None else None
+                    cover_is_custom = 0
+                conn.execute(
+                    """
+                    UPDATE people_group_asset_cache
+                    SET asset_count = MAX(asset_count - ?, 0),
+                        cover_asset_id = ?,
+                        cover_is_custom = ?,
+                        updated_at = ?
+                    WHERE group_id = ?
+                    """,
+                    (removed_count, cover_asset_id, cover_is_custom, timestamp, group_id),
+                )
+            conn.commit()
+
     def get_group_cover_asset_id(self, group_id: str) -> str | None:
         if not group_id:
             return None
@@ -1586,6 +1772,7 @@ class FaceStateRepository:
             conn.execute("DELETE FROM person_card_orders WHERE person_id = ?", (person_id,))
             conn.execute("DELETE FROM hidden_people WHERE person_id = ?", (person_id,))
             conn.execute("DELETE FROM person_profiles WHERE person_id = ?", (person_id,))
+            conn.execute("DELETE FROM people_dashboard WHERE person_id = ?", (person_id,))
             conn.commit()
 
     @staticmethod
@@ -1832,6 +2019,33 @@ class FaceStateRepository:
             "CREATE INDEX IF NOT EXISTS idx_people_group_assets_group_id "
             "ON people_group_assets(group_id)"
         )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_people_group_assets_position "
+            "ON people_group_assets(group_id, position)"
+        )
+        # Materialised People cards, kept current by the face repository's
+        # mutations so opening the dashboard never scans faces.
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS people_dashboard (
+                person_id TEXT PRIMARY KEY,
+                name TEXT,
+                key_face_id TEXT NOT NULL,
+                face_count INTEGER NOT NULL,
+                thumbnail_path TEXT,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_people_dashboard_rank "
+            "ON people_dashboard(face_count DESC, created_at ASC, person_id ASC)"
+        )
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS people_dashboard_state (
+                singleton INTEGER PRIMARY KEY CHECK (singleton = 1),
+                built_at TEXT NOT NULL
+            )
+            """)
 
     @staticmethod
     def _drop_legacy_manual_faces(conn: sqlite3.Connection) -> None:
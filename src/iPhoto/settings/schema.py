@@ -69,6 +69,7 @@ SETTINGS_SCHEMA: dict[str, Any] = {
                 "show_face_names_in_detail": {"type": "boolean"},
                 "show_hidden_people": {"type": "boolean"},
                 "show_map_extension_startup_prompt": {"type": "boolean"},
+                "skip_duplicate_imports": {"type": "boolean"},
                 "wheel_action": {
                     "type": "string",
                     "enum": ["navigate", "zoom"],
@@ -101,6 +102,7 @@ DEFAULT_SETTINGS: dict[str, Any] = {
         "show_face_names_in_detail": False,
         "show_hidden_people": False,
         "show_map_extension_startup_prompt": True,
+        "skip_duplicate_imports": False,
         "wheel_action": "navigate",
     },
     "last_open_albums": [],
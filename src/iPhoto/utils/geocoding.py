@@ -1,27 +1,187 @@
-"""Helpers for reverse geocoding GPS coordinates."""
+"""Helpers for reverse geocoding GPS coordinates.
+
+Lookups prefer the memory-mapped index derived from the bundled GeoNames
+database (see :mod:`maps.geonames_reverse`), which opens instantly and yields
+a city / district / region / country hierarchy.  Installs without that
+database fall back to the ``reverse_geocoder`` package, which builds its
+KD-tree in memory on first use.
+
+When the index has not been derived from the database yet it is built on a
+background thread; until it is ready, lookups made from the main (GUI) thread
+resolve to ``None`` instead of blocking, while worker threads wait for it.
+"""
 
 from __future__ import annotations
 
 import math
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from importlib.util import find_spec
 from functools import lru_cache
-from typing import Dict, Optional
-
-import reverse_geocoder  # type: ignore[import]
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .logging import get_logger
 
 
+@dataclass(frozen=True)
+class LocationHierarchy:
+    """Place names resolved for one coordinate, from most to least specific."""
+
+    city: str
+    region: str = ""
+    country: str = ""
+    country_code: str = ""
+    district: str = ""
+
+    @property
+    def label(self) -> Optional[str]:
+        # ``city — district`` (falling back to the region) is the label shape
+        # stored for already indexed assets, so location groups stay stable.
+        components = [
+            component for component in (self.city, self.district or self.region) if component
+        ]
+        if not components:
+            return None
+        return " — ".join(components)
+
+
+# Returned by ``_geonames_geocoder`` while the index is still being built.
+_INDEX_PENDING = object()
+
+
+class _GeoNamesIndexLoader:
+    """Open the GeoNames index once, building it off the calling thread."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._geocoder: Any = None
+        self._started = False
+
+    def get(self, *, wait: bool) -> Any:
+        if not self._ready.is_set():
+            self._start()
+            if not wait and not self._ready.is_set():
+                return _INDEX_PENDING
+            self._ready.wait()
+        return self._geocoder
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+        try:
+            from maps.geonames_reverse import open_reverse_geocoder
+
+            from ..settings.manager import default_settings_path
+
+            cache_dir = default_settings_path().parent / "geocoding"
+            geocoder = open_reverse_geocoder(cache_dir=cache_dir, build=False)
+        except Exception:
+            get_logger().debug("GeoNames reverse geocoding unavailable", exc_info=True)
+            self._finish(None)
+            return
+        if geocoder is not None:
+            self._finish(geocoder)
+            return
+        threading.Thread(
+            target=self._build,
+            args=(cache_dir,),
+            name="geonames-reverse-index",
+            daemon=True,
+        ).start()
+
+    def _build(self, cache_dir: Path) -> None:
+        geocoder = None
+        try:
+            from maps.geonames_reverse import open_reverse_geocoder
+
+            geocoder = open_reverse_geocoder(cache_dir=cache_dir)
+        except Exception:
+            get_logger().warning("Building the GeoNames reverse geocoding index failed", exc_info=True)
+        self._finish(geocoder)
+
+    def _finish(self, geocoder: Any) -> None:
+        self._geocoder = geocoder
+        self._ready.set()
+
+
+_index_loader = _GeoNamesIndexLoader()
+
+
+def _geonames_geocoder():
+    """Return the GeoNames-backed reverse geocoder, or ``None`` when unavailable.
+
+    On the main thread this returns ``_INDEX_PENDING`` rather than waiting for
+    an index build that is still running.
+    """
+
+    return _index_loader.get(wait=threading.current_thread() is not threading.main_thread())
+
+
 @lru_cache(maxsize=1)
-def _geocoder() -> "reverse_geocoder.RGeocoder":
-    """Return a cached reverse geocoder instance."""
+def _geocoder():
+    """Return a cached ``reverse_geocoder`` instance for the fallback path."""
+
+    import reverse_geocoder  # type: ignore[import]
 
     return reverse_geocoder.RGeocoder(mode=1, verbose=False)
 
 
-@lru_cache(maxsize=32768)
-def _lookup_location_name(latitude_key: float, longitude_key: float) -> Optional[str]:
-    """Resolve a stable location label for the rounded GPS coordinate."""
+_LOCATION_CACHE_SIZE = 32768
+_location_cache: "OrderedDict[Tuple[float, float], Optional[LocationHierarchy]]" = OrderedDict()
+_location_cache_lock = threading.Lock()
+
+
+def _lookup_locations(
+    keys: Iterable[Tuple[float, float]],
+) -> Optional[List[Optional[LocationHierarchy]]]:
+    """Resolve rounded coordinates; ``None`` while the index is still building."""
+
+    keys = list(keys)
+    geonames = _geonames_geocoder()
+    if geonames is _INDEX_PENDING:
+        return None
+    if geonames is not None:
+        try:
+            hits = geonames.query(keys)
+        except Exception:
+            get_logger().warning("GeoNames reverse geocoding failed", exc_info=True)
+        else:
+            return [
+                LocationHierarchy(
+                    hit.city,
+                    hit.region,
+                    hit.country,
+                    hit.country_code,
+                    hit.district,
+                )
+                if hit is not None
+                else None
+                for hit in hits
+            ]
+    return [_fallback_lookup(latitude_key, longitude_key) for latitude_key, longitude_key in keys]
+
+
+@lru_cache(maxsize=None)
+def _country_name(country_code: str) -> str:
+    """Return the English name for an ISO 3166 alpha-2 *country_code*."""
+
+    try:
+        from PySide6.QtCore import QLocale
+    except ImportError:
+        return country_code
+    territory = QLocale.codeToTerritory(country_code)
+    if territory == QLocale.Country.AnyTerritory:
+        return country_code
+    return QLocale.territoryToString(territory) or country_code
+
 
+def _fallback_lookup(latitude_key: float, longitude_key: float) -> Optional[LocationHierarchy]:
     try:
         result = _geocoder().query([(latitude_key, longitude_key)])
     except Exception:
@@ -49,11 +209,13 @@ def _lookup_location_name(latitude_key: float, longitude_key: float) -> Optional
         return None
 
     city = str(record.get("name", "")).strip()
-    admin = str(record.get("admin2") or record.get("admin1") or "").strip()
-    components = [component for component in (city, admin) if component]
-    if not components:
+    region = str(record.get("admin1") or "").strip()
+    district = str(record.get("admin2") or "").strip()
+    if not city and not region and not district:
         return None
-    return " — ".join(components)
+    country_code = str(record.get("cc", "")).strip().upper()
+    country = _country_name(country_code) if country_code else ""
+    return LocationHierarchy(city, region, country, country_code, district)
 
 
 def _coerce_coordinate(value: object) -> Optional[float]:
@@ -74,17 +236,7 @@ def _coerce_coordinate(value: object) -> Optional[float]:
     return None
 
 
-def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
-    """Return a human readable place name for *gps* coordinates.
-
-    Parameters
-    ----------
-    gps:
-        Mapping containing ``lat``/``lon`` keys (or ``latitude``/``longitude``
-        aliases). When either value is missing or the lookup fails the function
-        returns ``None``.
-    """
-
+def _coordinate_key(gps: Optional[Dict[str, float]]) -> Optional[Tuple[float, float]]:
     if not gps:
         return None
     latitude = _coerce_coordinate(gps.get("lat"))
@@ -103,7 +255,73 @@ def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
     # burst photos taken in the same area without changing the visible label.
     latitude_key = round(latitude, 4) if math.isfinite(latitude) else latitude
     longitude_key = round(longitude, 4) if math.isfinite(longitude) else longitude
-    location_name = _lookup_location_name(latitude_key, longitude_key)
+    return latitude_key, longitude_key
+
+
+def reverse_geocoding_available() -> bool:
+    """Return whether either geocoding backend can answer lookups."""
+
+    if _geonames_geocoder() is not None or "reverse_geocoder" in sys.modules:
+        return True
+    return find_spec("reverse_geocoder") is not None
+
+
+def resolve_location(gps: Optional[Dict[str, float]]) -> Optional[LocationHierarchy]:
+    """Return the city / region / country hierarchy for *gps* coordinates."""
+
+    return resolve_locations((gps,))[0]
+
+
+def resolve_locations(
+    gps_values: Iterable[Optional[Dict[str, float]]],
+) -> List[Optional[LocationHierarchy]]:
+    """Resolve many coordinates at once, preserving the input order.
+
+    Rounded coordinates are cached; the ones not seen before are answered by
+    one batched index query, which is considerably cheaper than resolving
+    them one at a time.
+    """
+
+    keys = [_coordinate_key(gps) for gps in gps_values]
+    resolved: Dict[Tuple[float, float], Optional[LocationHierarchy]] = {}
+    missing: List[Tuple[float, float]] = []
+    with _location_cache_lock:
+        for key in dict.fromkeys(key for key in keys if key is not None):
+            if not all(math.isfinite(component) for component in key):
+                resolved[key] = None
+            elif key in _location_cache:
+                _location_cache.move_to_end(key)
+                resolved[key] = _location_cache[key]
+            else:
+                missing.append(key)
+    if missing:
+        locations = _lookup_locations(missing)
+        if locations is None:
+            # The index is still being built; answer without caching.
+            locations = [None] * len(missing)
+        else:
+            with _location_cache_lock:
+                for key, location in zip(missing, locations, strict=True):
+                    _location_cache[key] = location
+                while len(_location_cache) > _LOCATION_CACHE_SIZE:
+                    _location_cache.popitem(last=False)
+        resolved.update(zip(missing, locations, strict=True))
+    return [resolved[key] if key is not None else None for key in keys]
+
+
+def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
+    """Return a human readable place name for *gps* coordinates.
+
+    Parameters
+    ----------
+    gps:
+        Mapping containing ``lat``/``lon`` keys (or ``latitude``/``longitude``
+        aliases). When either value is missing or the lookup fails the function
+        returns ``None``.
+    """
+
+    location = resolve_location(gps)
+    location_name = location.label if location is not None else None
     if location_name is None:
         return None
 
@@ -111,4 +329,20 @@ def resolve_location_name(gps: Optional[Dict[str, float]]) -> Optional[str]:
     return location_name
 
 
-__all__ = ["resolve_location_name"]
+def resolve_location_names(gps_values: Iterable[Optional[Dict[str, float]]]) -> List[Optional[str]]:
+    """Batch counterpart of :func:`resolve_location_name`."""
+
+    return [
+        location.label if location is not None else None
+        for location in resolve_locations(gps_values)
+    ]
+
+
+__all__ = [
+    "LocationHierarchy",
+    "resolve_location",
+    "resolve_location_name",
+    "resolve_location_names",
+    "resolve_locations",
+    "reverse_geocoding_available",
+]
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 from pathlib import Path
 import os
+import shutil
 
 import xxhash
 
+# ``compute_file_id`` hashes small files whole and samples larger ones.
+_FILE_ID_FULL_HASH_LIMIT = 2 * 1024 * 1024  # 2 MB
+_FILE_ID_SAMPLE_SIZE = 256 * 1024  # 256KB
+
 
 def file_xxh3(path: Path, *, chunk_size: int = 1024 * 1024) -> str:
     """Return the XXH3 128-bit hash of *path*."""
@@ -27,7 +32,7 @@ def compute_file_id(path: Path) -> str:
     For small files (< 2MB), hashes the entire content using XXH3.
     For large files, hashes a sample of the content (Head/Mid/Tail) + Size.
     """
-    threshold = 2 * 1024 * 1024  # 2 MB
+    threshold = _FILE_ID_FULL_HASH_LIMIT
 
     with path.open("rb") as f:
         # Use fstat to get size of the opened file handle to avoid TOCTOU race conditions
@@ -53,7 +58,7 @@ def compute_file_id(path: Path) -> str:
         # Mix in the size
         hasher.update(file_size.to_bytes(8, "little"))
 
-        chunk_size = 256 * 1024  # 256KB
+        chunk_size = _FILE_ID_SAMPLE_SIZE
 
         # Head
         hasher.update(f.read(chunk_size))
@@ -69,3 +74,54 @@ def compute_file_id(path: Path) -> str:
             hasher.update(f.read(chunk_size))
 
     return hasher.hexdigest()
+
+
+def copy_with_file_id(
+    source: Path,
+    target: Path,
+    *,
+    chunk_size: int = 1024 * 1024,
+) -> str:
+    """Copy *source* to *target* and return its :func:`compute_file_id` hash.
+
+    The digest is built from the bytes streamed through the copy, so importing
+    a file reads it exactly once.  Metadata is copied like :func:`shutil.copy2`.
+    """
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        file_size = os.fstat(src.fileno()).st_size
+        whole = xxhash.xxh3_128() if file_size <= _FILE_ID_FULL_HASH_LIMIT else None
+        sample = _FILE_ID_SAMPLE_SIZE
+        mid_start = file_size // 2 - sample // 2
+        # Same head/middle/tail windows that ``compute_file_id`` seeks to.
+        windows = [(0, sample)]
+        if file_size > sample * 2:
+            windows.append((mid_start, mid_start + sample))
+        if file_size > sample:
+            tail_start = max(0, file_size - sample)
+            windows.append((tail_start, tail_start + sample))
+        samples = [bytearray() for _ in windows]
+
+        offset = 0
+        while True:
+            chunk = src.read(chunk_size)
+            if not chunk:
+                break
+            dst.write(chunk)
+            end = offset + len(chunk)
+            if whole is not None:
+                whole.update(chunk)
+            else:
+                for (start, stop), buffer in zip(windows, samples, strict=True):
+                    if start < end and stop > offset:
+                        buffer += chunk[max(start, offset) - offset : min(stop, end) - offset]
+            offset = end
+    shutil.copystat(source, target)
+
+    if whole is not None:
+        return whole.hexdigest()
+    hasher = xxhash.xxh3_128()
+    hasher.update(file_size.to_bytes(8, "little"))
+    for buffer in samples:
+        hasher.update(buffer)
+    return hasher.hexdigest()
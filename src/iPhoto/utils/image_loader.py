@@ -11,6 +11,12 @@ from PySide6.QtCore import QSize, Qt
 from PySide6.QtGui import QImage, QImageReader, QPixmap
 
 from .deps import load_pillow
+from .micro_thumbnail import (
+    MICRO_HEADER_SIZE,
+    PIXEL_FORMAT_RGB565,
+    encode_micro_thumbnail,
+    read_micro_header,
+)
 from ..core.raw_processor import is_raw_extension, load_raw_to_pil
 
 _PILLOW = load_pillow()
@@ -107,8 +113,32 @@ def load_qpixmap(source: Path, target: QSize | None = None) -> Optional[QPixmap]
     return pixmap
 
 
+def qimage_from_micro_thumbnail(data: bytes | bytearray | memoryview) -> Optional[QImage]:
+    """Wrap a raw micro thumbnail payload in a :class:`QImage` without decoding.
+
+    The image shares memory with *data*, which it keeps alive.  Returns
+    ``None`` for blobs in any other format.
+    """
+
+    header = read_micro_header(data)
+    if header is None:
+        return None
+    pixels = memoryview(data)[MICRO_HEADER_SIZE:header.payload_size]
+    image_format = (
+        QImage.Format.Format_RGB16
+        if header.pixel_format == PIXEL_FORMAT_RGB565
+        else QImage.Format.Format_RGB888
+    )
+    image = QImage(pixels, header.width, header.height, header.bytes_per_line, image_format)
+    return None if image.isNull() else image
+
+
 def qimage_from_bytes(data: bytes) -> Optional[QImage]:
-    """Return a :class:`QImage` decoded from JPEG/PNG *data*."""
+    """Return a :class:`QImage` decoded from raw micro, JPEG or PNG *data*."""
+
+    micro = qimage_from_micro_thumbnail(data)
+    if micro is not None:
+        return micro
 
     # Avoid handing arbitrary/corrupt index BLOBs to platform image plugins.
     # Some Qt/PySide builds can crash natively instead of returning a null image.
@@ -202,10 +232,11 @@ def _load_raw_qimage(source: Path, target: QSize | None = None) -> Optional[QIma
 
 
 def generate_micro_thumbnail(source: Path) -> Optional[bytes]:
-    """Generate a 16x16 (max dimension) JPEG thumbnail bytes for the given image.
+    """Generate a 16x16 (max dimension) raw-pixel micro thumbnail for the given image.
 
     This function loads the image using Pillow, scales it down maintaining aspect ratio
-    such that the longest side is 16 pixels, and encodes it as a JPEG.
+    such that the longest side is 16 pixels, and encodes it with
+    :func:`~iPhoto.utils.micro_thumbnail.encode_micro_thumbnail`.
     """
     if _Image is None or _ImageOps is None:
         return None
@@ -244,15 +275,9 @@ def generate_micro_thumbnail(source: Path) -> Optional[bytes]:
             # Handle orientation
             img = _ImageOps.exif_transpose(img)  # type: ignore[attr-defined]
 
-            # Convert to RGB to ensure JPEG compatibility (drop alpha if present)
-            # We convert AFTER resizing to avoid expensive RGB conversion on full-res images (e.g. RGBA PNGs)
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-
-            # Save to bytes
-            output = BytesIO()
-            img.save(output, format="JPEG", quality=75)
-            return output.getvalue()
+            # Encoding converts to RGB AFTER resizing to avoid expensive conversion
+            # on full-res images (e.g. RGBA PNGs)
+            return encode_micro_thumbnail(img)
     except Exception:
         _LOGGER.debug("Failed to generate micro thumbnail for %s", source, exc_info=True)
         return None
@@ -270,13 +295,7 @@ def _generate_raw_micro_thumbnail(source: Path) -> Optional[bytes]:
         resample = getattr(_Image, "Resampling", _Image)
         resample_filter = getattr(resample, "BICUBIC", _Image.BICUBIC)
         pil_img.thumbnail(target_size, resample_filter)
-
-        if pil_img.mode != "RGB":
-            pil_img = pil_img.convert("RGB")
-
-        output = BytesIO()
-        pil_img.save(output, format="JPEG", quality=75)
-        return output.getvalue()
+        return encode_micro_thumbnail(pil_img)
     except Exception:
         _LOGGER.debug("Failed to generate RAW micro thumbnail for %s", source, exc_info=True)
         return None
@@ -0,0 +1,140 @@
+"""Raw-pixel encoding for the 16px micro thumbnails stored in the index.
+
+Micro thumbnails are painted as placeholders while the gallery scrolls, so
+they are stored as uncompressed pixels that Qt can wrap without decoding::
+
+    offset  size  field
+    0       4     magic ``b"IPMT"``
+    4       1     pixel format (``PIXEL_FORMAT_RGB565`` or ``PIXEL_FORMAT_RGB888``)
+    5       1     width in pixels (1-16)
+    6       1     height in pixels (1-16)
+    7       1     reserved, zero
+    8       ...   ``height`` tightly packed rows, little-endian for RGB565
+
+Rows written before this format are JPEG (or PNG) blobs;
+:func:`convert_legacy_micro_thumbnail` re-encodes them.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from io import BytesIO
+from typing import TYPE_CHECKING, Optional, Union
+
+import numpy as np
+
+from .deps import load_pillow
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+MICRO_THUMBNAIL_MAGIC = b"IPMT"
+MICRO_THUMBNAIL_SIZE = 16
+MICRO_HEADER_SIZE = 8
+PIXEL_FORMAT_RGB565 = 1
+PIXEL_FORMAT_RGB888 = 2
+_BYTES_PER_PIXEL = {PIXEL_FORMAT_RGB565: 2, PIXEL_FORMAT_RGB888: 3}
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class MicroThumbnailHeader:
+    """Geometry of a raw micro thumbnail payload."""
+
+    pixel_format: int
+    width: int
+    height: int
+
+    @property
+    def bytes_per_line(self) -> int:
+        return self.width * _BYTES_PER_PIXEL[self.pixel_format]
+
+    @property
+    def payload_size(self) -> int:
+        return MICRO_HEADER_SIZE + self.bytes_per_line * self.height
+
+
+def read_micro_header(data: BytesLike) -> Optional[MicroThumbnailHeader]:
+    """Return the header of a raw micro thumbnail, or ``None`` for other blobs."""
+
+    view = memoryview(data)
+    if len(view) < MICRO_HEADER_SIZE or bytes(view[:4]) != MICRO_THUMBNAIL_MAGIC:
+        return None
+    pixel_format, width, height = view[4], view[5], view[6]
+    if pixel_format not in _BYTES_PER_PIXEL:
+        return None
+    if not (0 < width <= MICRO_THUMBNAIL_SIZE and 0 < height <= MICRO_THUMBNAIL_SIZE):
+        return None
+    header = MicroThumbnailHeader(pixel_format, width, height)
+    if len(view) < header.payload_size:
+        return None
+    return header
+
+
+def is_raw_micro_thumbnail(data: object) -> bool:
+    return isinstance(data, (bytes, bytearray, memoryview)) and read_micro_header(data) is not None
+
+
+def encode_micro_thumbnail(
+    image: "Image.Image",
+    *,
+    pixel_format: int = PIXEL_FORMAT_RGB565,
+) -> bytes:
+    """Encode *image*, scaled to fit 16×16 if needed, as a raw micro thumbnail."""
+
+    if image.width > MICRO_THUMBNAIL_SIZE or image.height > MICRO_THUMBNAIL_SIZE:
+        # Any caller holding a PIL image has Pillow available.
+        pillow_image = load_pillow().Image  # type: ignore[union-attr]
+        resample = getattr(pillow_image, "Resampling", pillow_image)
+        image = image.copy()
+        image.thumbnail((MICRO_THUMBNAIL_SIZE, MICRO_THUMBNAIL_SIZE), resample.BICUBIC)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    pixels = np.asarray(image, dtype=np.uint8)
+    height, width = pixels.shape[:2]
+    if pixel_format == PIXEL_FORMAT_RGB565:
+        channels = pixels.astype(np.uint16)
+        packed = (
+            ((channels[..., 0] >> 3) << 11)
+            | ((channels[..., 1] >> 2) << 5)
+            | (channels[..., 2] >> 3)
+        )
+        body = packed.astype("<u2").tobytes()
+    elif pixel_format == PIXEL_FORMAT_RGB888:
+        body = np.ascontiguousarray(pixels).tobytes()
+    else:
+        raise ValueError(f"Unsupported micro thumbnail pixel format: {pixel_format}")
+    header = MICRO_THUMBNAIL_MAGIC + bytes((pixel_format, width, height, 0))
+    return header + body
+
+
+def convert_legacy_micro_thumbnail(data: BytesLike) -> Optional[bytes]:
+    """Re-encode a JPEG/PNG micro thumbnail blob in the raw format.
+
+    Returns ``None`` when the blob cannot be decoded.
+    """
+
+    pillow = load_pillow()
+    if pillow is None:
+        return None
+    try:
+        with pillow.Image.open(BytesIO(bytes(data))) as image:
+            image = pillow.ImageOps.exif_transpose(image)
+            return encode_micro_thumbnail(image)
+    except (OSError, ValueError, SyntaxError):
+        return None
+
+
+__all__ = [
+    "MICRO_HEADER_SIZE",
+    "MICRO_THUMBNAIL_MAGIC",
+    "MICRO_THUMBNAIL_SIZE",
+    "MicroThumbnailHeader",
+    "PIXEL_FORMAT_RGB565",
+    "PIXEL_FORMAT_RGB888",
+    "convert_legacy_micro_thumbnail",
+    "encode_micro_thumbnail",
+    "is_raw_micro_thumbnail",
+    "read_micro_header",
+]
@@ -37,6 +37,121 @@ def _expand_cached(pattern: str) -> Tuple[str, ...]:
     return tuple(_expand(pattern))
 
 
+# ``fnmatch.fnmatch`` folds case through ``os.path.normcase``; the compiled
+# matcher mirrors that so Windows keeps its case-insensitive globbing.
+_FOLD_CASE = os.path.normcase("A") != "A"
+_SUFFIX_GLOB = re.compile(r"^(?:\*\*/)?\*\.([^*?\[\]/.]+)$")
+
+
+def _normcase(value: str) -> str:
+    return os.path.normcase(value) if _FOLD_CASE else value
+
+
+def _glob_variants(patterns: Iterable[str]) -> Iterator[str]:
+    """Yield every brace-expanded glob plus its ``**/``-stripped twin."""
+
+    for pattern in patterns:
+        for expanded in _expand_cached(pattern):
+            yield expanded
+            if expanded.startswith("**/"):
+                yield expanded[3:]
+
+
+def _compile_alternation(globs: Iterable[str]) -> Optional[re.Pattern[str]]:
+    translated = sorted({fnmatch.translate(_normcase(glob)) for glob in globs})
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+class _GlobSet:
+    """A set of globs compiled into an extension lookup plus one regex.
+
+    Globs of the form ``*.ext`` or ``**/*.ext`` are answered by a hash lookup
+    on the final suffix of the relative path; every other glob is folded into
+    a single anchored alternation so a path is tested with one regex match
+    instead of one ``fnmatch`` call per expanded pattern.
+    """
+
+    __slots__ = ("suffixes", "regex")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        suffixes: set[str] = set()
+        remaining: list[str] = []
+        for glob in _glob_variants(patterns):
+            match = _SUFFIX_GLOB.match(glob)
+            if match is not None:
+                suffixes.add(_normcase(match.group(1)))
+            else:
+                remaining.append(glob)
+        self.suffixes = frozenset(suffixes)
+        self.regex = _compile_alternation(remaining)
+
+    def matches(self, rel: str) -> bool:
+        if self.suffixes:
+            _, dot, suffix = rel.rpartition(".")
+            if dot and suffix in self.suffixes:
+                return True
+        return self.regex is not None and self.regex.match(rel) is not None
+
+
+class PathMatcher:
+    """Compiled include/exclude filter for relative POSIX paths.
+
+    Semantics match :func:`fnmatch.fnmatch` applied to every brace-expanded
+    glob (including the ``**/`` prefix being optional), but the globs are
+    compiled once so filtering a large tree costs a suffix lookup or a single
+    regex match per file.  :meth:`prunes_dir` reports directories whose whole
+    subtree is excluded so discovery can skip descending into them.
+    """
+
+    __slots__ = ("_include", "_exclude", "_dir_exclude")
+
+    def __init__(self, include_globs: Iterable[str], exclude_globs: Iterable[str]) -> None:
+        exclude = tuple(exclude_globs)
+        self._include = _GlobSet(include_globs)
+        self._exclude = _GlobSet(exclude)
+        # ``<dir glob>/**`` excludes every descendant of a directory matching
+        # ``<dir glob>`` because ``*`` also spans ``/`` in fnmatch semantics.
+        self._dir_exclude = _compile_alternation(
+            glob[:-3]
+            for glob in _glob_variants(exclude)
+            if glob.endswith("/**") and len(glob) > 3
+        )
+
+    def is_excluded_rel(self, rel: str) -> bool:
+        """Return ``True`` if the relative path *rel* matches an exclude glob."""
+
+        return self._exclude.matches(_normcase(rel))
+
+    def matches_rel(self, rel: str) -> bool:
+        """Return ``True`` if the relative path *rel* should be scanned."""
+
+        rel = _normcase(rel)
+        return not self._exclude.matches(rel) and self._include.matches(rel)
+
+    def prunes_dir(self, rel_dir: str) -> bool:
+        """Return ``True`` if every path below *rel_dir* is excluded."""
+
+        return (
+            self._dir_exclude is not None
+            and self._dir_exclude.match(_normcase(rel_dir)) is not None
+        )
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_matcher(include: Tuple[str, ...], exclude: Tuple[str, ...]) -> PathMatcher:
+    return PathMatcher(include, exclude)
+
+
+def compile_path_matcher(
+    include_globs: Iterable[str], exclude_globs: Iterable[str]
+) -> PathMatcher:
+    """Return a cached :class:`PathMatcher` for the given glob lists."""
+
+    return _compile_matcher(tuple(include_globs), tuple(exclude_globs))
+
+
 def is_excluded(path: Path, globs: Iterable[str], *, root: Path) -> bool:
     """Return ``True`` if *path* should be excluded based on *globs*.
 
@@ -45,28 +160,14 @@ def is_excluded(path: Path, globs: Iterable[str], *, root: Path) -> bool:
     """
 
     rel = path.relative_to(root).as_posix()
-    for pattern in globs:
-        for expanded in _expand_cached(pattern):
-            if fnmatch.fnmatch(rel, expanded):
-                return True
-            if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
-                return True
-    return False
+    return compile_path_matcher((), globs).is_excluded_rel(rel)
 
 
 def should_include(path: Path, include_globs: Iterable[str], exclude_globs: Iterable[str], *, root: Path) -> bool:
     """Return ``True`` if *path* should be scanned."""
 
-    if is_excluded(path, exclude_globs, root=root):
-        return False
     rel = path.relative_to(root).as_posix()
-    for pattern in include_globs:
-        for expanded in _expand_cached(pattern):
-            if fnmatch.fnmatch(rel, expanded):
-                return True
-            if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
-                return True
-    return False
+    return compile_path_matcher(include_globs, exclude_globs).matches_rel(rel)
 
 
 def _exact_work_dir_entries(root: Path) -> dict[str, Path]:
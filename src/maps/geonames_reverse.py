@@ -0,0 +1,490 @@
+"""Offline reverse geocoding over the bundled GeoNames database.
+
+The search database is organised for name lookups, so nearest-place queries
+use a packed spatial index derived from it once: populated places sorted into
+one-degree grid cells, stored as flat arrays in a single file and memory
+mapped on open.  Opening costs a header read; queries touch only the cells
+around the requested points and are answered for whole batches at a time.
+
+The index also carries the first- and second-order administrative division
+and country names found in the database, so results expose a city / district
+/ region / country hierarchy rather than a single label.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import sqlite3
+import struct
+import threading
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import numpy as np
+
+LOGGER = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".revgeo"
+_INDEX_MAGIC = b"IPRGEO01"
+_INDEX_VERSION = 2
+_ALIGNMENT = 16
+_CELL_DEGREES = 1.0
+_ROWS = int(180 / _CELL_DEGREES)
+_COLUMNS = int(360 / _CELL_DEGREES)
+# Rings searched around a query cell before giving up (about 1,100 km at the
+# equator); places further away than that are not a meaningful label.
+_MAX_RING = 10
+_EARTH_RADIUS_KM = 6371.0088
+_KM_PER_DEGREE = math.pi * _EARTH_RADIUS_KM / 180.0
+# Historical, abandoned and destroyed places are not useful labels.
+_EXCLUDED_PLACE_CODES = {"PPLH", "PPLQ", "PPLW", "PPLCH"}
+_COUNTRY_CODES = ("PCLI", "PCLD", "PCLF", "PCLS", "PCLIX", "PCL", "TERR")
+_OPTIMIZED_ROWS_SQL = """
+SELECT DISTINCT geoname_id, primary_name, latitude, longitude, feature_code,
+       country_code, admin1_code, admin2_code, population
+FROM search_index
+"""
+_LEGACY_ROWS_SQL = """
+SELECT geoname_id, name, latitude, longitude, feature_code,
+       country_code, admin1_code, admin2_code, population
+FROM geonames
+"""
+
+
+@dataclass(frozen=True)
+class ReverseGeocodeHit:
+    """Nearest populated place for one coordinate."""
+
+    geoname_id: int
+    city: str
+    region: str
+    country: str
+    country_code: str
+    latitude: float
+    longitude: float
+    distance_km: float
+    district: str = ""
+
+
+def build_reverse_geocode_index(database_path: Path, index_path: Path) -> Path:
+    """Write the packed spatial index for *database_path* to *index_path*."""
+
+    database_path = Path(database_path)
+    index_path = Path(index_path)
+    places, regions, districts, countries = _read_places(database_path)
+
+    region_keys = sorted(regions)
+    region_lookup = {key: position for position, key in enumerate(region_keys)}
+    district_keys = sorted(districts)
+    district_lookup = {key: position for position, key in enumerate(district_keys)}
+    country_keys = sorted(countries)
+    country_lookup = {code: position for position, code in enumerate(country_keys)}
+
+    count = len(places)
+    latitudes = np.fromiter((place[2] for place in places), dtype=np.float32, count=count)
+    longitudes = np.fromiter((place[3] for place in places), dtype=np.float32, count=count)
+    cells = _cell_ids(latitudes.astype(np.float64), longitudes.astype(np.float64))
+    order = np.argsort(cells, kind="stable")
+    cell_offsets = np.searchsorted(cells[order], np.arange(_ROWS * _COLUMNS + 1)).astype(np.int32)
+
+    ordered = [places[position] for position in order.tolist()]
+    encoded_names = [str(place[1]).encode("utf-8") for place in ordered]
+    name_offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum([len(name) for name in encoded_names], out=name_offsets[1:])
+    arrays = {
+        "latitude": latitudes[order],
+        "longitude": longitudes[order],
+        "cell_offsets": cell_offsets,
+        "geoname_id": np.fromiter((place[0] for place in ordered), dtype=np.int64, count=count),
+        "region": np.fromiter(
+            (region_lookup.get((place[5], place[6]), -1) for place in ordered),
+            dtype=np.int32,
+            count=count,
+        ),
+        "district": np.fromiter(
+            (district_lookup.get((place[5], place[6], place[7]), -1) for place in ordered),
+            dtype=np.int32,
+            count=count,
+        ),
+        "country": np.fromiter(
+            (country_lookup.get(place[5], -1) for place in ordered),
+            dtype=np.int32,
+            count=count,
+        ),
+        "name_offsets": name_offsets,
+        "names": np.frombuffer(b"".join(encoded_names), dtype=np.uint8),
+    }
+    header = {
+        "version": _INDEX_VERSION,
+        "source": _source_fingerprint(database_path),
+        "places": count,
+        "regions": [regions[key] for key in region_keys],
+        "districts": [districts[key] for key in district_keys],
+        "countries": [[code, countries[code]] for code in country_keys],
+        "arrays": {},
+    }
+    _write_index(index_path, header, arrays)
+    LOGGER.info("Built reverse geocoding index %s with %d places", index_path, count)
+    return index_path
+
+
+class GeoNamesReverseGeocoder:
+    """Answer nearest-place queries from a memory-mapped packed index."""
+
+    def __init__(self, index_path: Path) -> None:
+        self._index_path = Path(index_path)
+        header, data_offset = _read_header(self._index_path)
+        self._header = header
+        self._regions: list[str] = [str(name) for name in header["regions"]]
+        self._districts: list[str] = [str(name) for name in header["districts"]]
+        self._countries: list[tuple[str, str]] = [
+            (str(code), str(name)) for code, name in header["countries"]
+        ]
+        self._arrays = {
+            name: np.memmap(
+                self._index_path,
+                dtype=np.dtype(dtype),
+                mode="r",
+                offset=data_offset + offset,
+                shape=(length,),
+            )
+            if length
+            else np.zeros(0, dtype=np.dtype(dtype))
+            for name, (offset, dtype, length) in header["arrays"].items()
+        }
+
+    @property
+    def source(self) -> dict[str, object]:
+        return dict(self._header["source"])
+
+    def __len__(self) -> int:
+        return int(self._header["places"])
+
+    def nearest(self, latitude: float, longitude: float) -> ReverseGeocodeHit | None:
+        return self.query([(latitude, longitude)])[0]
+
+    def query(self, coordinates: Iterable[Sequence[float]]) -> list[ReverseGeocodeHit | None]:
+        """Return the nearest place for every ``(latitude, longitude)`` pair."""
+
+        points = np.asarray(list(coordinates), dtype=np.float64).reshape(-1, 2)
+        results: list[ReverseGeocodeHit | None] = [None] * len(points)
+        if not len(points) or not len(self):
+            return results
+        best_index, best_distance = self._nearest_indices(points)
+        for position in np.flatnonzero(best_index >= 0).tolist():
+            results[position] = self._hit(int(best_index[position]), float(best_distance[position]))
+        return results
+
+    # ------------------------------------------------------------------
+    def _nearest_indices(self, points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        latitudes = points[:, 0]
+        longitudes = points[:, 1]
+        best_index = np.full(len(points), -1, dtype=np.int64)
+        best_distance = np.full(len(points), np.inf)
+        valid = np.isfinite(latitudes) & np.isfinite(longitudes) & (np.abs(latitudes) <= 90.0)
+        rows, columns = _cell_coordinates(latitudes, longitudes)
+        place_latitudes = self._arrays["latitude"]
+        place_longitudes = self._arrays["longitude"]
+
+        pending = np.flatnonzero(valid)
+        for ring in range(_MAX_RING + 1):
+            if not len(pending):
+                break
+            cell_keys = rows[pending] * _COLUMNS + columns[pending]
+            for cell in np.unique(cell_keys).tolist():
+                members = pending[cell_keys == cell]
+                candidates = self._ring_candidates(cell // _COLUMNS, cell % _COLUMNS, ring)
+                if not len(candidates):
+                    continue
+                distances = _distance_matrix(
+                    latitudes[members],
+                    longitudes[members],
+                    np.asarray(place_latitudes[candidates], dtype=np.float64),
+                    np.asarray(place_longitudes[candidates], dtype=np.float64),
+                )
+                nearest = np.argmin(distances, axis=1)
+                nearest_distance = distances[np.arange(len(members)), nearest]
+                improved = nearest_distance < best_distance[members]
+                best_distance[members[improved]] = nearest_distance[improved]
+                best_index[members[improved]] = candidates[nearest[improved]]
+            # Anything in the next ring is at least ``ring`` whole cells away.
+            reach = _ring_reach_km(latitudes[pending], ring)
+            pending = pending[~(best_distance[pending] <= reach)]
+        return best_index, best_distance
+
+    def _ring_candidates(self, row: int, column: int, ring: int) -> np.ndarray:
+        offsets = self._arrays["cell_offsets"]
+        ranges: list[np.ndarray] = []
+        for cell_row in range(row - ring, row + ring + 1):
+            if cell_row < 0 or cell_row >= _ROWS:
+                continue
+            edge_row = abs(cell_row - row) == ring
+            step = 1 if edge_row or ring == 0 else 2 * ring
+            seen_columns: set[int] = set()
+            for delta in range(-ring, ring + 1, step):
+                cell_column = (column + delta) % _COLUMNS
+                if cell_column in seen_columns:
+                    continue
+                seen_columns.add(cell_column)
+                cell = cell_row * _COLUMNS + cell_column
+                start, end = int(offsets[cell]), int(offsets[cell + 1])
+                if end > start:
+                    ranges.append(np.arange(start, end, dtype=np.int64))
+        if not ranges:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate(ranges)
+
+    def _hit(self, index: int, distance_km: float) -> ReverseGeocodeHit:
+        name_offsets = self._arrays["name_offsets"]
+        start, end = int(name_offsets[index]), int(name_offsets[index + 1])
+        city = bytes(self._arrays["names"][start:end]).decode("utf-8", errors="replace")
+        region_index = int(self._arrays["region"][index])
+        district_index = int(self._arrays["district"][index])
+        country_index = int(self._arrays["country"][index])
+        country_code, country = self._countries[country_index] if country_index >= 0 else ("", "")
+        return ReverseGeocodeHit(
+            geoname_id=int(self._arrays["geoname_id"][index]),
+            city=city,
+            region=self._regions[region_index] if region_index >= 0 else "",
+            country=country,
+            country_code=country_code,
+            latitude=float(self._arrays["latitude"][index]),
+            longitude=float(self._arrays["longitude"][index]),
+            distance_km=distance_km,
+            district=self._districts[district_index] if district_index >= 0 else "",
+        )
+
+
+_OPEN_LOCK = threading.Lock()
+
+
+def open_reverse_geocoder(
+    database_path: Path | None = None,
+    *,
+    cache_dir: Path | None = None,
+    build: bool = True,
+) -> GeoNamesReverseGeocoder | None:
+    """Open the index for *database_path*, building it on first use.
+
+    A prebuilt ``geonames.revgeo`` shipped next to the database is used when
+    it matches the database; otherwise the index is built next to the
+    database or, when that directory is read-only, in *cache_dir*.  Returns
+    ``None`` when no usable GeoNames database is installed, or when no
+    matching index exists yet and *build* is false.
+    """
+
+    from maps.map_sources import default_osmand_search_database, is_valid_osmand_search_database
+
+    database_path = Path(database_path or default_osmand_search_database())
+    if not is_valid_osmand_search_database(database_path):
+        return None
+    fingerprint = _source_fingerprint(database_path)
+    candidates = [database_path.with_suffix(INDEX_SUFFIX)]
+    if cache_dir is not None:
+        candidates.append(Path(cache_dir) / f"geonames-{fingerprint['digest']}{INDEX_SUFFIX}")
+
+    with _OPEN_LOCK:
+        for candidate in candidates:
+            geocoder = _open_matching(candidate, fingerprint)
+            if geocoder is not None:
+                return geocoder
+        if not build:
+            return None
+        for candidate in candidates:
+            try:
+                build_reverse_geocode_index(database_path, candidate)
+            except OSError:
+                LOGGER.debug("Cannot write reverse geocoding index %s", candidate, exc_info=True)
+                continue
+            return GeoNamesReverseGeocoder(candidate)
+    return None
+
+
+def _open_matching(index_path: Path, fingerprint: dict[str, object]) -> GeoNamesReverseGeocoder | None:
+    if not index_path.is_file():
+        return None
+    try:
+        geocoder = GeoNamesReverseGeocoder(index_path)
+    except (OSError, ValueError, KeyError):
+        LOGGER.warning("Ignoring unreadable reverse geocoding index %s", index_path, exc_info=True)
+        return None
+    if geocoder.source.get("digest") != fingerprint["digest"]:
+        return None
+    return geocoder
+
+
+def _read_places(
+    database_path: Path,
+) -> tuple[
+    list[tuple],
+    dict[tuple[str, str], str],
+    dict[tuple[str, str, str], str],
+    dict[str, str],
+]:
+    conn = sqlite3.connect(f"file:{database_path.as_posix()}?mode=ro", uri=True)
+    try:
+        tables = {
+            str(row[0])
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")
+        }
+        sql = _OPTIMIZED_ROWS_SQL if "search_index" in tables else _LEGACY_ROWS_SQL
+        rows = conn.execute(sql).fetchall()
+    finally:
+        conn.close()
+
+    places: dict[int, tuple] = {}
+    regions: dict[tuple[str, str], tuple[int, str]] = {}
+    districts: dict[tuple[str, str, str], tuple[int, str]] = {}
+    countries: dict[str, tuple[int, int, str]] = {}
+    for (
+        geoname_id,
+        name,
+        latitude,
+        longitude,
+        feature_code,
+        country_code,
+        admin1,
+        admin2,
+        population,
+    ) in rows:
+        name = str(name or "").strip()
+        feature_code = str(feature_code or "").strip().upper()
+        country_code = str(country_code or "").strip().upper()
+        admin1 = str(admin1 or "").strip()
+        admin2 = str(admin2 or "").strip()
+        population = int(population or 0)
+        if not name or latitude is None or longitude is None:
+            continue
+        if feature_code == "ADM1" and country_code and admin1:
+            current = regions.get((country_code, admin1))
+            if current is None or population > current[0]:
+                regions[(country_code, admin1)] = (population, name)
+        elif feature_code == "ADM2" and country_code and admin1 and admin2:
+            current = districts.get((country_code, admin1, admin2))
+            if current is None or population > current[0]:
+                districts[(country_code, admin1, admin2)] = (population, name)
+        elif feature_code in _COUNTRY_CODES and country_code:
+            rank = _COUNTRY_CODES.index(feature_code)
+            current = countries.get(country_code)
+            if current is None or (rank, -population) < (current[0], -current[1]):
+                countries[country_code] = (rank, population, name)
+        if feature_code.startswith("PPL") and feature_code not in _EXCLUDED_PLACE_CODES:
+            places[int(geoname_id)] = (
+                int(geoname_id),
+                name,
+                float(latitude),
+                float(longitude),
+                feature_code,
+                country_code,
+                admin1,
+                admin2,
+            )
+    # Countries without a political-entity row still group by their code.
+    for place in places.values():
+        if place[5] and place[5] not in countries:
+            countries[place[5]] = (len(_COUNTRY_CODES), 0, place[5])
+    return (
+        list(places.values()),
+        {key: value[1] for key, value in regions.items()},
+        {key: value[1] for key, value in districts.items()},
+        {code: value[2] for code, value in countries.items()},
+    )
+
+
+def _source_fingerprint(database_path: Path) -> dict[str, object]:
+    stat = database_path.stat()
+    size, mtime_ns = int(stat.st_size), int(stat.st_mtime_ns)
+    digest = f"{_INDEX_VERSION}-{size:x}-{mtime_ns:x}"
+    return {"size": size, "mtime_ns": mtime_ns, "digest": digest}
+
+
+def _write_index(index_path: Path, header: dict, arrays: dict[str, np.ndarray]) -> None:
+    offset = 0
+    layout: dict[str, list] = {}
+    for name, array in arrays.items():
+        layout[name] = [offset, array.dtype.str, int(array.size)]
+        offset += _aligned(array.nbytes)
+    header = {**header, "arrays": layout}
+    encoded = json.dumps(header, ensure_ascii=True).encode("utf-8")
+    preamble = _INDEX_MAGIC + struct.pack("<I", len(encoded)) + encoded
+    padding = _aligned(len(preamble)) - len(preamble)
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = index_path.with_name(f".{index_path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temporary, "wb") as handle:
+            handle.write(preamble + b"\0" * padding)
+            for array in arrays.values():
+                data = np.ascontiguousarray(array).tobytes()
+                handle.write(data + b"\0" * (_aligned(len(data)) - len(data)))
+        os.replace(temporary, index_path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+def _read_header(index_path: Path) -> tuple[dict, int]:
+    with open(index_path, "rb") as handle:
+        magic = handle.read(len(_INDEX_MAGIC))
+        if magic != _INDEX_MAGIC:
+            raise ValueError(f"{index_path} is not a reverse geocoding index")
+        (length,) = struct.unpack("<I", handle.read(4))
+        header = json.loads(handle.read(length).decode("utf-8"))
+    if header.get("version") != _INDEX_VERSION:
+        raise ValueError(f"Unsupported reverse geocoding index version in {index_path}")
+    return header, _aligned(len(_INDEX_MAGIC) + 4 + length)
+
+
+def _aligned(size: int) -> int:
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _cell_coordinates(latitudes: np.ndarray, longitudes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    with np.errstate(invalid="ignore"):
+        rows = np.floor((np.nan_to_num(latitudes) + 90.0) / _CELL_DEGREES).astype(np.int64)
+        wrapped = np.mod(np.nan_to_num(longitudes) + 180.0, 360.0)
+        columns = np.floor(wrapped / _CELL_DEGREES).astype(np.int64)
+    return np.clip(rows, 0, _ROWS - 1), np.clip(columns, 0, _COLUMNS - 1)
+
+
+def _cell_ids(latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    rows, columns = _cell_coordinates(latitudes, longitudes)
+    return rows * _COLUMNS + columns
+
+
+def _distance_matrix(
+    query_latitudes: np.ndarray,
+    query_longitudes: np.ndarray,
+    place_latitudes: np.ndarray,
+    place_longitudes: np.ndarray,
+) -> np.ndarray:
+    """Equirectangular distances in km; accurate to well under 1% at city range."""
+
+    delta_latitude = place_latitudes[None, :] - query_latitudes[:, None]
+    delta_longitude = np.mod(place_longitudes[None, :] - query_longitudes[:, None] + 180.0, 360.0) - 180.0
+    mean_latitude = np.radians((place_latitudes[None, :] + query_latitudes[:, None]) / 2.0)
+    return _KM_PER_DEGREE * np.hypot(delta_latitude, delta_longitude * np.cos(mean_latitude))
+
+
+def _ring_reach_km(latitudes: np.ndarray, ring: int) -> np.ndarray:
+    """Lower bound on the distance to any place beyond *ring* cells out."""
+
+    if ring == 0:
+        return np.zeros(len(latitudes))
+    # East-west cells shrink towards the poles; use the narrowest latitude the
+    # next ring can reach so the bound stays conservative.
+    edge = np.minimum(90.0, np.abs(latitudes) + (ring + 1) * _CELL_DEGREES)
+    return ring * _CELL_DEGREES * _KM_PER_DEGREE * np.cos(np.radians(edge))
+
+
+__all__ = [
+    "GeoNamesReverseGeocoder",
+    "INDEX_SUFFIX",
+    "ReverseGeocodeHit",
+    "build_reverse_geocode_index",
+    "open_reverse_geocoder",
+]
@@ -0,0 +1,495 @@
+"""Pool of persistent render helper processes speaking the JSON-line protocol.
+
+Every request written to a helper carries an ``"id"`` field.  Helpers that
+echo it back may answer out of order; responses without an id are matched to
+the oldest outstanding request of that process, which is exactly the order in
+which a sequential helper answers.  Requests are spread over up to ``size``
+processes and pipelined up to ``max_in_flight`` deep per process so a slow
+tile only delays the requests queued behind it on the same helper.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import subprocess
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Hashable, Mapping, Sequence
+
+from maps.tile_parser import TileLoadingError
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT_PER_HELPER = 2
+# A slot whose helper keeps dying before it answers anything is retired;
+# once every slot is retired the pool reports itself unavailable.
+MAX_CONSECUTIVE_HELPER_FAILURES = 3
+_SHUTDOWN_GRACE_SECONDS = 1.0
+_WAIT_SLICE_SECONDS = 0.25
+
+
+class HelperPoolUnavailableError(TileLoadingError):
+    """Raised when no helper process can currently accept requests."""
+
+
+@dataclass(frozen=True)
+class HelperSlotHealth:
+    """Diagnostic snapshot of one pool slot."""
+
+    slot: int
+    pid: int | None
+    in_flight: int
+    completed: int
+    restarts: int
+    consecutive_failures: int
+    retired: bool
+
+
+class _Request:
+    __slots__ = ("request_id", "payload", "key", "init", "future", "dispatched_at", "process")
+
+    def __init__(
+        self,
+        request_id: int,
+        payload: dict[str, object],
+        key: Hashable | None,
+        *,
+        init: bool = False,
+    ) -> None:
+        self.request_id = request_id
+        self.payload = payload
+        self.key = key
+        self.init = init
+        self.future: Future[dict[str, object]] = Future()
+        self.dispatched_at: float | None = None
+        self.process: _HelperProcess | None = None
+
+
+class _HelperProcess:
+    """One running helper with a reader thread collecting its responses."""
+
+    def __init__(self, pool: HelperProcessPool, slot: _HelperSlot) -> None:
+        self._pool = pool
+        self.slot = slot
+        self.in_flight: OrderedDict[int, _Request] = OrderedDict()
+        self.alive = True
+        self.init_future: Future[dict[str, object]] | None = None
+        self._abort_reason: str | None = None
+        self._popen = subprocess.Popen(
+            list(pool.command),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env=dict(pool.environment) if pool.environment is not None else None,
+            creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+        )
+        self._reader = threading.Thread(
+            target=self._read_responses,
+            name=f"osmand-helper-{slot.index}",
+            daemon=True,
+        )
+        self._reader.start()
+
+    @property
+    def pid(self) -> int:
+        return self._popen.pid
+
+    def send(self, request: _Request) -> None:
+        """Write *request*; the caller holds the pool lock."""
+
+        line = json.dumps({**request.payload, "id": request.request_id}, ensure_ascii=True) + "\n"
+        request.process = self
+        request.dispatched_at = time.monotonic()
+        self.in_flight[request.request_id] = request
+        stdin = self._popen.stdin
+        assert stdin is not None
+        try:
+            stdin.write(line.encode("utf8"))
+            stdin.flush()
+        except OSError as exc:
+            del self.in_flight[request.request_id]
+            request.process = None
+            raise HelperPoolUnavailableError(f"Unable to write to the render helper: {exc}") from exc
+
+    def request_shutdown(self) -> None:
+        stdin = self._popen.stdin
+        try:
+            if stdin is not None and not stdin.closed:
+                stdin.write(b'{"command": "shutdown"}\n')
+                stdin.close()
+        except OSError:
+            pass
+
+    def wait_or_kill(self, timeout: float) -> None:
+        try:
+            self._popen.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self.kill()
+            self._popen.wait()
+
+    def abort(self, reason: str) -> None:
+        """Kill the helper; its in-flight requests fail with *reason*."""
+
+        self._abort_reason = reason
+        self.kill()
+
+    def kill(self) -> None:
+        if self._popen.poll() is None:
+            try:
+                self._popen.kill()
+            except OSError:
+                pass
+
+    def _read_responses(self) -> None:
+        stdout = self._popen.stdout
+        assert stdout is not None
+        reason = "Render helper exited"
+        for raw_line in stdout:
+            line = raw_line.decode("utf8", errors="replace").strip()
+            if not line:
+                continue
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                reason = f"Render helper returned invalid JSON: {line!r}"
+                break
+            if not isinstance(response, dict):
+                reason = "Render helper returned a non-object JSON response"
+                break
+            self._pool._complete(self, response)
+        self.kill()
+        self._pool._process_lost(self, self._abort_reason or reason)
+
+
+class _HelperSlot:
+    __slots__ = ("index", "process", "spawned", "completed", "restarts", "consecutive_failures")
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.process: _HelperProcess | None = None
+        self.spawned = False
+        self.completed = 0
+        self.restarts = 0
+        self.consecutive_failures = 0
+
+    @property
+    def retired(self) -> bool:
+        return self.consecutive_failures >= MAX_CONSECUTIVE_HELPER_FAILURES
+
+
+class HelperProcessPool:
+    """Run up to ``size`` helper processes and pipeline requests across them.
+
+    Each helper is started lazily, the first time the live helpers are all
+    ``max_in_flight`` deep, and is sent *init_payload* before any other
+    request.  Requests submitted with the same ``key`` while one is still
+    outstanding share its future.  A helper that exits, times out or writes
+    garbage fails only its own in-flight requests and is replaced on demand.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        *,
+        init_payload: Mapping[str, object],
+        environment: Mapping[str, str] | None = None,
+        size: int = 1,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT_PER_HELPER,
+    ) -> None:
+        if not command:
+            raise ValueError("HelperProcessPool requires a helper command")
+        self.command = tuple(command)
+        self.environment = dict(environment) if environment is not None else None
+        self._init_payload = dict(init_payload)
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._slots = [_HelperSlot(index) for index in range(max(1, int(size)))]
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._backlog: deque[_Request] = deque()
+        self._by_key: dict[Hashable, _Request] = {}
+        self._init_response: dict[str, object] | None = None
+        self._closed = False
+
+    @property
+    def size(self) -> int:
+        return len(self._slots)
+
+    @property
+    def capacity(self) -> int:
+        """Return how many requests the pool keeps in flight at most."""
+
+        return len(self._slots) * self._max_in_flight
+
+    @property
+    def init_response(self) -> dict[str, object] | None:
+        return self._init_response
+
+    def start(self, *, timeout_ms: int) -> dict[str, object]:
+        """Start the first helper and return its ``init`` response."""
+
+        with self._lock:
+            self._ensure_open()
+            slot = self._slots[0]
+            if slot.process is None:
+                self._spawn(slot)
+            process = slot.process
+            assert process is not None and process.init_future is not None
+            init_future = process.init_future
+        response = self.wait(init_future, timeout_ms=timeout_ms)
+        if response.get("status") != "ok":
+            message = str(response.get("message", "failed to initialise render helper"))
+            raise HelperPoolUnavailableError(message)
+        return response
+
+    def submit(self, payload: Mapping[str, object], *, key: Hashable | None = None) -> Future[dict[str, object]]:
+        """Queue *payload* and return a future resolving to its response."""
+
+        with self._lock:
+            self._ensure_open()
+            if key is not None:
+                existing = self._by_key.get(key)
+                if existing is not None:
+                    return existing.future
+            request = _Request(next(self._ids), dict(payload), key)
+            if key is not None:
+                self._by_key[key] = request
+            self._backlog.append(request)
+            failed = self._dispatch_locked()
+        self._fail_all(failed)
+        return request.future
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Return whether a request submitted under *key* is outstanding."""
+
+        with self._lock:
+            return key in self._by_key
+
+    def wait(self, future: Future[dict[str, object]], *, timeout_ms: int) -> dict[str, object]:
+        """Return the response of *future*, killing its helper on timeout.
+
+        The timeout only runs while the request is on a helper; time spent in
+        the pool backlog is bounded by the requests ahead of it.
+        """
+
+        timeout = max(0.0, timeout_ms / 1000.0)
+        while True:
+            try:
+                return future.result(timeout=_WAIT_SLICE_SECONDS)
+            except FutureTimeoutError:
+                pass
+            with self._lock:
+                request = self._find_request(future)
+                if request is None or request.dispatched_at is None or request.process is None:
+                    continue
+                if time.monotonic() - request.dispatched_at < timeout:
+                    continue
+                process = request.process
+            LOGGER.warning(
+                "Render helper %s timed out after %sms; restarting it",
+                process.pid,
+                timeout_ms,
+            )
+            process.abort("Timed out while waiting for the render helper")
+            try:
+                return future.result(timeout=_SHUTDOWN_GRACE_SECONDS * 5)
+            except FutureTimeoutError as exc:  # pragma: no cover - reader is wedged
+                raise HelperPoolUnavailableError("Timed out while waiting for the render helper") from exc
+
+    def health(self) -> list[HelperSlotHealth]:
+        with self._lock:
+            return [
+                HelperSlotHealth(
+                    slot=slot.index,
+                    pid=slot.process.pid if slot.process is not None else None,
+                    in_flight=len(slot.process.in_flight) if slot.process is not None else 0,
+                    completed=slot.completed,
+                    restarts=slot.restarts,
+                    consecutive_failures=slot.consecutive_failures,
+                    retired=slot.retired,
+                )
+                for slot in self._slots
+            ]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            processes = [slot.process for slot in self._slots if slot.process is not None]
+            abandoned = list(self._backlog)
+            self._backlog.clear()
+            for process in processes:
+                process.alive = False
+                abandoned.extend(process.in_flight.values())
+                process.in_flight.clear()
+            self._by_key.clear()
+        self._fail_all(abandoned, "Render helper pool shut down")
+        for process in processes:
+            process.request_shutdown()
+        for process in processes:
+            process.wait_or_kill(_SHUTDOWN_GRACE_SECONDS)
+
+    # ------------------------------------------------------------------
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise HelperPoolUnavailableError("Render helper pool has been shut down")
+
+    def _spawn(self, slot: _HelperSlot) -> _HelperProcess:
+        try:
+            process = _HelperProcess(self, slot)
+        except OSError as exc:
+            slot.consecutive_failures += 1
+            raise HelperPoolUnavailableError(
+                f"Unable to start render helper '{self.command[0]}': {exc}",
+            ) from exc
+        if slot.spawned:
+            slot.restarts += 1
+        slot.spawned = True
+        slot.process = process
+        init_request = _Request(next(self._ids), self._init_payload, None, init=True)
+        process.init_future = init_request.future
+        try:
+            process.send(init_request)
+        except HelperPoolUnavailableError:
+            process.kill()
+            raise
+        return process
+
+    def _dispatch_locked(self) -> list[_Request]:
+        """Hand backlog requests to helpers; return requests that must fail."""
+
+        while self._backlog:
+            process = self._select_process_locked()
+            if process is None:
+                break
+            request = self._backlog.popleft()
+            try:
+                process.send(request)
+            except HelperPoolUnavailableError:
+                self._backlog.appendleft(request)
+                process.kill()
+                break
+        if self._backlog and all(slot.retired for slot in self._slots):
+            failed = list(self._backlog)
+            self._backlog.clear()
+            return failed
+        return []
+
+    def _select_process_locked(self) -> _HelperProcess | None:
+        live = [
+            slot.process
+            for slot in self._slots
+            if slot.process is not None and slot.process.alive
+        ]
+        ready = [process for process in live if len(process.in_flight) < self._max_in_flight]
+        idle = [process for process in ready if not process.in_flight]
+        if idle:
+            return idle[0]
+        # Prefer a new helper over queueing behind a busy one.
+        for slot in self._slots:
+            if slot.process is None and not slot.retired:
+                try:
+                    return self._spawn(slot)
+                except HelperPoolUnavailableError as exc:
+                    LOGGER.warning("%s", exc)
+        if ready:
+            return min(ready, key=lambda process: len(process.in_flight))
+        return None
+
+    def _complete(self, process: _HelperProcess, response: dict[str, object]) -> None:
+        failed: list[_Request] = []
+        with self._lock:
+            request = None
+            response_id = response.get("id")
+            if response_id is None:
+                if process.in_flight:
+                    _, request = process.in_flight.popitem(last=False)
+            else:
+                try:
+                    request = process.in_flight.pop(int(response_id), None)
+                except (TypeError, ValueError):
+                    request = None
+            if request is None:
+                LOGGER.debug("Ignoring unsolicited render helper response: %s", response)
+                return
+            rejected = request.init and response.get("status") != "ok"
+            if rejected:
+                # A helper that rejects its configuration will not do better
+                # on restart; one more loss retires the slot.
+                process.alive = False
+                process.slot.consecutive_failures = MAX_CONSECUTIVE_HELPER_FAILURES - 1
+            elif request.init:
+                if self._init_response is None:
+                    self._init_response = response
+            else:
+                process.slot.completed += 1
+                if response.get("status") == "ok":
+                    process.slot.consecutive_failures = 0
+            self._forget_locked(request)
+            if not self._closed:
+                failed = self._dispatch_locked()
+        if rejected:
+            message = str(response.get("message", "failed to initialise render helper"))
+            LOGGER.warning("Render helper %s failed to initialise: %s", process.pid, message)
+            process.abort(message)
+        request.future.set_result(response)
+        self._fail_all(failed)
+
+    def _process_lost(self, process: _HelperProcess, reason: str) -> None:
+        with self._lock:
+            process.alive = False
+            slot = process.slot
+            if slot.process is process:
+                slot.process = None
+            lost = list(process.in_flight.values())
+            process.in_flight.clear()
+            unavailable: list[_Request] = []
+            if not self._closed:
+                slot.consecutive_failures += 1
+                LOGGER.warning("%s (pid %s); %d request(s) failed", reason, process.pid, len(lost))
+                unavailable = self._dispatch_locked()
+        process.wait_or_kill(_SHUTDOWN_GRACE_SECONDS)
+        self._fail_all(lost, reason)
+        self._fail_all(unavailable)
+
+    def _forget_locked(self, request: _Request) -> None:
+        if request.key is not None and self._by_key.get(request.key) is request:
+            del self._by_key[request.key]
+
+    def _fail_all(
+        self,
+        requests: list[_Request],
+        reason: str = "No render helper process is available",
+    ) -> None:
+        if not requests:
+            return
+        with self._lock:
+            for request in requests:
+                self._forget_locked(request)
+        error = HelperPoolUnavailableError(reason)
+        for request in requests:
+            if not request.future.done():
+                request.future.set_exception(error)
+
+    def _find_request(self, future: Future[dict[str, object]]) -> _Request | None:
+        for slot in self._slots:
+            if slot.process is None:
+                continue
+            for request in slot.process.in_flight.values():
+                if request.future is future:
+                    return request
+        return None
+
+
+__all__ = [
+    "DEFAULT_MAX_IN_FLIGHT_PER_HELPER",
+    "HelperPoolUnavailableError",
+    "HelperProcessPool",
+    "HelperSlotHealth",
+    "MAX_CONSECUTIVE_HELPER_FAILURES",
+]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from collections import OrderedDict
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Iterable
 
 from PySide6.QtCore import QMetaObject, QObject, QThread, QTimer, Qt, Signal, Slot
@@ -15,20 +16,29 @@ from maps.tile_parser import TileLoadingError
 
 
 class _TileWorker(QObject):
-    """Background worker that retrieves tiles without blocking the GUI."""
+    """Background worker that retrieves tiles without blocking the GUI.
+
+    Backends are called one request at a time unless they advertise a
+    ``max_concurrent_requests`` above one, in which case that many loads run
+    on a private thread pool and complete in whatever order they finish.
+    """
 
     tile_loaded = Signal(int, int, int, object)
     tile_missing = Signal(int, int, int)
+    _load_finished = Signal()
 
     def __init__(self, tile_backend: TileBackend) -> None:
         super().__init__()
         self._tile_backend = tile_backend
         self._request_queue: deque[tuple[int, int, int]] = deque()
         self._busy = False
+        self._in_flight = 0
+        self._executor: ThreadPoolExecutor | None = None
+        self._load_finished.connect(self._handle_load_finished)
 
     @Slot(int, int, int)
     def request_tile(self, z: int, x: int, y: int) -> None:
-        """Queue tile requests so the helper protocol is never re-entered."""
+        """Queue tile requests so a serial backend is never re-entered."""
 
         self._request_queue.append((z, x, y))
         if self._busy:
@@ -37,14 +47,48 @@ class _TileWorker(QObject):
         self._busy = True
         self._drain_queue()
 
+    @Slot()
+    def discard_queued(self) -> None:
+        """Drop requests that have not reached the backend yet."""
+
+        self._request_queue.clear()
+
     @Slot()
     def _drain_queue(self) -> None:
-        if not self._request_queue:
+        limit = _max_concurrent_requests(self._tile_backend)
+        if limit > 1:
+            while self._request_queue and self._in_flight < limit:
+                self._in_flight += 1
+                self._concurrent_executor(limit).submit(
+                    self._load_concurrently,
+                    *self._request_queue.popleft(),
+                )
             self._busy = False
             return
 
-        z, x, y = self._request_queue.popleft()
+        if not self._request_queue or self._in_flight:
+            # Concurrent loads still running after the backend dropped to
+            # serial mode resume draining from ``_handle_load_finished``.
+            self._busy = False
+            return
+
+        self._load(*self._request_queue.popleft())
+        QTimer.singleShot(0, self._drain_queue)
+
+    @Slot()
+    def _handle_load_finished(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        if not self._busy:
+            self._busy = True
+            self._drain_queue()
 
+    def _load_concurrently(self, z: int, x: int, y: int) -> None:
+        try:
+            self._load(z, x, y)
+        finally:
+            self._load_finished.emit()
+
+    def _load(self, z: int, x: int, y: int) -> None:
         try:
             tile = self._tile_backend.load_tile(z, x, y)
         except TileLoadingError as exc:
@@ -62,7 +106,10 @@ class _TileWorker(QObject):
             else:
                 self.tile_loaded.emit(z, x, y, tile)
 
-        QTimer.singleShot(0, self._drain_queue)
+    def _concurrent_executor(self, limit: int) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=limit, thread_name_prefix="map-tile")
+        return self._executor
 
     @Slot()
     def shutdown_backend(self) -> None:
@@ -70,7 +117,20 @@ class _TileWorker(QObject):
 
         self._request_queue.clear()
         self._busy = False
+        # Shutting the backend down first fails in-flight helper requests, so
+        # the pool threads return promptly instead of waiting for renders.
         self._tile_backend.shutdown()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self._in_flight = 0
+
+
+def _max_concurrent_requests(tile_backend: TileBackend) -> int:
+    try:
+        return max(1, int(getattr(tile_backend, "max_concurrent_requests", 1)))
+    except (TypeError, ValueError):
+        return 1
 
 
 class TileManager(QObject):
@@ -82,17 +142,20 @@ class TileManager(QObject):
     tiles_changed = Signal()
 
     _request_tile = Signal(int, int, int)
+    _discard_requests = Signal()
 
     def __init__(
         self,
         tile_backend: TileBackend,
         *,
         cache_limit: int = 256,
+        max_pending: int = 64,
         parent: QObject | None = None,
     ) -> None:
         super().__init__(parent)
         self._tile_backend = tile_backend
         self._cache_limit = cache_limit
+        self._max_pending = max(1, int(max_pending))
 
         self._tile_cache: OrderedDict[tuple[int, int, int], TilePayload] = OrderedDict()
         self._pending_tiles: set[tuple[int, int, int]] = set()
@@ -104,6 +167,7 @@ class TileManager(QObject):
         self._tile_worker.tile_loaded.connect(self._handle_tile_loaded)
         self._tile_worker.tile_missing.connect(self._handle_tile_missing)
         self._request_tile.connect(self._tile_worker.request_tile)
+        self._discard_requests.connect(self._tile_worker.discard_queued)
         self._loader_thread.finished.connect(self._tile_worker.deleteLater)
         self._loader_thread.start()
 
@@ -135,10 +199,17 @@ class TileManager(QObject):
 
     # ------------------------------------------------------------------
     def ensure_tile(self, tile_key: tuple[int, int, int]) -> None:
-        """Schedule ``tile_key`` for loading when it is not cached."""
+        """Schedule ``tile_key`` for loading when it is not cached.
+
+        Requests beyond ``max_pending`` outstanding tiles are refused rather
+        than queued; every completed tile triggers a repaint that asks again
+        for whatever is still visible, so the backlog never outgrows the view.
+        """
 
         if tile_key in self._missing_tiles or tile_key in self._pending_tiles:
             return
+        if len(self._pending_tiles) >= self._max_pending:
+            return
 
         self._pending_tiles.add(tile_key)
         self._request_tile.emit(*tile_key)
@@ -176,6 +247,7 @@ class TileManager(QObject):
         self._tile_backend.clear_cache()
         self._tile_cache.clear()
         self._pending_tiles.clear()
+        self._discard_requests.emit()
         self._missing_tiles.clear()
         self.tiles_changed.emit()
 
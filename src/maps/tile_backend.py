@@ -6,17 +6,31 @@ import hashlib
 import json
 import logging
 import os
+import shutil
 import sys
 import tempfile
+import threading
 import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Protocol, TypeAlias
 
-from PySide6.QtCore import QProcess, QProcessEnvironment, QStandardPaths
+from PySide6.QtCore import QProcessEnvironment, QStandardPaths
 from PySide6.QtGui import QImage
 
+from maps.helper_pool import (
+    DEFAULT_MAX_IN_FLIGHT_PER_HELPER,
+    HelperPoolUnavailableError,
+    HelperProcessPool,
+    HelperSlotHealth,
+)
 from maps.map_sources import MapBackendMetadata, MapSourceSpec
+from maps.tile_cache import (
+    DEFAULT_CACHE_BUDGET_BYTES,
+    RasterTileCache,
+    TileKey,
+    remove_legacy_tile_tree,
+)
 from maps.tile_parser import TileAccessError, TileLoadingError, TileParser
 
 LOGGER = logging.getLogger(__name__)
@@ -29,8 +43,13 @@ else:
     DEFAULT_MINGW_ROOT = Path()
 ENV_QT_ROOT = "IPHOTO_OSMAND_QT_ROOT"
 ENV_MINGW_ROOT = "IPHOTO_OSMAND_MINGW_ROOT"
+ENV_HELPER_PROCESSES = "IPHOTO_OSMAND_HELPER_PROCESSES"
+ENV_TILE_CACHE_MB = "IPHOTO_OSMAND_TILE_CACHE_MB"
 DEFAULT_HELPER_INIT_TIMEOUT_MS = 30000
 DEFAULT_HELPER_RENDER_TIMEOUT_MS = 30000
+# Every helper maps the OBF and style resources on its own, so the default
+# pool stays small even on machines with many cores.
+MAX_DEFAULT_HELPER_PROCESSES = 3
 
 
 def _startup_profile_enabled() -> bool:
@@ -42,6 +61,30 @@ def _startup_profile_enabled() -> bool:
     }
 
 
+def _helper_pool_size() -> int:
+    configured = os.environ.get(ENV_HELPER_PROCESSES, "").strip()
+    if configured:
+        try:
+            return max(1, int(configured))
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", ENV_HELPER_PROCESSES, configured)
+    return max(1, min(MAX_DEFAULT_HELPER_PROCESSES, (os.cpu_count() or 2) // 2))
+
+
+def _tile_cache_budget_bytes() -> int:
+    configured = os.environ.get(ENV_TILE_CACHE_MB, "").strip()
+    if configured:
+        try:
+            return max(0, int(float(configured) * 1024 * 1024))
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", ENV_TILE_CACHE_MB, configured)
+    return DEFAULT_CACHE_BUDGET_BYTES
+
+
+def _scale_tag(device_scale: float) -> str:
+    return f"{device_scale:.2f}".replace(".", "_")
+
+
 def _log_startup_profile(stage: str, elapsed_ms: float, **details: object) -> None:
     if not _startup_profile_enabled():
         return
@@ -157,7 +200,12 @@ class LegacyVectorBackend:
 
 
 class OsmAndRasterBackend:
-    """Load map tiles through an external OsmAnd-compatible helper."""
+    """Load map tiles through a pool of external OsmAnd-compatible helpers.
+
+    ``load_tile`` is safe to call from several threads at once; up to
+    :attr:`max_concurrent_requests` renders are pipelined across the helper
+    processes and duplicate requests for the same tile share one render.
+    """
 
     CACHE_SCHEMA_VERSION = "2"
     DEFAULT_METADATA = MapBackendMetadata(
@@ -175,8 +223,12 @@ class OsmAndRasterBackend:
         self._source = source
         self.metadata = self.DEFAULT_METADATA
         self._device_scale = 1.0
-        self._process: QProcess | None = None
+        self._pool_size = _helper_pool_size()
+        self._pool: HelperProcessPool | None = None
+        self._pool_lock = threading.Lock()
         self._cache_root: Path | None = None
+        self._tile_cache: RasterTileCache | None = None
+        self._tile_cache_lock = threading.Lock()
 
     def probe(self) -> MapBackendMetadata:
         self._validate_paths()
@@ -186,169 +238,153 @@ class OsmAndRasterBackend:
         """Start the helper once in the current thread for diagnostics only."""
 
         self._validate_paths()
-        self._ensure_process()
+        self._ensure_pool()
         return self.metadata
 
     def load_tile(self, z: int, x: int, y: int) -> Optional[RasterTile]:
         self._validate_paths()
-        cache_path = self._cache_file_path(z, x, y)
-        if cache_path.exists():
-            return self._load_cached_tile(cache_path)
-
+        device_scale = self._device_scale
+        key = (_scale_tag(device_scale), int(z), int(x), int(y))
+        tile_cache = self._ensure_tile_cache()
+        data = tile_cache.get(key)
+        if data is not None:
+            return self._decode_tile(data, device_scale)
+
+        staging_path = self._staging_file_path(key)
         for attempt in range(2):
             try:
-                self._render_tile_to_cache(z, x, y, cache_path)
+                data = self._render_tile(z, x, y, device_scale, staging_path)
                 break
             except TileBackendUnavailableError:
-                self._remove_partial_cache_file(cache_path)
+                self._remove_partial_cache_file(staging_path)
                 if attempt >= 1:
                     raise
+                # The pool has already replaced the failed helper; only the
+                # requests that were on it need to be resubmitted.
                 LOGGER.warning(
-                    "OsmAnd helper became unavailable while rendering %s/%s/%s; restarting and retrying once",
+                    "OsmAnd helper became unavailable while rendering %s/%s/%s; retrying once",
                     z,
                     x,
                     y,
                 )
-                self.shutdown()
 
-        return self._load_cached_tile(cache_path)
+        if data is None:
+            data = tile_cache.get(key)
+            if data is None:
+                raise TileRenderError(
+                    f"OsmAnd helper reported success but '{staging_path}' was not created",
+                )
+        else:
+            # Cache before unlinking so a duplicate that finds the staging
+            # file gone is guaranteed to find the tile in the cache.
+            tile_cache.put(key, data)
+            self._remove_partial_cache_file(staging_path)
+        return self._decode_tile(data, device_scale)
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Return how many ``load_tile`` calls may usefully run at once."""
+
+        return self._pool_size * DEFAULT_MAX_IN_FLIGHT_PER_HELPER
 
     def clear_cache(self) -> None:
         return None
 
     def shutdown(self) -> None:
-        if self._process is None:
-            return
-
-        try:
-            self._communicate(self._process, {"command": "shutdown"}, timeout_ms=1000)
-        except TileLoadingError:
-            pass
-
-        self._process.kill()
-        self._process.waitForFinished(1000)
-        self._process = None
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+        with self._tile_cache_lock:
+            tile_cache, self._tile_cache = self._tile_cache, None
+        if tile_cache is not None:
+            tile_cache.close()
 
     def set_device_scale(self, scale: float) -> None:
         self._device_scale = max(1.0, float(scale))
 
-    def _ensure_process(self) -> QProcess:
-        if self._process is not None and self._process.state() == QProcess.ProcessState.Running:
-            return self._process
+    def helper_health(self) -> list[HelperSlotHealth]:
+        """Return per-process diagnostics of the running helper pool."""
 
-        command = self._helper_command()
-        if not command:
-            raise TileBackendUnavailableError(
-                "OsmAnd helper command not configured. Set IPHOTO_OSMAND_RENDER_HELPER.",
-            )
+        pool = self._pool
+        return pool.health() if pool is not None else []
+
+    def _ensure_pool(self) -> HelperProcessPool:
+        with self._pool_lock:
+            if self._pool is not None:
+                return self._pool
+
+            command = self._helper_command()
+            if not command:
+                raise TileBackendUnavailableError(
+                    "OsmAnd helper command not configured. Set IPHOTO_OSMAND_RENDER_HELPER.",
+                )
 
-        total_started = time.perf_counter()
-        process = QProcess()
-        process.setProcessChannelMode(QProcess.ProcessChannelMode.ForwardedErrorChannel)
-        process.setProgram(command[0])
-        process.setArguments(list(command[1:]))
-        process.setProcessEnvironment(_helper_process_environment(Path(command[0])))
-        start_wait_started = time.perf_counter()
-        process.start()
-        if not process.waitForStarted(5000):
-            stderr = bytes(process.readAllStandardError()).decode("utf8", errors="replace").strip()
-            detail = f": {stderr}" if stderr else ""
-            raise TileBackendUnavailableError(
-                f"Unable to start OsmAnd helper '{command[0]}'{detail}",
+            total_started = time.perf_counter()
+            environment = _helper_process_environment(Path(command[0]))
+            pool = HelperProcessPool(
+                command,
+                init_payload={
+                    "command": "init",
+                    "obf_path": str(self._source.data_path),
+                    "resources_root": str(self._source.resources_root),
+                    "style_path": str(self._source.style_path),
+                    "night_mode": False,
+                },
+                environment={key: environment.value(key) for key in environment.keys()},
+                size=self._pool_size,
+            )
+            init_started = time.perf_counter()
+            try:
+                response = pool.start(timeout_ms=DEFAULT_HELPER_INIT_TIMEOUT_MS)
+            except HelperPoolUnavailableError as exc:
+                pool.shutdown()
+                raise TileBackendUnavailableError(str(exc)) from exc
+            _log_startup_profile(
+                "helper_init",
+                (time.perf_counter() - init_started) * 1000.0,
+                source=self._source.data_path,
             )
-        _log_startup_profile(
-            "helper_waitForStarted",
-            (time.perf_counter() - start_wait_started) * 1000.0,
-            command=command[0],
-        )
 
-        init_started = time.perf_counter()
-        response = self._communicate(
-            process,
-            {
-                "command": "init",
-                "obf_path": str(self._source.data_path),
-                "resources_root": str(self._source.resources_root),
-                "style_path": str(self._source.style_path),
-                "night_mode": False,
-            },
-            timeout_ms=DEFAULT_HELPER_INIT_TIMEOUT_MS,
-        )
-        _log_startup_profile(
-            "helper_init",
-            (time.perf_counter() - init_started) * 1000.0,
-            source=self._source.data_path,
-        )
-        if response.get("status") != "ok":
-            process.kill()
-            process.waitForFinished(1000)
-            message = str(response.get("message", "failed to initialise OsmAnd helper"))
-            raise TileBackendUnavailableError(message)
-
-        self.metadata = MapBackendMetadata(
-            min_zoom=float(response.get("min_zoom", self.DEFAULT_METADATA.min_zoom)),
-            max_zoom=float(response.get("max_zoom", self.DEFAULT_METADATA.max_zoom)),
-            provides_place_labels=bool(
-                response.get(
-                    "provides_place_labels",
-                    self.DEFAULT_METADATA.provides_place_labels,
+            self.metadata = MapBackendMetadata(
+                min_zoom=float(response.get("min_zoom", self.DEFAULT_METADATA.min_zoom)),
+                max_zoom=float(response.get("max_zoom", self.DEFAULT_METADATA.max_zoom)),
+                provides_place_labels=bool(
+                    response.get(
+                        "provides_place_labels",
+                        self.DEFAULT_METADATA.provides_place_labels,
+                    ),
                 ),
-            ),
-            tile_kind="raster",
-            tile_scheme="xyz",
-            fetch_max_zoom=max(
-                0,
-                int(float(response.get("max_zoom", self.DEFAULT_METADATA.max_zoom))),
-            ),
-        )
-        self._process = process
-        _log_startup_profile(
-            "helper_total_startup",
-            (time.perf_counter() - total_started) * 1000.0,
-            source=self._source.data_path,
-        )
-        return process
+                tile_kind="raster",
+                tile_scheme="xyz",
+                fetch_max_zoom=max(
+                    0,
+                    int(float(response.get("max_zoom", self.DEFAULT_METADATA.max_zoom))),
+                ),
+            )
+            self._pool = pool
+            _log_startup_profile(
+                "helper_total_startup",
+                (time.perf_counter() - total_started) * 1000.0,
+                source=self._source.data_path,
+                processes=self._pool_size,
+            )
+            return pool
 
-    def _communicate(
+    def _request(
         self,
-        process: QProcess,
+        pool: HelperProcessPool,
         payload: dict[str, object],
         *,
         timeout_ms: int = 5000,
     ) -> dict[str, object]:
-        message = json.dumps(payload, ensure_ascii=True) + "\n"
-        process.write(message.encode("utf8"))
-        if not process.waitForBytesWritten(timeout_ms):
-            self._discard_process(process)
-            raise TileBackendUnavailableError("Timed out while writing to the OsmAnd helper")
-
-        if not process.canReadLine() and not process.waitForReadyRead(timeout_ms):
-            self._discard_process(process)
-            raise TileBackendUnavailableError("Timed out while waiting for the OsmAnd helper")
-
-        while not process.canReadLine():
-            if not process.waitForReadyRead(timeout_ms):
-                self._discard_process(process)
-                raise TileBackendUnavailableError("Timed out while reading from the OsmAnd helper")
-
-        raw_line = bytes(process.readLine()).decode("utf8", errors="replace").strip()
-        if not raw_line:
-            self._discard_process(process)
-            raise TileBackendUnavailableError("OsmAnd helper returned an empty response")
+        """Send *payload* through the pool, sharing duplicate renders."""
 
         try:
-            response = json.loads(raw_line)
-        except json.JSONDecodeError as exc:
-            self._discard_process(process)
-            raise TileBackendUnavailableError(
-                f"OsmAnd helper returned invalid JSON: {raw_line!r}",
-            ) from exc
-
-        if not isinstance(response, dict):
-            self._discard_process(process)
-            raise TileBackendUnavailableError("OsmAnd helper returned a non-object JSON response")
-
-        return response
+            future = pool.submit(payload, key=payload.get("output_path"))
+            return pool.wait(future, timeout_ms=timeout_ms)
+        except HelperPoolUnavailableError as exc:
+            raise TileBackendUnavailableError(str(exc)) from exc
 
     def _validate_paths(self) -> None:
         data_path = Path(self._source.data_path)
@@ -364,18 +400,31 @@ class OsmAndRasterBackend:
     def _helper_command(self) -> tuple[str, ...] | None:
         return self._source.helper_command
 
-    def _render_tile_to_cache(self, z: int, x: int, y: int, cache_path: Path) -> None:
-        process = self._ensure_process()
+    def _render_tile(
+        self,
+        z: int,
+        x: int,
+        y: int,
+        device_scale: float,
+        staging_path: Path,
+    ) -> bytes | None:
+        """Render one tile through the pool and return its encoded PNG.
+
+        ``None`` means the staging file was already collected by a duplicate
+        request that shared this render.
+        """
+
+        pool = self._ensure_pool()
         request = {
             "command": "render",
             "z": int(z),
             "x": int(x),
             "y": int(y),
-            "device_scale": float(self._device_scale),
-            "output_path": str(cache_path),
+            "device_scale": float(device_scale),
+            "output_path": str(staging_path),
         }
         render_started = time.perf_counter()
-        response = self._communicate(process, request, timeout_ms=DEFAULT_HELPER_RENDER_TIMEOUT_MS)
+        response = self._request(pool, request, timeout_ms=DEFAULT_HELPER_RENDER_TIMEOUT_MS)
         _log_startup_profile(
             "helper_render",
             (time.perf_counter() - render_started) * 1000.0,
@@ -387,15 +436,13 @@ class OsmAndRasterBackend:
             message = str(response.get("message", "unknown render failure"))
             raise TileRenderError(message)
 
-        if not cache_path.exists():
-            raise TileRenderError(f"OsmAnd helper reported success but '{cache_path}' was not created")
-
-    def _discard_process(self, process: QProcess) -> None:
-        if self._process is process:
-            self._process = None
-        if process.state() != QProcess.ProcessState.NotRunning:
-            process.kill()
-            process.waitForFinished(1000)
+        try:
+            data = staging_path.read_bytes()
+        except OSError:
+            # A coalesced duplicate of this request may already have moved
+            # the file into the cache.
+            return None
+        return data
 
     def _remove_partial_cache_file(self, cache_path: Path) -> None:
         try:
@@ -403,12 +450,26 @@ class OsmAndRasterBackend:
         except OSError:
             LOGGER.debug("Failed to remove partial cache file '%s'", cache_path, exc_info=True)
 
-    def _cache_file_path(self, z: int, x: int, y: int) -> Path:
-        cache_root = self._cache_directory()
-        scale_tag = f"{self._device_scale:.2f}".replace(".", "_")
-        cache_path = cache_root / scale_tag / str(z) / str(x)
-        cache_path.mkdir(parents=True, exist_ok=True)
-        return cache_path / f"{y}.png"
+    def _ensure_tile_cache(self) -> RasterTileCache:
+        with self._tile_cache_lock:
+            if self._tile_cache is None:
+                cache_root = self._cache_directory()
+                staging_root = cache_root / "staging"
+                shutil.rmtree(staging_root, ignore_errors=True)
+                staging_root.mkdir(parents=True, exist_ok=True)
+                self._tile_cache = RasterTileCache(cache_root, budget_bytes=_tile_cache_budget_bytes())
+                self._tile_cache.preload_hot_tiles()
+                threading.Thread(
+                    target=remove_legacy_tile_tree,
+                    args=(cache_root,),
+                    name="map-tile-cache-cleanup",
+                    daemon=True,
+                ).start()
+            return self._tile_cache
+
+    def _staging_file_path(self, key: TileKey) -> Path:
+        # Deterministic per tile so duplicate requests coalesce in the pool.
+        return self._cache_directory() / "staging" / ("_".join(str(part) for part in key) + ".png")
 
     def _cache_directory(self) -> Path:
         if self._cache_root is None:
@@ -429,11 +490,11 @@ class OsmAndRasterBackend:
             self._cache_root = Path(base) / "maps" / "obf" / fingerprint
         return self._cache_root
 
-    def _load_cached_tile(self, path: Path) -> RasterTile:
-        image = QImage(str(path))
+    def _decode_tile(self, data: bytes, device_scale: float) -> RasterTile:
+        image = QImage.fromData(data, "PNG")
         if image.isNull():
-            raise TileRenderError(f"Unable to decode raster tile '{path}'")
-        return RasterTile(image=image, device_scale=self._device_scale)
+            raise TileRenderError("Unable to decode cached raster tile")
+        return RasterTile(image=image, device_scale=device_scale)
 
 
 def _helper_process_environment(helper_executable: Path) -> QProcessEnvironment:
@@ -558,6 +619,11 @@ class FallbackTileBackend:
     def probe(self) -> MapBackendMetadata:
         return self.metadata
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        backend = self._primary if self._primary_enabled else self._fallback
+        return max(1, int(getattr(backend, "max_concurrent_requests", 1)))
+
     def load_tile(self, z: int, x: int, y: int) -> Optional[TilePayload]:
         if self._primary_enabled:
             try:
@@ -0,0 +1,295 @@
+"""Single-file, size-bounded cache for rendered raster map tiles.
+
+Rendered tiles used to be written as ``<scale>/<z>/<x>/<y>.png`` trees that
+grew without bound.  They now live as PNG blobs in one SQLite database per
+cache fingerprint (an MBTiles-like layout keyed by device scale as well), with
+a byte budget enforced by least-recently-used eviction.
+
+Writes and access-time updates are buffered in memory and committed in
+batches by a background thread, so ``get`` sees a tile as soon as ``put``
+returns while the disk only sees one transaction per batch.  Low zoom levels
+that every session starts on are preloaded into memory when the cache opens.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable
+
+LOGGER = logging.getLogger(__name__)
+
+TILE_DATABASE_FILENAME = "tiles.db"
+DEFAULT_CACHE_BUDGET_BYTES = 512 * 1024 * 1024
+DEFAULT_HOT_ZOOM_LEVELS = (2, 3, 4)
+DEFAULT_HOT_BUDGET_BYTES = 32 * 1024 * 1024
+_FLUSH_INTERVAL_SECONDS = 0.5
+_FLUSH_BATCH_SIZE = 64
+# Eviction trims below the budget so a full cache does not evict on every batch.
+_EVICTION_TARGET_RATIO = 0.9
+# ``<scale>/<z>/<x>/<y>.png`` directories written by the previous layout.
+_LEGACY_SCALE_DIRECTORY = re.compile(r"^\d+_\d{2}$")
+
+TileKey = tuple[str, int, int, int]
+
+
+class RasterTileCache:
+    """Persist encoded tiles keyed by ``(scale_tag, z, x, y)``.
+
+    Safe to share between tile loader threads.  ``close`` flushes pending
+    writes; tiles buffered when the process dies are simply rendered again.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        budget_bytes: int = DEFAULT_CACHE_BUDGET_BYTES,
+        hot_zoom_levels: Iterable[int] = DEFAULT_HOT_ZOOM_LEVELS,
+        hot_budget_bytes: int = DEFAULT_HOT_BUDGET_BYTES,
+    ) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._budget_bytes = max(0, int(budget_bytes))
+        self._hot_zoom_levels = frozenset(int(level) for level in hot_zoom_levels)
+        self._hot_budget_bytes = max(0, int(hot_budget_bytes))
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self._directory / TILE_DATABASE_FILENAME,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        # ``auto_vacuum`` only takes effect before the first table exists; it
+        # lets eviction hand freed pages back to the file system.
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS tiles (
+                scale TEXT NOT NULL,
+                z INTEGER NOT NULL,
+                x INTEGER NOT NULL,
+                y INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (scale, z, x, y)
+            ) WITHOUT ROWID
+            """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tiles_last_access ON tiles(last_access)")
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()
+        self._stored_bytes = int(row[0])
+
+        self._pending_writes: OrderedDict[TileKey, bytes] = OrderedDict()
+        self._pending_access: dict[TileKey, float] = {}
+        self._hot: dict[TileKey, bytes] = {}
+        self._hot_bytes = 0
+        self._closed = False
+        self._stopping = False
+        self._wakeup = threading.Condition(self._lock)
+        self._writer = threading.Thread(target=self._run_writer, name="map-tile-cache", daemon=True)
+        self._writer.start()
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def stored_bytes(self) -> int:
+        """Return the committed payload size, excluding buffered writes."""
+
+        with self._lock:
+            return self._stored_bytes
+
+    def get(self, key: TileKey) -> bytes | None:
+        with self._lock:
+            data = self._hot.get(key)
+            if data is None:
+                data = self._pending_writes.get(key)
+            if data is None:
+                if self._closed:
+                    return None
+                row = self._conn.execute(
+                    "SELECT data FROM tiles WHERE scale = ? AND z = ? AND x = ? AND y = ?",
+                    key,
+                ).fetchone()
+                if row is None:
+                    return None
+                data = bytes(row[0])
+                self._remember_hot(key, data)
+            self._pending_access[key] = time.time()
+            return data
+
+    def put(self, key: TileKey, data: bytes) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._pending_writes[key] = bytes(data)
+            self._pending_access.pop(key, None)
+            self._remember_hot(key, data)
+            if len(self._pending_writes) >= _FLUSH_BATCH_SIZE:
+                self._wakeup.notify()
+
+    def preload_hot_tiles(self) -> int:
+        """Load the configured hot zoom levels into memory, newest first."""
+
+        if not self._hot_zoom_levels or not self._hot_budget_bytes:
+            return 0
+        placeholders = ", ".join("?" for _ in self._hot_zoom_levels)
+        with self._lock:
+            if self._closed:
+                return 0
+            rows = self._conn.execute(
+                f"SELECT scale, z, x, y, data FROM tiles WHERE z IN ({placeholders}) "
+                "ORDER BY last_access DESC",
+                tuple(sorted(self._hot_zoom_levels)),
+            ).fetchall()
+            loaded = 0
+            for scale, z, x, y, data in rows:
+                if self._hot_bytes + len(data) > self._hot_budget_bytes:
+                    break
+                if self._remember_hot((scale, z, x, y), bytes(data)):
+                    loaded += 1
+            return loaded
+
+    def flush(self) -> None:
+        """Commit buffered writes and access times, then enforce the budget."""
+
+        with self._lock:
+            if self._closed:
+                return
+            writes = list(self._pending_writes.items())
+            access = list(self._pending_access.items())
+            self._pending_writes.clear()
+            self._pending_access.clear()
+            if not writes and not access:
+                return
+            now = time.time()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                replaced = 0
+                for key, _ in writes:
+                    row = self._conn.execute(
+                        "SELECT size FROM tiles WHERE scale = ? AND z = ? AND x = ? AND y = ?",
+                        key,
+                    ).fetchone()
+                    if row is not None:
+                        replaced += int(row[0])
+                self._conn.executemany(
+                    """
+                    INSERT INTO tiles (scale, z, x, y, data, size, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(scale, z, x, y) DO UPDATE SET
+                        data = excluded.data,
+                        size = excluded.size,
+                        last_access = excluded.last_access
+                    """,
+                    [(*key, sqlite3.Binary(data), len(data), now) for key, data in writes],
+                )
+                self._conn.executemany(
+                    "UPDATE tiles SET last_access = ? WHERE scale = ? AND z = ? AND x = ? AND y = ?",
+                    [(accessed, *key) for key, accessed in access],
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._stored_bytes += sum(len(data) for _, data in writes) - replaced
+            if self._stored_bytes > self._budget_bytes:
+                self._evict(int(self._budget_bytes * _EVICTION_TARGET_RATIO))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed or self._stopping:
+                return
+            self._stopping = True
+            self._wakeup.notify()
+        self._writer.join(timeout=5.0)
+        with self._lock:
+            try:
+                self.flush()
+            except sqlite3.Error:
+                LOGGER.warning("Failed to flush the map tile cache", exc_info=True)
+            self._closed = True
+            self._hot.clear()
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    def _remember_hot(self, key: TileKey, data: bytes) -> bool:
+        if key[1] not in self._hot_zoom_levels or key in self._hot:
+            return False
+        if self._hot_bytes + len(data) > self._hot_budget_bytes:
+            return False
+        self._hot[key] = data
+        self._hot_bytes += len(data)
+        return True
+
+    def _evict(self, target_bytes: int) -> None:
+        excess = self._stored_bytes - target_bytes
+        victims: list[TileKey] = []
+        freed = 0
+        for scale, z, x, y, size in self._conn.execute(
+            "SELECT scale, z, x, y, size FROM tiles ORDER BY last_access"
+        ):
+            if freed >= excess:
+                break
+            victims.append((scale, z, x, y))
+            freed += int(size)
+        if not victims:
+            return
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany(
+                "DELETE FROM tiles WHERE scale = ? AND z = ? AND x = ? AND y = ?",
+                victims,
+            )
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._stored_bytes -= freed
+        for key in victims:
+            data = self._hot.pop(key, None)
+            if data is not None:
+                self._hot_bytes -= len(data)
+        self._conn.execute("PRAGMA incremental_vacuum")
+        LOGGER.debug("Evicted %d map tiles (%d bytes)", len(victims), freed)
+
+    def _run_writer(self) -> None:
+        with self._lock:
+            while not self._stopping:
+                self._wakeup.wait(_FLUSH_INTERVAL_SECONDS)
+                if self._stopping:
+                    return
+                try:
+                    self.flush()
+                except sqlite3.Error:
+                    LOGGER.warning("Failed to write map tiles to the cache", exc_info=True)
+
+
+def remove_legacy_tile_tree(directory: Path) -> None:
+    """Delete ``<scale>/<z>/<x>/<y>.png`` trees left by the old cache layout."""
+
+    try:
+        entries = list(Path(directory).iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir() and _LEGACY_SCALE_DIRECTORY.match(entry.name):
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+__all__ = [
+    "DEFAULT_CACHE_BUDGET_BYTES",
+    "DEFAULT_HOT_ZOOM_LEVELS",
+    "RasterTileCache",
+    "TILE_DATABASE_FILENAME",
+    "TileKey",
+    "remove_legacy_tile_tree",
+]
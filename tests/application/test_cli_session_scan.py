@@ -7,18 +7,31 @@ from typer.testing import CliRunner
 
 from iPhoto import cli
 from iPhoto.bootstrap.library_scan_service import AlbumReport
+from iPhoto.domain.models.scan import ScanJobProgress
 
 
 class _FakeScans:
     def __init__(self) -> None:
-        self.scanned: list[tuple[Path, bool]] = []
+        self.scanned: list[tuple[Path, bool, bool]] = []
         self.finalized: list[tuple[Path, list[dict]]] = []
         self.reported: list[Path] = []
 
-    def scan_album(self, root: Path, *, persist_chunks: bool):
-        self.scanned.append((root, persist_chunks))
+    def scan_album(self, root: Path, *, persist_chunks: bool, resume: bool):
+        self.scanned.append((root, persist_chunks, resume))
         return SimpleNamespace(rows=[{"rel": "a.jpg"}])
 
+    def scan_progress(self, root: Path) -> ScanJobProgress:
+        return ScanJobProgress(
+            job_id="scan_1",
+            status="running",
+            found_count=10,
+            processed_count=4,
+            checkpointed_dirs=2,
+            discovery_cursor="2024/Trip",
+            rows_per_second=2.0,
+            eta_seconds=3.0,
+        )
+
     def finalize_scan(self, root: Path, rows: list[dict]) -> None:
         self.finalized.append((root, rows))
 
@@ -58,7 +71,7 @@ def test_cli_scan_uses_headless_session(monkeypatch, tmp_path: Path) -> None:
 
     assert result.exit_code == 0
     assert "Indexed 1 assets" in result.output
-    assert session.scans.scanned == [(tmp_path, False)]
+    assert session.scans.scanned == [(tmp_path, True, False)]
     assert session.scans.finalized == [(tmp_path, [{"rel": "a.jpg"}])]
     assert session.asset_lifecycle.reconciled == [(tmp_path, [{"rel": "a.jpg"}])]
     assert session.shutdown_called is True
@@ -66,6 +79,68 @@ def test_cli_scan_uses_headless_session(monkeypatch, tmp_path: Path) -> None:
     assert not hasattr(cli, "get_global_repository")
 
 
+def test_cli_scan_resume_and_status_report_throughput(monkeypatch, tmp_path: Path) -> None:
+    session = _FakeSession()
+    monkeypatch.setattr(
+        cli,
+        "create_headless_library_session",
+        lambda root: session,
+    )
+
+    scan_result = CliRunner().invoke(cli.app, ["scan", str(tmp_path), "--resume"])
+    status_result = CliRunner().invoke(cli.app, ["scan-status", str(tmp_path)])
+
+    assert scan_result.exit_code == 0
+    assert session.scans.scanned == [(tmp_path, True, True)]
+    assert "2.0 assets/s" in scan_result.output
+    assert status_result.exit_code == 0
+    assert "Processed: 4/10" in status_result.output
+    assert "Cursor: 2024/Trip" in status_result.output
+    assert "ETA: 3s" in status_result.output
+
+
+def test_cli_index_emits_json_report_and_exits_on_sigterm(monkeypatch, tmp_path: Path) -> None:
+    import json
+    import os
+    import signal
+
+    import iPhoto.bootstrap.library_index_runner as runner_module
+
+    session = _FakeSession()
+    created: list[dict] = []
+
+    class _Runner:
+        def __init__(self, runner_session, **kwargs) -> None:
+            assert runner_session is session
+            created.append(kwargs)
+            self.cancelled = False
+
+        def cancel(self) -> None:
+            self.cancelled = True
+
+        def run(self):
+            os.kill(os.getpid(), signal.SIGTERM)
+            return SimpleNamespace(
+                as_dict=lambda: {"interrupted": self.cancelled, "stages": {"scan": {}}}
+            )
+
+    monkeypatch.setattr(cli, "create_headless_library_session", lambda root: session)
+    monkeypatch.setattr(runner_module, "LibraryIndexRunner", _Runner)
+    report_path = tmp_path / "report.json"
+    previous_handler = signal.getsignal(signal.SIGTERM)
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["index", str(tmp_path), "-j", "3", "--faces", "--resume", "--report", str(report_path)],
+    )
+
+    assert result.exit_code == 128 + signal.SIGTERM
+    assert created == [{"workers": 3, "detect_faces": True, "resume": True}]
+    assert json.loads(report_path.read_text(encoding="utf-8"))["interrupted"] is True
+    assert session.shutdown_called is True
+    assert signal.getsignal(signal.SIGTERM) == previous_handler
+
+
 def test_cli_report_uses_headless_session(monkeypatch, tmp_path: Path) -> None:
     session = _FakeSession()
     monkeypatch.setattr(
@@ -82,3 +157,34 @@ def test_cli_report_uses_headless_session(monkeypatch, tmp_path: Path) -> None:
     assert "Live pairs: 1" in result.output
     assert session.scans.reported == [tmp_path]
     assert session.shutdown_called is True
+
+
+def test_cli_search_pages_through_query_service(monkeypatch, tmp_path: Path) -> None:
+    from iPhoto.domain.models.query import WindowResult
+
+    calls: list[tuple[str, int, int]] = []
+
+    class _FakeQueries:
+        def search_assets(self, text: str, *, first: int, limit: int) -> WindowResult:
+            calls.append((text, first, limit))
+            return WindowResult(
+                first=first,
+                rows=[{"rel": "Kyoto/[1].jpg", "location": "Kyoto", "make": "FUJIFILM"}],
+                total_count=11,
+                collection_revision=1,
+            )
+
+    session = _FakeSession()
+    session.asset_queries = _FakeQueries()
+    monkeypatch.setattr(cli, "create_headless_library_session", lambda root: session)
+
+    result = CliRunner().invoke(
+        cli.app,
+        ["search", "kyoto fuji", str(tmp_path), "--limit", "5", "--page", "3"],
+    )
+
+    assert result.exit_code == 0
+    assert calls == [("kyoto fuji", 10, 5)]
+    assert "Kyoto/[1].jpg" in result.output
+    assert "11-11 of 11 matches" in result.output
+    assert session.shutdown_called is True
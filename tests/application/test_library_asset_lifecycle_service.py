@@ -13,6 +13,10 @@ from iPhoto.bootstrap.library_asset_lifecycle_service import (
 )
 from iPhoto.cache.index_store import get_global_repository, reset_global_repository
 from iPhoto.config import RECENTLY_DELETED_DIR_NAME
+from iPhoto.infrastructure.services.thumbnail_cache_keys import (
+    thumbnail_cache_file_for_key,
+    thumbnail_cache_key,
+)
 
 
 class _PairRecorder:
@@ -82,6 +86,62 @@ def test_apply_move_reuses_cached_metadata_and_pairs_once(tmp_path: Path) -> Non
     assert pair_recorder.pair_roots == [library_root]
 
 
+def test_apply_move_rekeys_rows_and_thumbnail_cache_without_decoding(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    library_root = tmp_path / "Library"
+    album_a = library_root / "AlbumA"
+    album_b = library_root / "AlbumB"
+    album_a.mkdir(parents=True)
+    album_b.mkdir()
+    source = album_a / "photo.jpg"
+    target = album_b / "photo.jpg"
+    target.write_bytes(b"moved")
+    cache_dir = library_root / ".iPhoto" / "cache" / "thumbs"
+    cache_dir.mkdir(parents=True)
+    old_key = thumbnail_cache_key(source)
+    thumbnail_cache_file_for_key(cache_dir, old_key).write_bytes(b"jpeg")
+    get_global_repository(library_root).write_rows(
+        [
+            {
+                "rel": "AlbumA/photo.jpg",
+                "id": "asset-1",
+                "make": "Cached Camera",
+                "micro_thumbnail": b"micro",
+                "thumb_cache_key": old_key,
+                "thumbnail_state": "ready",
+            }
+        ]
+    )
+
+    def fail_ensure_scan_thumbnail(*_args, **_kwargs):
+        raise AssertionError("moved thumbnails should be re-keyed, not regenerated")
+
+    monkeypatch.setattr(lifecycle_module, "ensure_scan_thumbnail", fail_ensure_scan_thumbnail)
+    service = LibraryAssetLifecycleService(
+        library_root,
+        scan_service=_PairRecorder(),  # type: ignore[arg-type]
+    )
+
+    result = service.apply_move(
+        moved=[(source, target)],
+        source_root=album_a,
+        destination_root=album_b,
+    )
+
+    rows = _rows(library_root)
+    moved_row = rows["AlbumB/photo.jpg"]
+    new_key = thumbnail_cache_key(target)
+    assert result.errors == []
+    assert "AlbumA/photo.jpg" not in rows
+    assert moved_row["make"] == "Cached Camera"
+    assert moved_row["micro_thumbnail"] == b"micro"
+    assert moved_row["thumb_cache_key"] == new_key
+    assert thumbnail_cache_file_for_key(cache_dir, new_key).read_bytes() == b"jpeg"
+    assert not thumbnail_cache_file_for_key(cache_dir, old_key).exists()
+
+
 def test_sessionless_move_uses_destination_root_thumbnail_cache(
     tmp_path: Path,
     monkeypatch,
@@ -217,6 +277,7 @@ def test_delete_annotation_uses_manifest_album_without_work_dir(tmp_path: Path)
     assert result.errors == []
     assert rows[trash_rel]["original_album_id"] == "album-a"
     assert rows[trash_rel]["original_album_subpath"] == "photo.jpg"
+    assert service.album_root_for_id("album-a") == album_root
 
 
 def test_delete_annotation_normalizes_legacy_album_manifest(tmp_path: Path) -> None:
@@ -368,6 +429,28 @@ def test_cleanup_deleted_index_removes_missing_trash_rows(tmp_path: Path) -> Non
     assert _rows(library_root) == {}
 
 
+def test_trash_delete_prunes_one_ledger_window_per_move(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(lifecycle_module, "_TRASH_PRUNE_BATCH", 2)
+    library_root = tmp_path / "Library"
+    trash_root = library_root / RECENTLY_DELETED_DIR_NAME
+    trash_root.mkdir(parents=True)
+    stale = [f"{RECENTLY_DELETED_DIR_NAME}/gone-{index}.jpg" for index in range(3)]
+    repository = get_global_repository(library_root)
+    repository.write_rows(
+        {"rel": rel, "id": rel, "is_deleted": 1} for rel in stale
+    )
+    service = LibraryAssetLifecycleService(library_root)
+
+    service._cleanup_stale_trash_rows(repository, library_root)  # noqa: SLF001
+    assert len(_rows(library_root)) == 1
+
+    service._cleanup_stale_trash_rows(repository, library_root)  # noqa: SLF001
+    assert _rows(library_root) == {}
+
+
 def test_reconcile_missing_scan_rows_prunes_scope_after_scan_finalize(
     tmp_path: Path,
 ) -> None:
@@ -15,7 +15,7 @@ class _FakeLifecycleService:
         self.read_roots: list[Path] = []
         self.read_rels: list[list[str]] = []
 
-    def read_restore_index_rows(self, trash_root: Path) -> list[dict]:
+    def read_restore_index_rows(self, trash_root: Path, paths=None) -> list[dict]:
         self.read_roots.append(Path(trash_root))
         return [dict(row) for row in self.rows]
 
@@ -396,3 +396,44 @@ def test_restore_plan_revalidates_cached_album_root_after_rename(
     assert second_plan.errors == []
     assert second_plan.batches[0].destination_root == renamed_root.resolve()
     assert not album_root.exists()
+
+
+def test_restore_plan_resolves_album_id_through_registry_without_walking(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    library_root = tmp_path / "Library"
+    album_root = library_root / "AlbumA"
+    trash_root = library_root / RECENTLY_DELETED_DIR_NAME
+    album_root.mkdir(parents=True)
+    trash_root.mkdir()
+    (album_root / ".iphoto.album.json").write_text('{"id": "album-a"}', encoding="utf-8")
+    trashed = trash_root / "photo.jpg"
+    trashed.write_bytes(b"data")
+
+    class _RegistryLifecycleService(_FakeLifecycleService):
+        def album_root_for_id(self, album_id: str) -> Path | None:
+            return album_root if album_id == "album-a" else None
+
+    lifecycle = _RegistryLifecycleService(
+        [
+            {
+                "rel": f"{RECENTLY_DELETED_DIR_NAME}/photo.jpg",
+                "original_album_id": "album-a",
+                "original_album_subpath": "photo.jpg",
+            }
+        ]
+    )
+    service = LibraryAssetOperationService(
+        library_root,
+        lifecycle_service=lifecycle,  # type: ignore[arg-type]
+    )
+
+    def _no_walk(self, pattern):
+        raise AssertionError(f"unexpected library walk for {pattern}")
+
+    monkeypatch.setattr(Path, "rglob", _no_walk)
+    plan = service.plan_restore_request([trashed], trash_root=trash_root)
+
+    assert plan.errors == []
+    assert plan.batches[0].destination_root == album_root.resolve()
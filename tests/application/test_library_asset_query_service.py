@@ -586,3 +586,103 @@ def test_thumbnail_backfill_skips_queries_that_collection_api_cannot_represent(
 
     assert queued == 0
     assert repo.candidate_calls == []
+
+
+class _MicroMigrationRepository(_Repository):
+    def __init__(self, blobs: dict[str, bytes]) -> None:
+        super().__init__()
+        self.blobs = dict(blobs)
+        self.read_calls: list[tuple[str | None, int]] = []
+
+    def read_legacy_micro_thumbnails(self, after_rel=None, limit: int = 256):
+        self.read_calls.append((after_rel, limit))
+        return [
+            (rel, blob)
+            for rel, blob in sorted(self.blobs.items())
+            if rel > (after_rel or "") and not blob.startswith(b"IPMT")
+        ][:limit]
+
+    def replace_micro_thumbnails(self, updates) -> int:
+        updated = 0
+        for rel, expected, replacement in updates:
+            if self.blobs.get(rel) == expected:
+                self.blobs[rel] = replacement
+                updated += 1
+        return updated
+
+
+def test_micro_thumbnail_migration_runs_in_interleaved_batches(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    from io import BytesIO
+
+    from PIL import Image
+
+    from iPhoto.bootstrap import library_asset_query_service as module
+    from iPhoto.utils.micro_thumbnail import read_micro_header
+
+    payload = BytesIO()
+    Image.new("RGB", (16, 12), "red").save(payload, format="JPEG")
+    repo = _MicroMigrationRepository(
+        {"a.jpg": payload.getvalue(), "b.jpg": b"\xff\xd8\xffbroken", "c.jpg": payload.getvalue()}
+    )
+    monkeypatch.setattr(module, "_MICRO_MIGRATION_BATCH_SIZE", 2)
+    service = LibraryAssetQueryService(tmp_path, repository_factory=lambda _root: repo)
+    executor = _DeferredExecutor()
+    service._thumbnail_backfill_executor = executor  # type: ignore[assignment]
+
+    assert service.request_micro_thumbnail_migration() is True
+    assert service.request_micro_thumbnail_migration() is False
+    while executor.submitted:
+        fn, args = executor.submitted.pop(0)
+        fn(*args)
+
+    assert repo.read_calls == [(None, 2), ("b.jpg", 2), ("c.jpg", 2)]
+    assert read_micro_header(repo.blobs["a.jpg"]).width == 16
+    assert read_micro_header(repo.blobs["c.jpg"]).height == 12
+    # Undecodable blobs are cleared so thumbnail backfill regenerates them.
+    assert repo.blobs["b.jpg"] is None
+
+
+
+def test_album_dashboard_feed_prefers_manifest_cover_with_ready_thumbnail(tmp_path: Path) -> None:
+    library_root = tmp_path / "Library"
+    trips = library_root / "Trips"
+    other = library_root / "Other"
+    trips.mkdir(parents=True)
+    other.mkdir()
+    (trips / ".iphoto.album.json").write_text(
+        '{"id": "trips-id", "cover": "pick.jpg"}', encoding="utf-8"
+    )
+    repo = IndexStore(library_root)
+    repo.write_rows(
+        [
+            {
+                "rel": "Trips/pick.jpg",
+                "id": "pick",
+                "ts": 1,
+                "media_type": 0,
+                "thumbnail_state": "ready",
+                "thumb_cache_key": "thumb-pick",
+            },
+            {"rel": "Trips/newest.jpg", "id": "newest", "ts": 2, "media_type": 0},
+            {"rel": "Other/only.jpg", "id": "only", "ts": 3, "media_type": 0},
+        ]
+    )
+    service = LibraryAssetQueryService(
+        library_root,
+        repository_factory=lambda _root: repo,
+    )
+
+    feed = service.read_album_dashboard_feed([trips, other])
+
+    assert feed[trips].asset_count == 2
+    assert feed[trips].cover_rel == "Trips/pick.jpg"
+    assert feed[trips].cover_thumb_key == "thumb-pick"
+    assert feed[trips].registered is True
+    assert service.thumbnail_cache_file("thumb-pick").name == "thumb-pick.jpg"
+    # Albums without a manifest fall back to the newest asset, thumbnail not yet ready.
+    assert feed[other].cover_rel == "Other/only.jpg"
+    assert feed[other].cover_thumb_key is None
+    assert feed[other].registered is False
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+import iPhoto.utils.geocoding as geocoding_module
+from iPhoto.bootstrap.library_index_runner import LibraryIndexRunner
+from iPhoto.bootstrap.library_scan_service import LibraryScanService
+from iPhoto.bootstrap.library_session import create_headless_library_session
+from iPhoto.cache.index_store import get_global_repository, reset_global_repository
+
+
+class _Scanner:
+    def __init__(self, rows: list[dict[str, Any]], *, on_row=None) -> None:
+        self._rows = rows
+        self._on_row = on_row
+
+    def scan(
+        self,
+        _root: Path,
+        _include: Iterable[str],
+        _exclude: Iterable[str],
+        **_kwargs: object,
+    ):
+        for row in self._rows:
+            if self._on_row is not None:
+                self._on_row()
+            yield dict(row)
+
+
+@pytest.fixture(autouse=True)
+def clean_global_repository():
+    reset_global_repository()
+    yield
+    reset_global_repository()
+
+
+def _runner(library_root: Path, scanner: _Scanner, **kwargs: Any) -> LibraryIndexRunner:
+    session = create_headless_library_session(library_root)
+    return LibraryIndexRunner(
+        session,
+        scan_service_factory=lambda root, _workers: LibraryScanService(root, scanner=scanner),
+        **kwargs,
+    )
+
+
+def test_index_runner_reports_every_stage_and_backfills_locations(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    for name in ("a.jpg", "b.jpg"):
+        (library_root / name).write_bytes(b"x")
+    monkeypatch.setattr(
+        geocoding_module,
+        "resolve_location_names",
+        lambda gps_values: ["Paris — Île-de-France" if gps else None for gps in gps_values],
+    )
+    runner = _runner(
+        library_root,
+        _Scanner(
+            [
+                {"rel": "a.jpg", "id": "a", "gps": {"lat": 48.85, "lon": 2.35}},
+                {"rel": "b.jpg", "id": "b"},
+            ]
+        ),
+        workers=3,
+    )
+
+    report = runner.run().as_dict()
+
+    assert report["workers"] == 3
+    assert report["interrupted"] is False
+    assert report["scan_job_id"]
+    assert list(report["stages"]) == ["scan", "finalize", "geocode", "faces"]
+    assert report["stages"]["scan"]["items"] == 2
+    assert report["stages"]["geocode"]["items"] == 1
+    assert report["stages"]["faces"]["skipped"] == "disabled"
+    assert report["peak_rss_bytes"] > 0
+    rows = get_global_repository(library_root).get_rows_by_rels(["a.jpg"])
+    assert rows["a.jpg"]["location"] == "Paris — Île-de-France"
+    job = get_global_repository(library_root).latest_scan_job(
+        root=library_root.as_posix(),
+        scope="library",
+    )
+    assert job["status"] == "completed"
+
+
+def test_cancelled_index_run_skips_finalize_and_stays_resumable(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    store = get_global_repository(library_root)
+    store.write_rows([{"rel": "kept.jpg", "id": "kept"}])
+    (library_root / "kept.jpg").write_bytes(b"x")
+    runner: LibraryIndexRunner | None = None
+
+    def cancel() -> None:
+        assert runner is not None
+        runner.cancel()
+
+    runner = _runner(library_root, _Scanner([{"rel": "new.jpg", "id": "new"}], on_row=cancel))
+
+    report = runner.run().as_dict()
+
+    assert report["interrupted"] is True
+    assert report["stages"]["finalize"]["skipped"] == "interrupted"
+    assert report["stages"]["geocode"]["skipped"] == "interrupted"
+    # The partial scan must not prune rows it never reached.
+    assert store.get_rows_by_rels(["kept.jpg"])
+    job = store.latest_scan_job(root=library_root.as_posix(), scope="library")
+    assert job["status"] == "cancelled"
+    assert job["job_id"] == report["scan_job_id"]
@@ -3,6 +3,7 @@ from __future__ import annotations
 from pathlib import Path
 
 from iPhoto.bootstrap.library_location_service import LibraryLocationService
+from iPhoto.domain.models.query import GeoFeedDelta
 
 
 class _QueryService:
@@ -120,3 +121,55 @@ def test_location_service_converts_incremental_scan_row(tmp_path: Path) -> None:
     assert asset.album_path == root / "Album"
     assert asset.live_photo_group_id == "group-1"
     assert asset.live_partner_rel == "Album/live.mov"
+
+
+class _RevisionedQueryService(_QueryService):
+    def __init__(self, rows: list[dict]) -> None:
+        super().__init__(rows)
+        self.revision = 1
+        self.pending_delta: GeoFeedDelta | None = None
+        self.delta_requests: list[int] = []
+
+    def geo_revision(self) -> int:
+        return self.revision
+
+    def read_geotagged_changes(self, since_revision: int) -> GeoFeedDelta:
+        self.delta_requests.append(since_revision)
+        delta = self.pending_delta or GeoFeedDelta(revision=since_revision, rows=[])
+        self.pending_delta = None
+        return delta
+
+
+def test_location_service_applies_revision_deltas(tmp_path: Path) -> None:
+    root = tmp_path / "Library"
+    root.mkdir()
+
+    def row(rel: str, lat: float) -> dict:
+        return {"rel": rel, "id": rel, "gps": {"lat": lat, "lon": 0.0}, "mime": "image/jpeg"}
+
+    query_service = _RevisionedQueryService([row("a.jpg", 1.0), row("b.jpg", 2.0)])
+    service = LibraryLocationService(root, query_service=query_service)  # type: ignore[arg-type]
+    first = service.list_geotagged_assets()
+
+    service.invalidate_cache()
+    assert service.list_geotagged_assets() == first
+    assert query_service.delta_requests == [1]
+
+    query_service.pending_delta = GeoFeedDelta(
+        revision=4,
+        rows=[row("c.jpg", 3.0), row("a.jpg", 9.0)],
+        removed_rels=("b.jpg",),
+    )
+    service.invalidate_cache()
+    patched = service.list_geotagged_assets()
+
+    assert [(asset.library_relative, asset.latitude) for asset in patched] == [
+        ("a.jpg", 9.0),
+        ("c.jpg", 3.0),
+    ]
+    assert query_service.calls == 1
+    assert query_service.delta_requests == [1, 1]
+
+    service.invalidate_cache()
+    assert service.list_geotagged_assets()[1] is patched[1]
+    assert query_service.delta_requests[-1] == 4
@@ -157,6 +157,25 @@ def test_people_coordinator_done_bookkeeping_uses_injected_repository(tmp_path:
     assert asset_repository.status_updates == [(("asset-a",), "done")]
 
 
+def test_people_coordinator_syncs_search_names_only_for_changed_people(tmp_path: Path) -> None:
+    asset_repository = FakePeopleAssetRepository()
+    search_syncs: list[tuple[list[tuple[str, str, str]], tuple[str, ...] | None]] = []
+    asset_repository.replace_asset_people = lambda rows, *, person_ids=None: search_syncs.append(
+        (list(rows), person_ids)
+    )
+    coordinator = PeopleIndexCoordinator(tmp_path, asset_repository=asset_repository)
+
+    coordinator._emit_snapshot(changed_person_ids=("person-a",))
+    coordinator._emit_snapshot(
+        changed_person_ids=("person-b",),
+        person_redirects={"person-c": "person-b"},
+    )
+    coordinator._emit_snapshot(changed_asset_ids=("asset-a",))
+
+    # The first sync after binding mirrors every named person; later ones are scoped.
+    assert search_syncs == [([], None), ([], ("person-b", "person-c"))]
+
+
 def test_people_service_binds_injected_coordinator_to_asset_repository(tmp_path: Path) -> None:
     asset_repository = FakePeopleAssetRepository()
     coordinator = PeopleIndexCoordinator(tmp_path)
@@ -4,6 +4,7 @@ import sqlite3
 import json
 import time
 from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
@@ -559,6 +560,52 @@ def test_scan_specific_files_prefixes_subalbum_rows(
     ]
 
 
+def test_pair_imported_files_links_new_rows_without_resetting_album(
+    tmp_path: Path,
+) -> None:
+    library_root = tmp_path / "library"
+    album_root = library_root / "album"
+    album_root.mkdir(parents=True)
+    service = LibraryScanService(library_root)
+    store = get_global_repository(library_root)
+
+    def _row(rel: str, mime: str, dt: str, **extra: Any) -> dict[str, Any]:
+        ts = int(datetime.fromisoformat(dt.replace("Z", "+00:00")).timestamp() * 1_000_000)
+        return {"rel": rel, "id": rel, "mime": mime, "dt": dt, "ts": ts, "bytes": 1, **extra}
+
+    existing = [
+        _row("album/OLD.HEIC", "image/heic", "2024-01-01T00:00:00Z", content_id="old"),
+        _row("album/OLD.MOV", "video/quicktime", "2024-01-01T00:00:00Z", content_id="old"),
+        _row("album/NEW.MOV", "video/quicktime", "2024-06-01T12:00:00Z"),
+    ]
+    service.finalize_scan(album_root, existing)
+    service.pair_album(album_root)
+
+    imported = _row("album/NEW.HEIC", "image/heic", "2024-06-01T12:00:01Z")
+    store.merge_scan_rows([imported])
+    groups = service.pair_imported_files(album_root, [imported])
+
+    assert [(group.still, group.motion) for group in groups] == [("NEW.HEIC", "NEW.MOV")]
+    indexed = {row["rel"]: row for row in store.read_all(filter_hidden=False)}
+    assert indexed["album/NEW.HEIC"]["live_partner_rel"] == "album/NEW.MOV"
+    assert indexed["album/NEW.MOV"]["live_role"] == 1
+    assert indexed["album/OLD.HEIC"]["live_partner_rel"] == "album/OLD.MOV"
+    links = json.loads((album_root / ".iPhoto" / "links.json").read_text())
+    assert sorted((group["still"], group["motion"]) for group in links["live_groups"]) == [
+        ("NEW.HEIC", "NEW.MOV"),
+        ("OLD.HEIC", "OLD.MOV"),
+    ]
+
+
+def test_indexed_asset_ids_ignores_unknown_ids(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    service = LibraryScanService(library_root)
+    get_global_repository(library_root).merge_scan_rows([{"rel": "a.jpg", "id": "as_a"}])
+
+    assert service.indexed_asset_ids(["as_a", "as_missing"]) == {"as_a"}
+
+
 def test_scan_batch_committed_transport_contains_only_ready_rows(tmp_path: Path) -> None:
     library_root = tmp_path / "library"
     library_root.mkdir()
@@ -615,3 +662,126 @@ def test_scan_batch_committed_transport_contains_only_ready_rows(tmp_path: Path)
     assert visible_event is not None
     visible_payload = json.loads(visible_event[0])
     assert "visible_publish" in visible_payload["stage_elapsed_ms"]
+
+
+class _CheckpointingScanner:
+    """Fake scanner that reports directories and can stop inside one."""
+
+    def __init__(self, dirs: dict[str, list[str]], *, fail_in: str | None = None) -> None:
+        self._dirs = dirs
+        self._fail_in = fail_in
+        self.completed_dirs: set[str] | None = None
+
+    def scan(
+        self,
+        _root: Path,
+        _include: Iterable[str],
+        _exclude: Iterable[str],
+        *,
+        existing_index: dict[str, dict[str, Any]] | None = None,
+        progress_callback=None,
+        completed_dirs=None,
+        directory_callback=None,
+    ):
+        self.completed_dirs = set(completed_dirs or ())
+        found = sum(len(names) for names in self._dirs.values())
+        processed = 0
+        for rel in sorted(existing_index or {}):
+            if rel.rpartition("/")[0] in self.completed_dirs:
+                processed += 1
+                yield existing_index[rel]
+        for rel_dir, names in self._dirs.items():
+            if rel_dir in self.completed_dirs:
+                continue
+            for name in names:
+                if rel_dir == self._fail_in:
+                    raise RuntimeError("interrupted")
+                processed += 1
+                if progress_callback is not None:
+                    progress_callback(processed, found)
+                yield {"rel": f"{rel_dir}/{name}", "id": name}
+            if directory_callback is not None:
+                directory_callback(rel_dir)
+
+
+def test_resumed_scan_skips_checkpointed_directories(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    dirs = {"a": ["1.jpg", "2.jpg"], "b": ["3.jpg"], "c": ["4.jpg"]}
+    interrupted = _CheckpointingScanner(dirs, fail_in="c")
+    service = LibraryScanService(library_root, scanner=interrupted)
+
+    with pytest.raises(RuntimeError, match="interrupted"):
+        service.scan_album(library_root, persist_chunks=True, chunk_size=1)
+
+    store = get_global_repository(library_root)
+    first_job = store.latest_scan_job(root=library_root.as_posix(), scope="library")
+    assert first_job["status"] == "failed"
+    # "b" was reported after its last row, but no later chunk committed it.
+    assert first_job["discovery_cursor"] == "a"
+
+    resumed = _CheckpointingScanner(dirs)
+    service = LibraryScanService(library_root, scanner=resumed)
+    result = service.scan_album(library_root, persist_chunks=True, chunk_size=1, resume=True)
+
+    assert result.scan_job_id == first_job["job_id"]
+    assert resumed.completed_dirs == {"a"}
+    assert sorted(row["rel"] for row in result.rows) == ["a/1.jpg", "a/2.jpg", "b/3.jpg", "c/4.jpg"]
+    with sqlite3.connect(store.path) as conn:
+        committed = conn.execute(
+            "SELECT SUM(json_extract(payload_json, '$.rows')) FROM scan_events "
+            "WHERE job_id = ? AND event_type = 'batch_committed'",
+            [result.scan_job_id],
+        ).fetchone()[0]
+    # Replayed rows are already stored; only b and c are committed again.
+    assert committed == 5
+
+    progress = service.scan_progress(library_root)
+    assert progress is not None
+    assert progress.job_id == result.scan_job_id
+    assert progress.status == "scanned"
+    assert progress.checkpointed_dirs == 3
+    assert progress.discovery_cursor == "c"
+    assert progress.eta_seconds == 0.0
+
+
+def test_scan_without_resume_starts_a_fresh_job(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    library_root.mkdir()
+    dirs = {"a": ["1.jpg"], "b": ["2.jpg"]}
+    service = LibraryScanService(library_root, scanner=_CheckpointingScanner(dirs, fail_in="b"))
+    with pytest.raises(RuntimeError):
+        service.scan_album(library_root, persist_chunks=True, chunk_size=1)
+    failed_job = get_global_repository(library_root).latest_scan_job(
+        root=library_root.as_posix(), scope="library"
+    )
+
+    scanner = _CheckpointingScanner(dirs)
+    service = LibraryScanService(library_root, scanner=scanner)
+    result = service.scan_album(library_root, persist_chunks=True, chunk_size=1)
+
+    assert result.scan_job_id != failed_job["job_id"]
+    assert scanner.completed_dirs == set()
+    assert len(result.rows) == 2
+
+
+def test_scan_job_progress_reports_throughput_and_eta(tmp_path: Path) -> None:
+    store = get_global_repository(tmp_path)
+    store.create_scan_job(job_id="scan_eta", root=tmp_path.as_posix(), scope="library")
+    store.record_scan_checkpoint("scan_eta", ["a", "b"], found_count=1000, processed_count=200)
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("UPDATE scan_jobs SET started_at = 1000 WHERE job_id = 'scan_eta'")
+        conn.executemany(
+            "INSERT INTO scan_events (job_id, event_type, payload_json, created_at) "
+            "VALUES ('scan_eta', 'batch_committed', ?, ?)",
+            [('{"rows": 100}', 2000), ('{"rows": 100}', 3000)],
+        )
+
+    progress = store.scan_job_progress("scan_eta")
+
+    assert progress is not None
+    assert progress.rows_per_second == 100.0
+    assert progress.eta_seconds == 8.0
+    assert progress.checkpointed_dirs == 2
+    assert progress.discovery_cursor == "b"
+    assert store.scan_job_progress("missing") is None
@@ -264,6 +264,37 @@ def test_old_style_rows_without_thumbnail_key_are_backfill_candidates(
     assert candidates[0]["thumbnail_state"] == "stale"
 
 
+def test_legacy_micro_thumbnails_are_listed_by_rel_and_replaced_once(
+    store: IndexStore,
+) -> None:
+    jpeg_micro = b"\xff\xd8\xff-legacy"
+    raw_micro = b"IPMT\x01\x01\x01\x00\x1f\x00"
+    rows = []
+    for index, micro in enumerate((jpeg_micro, raw_micro, jpeg_micro, None)):
+        row = _thumbnail_backfill_row(index, stale=False)
+        row["micro_thumbnail"] = micro
+        rows.append(row)
+    store.write_rows(rows)
+
+    legacy = store.read_legacy_micro_thumbnails(limit=10)
+    assert [rel for rel, _blob in legacy] == ["asset-00000.jpg", "asset-00002.jpg"]
+    assert store.read_legacy_micro_thumbnails("asset-00000.jpg", limit=10)[0][0] == (
+        "asset-00002.jpg"
+    )
+
+    updated = store.replace_micro_thumbnails(
+        [
+            ("asset-00000.jpg", jpeg_micro, raw_micro),
+            ("asset-00002.jpg", b"changed-since-read", raw_micro),
+        ]
+    )
+
+    assert updated == 1
+    by_rel = store.get_rows_by_rels(["asset-00000.jpg", "asset-00002.jpg"])
+    assert by_rel["asset-00000.jpg"]["micro_thumbnail"] == raw_micro
+    assert by_rel["asset-00002.jpg"]["micro_thumbnail"] == jpeg_micro
+
+
 def _thumbnail_backfill_row(
     index: int,
     *,
@@ -356,6 +387,16 @@ def test_thumbnail_backfill_top_window_includes_rows_before_first_ready(
     assert [row["id"] for row in candidates] == ["asset-00100"]
 
 
+def test_thumbnail_backfill_candidates_respect_person_scope(store: IndexStore) -> None:
+    store.write_rows(_thumbnail_backfill_row(index, stale=True) for index in range(4))
+    store.replace_person_assets([("asset-00002", "alice")])
+    query = CollectionQuery(collection_type=CollectionType.PEOPLE, person_ids=("alice",))
+
+    candidates = store.read_thumbnail_backfill_candidates(query, 0, 10)
+
+    assert [row["id"] for row in candidates] == ["asset-00002"]
+
+
 def test_thumbnail_backfill_candidates_follow_visible_window_with_stale_rows(
     store: IndexStore,
 ) -> None:
@@ -815,6 +856,36 @@ def test_collection_window_reuses_count_revision_cache_until_invalidation(store:
     assert store._collection_meta_cache == {}
 
 
+def test_favorite_toggle_only_invalidates_favorite_collections(store: IndexStore) -> None:
+    store.write_rows(
+        [
+            {
+                "rel": f"{name}.jpg",
+                "id": name,
+                "thumbnail_state": "ready",
+                "thumb_cache_key": f"thumb-{name}",
+            }
+            for name in ("a", "b", "c")
+        ]
+    )
+    all_photos = CollectionQuery()
+    favorites = CollectionQuery(collection_type=CollectionType.FAVORITES)
+    store.read_collection_window(all_photos, 0, 2)
+    store.read_collection_window(favorites, 0, 2)
+
+    store.set_favorite_status("a.jpg", True)
+
+    assert all_photos in store._collection_meta_cache
+    assert all_photos in store._collection_anchor_cache
+    assert favorites not in store._collection_meta_cache
+    assert store.read_collection_window(favorites, 0, 2).total_count == 1
+
+    store.update_thumbnail_ready("b.jpg", thumb_cache_key="thumb-b2")
+
+    assert store._collection_meta_cache == {}
+    assert all_photos in store._collection_anchor_cache
+
+
 def test_gallery_collection_window_uses_light_projection_with_micro(store: IndexStore) -> None:
     store.write_rows(
         [
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from iPhoto.cache.index_store import IndexStore
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> IndexStore:
+    return IndexStore(tmp_path)
+
+
+def _geo(rel: str, lat: float, lon: float, **extra) -> dict:
+    return {"rel": rel, "id": f"id-{rel}", "gps": {"lat": lat, "lon": lon}, **extra}
+
+
+def test_geotagged_rows_use_numeric_coordinates(store: IndexStore) -> None:
+    store.write_rows(
+        [
+            _geo("a.jpg", 48.1, 11.5, micro_thumbnail=b"x" * 64),
+            {"rel": "plain.jpg", "id": "plain"},
+            {"rel": "bad.jpg", "id": "bad", "gps": {"lat": "n/a", "lon": 1.0}},
+        ]
+    )
+
+    rows = list(store.read_geotagged())
+
+    assert [row["rel"] for row in rows] == ["a.jpg"]
+    assert rows[0]["gps"] == {"lat": 48.1, "lon": 11.5}
+    assert "micro_thumbnail" not in rows[0]
+    with sqlite3.connect(store.path) as conn:
+        assert conn.execute(
+            "SELECT gps_lat, gps_lon FROM assets WHERE rel = 'a.jpg'"
+        ).fetchone() == (48.1, 11.5)
+
+
+def test_geo_changes_report_upserts_and_removals(store: IndexStore) -> None:
+    store.write_rows([_geo("a.jpg", 1.0, 2.0), _geo("b.jpg", 3.0, 4.0)])
+    baseline = store.geo_revision()
+    assert baseline > 0
+    assert store.read_geotagged_changes(baseline).rows == []
+
+    store.append_rows([{"rel": "plain.jpg", "id": "plain"}])
+    assert store.geo_revision() == baseline
+
+    store.append_rows([_geo("a.jpg", 5.0, 6.0), _geo("c.jpg", 7.0, 8.0)])
+    store.append_rows([{"rel": "b.jpg", "id": "id-b.jpg"}])
+    delta = store.read_geotagged_changes(baseline)
+
+    assert {row["rel"]: row["gps"] for row in delta.rows} == {
+        "a.jpg": {"lat": 5.0, "lon": 6.0},
+        "c.jpg": {"lat": 7.0, "lon": 8.0},
+    }
+    assert delta.removed_rels == ("b.jpg",)
+    assert delta.revision == store.geo_revision()
+
+    store.remove_rows(["c.jpg"])
+    store.update_location("a.jpg", "Munich")
+    later = store.read_geotagged_changes(delta.revision)
+
+    assert [row["rel"] for row in later.rows] == ["a.jpg"]
+    assert later.rows[0]["location"] == "Munich"
+    assert later.removed_rels == ("c.jpg",)
+
+
+def test_update_asset_geodata_keeps_numeric_columns_in_sync(store: IndexStore) -> None:
+    store.write_rows([{"rel": "a.jpg", "id": "a"}])
+    revision = store.geo_revision()
+
+    store.update_asset_geodata("a.jpg", gps={"lat": 10.0, "lon": 20.0}, location="Rome")
+    added = store.read_geotagged_changes(revision)
+    assert [row["gps"] for row in added.rows] == [{"lat": 10.0, "lon": 20.0}]
+
+    store.update_asset_geodata("a.jpg", gps=None, location=None)
+    cleared = store.read_geotagged_changes(added.revision)
+    assert cleared.rows == []
+    assert cleared.removed_rels == ("a.jpg",)
+
+
+def test_existing_libraries_are_backfilled(tmp_path: Path) -> None:
+    IndexStore(tmp_path).write_rows([_geo("a.jpg", 1.5, 2.5)])
+    db_path = tmp_path / ".iPhoto" / "global_index.db"
+    with sqlite3.connect(db_path) as conn:
+        for name in ("insert", "delete", "update"):
+            conn.execute(f"DROP TRIGGER geo_changes_after_{name}")
+        conn.execute("DROP TABLE geo_changes")
+        conn.execute("UPDATE assets SET gps_lat = NULL, gps_lon = NULL")
+
+    reopened = IndexStore(tmp_path)
+
+    assert [row["gps"] for row in reopened.read_geotagged()] == [{"lat": 1.5, "lon": 2.5}]
+    assert reopened.geo_revision() == 1
+    assert reopened.read_geotagged_changes(0).rows[0]["rel"] == "a.jpg"
+
+
+def test_geo_feed_keeps_legacy_metadata_location_fallback(store: IndexStore) -> None:
+    from iPhoto.application.services.location_asset_service import geotagged_asset_from_row
+
+    with sqlite3.connect(store.path) as conn:
+        conn.execute("ALTER TABLE assets ADD COLUMN metadata TEXT")
+    baseline = store.geo_revision()
+    store.write_rows(
+        [
+            _geo("legacy.jpg", 1.0, 2.0, metadata={"location": "Paris"}),
+            _geo("named.jpg", 3.0, 4.0, location="Berlin", metadata={"location": "Stale"}),
+        ]
+    )
+
+    rows = {row["rel"]: row for row in store.read_geotagged()}
+
+    assert rows["legacy.jpg"]["metadata"] == {"location": "Paris"}
+    assert "metadata" not in rows["named.jpg"]
+    asset = geotagged_asset_from_row(store.path.parent, rows["legacy.jpg"])
+    assert asset is not None and asset.location_name == "Paris"
+    delta = {row["rel"]: row for row in store.read_geotagged_changes(baseline).rows}
+    assert delta["legacy.jpg"]["metadata"] == {"location": "Paris"}
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from iPhoto.bootstrap.library_asset_query_service import LibraryAssetQueryService
+from iPhoto.cache.index_store import IndexStore
+from iPhoto.cache.index_store import queries
+from iPhoto.cache.index_store.queries import build_fts_match, parse_search_query
+from iPhoto.domain.models.query import AssetQuery, CollectionQuery, CollectionType
+
+
+def _row(rel: str, **extra) -> dict:
+    row = {
+        "rel": rel,
+        "id": f"id-{rel}",
+        "dt": "2024-05-01T10:00:00Z",
+        "ts": 1_714_557_600_000_000,
+        "media_type": 0,
+    }
+    row.update(extra)
+    return row
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> IndexStore:
+    store = IndexStore(tmp_path)
+    store.write_rows(
+        [
+            _row("Trips/Kyoto/IMG_0001.jpg", location="Kyoto, Japan", make="FUJIFILM", model="X-T5"),
+            _row("Trips/Kyoto/IMG_0002.jpg", location="Kyoto, Japan", make="Apple", model="iPhone 15"),
+            _row("Trips/Osaka/IMG_0003.jpg", location="Osaka, Japan", make="FUJIFILM", model="X100V",
+                 lens="XF23mmF2"),
+            _row("Home/IMG_0004.jpg", location="Zürich", make="Sony", model="A7 IV"),
+        ]
+    )
+    return store
+
+
+def _search(store: IndexStore, text: str, **kwargs) -> list[str]:
+    query = CollectionQuery(
+        collection_type=CollectionType.SEARCH,
+        search_text=text,
+        min_thumbnail_state=None,
+        **kwargs,
+    )
+    return [row["rel"] for row in store.search_assets(query, 0, 50).rows]
+
+
+def test_parse_search_query_supports_fields_phrases_and_exclusions() -> None:
+    terms = parse_search_query('kyoto camera:fuji "new york" -osaka bogus:thing')
+
+    assert [(t.text, t.column, t.negated, t.phrase) for t in terms] == [
+        ("kyoto", None, False, False),
+        ("fuji", "camera", False, False),
+        ("new york", None, False, True),
+        ("osaka", None, True, False),
+        ("bogus:thing", None, False, False),
+    ]
+    assert build_fts_match("-osaka") is None
+    assert build_fts_match('  "" * ') is None
+    assert build_fts_match('say "hi') == '("say"* AND "hi")'
+
+
+def test_search_combines_location_and_camera(store: IndexStore) -> None:
+    assert _search(store, "Kyoto Fujifilm") == ["Trips/Kyoto/IMG_0001.jpg"]
+    assert set(_search(store, "fuji")) == {
+        "Trips/Kyoto/IMG_0001.jpg",
+        "Trips/Osaka/IMG_0003.jpg",
+    }
+    assert _search(store, "lens:xf23") == ["Trips/Osaka/IMG_0003.jpg"]
+    assert _search(store, "zurich") == ["Home/IMG_0004.jpg"]
+    assert _search(store, "japan -kyoto") == ["Trips/Osaka/IMG_0003.jpg"]
+    assert _search(store, "japan", album_path="Trips/Osaka") == ["Trips/Osaka/IMG_0003.jpg"]
+
+
+def test_search_index_follows_upserts_and_deletes(store: IndexStore) -> None:
+    store.append_rows([_row("Trips/Kyoto/IMG_0001.jpg", location="Nara, Japan")])
+    assert _search(store, "nara") == ["Trips/Kyoto/IMG_0001.jpg"]
+    assert _search(store, "location:kyoto") == ["Trips/Kyoto/IMG_0002.jpg"]
+
+    store.update_location("Trips/Kyoto/IMG_0002.jpg", "Tokyo")
+    assert _search(store, "tokyo") == ["Trips/Kyoto/IMG_0002.jpg"]
+
+    store.remove_rows(["Trips/Kyoto/IMG_0001.jpg"])
+    assert _search(store, "nara") == []
+    with sqlite3.connect(store.path) as conn:
+        fts_rows = conn.execute("SELECT COUNT(*) FROM assets_fts").fetchone()[0]
+        asset_rows = conn.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+    assert fts_rows == asset_rows
+
+
+def test_search_matches_person_names(store: IndexStore) -> None:
+    store.replace_asset_people(
+        [
+            ("id-Home/IMG_0004.jpg", "p1", "Alice Smith"),
+            ("id-Trips/Kyoto/IMG_0002.jpg", "p1", "Alice Smith"),
+        ]
+    )
+    assert set(_search(store, "person:alice")) == {
+        "Home/IMG_0004.jpg",
+        "Trips/Kyoto/IMG_0002.jpg",
+    }
+
+    store.replace_asset_people([("id-Home/IMG_0004.jpg", "p1", "Alice Jones")])
+    assert _search(store, "alice") == ["Home/IMG_0004.jpg"]
+    assert _search(store, "smith") == []
+
+    # A scoped replace leaves other people's memberships alone.
+    store.replace_asset_people(
+        [("id-Trips/Osaka/IMG_0003.jpg", "p2", "Bob Lee")],
+        person_ids=["p2"],
+    )
+    assert _search(store, "alice") == ["Home/IMG_0004.jpg"]
+    assert _search(store, "bob") == ["Trips/Osaka/IMG_0003.jpg"]
+    store.replace_asset_people([], person_ids=["p2"])
+    assert _search(store, "bob") == []
+    assert _search(store, "alice") == ["Home/IMG_0004.jpg"]
+
+
+def test_search_falls_back_to_rel_like_without_fts5(
+    store: IndexStore,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(queries, "fts5_available", lambda: False)
+    with sqlite3.connect(store.path) as conn:
+        for (trigger,) in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'assets_fts%'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {trigger}")
+        conn.execute("DROP TABLE assets_fts")
+
+    assert _search(store, "IMG_0003") == ["Trips/Osaka/IMG_0003.jpg"]
+    rows = store.read_collection_window(
+        CollectionQuery(search_text="kyoto", min_thumbnail_state=None), 0, 10
+    ).rows
+    assert sorted(row["rel"] for row in rows) == [
+        "Trips/Kyoto/IMG_0001.jpg",
+        "Trips/Kyoto/IMG_0002.jpg",
+    ]
+
+
+def test_search_ranks_and_paginates(store: IndexStore) -> None:
+    query = CollectionQuery(
+        collection_type=CollectionType.SEARCH,
+        search_text="japan",
+        min_thumbnail_state=None,
+    )
+    first = store.search_assets(query, 0, 2)
+    second = store.search_assets(query, 2, 2)
+
+    assert first.total_count == 3
+    assert len(first.rows) == 2
+    assert len(second.rows) == 1
+    assert {row["rel"] for row in first.rows + second.rows} == {
+        "Trips/Kyoto/IMG_0001.jpg",
+        "Trips/Kyoto/IMG_0002.jpg",
+        "Trips/Osaka/IMG_0003.jpg",
+    }
+    assert store.search_assets(
+        CollectionQuery(search_text="-japan"), 0, 10
+    ).total_count == 0
+
+
+def test_existing_rows_are_backfilled_into_search_index(tmp_path: Path) -> None:
+    IndexStore(tmp_path).write_rows([_row("a/IMG.jpg", location="Lisbon")])
+    db_path = tmp_path / ".iPhoto" / "global_index.db"
+    with sqlite3.connect(db_path) as conn:
+        for trigger in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'trigger'"
+        ).fetchall():
+            conn.execute(f"DROP TRIGGER {trigger[0]}")
+        conn.execute("DROP TABLE assets_fts")
+
+    reopened = IndexStore(tmp_path)
+    assert _search(reopened, "lisbon") == ["a/IMG.jpg"]
+
+
+def test_query_service_scopes_search_results(tmp_path: Path, store: IndexStore) -> None:
+    service = LibraryAssetQueryService(tmp_path, repository_factory=lambda _root: store)
+    try:
+        window = service.search_assets("japan", root=tmp_path / "Trips" / "Osaka")
+    finally:
+        service.shutdown()
+
+    assert [row["rel"] for row in window.rows] == ["IMG_0003.jpg"]
+    assert window.total_count == 1
+
+
+def test_query_service_pages_person_and_group_memberships(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(
+        _row(
+            f"People/IMG_{index}.jpg",
+            ts=1_714_557_600_000_000 + index,
+            thumbnail_state="ready",
+            thumb_cache_key=f"thumb-{index}",
+        )
+        for index in range(5)
+    )
+    store.replace_person_assets(
+        [(f"id-People/IMG_{index}.jpg", "alice") for index in range(4)]
+        + [(f"id-People/IMG_{index}.jpg", "bob") for index in (1, 3, 4)]
+        + [("id-missing", "bob")]
+    )
+    service = LibraryAssetQueryService(tmp_path, repository_factory=lambda _root: store)
+    try:
+        alice = AssetQuery(person_ids=["alice"])
+        window = service.read_query_asset_window(tmp_path, alice, 1, 2)
+        group = AssetQuery(person_ids=["alice", "bob"])
+        group_rows = list(service.read_query_asset_rows(tmp_path, group))
+
+        assert [row["rel"] for row in window.rows] == ["People/IMG_2.jpg", "People/IMG_1.jpg"]
+        assert window.total_count == 4
+        assert [row["rel"] for row in group_rows] == ["People/IMG_3.jpg", "People/IMG_1.jpg"]
+        assert service.count_query_assets(AssetQuery(person_ids=["bob"])) == 3
+
+        store.replace_person_assets([("id-People/IMG_0.jpg", "alice")])
+        assert service.count_query_assets(alice) == 1
+        assert service.count_query_assets(group) == 0
+
+        store.replace_person_assets([("id-People/IMG_0.jpg", "bob")], person_ids=["bob"])
+        assert service.count_query_assets(alice) == 1
+        assert service.count_query_assets(group) == 1
+    finally:
+        service.shutdown()
+
+
+def test_search_latency_on_large_index(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    cameras = [("FUJIFILM", "X-T5"), ("Apple", "iPhone 15"), ("Sony", "A7 IV"), ("Canon", "R5")]
+    places = ["Kyoto, Japan", "Lisbon, Portugal", "Austin, USA", "Oslo, Norway", "Cusco, Peru"]
+    store.write_rows(
+        _row(
+            f"Album {index % 200}/IMG_{index:06d}.jpg",
+            location=places[index % len(places)],
+            make=cameras[index % len(cameras)][0],
+            model=cameras[index % len(cameras)][1],
+        )
+        for index in range(20_000)
+    )
+    query = CollectionQuery(search_text="Kyoto Fujifilm", min_thumbnail_state=None)
+
+    started = time.perf_counter()
+    window = store.search_assets(query, 0, 100)
+    elapsed = time.perf_counter() - started
+
+    assert window.total_count == 1_000
+    assert len(window.rows) == 100
+    assert elapsed < 0.5
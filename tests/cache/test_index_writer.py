@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import gc
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from iPhoto.cache.index_store import IndexStore
+from iPhoto.cache.index_store.writer import WritePriority
+
+
+@pytest.fixture
+def store(tmp_path: Path):
+    repo = IndexStore(tmp_path)
+    yield repo
+    repo.close()
+
+
+def _favorites(store: IndexStore) -> dict[str, int]:
+    return {row["rel"]: row["is_favorite"] for row in store.read_all()}
+
+
+def test_interactive_writes_overtake_queued_bulk_merges(store: IndexStore) -> None:
+    store.write_rows([{"rel": "a.jpg"}, {"rel": "b.jpg"}])
+    release = threading.Event()
+    started = threading.Event()
+    order: list[str] = []
+
+    def blocking_merge() -> None:
+        started.set()
+        release.wait(5)
+        order.append("merge-1")
+
+    first = store.submit_write(blocking_merge, priority=WritePriority.BULK)
+    assert started.wait(5)
+    second = store.submit_write(lambda: order.append("merge-2"), priority=WritePriority.BULK)
+    interactive = [
+        store.submit_write(lambda rel=rel: order.append(rel) or store.set_favorite_status(rel, True))
+        for rel in ("a.jpg", "b.jpg")
+    ]
+    release.set()
+
+    for future in (first, second, *interactive):
+        future.result(5)
+    assert order == ["merge-1", "a.jpg", "b.jpg", "merge-2"]
+    assert _favorites(store) == {"a.jpg": 1, "b.jpg": 1}
+
+    histograms = store.commit_latency_histograms()
+    assert histograms["interactive"]["count"] == 2
+    assert histograms["bulk"]["count"] >= 3
+    assert sum(count for _bound, count in histograms["interactive"]["buckets"]) == 2
+
+
+def test_failed_command_does_not_undo_its_group(store: IndexStore) -> None:
+    store.write_rows([{"rel": "a.jpg"}, {"rel": "b.jpg"}])
+    release = threading.Event()
+    started = threading.Event()
+
+    def hold_writer() -> None:
+        started.set()
+        release.wait(5)
+
+    def fail_after_write() -> None:
+        store.set_favorite_status("b.jpg", True)
+        raise RuntimeError("boom")
+
+    blocker = store.submit_write(hold_writer)
+    assert started.wait(5)
+    ok = store.submit_write(lambda: store.set_favorite_status("a.jpg", True))
+    failed = store.submit_write(fail_after_write)
+    release.set()
+
+    blocker.result(5)
+    ok.result(5)
+    with pytest.raises(RuntimeError, match="boom"):
+        failed.result(5)
+    assert _favorites(store) == {"a.jpg": 1, "b.jpg": 0}
+
+
+def test_writes_inside_a_transaction_join_it(store: IndexStore) -> None:
+    store.write_rows([{"rel": "a.jpg"}])
+
+    with pytest.raises(RuntimeError):
+        with store.transaction(begin_mode="IMMEDIATE"):
+            store.set_favorite_status("a.jpg", True)
+            raise RuntimeError("abort")
+    assert _favorites(store) == {"a.jpg": 0}
+
+    with store.transaction(begin_mode="IMMEDIATE"):
+        store.set_favorite_status("a.jpg", True)
+    assert _favorites(store) == {"a.jpg": 1}
+
+
+def test_readers_are_pooled_per_thread(store: IndexStore) -> None:
+    manager = store._db_manager
+    conn = manager.get_connection()
+    conn.row_factory = dict
+    conn.close()
+    again = manager.get_connection()
+    assert again is conn
+    assert again.row_factory is None
+    assert again.execute("SELECT 1").fetchone() == (1,)
+
+    other: list[object] = []
+    thread = threading.Thread(target=lambda: other.append(manager.get_connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not conn
+
+    manager.close()
+    assert manager.get_connection() is not conn
+
+
+def test_readers_are_released_when_their_thread_exits(store: IndexStore) -> None:
+    manager = store._db_manager
+    for _ in range(50):
+        thread = threading.Thread(target=lambda: manager.get_connection().execute("SELECT 1"))
+        thread.start()
+        thread.join()
+    gc.collect()
+    assert len(manager._readers) <= 1
+
+
+def test_close_leaves_other_threads_readers_to_their_owner(store: IndexStore) -> None:
+    manager = store._db_manager
+    opened = threading.Event()
+    closed = threading.Event()
+    seen: list[object] = []
+
+    def read() -> None:
+        conn = manager.get_connection()
+        opened.set()
+        closed.wait(5)
+        seen.append(conn.execute("SELECT 1").fetchone())
+        seen.append(manager.get_connection() is not conn)
+
+    thread = threading.Thread(target=read)
+    thread.start()
+    opened.wait(5)
+    manager.close()
+    closed.set()
+    thread.join()
+    gc.collect()
+
+    assert seen == [(1,), True]
+    manager.get_connection()
+    assert len(manager._readers) == 1
+
+
+def test_commit_hooks_run_after_the_group_commits(store: IndexStore) -> None:
+    store.write_rows([{"rel": "a.jpg"}, {"rel": "b.jpg"}])
+    manager = store._db_manager
+    release = threading.Event()
+    started = threading.Event()
+    seen: list[tuple[str, int]] = []
+
+    def committed_favorite(rel: str) -> None:
+        conn = sqlite3.connect(manager.db_path)
+        try:
+            row = conn.execute("SELECT is_favorite FROM assets WHERE rel = ?", (rel,)).fetchone()
+        finally:
+            conn.close()
+        seen.append((rel, row[0]))
+
+    def hold_writer() -> None:
+        started.set()
+        release.wait(5)
+
+    def favorite(rel: str, *, fail: bool = False) -> None:
+        store.set_favorite_status(rel, True)
+        manager.call_after_commit(lambda: committed_favorite(rel))
+        if fail:
+            raise RuntimeError("boom")
+
+    blocker = store.submit_write(hold_writer)
+    assert started.wait(5)
+    ok = store.submit_write(lambda: favorite("a.jpg"))
+    failed = store.submit_write(lambda: favorite("b.jpg", fail=True))
+    release.set()
+
+    blocker.result(5)
+    ok.result(5)
+    with pytest.raises(RuntimeError, match="boom"):
+        failed.result(5)
+    assert seen == [("a.jpg", 1)]
@@ -117,6 +117,111 @@ class TestGetRowsByRels:
         assert row["media_type"] == "image"
 
 
+class TestMoveRows:
+    """Verify AssetRepository.move_rows() re-keys rows in place."""
+
+    @pytest.fixture()
+    def repo(self, tmp_path: Path) -> AssetRepository:
+        repo = AssetRepository(tmp_path)
+        repo.append_rows([
+            {
+                "rel": "A/photo.jpg",
+                "id": "id1",
+                "make": "Kept Camera",
+                "micro_thumbnail": b"micro",
+                "thumb_cache_key": "old-key",
+                "thumbnail_state": "ready",
+            },
+            {"rel": "B/photo.jpg", "id": "stale"},
+        ])
+        yield repo
+        repo.close()
+
+    def test_rekeys_rows_and_keeps_metadata(self, repo: AssetRepository) -> None:
+        moved = repo.move_rows([
+            {
+                "old_rel": "A/photo.jpg",
+                "rel": "B/photo.jpg",
+                "parent_album_path": "B",
+                "is_deleted": 0,
+                "thumbnail_state": "ready",
+                "thumb_cache_key": "new-key",
+            }
+        ])
+
+        rows = repo.get_rows_by_rels(["A/photo.jpg", "B/photo.jpg"])
+        assert moved == 1
+        assert list(rows) == ["B/photo.jpg"]
+        row = rows["B/photo.jpg"]
+        assert row["id"] == "id1"
+        assert row["parent_album_path"] == "B"
+        assert row["make"] == "Kept Camera"
+        assert row["micro_thumbnail"] == b"micro"
+        assert row["thumb_cache_key"] == "new-key"
+
+    def test_empty_input(self, repo: AssetRepository) -> None:
+        assert repo.move_rows([]) == 0
+
+
+class TestTrashLedger:
+    """Verify the trash ledger follows rows into and out of Recently Deleted."""
+
+    @pytest.fixture()
+    def repo(self, tmp_path: Path) -> AssetRepository:
+        repo = AssetRepository(tmp_path)
+        repo.append_rows([{"rel": "A/photo.jpg", "id": "id1"}])
+        yield repo
+        repo.close()
+
+    def test_move_into_trash_records_entry_and_restore_drops_it(
+        self, repo: AssetRepository
+    ) -> None:
+        repo.move_rows([
+            {
+                "old_rel": "A/photo.jpg",
+                "rel": ".Trash/photo.jpg",
+                "parent_album_path": ".Trash",
+                "is_deleted": 1,
+                "original_rel_path": "A/photo.jpg",
+            }
+        ])
+
+        entry = repo.read_trash_entries([".Trash/photo.jpg"])[".Trash/photo.jpg"]
+        assert entry.original_rel_path == "A/photo.jpg"
+        assert entry.expires_at > entry.deleted_at
+
+        # A rescan without restore columns keeps the recorded ones.
+        repo.append_rows([{"rel": ".Trash/photo.jpg", "id": "id1", "is_deleted": 1}])
+        assert repo.read_trash_window() == [entry]
+
+        repo.move_rows([
+            {
+                "old_rel": ".Trash/photo.jpg",
+                "rel": "A/photo.jpg",
+                "parent_album_path": "A",
+                "is_deleted": 0,
+            }
+        ])
+        assert repo.read_trash_window() == []
+
+    def test_window_pages_by_deletion_time(self, repo: AssetRepository) -> None:
+        repo.append_rows(
+            {"rel": f".Trash/{index}.jpg", "id": f"t{index}", "is_deleted": 1}
+            for index in range(5)
+        )
+
+        first = repo.read_trash_window(limit=3)
+        rest = repo.read_trash_window((first[-1].deleted_at, first[-1].rel), 3)
+
+        assert len(first) == 3
+        assert {entry.rel for entry in first + rest} == {
+            f".Trash/{index}.jpg" for index in range(5)
+        }
+        assert repo.read_trash_window(expired_before=first[0].deleted_at) == []
+        repo.remove_rows([".Trash/0.jpg"])
+        assert ".Trash/0.jpg" not in repo.read_trash_entries([".Trash/0.jpg"])
+
+
 # ------------------------------------------------------------------
 # Plan 1 §5.2: MoveOperationResult
 # ------------------------------------------------------------------
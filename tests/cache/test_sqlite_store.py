@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import time
 from pathlib import Path
+from datetime import datetime
 import pytest
 from iPhoto.cache.index_store import IndexStore, GLOBAL_INDEX_DB_NAME
+from iPhoto.domain.models.query import CollectionQuery, CollectionType, TimelineGranularity
 from iPhoto.config import WORK_DIR_NAME
 
 @pytest.fixture
@@ -491,6 +494,150 @@ def test_count_album_assets(store: IndexStore) -> None:
     assert store.count_album_assets("Album1", include_subalbums=True) == 3
 
 
+def test_read_album_stats_rolls_up_sub_albums(store: IndexStore) -> None:
+    store.write_rows([
+        {"rel": "Trips/a.jpg", "id": "1", "dt": "2023-01-01T00:00:00Z", "ts": 10,
+         "bytes": 100, "media_type": 0, "is_favorite": 1},
+        {"rel": "Trips/Rome/b.mov", "id": "2", "dt": "2023-06-01T00:00:00Z", "ts": 20,
+         "bytes": 50, "media_type": 1},
+        {"rel": "Trips/Rome/c.mov", "id": "3", "media_type": 1, "live_role": 1},
+        {"rel": "Other/d.jpg", "id": "4", "media_type": 0},
+    ])
+
+    stats = store.read_album_stats()
+
+    trips = stats["Trips"]
+    assert trips.direct.asset_count == 1
+    assert trips.direct.favorite_count == 1
+    assert trips.recursive.asset_count == 2
+    assert (trips.recursive.photo_count, trips.recursive.video_count) == (1, 1)
+    assert trips.recursive.total_bytes == 150
+    assert (trips.recursive.first_ts, trips.recursive.last_ts) == (10, 20)
+    assert trips.recursive.cover_rel == "Trips/Rome/b.mov"
+    assert stats["Trips/Rome"].direct.asset_count == 1
+    assert store.count_album_assets("Trips", include_subalbums=True) == 2
+    assert store.count_album_assets("Trips/Rome") == 1
+
+
+def test_album_stats_follow_incremental_writes(store: IndexStore) -> None:
+    store.write_rows([
+        {"rel": "A/a.jpg", "id": "1", "dt": "2023-01-01T00:00:00Z"},
+        {"rel": "B/b.jpg", "id": "2"},
+    ])
+    assert store.list_albums() == ["A", "B"]
+
+    store.set_favorite_status("A/a.jpg", True)
+    store.merge_scan_rows([{"rel": "A/new.jpg", "id": "3", "dt": "2024-01-01T00:00:00Z"}])
+    store.remove_rows(["B/b.jpg"])
+
+    stats = store.read_album_stats()
+    assert set(stats) == {"A"}
+    assert stats["A"].direct.favorite_count == 1
+    assert stats["A"].direct.asset_count == 2
+    assert stats["A"].direct.cover_rel == "A/new.jpg"
+    assert store.list_albums() == ["A"]
+
+
+def _timeline_row(rel: str, asset_id: str, day: str, **extra) -> dict:
+    ts = int(datetime.fromisoformat(f"{day}T12:00:00+00:00").timestamp() * 1_000_000)
+    return {"rel": rel, "id": asset_id, "ts": ts, "media_type": 0, **extra}
+
+
+def test_read_timeline_maps_rows_to_dates_and_back(store: IndexStore) -> None:
+    store.write_rows([
+        _timeline_row("A/1.jpg", "1", "2024-03-02"),
+        _timeline_row("A/2.jpg", "2", "2024-03-02"),
+        _timeline_row("A/3.jpg", "3", "2024-01-15", is_favorite=1),
+        _timeline_row("B/4.jpg", "4", "2023-12-31"),
+        {"rel": "B/5.jpg", "id": "5", "media_type": 0},
+    ])
+    query = CollectionQuery(min_thumbnail_state=None)
+
+    timeline = store.read_timeline(query)
+
+    assert [(b.year, b.month, b.day, b.count, b.first_row) for b in timeline.buckets] == [
+        (2024, 3, 2, 2, 0),
+        (2024, 1, 15, 1, 2),
+        (2023, 12, 31, 1, 3),
+        (None, None, None, 1, 4),
+    ]
+    assert timeline.total_count == store.count_collection(query)
+    years = timeline.rollup(TimelineGranularity.YEAR)
+    assert [(b.year, b.count, b.first_row) for b in years] == [
+        (2024, 3, 0), (2023, 1, 3), (None, 1, 4),
+    ]
+    assert timeline.bucket_at(2, TimelineGranularity.MONTH).month == 1
+    assert timeline.row_for_date(2024, 2) == 2
+    assert timeline.row_for_date(2020) == 4
+    album = store.read_timeline(CollectionQuery(
+        collection_type=CollectionType.ALBUM,
+        album_path="B",
+        min_thumbnail_state=None,
+    ))
+    assert [b.count for b in album.buckets] == [1, 1]
+
+
+@pytest.fixture
+def local_zone(monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is unavailable on this platform")
+
+    def _set(zone: str) -> None:
+        monkeypatch.setenv("TZ", zone)
+        time.tzset()
+
+    yield _set
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_read_timeline_buckets_by_local_day_near_midnight(tmp_path: Path, local_zone) -> None:
+    def _at(rel: str, asset_id: str, instant: str) -> dict:
+        ts = int(datetime.fromisoformat(instant).timestamp() * 1_000_000)
+        return {"rel": rel, "id": asset_id, "ts": ts, "media_type": 0}
+
+    local_zone("Asia/Tokyo")
+    store = IndexStore(tmp_path)
+    store.write_rows([
+        _at("A/late.jpg", "1", "2024-05-01T14:30:00+00:00"),
+        _at("A/early.jpg", "2", "2024-05-01T15:30:00+00:00"),
+    ])
+    query = CollectionQuery(min_thumbnail_state=None)
+
+    days = [(b.month, b.day, b.count) for b in store.read_timeline(query).buckets]
+    assert days == [(5, 2, 1), (5, 1, 1)]
+    filtered = store.read_timeline(CollectionQuery(min_thumbnail_state=None, has_gps=False))
+    assert [(b.month, b.day, b.count) for b in filtered.buckets] == days
+
+    local_zone("America/New_York")
+    reopened = IndexStore(tmp_path)
+    assert [(b.month, b.day, b.count) for b in reopened.read_timeline(query).buckets] == [
+        (5, 1, 2),
+    ]
+
+
+def test_read_timeline_follows_merges_favorites_and_removals(store: IndexStore) -> None:
+    store.write_rows([
+        _timeline_row("A/1.jpg", "1", "2024-03-02"),
+        _timeline_row("A/2.jpg", "2", "2024-01-15"),
+    ])
+    favorites = CollectionQuery(
+        collection_type=CollectionType.FAVORITES,
+        min_thumbnail_state=None,
+    )
+    assert store.read_timeline(favorites).buckets == []
+
+    store.set_favorite_status("A/2.jpg", True)
+    store.merge_scan_rows([_timeline_row("A/3.jpg", "3", "2024-03-02")])
+    store.remove_rows(["A/1.jpg"])
+
+    assert [(b.month, b.count) for b in store.read_timeline(favorites).buckets] == [(1, 1)]
+    everything = store.read_timeline(CollectionQuery(min_thumbnail_state=None))
+    assert [(b.month, b.count) for b in everything.buckets] == [(3, 1), (1, 1)]
+    gps_only = store.read_timeline(CollectionQuery(has_gps=False, min_thumbnail_state=None))
+    assert [(b.month, b.count) for b in gps_only.buckets] == [(3, 1), (1, 1)]
+
+
 def test_album_path_with_special_chars(store: IndexStore) -> None:
     """Test that album paths containing SQL LIKE wildcards are handled correctly."""
     rows = [
@@ -2171,3 +2171,69 @@ def test_mid_scroll_rescan_updates_gallery_after_single_scan_finished(tmp_path:
     assert visible_dto is not None
     assert visible_dto.rel_path == Path("asset_119.jpg")
     assert store.asset_at(0) is None
+
+
+def _load_async_window(store: GalleryCollectionStore, requests: list, count: int) -> None:
+    request = requests[-1]
+    rows = {}
+    for row in range(count):
+        dto = scan_row_to_dto(
+            Path("."),
+            f"asset_{row}.jpg",
+            {"id": f"asset-{row}", "rel": f"asset_{row}.jpg", "media_type": 0},
+        )
+        assert dto is not None
+        rows[row] = dto
+    assert store.apply_window_result(
+        GalleryWindowResult(
+            generation=request.generation,
+            first=0,
+            last=count - 1,
+            rows=rows,
+            total_count=count,
+            collection_revision=42,
+            requested_revision=request.collection_revision,
+        )
+    )
+
+
+def test_revisited_query_paints_snapshot_before_revalidating() -> None:
+    service = _FakeQueryService([])
+    requests: list[GalleryWindowRequest] = []
+    restored: list[int] = []
+    store = GalleryCollectionStore(service, library_root=Path("."))
+    store.set_window_request_handler(requests.append)
+    store.scroll_restored.connect(restored.append)
+    store.load_selection(Path("."), query=AssetQuery())
+    _load_async_window(store, requests, 5)
+    store.prioritize_rows(2, 4)
+
+    store.load_selection(Path("."), query=AssetQuery(is_favorite=True))
+    assert store.count() == 0
+    requests.clear()
+
+    store.load_selection(Path("."), query=AssetQuery())
+
+    assert store.count() == 5
+    assert store.asset_at(0) is not None
+    assert store.asset_at(0).rel_path == Path("asset_0.jpg")
+    assert restored == [2]
+    assert len(requests) == 1
+    assert requests[0].view_first <= 2
+
+
+def test_scan_rows_in_scope_drop_the_snapshot() -> None:
+    service = _FakeQueryService([])
+    requests: list[GalleryWindowRequest] = []
+    store = GalleryCollectionStore(service, library_root=Path("."))
+    store.set_window_request_handler(requests.append)
+    store.load_selection(Path("."), query=AssetQuery())
+    _load_async_window(store, requests, 5)
+    store.load_selection(Path("."), query=AssetQuery(is_favorite=True))
+
+    store.record_scan_batch(
+        SimpleNamespace(root=Path("."), rows=[{"rel": "new.jpg", "id": "new"}], job_id="scan")
+    )
+    store.load_selection(Path("."), query=AssetQuery())
+
+    assert store.count() == 0
@@ -5,6 +5,7 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+from PIL import Image
 from PySide6.QtCore import QModelIndex, Qt
 from PySide6.QtGui import QImage
 
@@ -21,6 +22,8 @@ from iPhoto.gui.viewmodels.gallery_thumbnail_hint_loader import (
 )
 from iPhoto.gui.viewmodels.gallery_tile import GalleryTileSnapshot
 from iPhoto.infrastructure.services.thumbnail_cache_service import ThumbnailCacheService
+from iPhoto.utils.image_loader import qimage_from_micro_thumbnail
+from iPhoto.utils.micro_thumbnail import encode_micro_thumbnail
 
 
 class _Signal:
@@ -288,6 +291,8 @@ def test_tile_snapshot_is_micro_first_and_memory_only(adapter, mock_store, mock_
     assert snapshot.loading_state == "micro"
     assert snapshot.micro_image is micro
     assert snapshot.full_pixmap is None
+    assert snapshot.micro_atlas is not None
+    assert snapshot.micro_atlas_rect.size() == micro.size()
     mock_store.ensure_row_loaded.assert_not_called()
     mock_thumb_service.request_many.assert_not_called()
 
@@ -1110,3 +1115,26 @@ def test_source_change_count_change_still_resets_model(adapter, mock_store):
 
     assert reset_count == 2
     assert changed_ranges == []
+
+
+def test_removed_rows_release_their_micro_atlas_cells(adapter, mock_store):
+    micro = qimage_from_micro_thumbnail(encode_micro_thumbnail(Image.new("RGB", (4, 4))))
+    mock_store.count.return_value = 1
+    mock_store.asset_at.return_value = _make_dto(micro_thumbnail=micro)
+    adapter.data(adapter.index(0, 0), Roles.TILE_SNAPSHOT)
+    assert len(adapter._micro_atlas) == 1
+
+    assert adapter.removeRows(0, 1)
+
+    assert len(adapter._micro_atlas) == 0
+
+
+def test_rebind_asset_query_service_clears_micro_atlas(adapter, mock_store):
+    micro = qimage_from_micro_thumbnail(encode_micro_thumbnail(Image.new("RGB", (4, 4))))
+    mock_store.count.return_value = 1
+    mock_store.asset_at.return_value = _make_dto(micro_thumbnail=micro)
+    adapter.data(adapter.index(0, 0), Roles.TILE_SNAPSHOT)
+
+    adapter.rebind_asset_query_service(MagicMock(), Path("/library"))
+
+    assert len(adapter._micro_atlas) == 0
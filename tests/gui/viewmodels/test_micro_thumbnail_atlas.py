@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import pytest
+from PIL import Image
+
+from iPhoto.gui.viewmodels.micro_thumbnail_atlas import MicroThumbnailAtlas
+from iPhoto.utils.image_loader import qimage_from_micro_thumbnail
+from iPhoto.utils.micro_thumbnail import encode_micro_thumbnail
+
+
+@pytest.fixture(autouse=True)
+def _qt_app(qapp):
+    return qapp
+
+
+def _micro(color: tuple[int, int, int], size: tuple[int, int] = (16, 16)):
+    return qimage_from_micro_thumbnail(encode_micro_thumbnail(Image.new("RGB", size, color)))
+
+
+def test_atlas_packs_micro_images_into_padded_cells() -> None:
+    atlas = MicroThumbnailAtlas(capacity=4)
+
+    red = atlas.rect_for("a", _micro((255, 0, 0), (16, 8)))
+    blue = atlas.rect_for("b", _micro((0, 0, 255)))
+
+    assert (red.width(), red.height()) == (16, 8)
+    assert not red.intersects(blue)
+    image = atlas.image
+    assert image.pixelColor(red.topLeft()).red() > 240
+    assert image.pixelColor(blue.bottomRight()).blue() > 240
+    # The border repeats the edge pixels so bilinear sampling stays in the cell.
+    assert image.pixelColor(red.left() - 1, red.top() - 1).red() > 240
+    assert image.pixelColor(blue.right() + 1, blue.top()).blue() > 240
+
+
+def test_atlas_reuses_cells_and_evicts_least_recently_used() -> None:
+    atlas = MicroThumbnailAtlas(capacity=2)
+    first = _micro((255, 0, 0))
+    second = _micro((0, 255, 0))
+
+    rect_a = atlas.rect_for("a", first)
+    rect_b = atlas.rect_for("b", second)
+    assert atlas.rect_for("a", first) == rect_a
+
+    rect_c = atlas.rect_for("c", _micro((0, 0, 255)))
+
+    assert rect_c == rect_b
+    assert len(atlas) == 2
+    assert atlas.image.pixelColor(rect_c.topLeft()).blue() > 240
+
+    replacement = _micro((255, 255, 255))
+    assert atlas.rect_for("a", replacement) == rect_a
+    assert atlas.image.pixelColor(rect_a.topLeft()).green() > 240
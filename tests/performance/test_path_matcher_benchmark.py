@@ -0,0 +1,80 @@
+"""Benchmarks for the compiled discovery include/exclude matcher."""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import time
+
+import pytest
+
+from iPhoto.config import DEFAULT_EXCLUDE, DEFAULT_INCLUDE
+from iPhoto.utils.pathutils import _expand, compile_path_matcher
+
+
+BASELINE_PATHS = 100_000
+STRESS_PATHS = 1_000_000
+
+MAX_BASELINE_SECONDS = 2.0
+
+
+def _synthetic_rels(count: int) -> list[str]:
+    suffixes = ("jpg", "HEIC", "mov", "CR3", "txt", "json", "png", "xmp")
+    rels = []
+    for index in range(count):
+        album = f"Album {index % 2_000:04d}"
+        suffix = suffixes[index % len(suffixes)]
+        if index % 97 == 0:
+            rels.append(f"{album}/._IMG_{index:07d}.{suffix}")
+        elif index % 101 == 0:
+            rels.append(f".Trash/{album}/IMG_{index:07d}.{suffix}")
+        else:
+            rels.append(f"{album}/Sub {index % 7}/IMG_{index:07d}.{suffix}")
+    return rels
+
+
+def _legacy_matches(rel: str) -> bool:
+    def _hit(globs: list[str]) -> bool:
+        for pattern in globs:
+            for expanded in _expand(pattern):
+                if fnmatch.fnmatch(rel, expanded):
+                    return True
+                if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
+                    return True
+        return False
+
+    return not _hit(DEFAULT_EXCLUDE) and _hit(DEFAULT_INCLUDE)
+
+
+def _measure(count: int) -> tuple[float, int]:
+    rels = _synthetic_rels(count)
+    matcher = compile_path_matcher(DEFAULT_INCLUDE, DEFAULT_EXCLUDE)
+    started = time.perf_counter()
+    matched = sum(1 for rel in rels if matcher.matches_rel(rel))
+    return time.perf_counter() - started, matched
+
+
+def test_compiled_matcher_agrees_with_legacy_on_sample() -> None:
+    matcher = compile_path_matcher(DEFAULT_INCLUDE, DEFAULT_EXCLUDE)
+    for rel in _synthetic_rels(2_000):
+        assert matcher.matches_rel(rel) == _legacy_matches(rel), rel
+
+
+def test_compiled_matcher_performance_baseline() -> None:
+    elapsed, matched = _measure(BASELINE_PATHS)
+
+    assert 0 < matched < BASELINE_PATHS
+    assert elapsed < MAX_BASELINE_SECONDS, (
+        f"compiled matcher baseline took {elapsed:.3f}s for {BASELINE_PATHS} paths"
+    )
+
+
+@pytest.mark.skipif(
+    os.environ.get("IPHOTO_RUN_STRESS") != "1",
+    reason="Set IPHOTO_RUN_STRESS=1 to run the million-path matcher benchmark.",
+)
+def test_stress_compiled_matcher_million_paths() -> None:
+    elapsed, matched = _measure(STRESS_PATHS)
+
+    assert 0 < matched < STRESS_PATHS
+    assert elapsed < MAX_BASELINE_SECONDS * (STRESS_PATHS / BASELINE_PATHS)
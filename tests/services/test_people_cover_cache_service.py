@@ -11,6 +11,7 @@ from PySide6.QtGui import QImage
 from PySide6.QtWidgets import QApplication
 
 from iPhoto.infrastructure.services.people_cover_cache_service import (
+    PeopleCoverBatchRenderTask,
     PeopleCoverCacheService,
     PeopleCoverRenderTask,
     PeopleCoverWorkerSignals,
@@ -73,3 +74,32 @@ def test_handle_render_result_skips_cache_write_during_shutdown(
 
     assert service.cached_pixmap("cache-key") is None
     assert not (tmp_path / "people-covers" / "cache-key.png").exists()
+
+
+def test_batch_render_task_emits_one_cover_per_packed_crop(
+    qapp: QApplication, tmp_path: Path
+) -> None:
+    from PIL import Image
+
+    from iPhoto.people.face_crop_store import close_face_crop_stores, store_face_crop
+
+    thumbnail_dir = tmp_path / "faces" / "thumbnails"
+    image = Image.new("RGB", (200, 200), color=(10, 200, 30))
+    present = store_face_crop(image, (50, 50, 80, 80), thumbnail_dir / "face-a.png")
+    captured: dict[str, QImage] = {}
+    signals = PeopleCoverWorkerSignals()
+    signals.result.connect(lambda cache_key, cover: captured.__setitem__(cache_key, cover))
+
+    try:
+        PeopleCoverBatchRenderTask(
+            requests=[("key-a", present), ("key-b", thumbnail_dir / "missing.png")],
+            size=(40, 30),
+            signals=signals,
+        ).run()
+    finally:
+        close_face_crop_stores()
+
+    assert set(captured) == {"key-a", "key-b"}
+    assert captured["key-a"].size().width() == 40
+    assert captured["key-a"].size().height() == 30
+    assert captured["key-b"].isNull()
@@ -22,7 +22,7 @@ class _FakeLifecycleService:
         self.read_roots: list[Path] = []
         self.read_rels: list[list[str]] = []
 
-    def read_restore_index_rows(self, trash_root: Path) -> list[dict]:
+    def read_restore_index_rows(self, trash_root: Path, paths=None) -> list[dict]:
         self.read_roots.append(Path(trash_root))
         return list(self.rows)
 
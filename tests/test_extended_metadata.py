@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from iPhoto.bootstrap.library_asset_query_service import LibraryAssetQueryService
+from iPhoto.cache.index_store import IndexStore
+from iPhoto.io.extended_metadata import (
+    decode_extended_metadata,
+    encode_extended_metadata,
+    extract_extended_metadata,
+)
+
+
+def test_extended_metadata_round_trips_with_version() -> None:
+    payload = {
+        "SourceFile": "/tmp/IMG_0001.jpg",
+        "ExifIFD": {"LensMake": "Apple", "ExposureProgram": 2, "Flash": 16},
+        "GPS": {"GPSAltitude": 12.5},
+        "Composite": {"FocalLengthIn35mmFormat": 26},
+    }
+
+    extended = extract_extended_metadata(payload)
+    decoded = decode_extended_metadata(encode_extended_metadata(extended))
+
+    assert decoded == {
+        "lens_make": "Apple",
+        "exposure_program": 2,
+        "flash": 16,
+        "gps_altitude": 12.5,
+        "focal_length_35mm": 26,
+    }
+    assert decode_extended_metadata(None) is None
+    assert decode_extended_metadata('{"v":0,"flash":16}') is None
+
+
+def test_extended_metadata_derives_bit_rate_from_size_and_duration() -> None:
+    extended = extract_extended_metadata({}, {"bytes": 1_000_000, "dur": 8.0})
+
+    assert extended == {"bit_rate": 1_000_000}
+
+
+def test_query_service_reads_and_stores_asset_details(tmp_path: Path) -> None:
+    store = IndexStore(tmp_path)
+    store.write_rows(
+        [
+            {"rel": "old.jpg", "id": "old", "ts": 1, "media_type": 0, "make": "Canon"},
+            {
+                "rel": "new.jpg",
+                "id": "new",
+                "ts": 2,
+                "media_type": 0,
+                "iso": 200,
+                "extended_meta": encode_extended_metadata({"flash": 0}),
+            },
+        ]
+    )
+    service = LibraryAssetQueryService(tmp_path, repository_factory=lambda _root: store)
+    try:
+        assert service.read_asset_details(tmp_path / "old.jpg") is None
+        assert service.read_asset_details(tmp_path / "new.jpg") == {"iso": 200, "flash": 0}
+
+        assert service.store_asset_details(
+            tmp_path / "old.jpg",
+            {"iso": 400, "lens": "RF 24-70", "make": None},
+            {"metering_mode": 5},
+        )
+        assert service.read_asset_details(tmp_path / "old.jpg") == {
+            "make": "Canon",
+            "lens": "RF 24-70",
+            "iso": 400,
+            "metering_mode": 5,
+        }
+    finally:
+        service.shutdown()
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from iPhoto.people.face_crop_store import (
+    FaceCropStore,
+    close_face_crop_stores,
+    face_crop_signature,
+    load_face_crops,
+    open_face_crop_store,
+    read_face_crop_bytes,
+    store_face_crop,
+)
+
+
+@pytest.fixture(autouse=True)
+def _close_stores():
+    yield
+    close_face_crop_stores()
+
+
+def _solid(color: tuple[int, int, int], size: int = 64) -> Image.Image:
+    return Image.new("RGB", (size, size), color=color)
+
+
+def _pack_files(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.glob("face_crops-*.pack"))
+
+
+def test_store_round_trips_crops_in_one_pack(tmp_path: Path) -> None:
+    store = FaceCropStore(tmp_path / "thumbnails")
+
+    assert store.put_many([("a", _solid((255, 0, 0))), ("b", _solid((0, 0, 255)))]) == 2
+
+    images = store.load_many(["a", "b", "missing"])
+    assert set(images) == {"a", "b"}
+    assert images["a"].getpixel((32, 32))[0] > 200
+    assert images["b"].getpixel((32, 32))[2] > 200
+    assert _pack_files(tmp_path / "thumbnails") == ["face_crops-0.pack"]
+    assert not list((tmp_path / "thumbnails").glob("*.png"))
+    store.close()
+
+
+def test_rewriting_a_crop_changes_its_signature(tmp_path: Path) -> None:
+    store = FaceCropStore(tmp_path)
+    store.put("a", _solid((255, 0, 0)))
+    first = store.signature("a")
+
+    store.put("a", _solid((0, 255, 0)))
+
+    assert store.signature("a") not in {None, first}
+    assert store.load("a").getpixel((10, 10))[1] > 200
+    assert store.signature("missing") is None
+    store.close()
+
+
+def test_garbage_collection_drops_dead_crops_and_compacts(tmp_path: Path) -> None:
+    store = FaceCropStore(tmp_path)
+    store.put_many([(f"face-{index}", _solid((index * 20, 0, 0))) for index in range(6)])
+
+    removed = store.collect_garbage(["face-0"], grace_seconds=0)
+
+    assert removed == 5
+    assert _pack_files(tmp_path) == ["face_crops-1.pack"]
+    assert set(store.load_many(f"face-{index}" for index in range(6))) == {"face-0"}
+    assert store.load("face-0") is not None
+    store.close()
+
+
+def test_garbage_collection_keeps_recent_uncommitted_crops(tmp_path: Path) -> None:
+    store = FaceCropStore(tmp_path)
+    store.put("fresh", _solid((1, 2, 3)))
+
+    assert store.collect_garbage([]) == 0
+    assert store.contains("fresh")
+    store.close()
+
+
+def test_migration_packs_loose_png_thumbnails_once(tmp_path: Path) -> None:
+    thumbnail_dir = tmp_path / "thumbnails"
+    thumbnail_dir.mkdir()
+    _solid((0, 255, 0)).save(thumbnail_dir / "legacy.png")
+    legacy_path = thumbnail_dir / "legacy.png"
+    assert load_face_crops([legacy_path])[legacy_path].getpixel((5, 5))[1] == 255
+
+    store = open_face_crop_store(thumbnail_dir, create=True)
+    assert store.migrate_loose_files() == 1
+
+    assert not legacy_path.exists()
+    assert read_face_crop_bytes(legacy_path) is not None
+    assert face_crop_signature(legacy_path).startswith("pack:")
+    _solid((0, 0, 255)).save(thumbnail_dir / "late.png")
+    assert store.migrate_loose_files() == 0
+
+
+def test_store_face_crop_and_batch_loads_resolve_logical_paths(tmp_path: Path) -> None:
+    thumbnail_dir = tmp_path / "faces" / "thumbnails"
+    image = Image.new("RGB", (400, 300), color=(200, 100, 50))
+    first = store_face_crop(image, (100, 80, 60, 60), thumbnail_dir / "one.png")
+    second = store_face_crop(image, (10, 10, 50, 50), thumbnail_dir / "two.png")
+
+    crops = load_face_crops([first, second, thumbnail_dir / "gone.png"])
+
+    assert set(crops) == {first, second}
+    assert all(min(crop.size) >= 160 for crop in crops.values())
+    assert open_face_crop_store(tmp_path / "elsewhere") is None
+    assert not (tmp_path / "elsewhere").exists()
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from iPhoto.people.face_crop_store import load_face_crop
+from iPhoto.people.face_scan_engine import FaceScanEngine
+from iPhoto.people.image_utils import load_image_rgb_for_detection
+
+
+class _StubDetector:
+    """Return one face covering the centre quarter of every image."""
+
+    def __init__(self, *, on_get=None) -> None:
+        self.shapes: list[tuple[int, ...]] = []
+        self._on_get = on_get
+
+    def get(self, image_bgr: np.ndarray) -> list[SimpleNamespace]:
+        if self._on_get is not None:
+            self._on_get()
+        self.shapes.append(image_bgr.shape)
+        height, width = image_bgr.shape[:2]
+        return [
+            SimpleNamespace(
+                bbox=np.array([width / 4, height / 4, width * 3 / 4, height * 3 / 4]),
+                det_score=0.9,
+                embedding=np.ones(8, dtype=np.float32),
+            )
+        ]
+
+
+def _write_jpeg(path: Path, size: tuple[int, int], *, orientation: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    exif = Image.Exif()
+    if orientation is not None:
+        exif[0x0112] = orientation
+    Image.new("RGB", size, color=(120, 90, 60)).save(path, format="JPEG", exif=exif)
+
+
+@pytest.fixture
+def engine_factory():
+    engines: list[FaceScanEngine] = []
+
+    def create(detector, **kwargs) -> FaceScanEngine:
+        engine = FaceScanEngine(detector, **kwargs)
+        engines.append(engine)
+        return engine
+
+    yield create
+    for engine in engines:
+        engine.close()
+
+
+def test_load_image_for_detection_downscales_and_reports_oriented_source_size(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "rotated.jpg"
+    _write_jpeg(path, (4000, 3000), orientation=6)
+
+    image, source_size = load_image_rgb_for_detection(path, max_side=1000)
+
+    assert max(image.size) <= 1000
+    assert image.width < image.height
+    assert source_size == (3000, 4000)
+
+
+def test_engine_maps_working_resolution_boxes_back_to_source(
+    tmp_path: Path,
+    engine_factory,
+) -> None:
+    _write_jpeg(tmp_path / "album" / "a.jpg", (2400, 1600))
+    detector = _StubDetector()
+    engine = engine_factory(detector, working_size=600)
+
+    results = engine.detect(
+        [{"id": "asset-a", "rel": "album/a.jpg"}],
+        library_root=tmp_path,
+        thumbnail_dir=tmp_path / "faces" / "thumbs",
+    )
+
+    assert detector.shapes == [(400, 600, 3)]
+    [result] = results
+    [face] = result.faces
+    assert (face.image_width, face.image_height) == (2400, 1600)
+    assert (face.box_x, face.box_y, face.box_w, face.box_h) == (600, 400, 1200, 800)
+    assert face.thumbnail_path.startswith("thumbs/")
+    crop = load_face_crop(tmp_path / "faces" / face.thumbnail_path)
+    assert crop is not None and crop.width == crop.height
+    stats = engine.stage_stats()
+    assert {stage: stats[stage].images for stage in stats} == {
+        "decode": 1,
+        "detect": 1,
+        "crop": 1,
+    }
+    assert stats["decode"].images_per_sec is not None
+
+
+def test_engine_keeps_row_order_around_unreadable_images(
+    tmp_path: Path,
+    engine_factory,
+) -> None:
+    _write_jpeg(tmp_path / "a.jpg", (320, 240))
+    (tmp_path / "b.jpg").write_bytes(b"not an image")
+    _write_jpeg(tmp_path / "c.jpg", (320, 240))
+    engine = engine_factory(_StubDetector(), min_face_size=10)
+
+    results = engine.detect(
+        [
+            {"id": "a", "rel": "a.jpg"},
+            {"id": "b", "rel": "b.jpg"},
+            {"id": "c", "rel": "c.jpg"},
+        ],
+        library_root=tmp_path,
+        thumbnail_dir=tmp_path / "thumbs",
+    )
+
+    assert [item.asset_id for item in results] == ["a", "b", "c"]
+    assert [len(item.faces) for item in results] == [1, 0, 1]
+    assert results[1].error
+    assert results[0].error is None and results[2].error is None
+
+
+def test_engine_decodes_ahead_while_the_detector_runs(
+    tmp_path: Path,
+    engine_factory,
+) -> None:
+    rows = []
+    for index in range(3):
+        _write_jpeg(tmp_path / f"{index}.jpg", (320, 240))
+        rows.append({"id": str(index), "rel": f"{index}.jpg"})
+    engine_ref: list[FaceScanEngine] = []
+    overlapped = threading.Event()
+
+    def wait_for_prefetch() -> None:
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline:
+            if engine_ref[0].stage_stats()["decode"].images >= 2:
+                overlapped.set()
+                return
+            time.sleep(0.01)
+
+    engine = engine_factory(
+        _StubDetector(on_get=wait_for_prefetch),
+        min_face_size=10,
+        decode_workers=1,
+    )
+    engine_ref.append(engine)
+
+    results = engine.detect(rows, library_root=tmp_path, thumbnail_dir=tmp_path / "thumbs")
+
+    assert overlapped.is_set()
+    assert [item.asset_id for item in results] == ["0", "1", "2"]
+
+
+def test_engine_stops_collecting_once_cancelled(tmp_path: Path, engine_factory) -> None:
+    for name in ("a", "b"):
+        _write_jpeg(tmp_path / f"{name}.jpg", (320, 240))
+    detector = _StubDetector()
+    engine = engine_factory(detector, min_face_size=10)
+    checks = 0
+
+    def is_cancelled() -> bool:
+        nonlocal checks
+        checks += 1
+        return checks > 3
+
+    results = engine.detect(
+        [{"id": "a", "rel": "a.jpg"}, {"id": "b", "rel": "b.jpg"}],
+        library_root=tmp_path,
+        thumbnail_dir=tmp_path / "thumbs",
+        is_cancelled=is_cancelled,
+    )
+
+    assert [item.asset_id for item in results] == ["a"]
@@ -6,16 +6,120 @@ stub_module = types.ModuleType("reverse_geocoder")
 stub_module.RGeocoder = object
 sys.modules.setdefault("reverse_geocoder", stub_module)
 
+import pytest
+
 from iPhoto.utils import geocoding
 
 
+@pytest.fixture(autouse=True)
+def _empty_location_cache():
+    geocoding._location_cache.clear()
+    yield
+    geocoding._location_cache.clear()
+
+
 def test_resolve_location_name_accepts_latitude_longitude_strings(monkeypatch):
     class _StubGeocoder:
         def query(self, _coords):
-            return [{"name": "London", "admin1": "England"}]
+            return [{"name": "London", "admin1": "England", "cc": "GB"}]
 
+    monkeypatch.setattr(geocoding, "_geonames_geocoder", lambda: None)
     monkeypatch.setattr(geocoding, "_geocoder", lambda: _StubGeocoder())
 
     result = geocoding.resolve_location_name({"latitude": "51.5074", "longitude": "-0.1278"})
 
     assert result == "London — England"
+    location = geocoding.resolve_location({"lat": 51.5074, "lon": -0.1278})
+    assert (location.country, location.country_code) == ("United Kingdom", "GB")
+
+
+def test_fallback_labels_prefer_the_second_level_division(monkeypatch):
+    class _StubGeocoder:
+        def query(self, _coords):
+            return [{"name": "Brooklyn", "admin1": "New York", "admin2": "Kings County", "cc": "US"}]
+
+    monkeypatch.setattr(geocoding, "_geonames_geocoder", lambda: None)
+    monkeypatch.setattr(geocoding, "_geocoder", lambda: _StubGeocoder())
+
+    location = geocoding.resolve_location({"lat": 40.65, "lon": -73.95})
+
+    assert location.label == "Brooklyn — Kings County"
+    assert location.region == "New York"
+
+
+def test_lookups_are_not_cached_while_the_index_is_building(monkeypatch):
+    from maps.geonames_reverse import ReverseGeocodeHit
+
+    state = {"index": geocoding._INDEX_PENDING}
+    queries = []
+
+    class _StubIndex:
+        def query(self, coords):
+            queries.append(list(coords))
+            return [
+                ReverseGeocodeHit(1, "Versailles", "Île-de-France", "France", "FR", lat, lon, 0.1, "Yvelines")
+                for lat, lon in coords
+            ]
+
+    monkeypatch.setattr(geocoding, "_geonames_geocoder", lambda: state["index"])
+    gps = {"lat": 48.8036, "lon": 2.1342}
+
+    assert geocoding.resolve_location_name(gps) is None
+
+    state["index"] = _StubIndex()
+    assert geocoding.resolve_location_name(gps) == "Versailles — Yvelines"
+    assert geocoding.resolve_location_name(gps) == "Versailles — Yvelines"
+    assert queries == [[(48.8036, 2.1342)]]
+
+
+def test_index_is_built_off_the_main_thread(monkeypatch, tmp_path):
+    import threading
+
+    import maps.geonames_reverse as geonames_reverse
+
+    build_started = threading.Event()
+    release = threading.Event()
+    built = object()
+
+    def fake_open(*, cache_dir, build=True):
+        if not build:
+            return None
+        build_started.set()
+        release.wait(5)
+        return built
+
+    monkeypatch.setattr(geonames_reverse, "open_reverse_geocoder", fake_open)
+    monkeypatch.setattr(
+        "iPhoto.settings.manager.default_settings_path", lambda: tmp_path / "settings.json"
+    )
+    loader = geocoding._GeoNamesIndexLoader()
+
+    assert loader.get(wait=False) is geocoding._INDEX_PENDING
+    assert build_started.wait(5)
+    assert loader.get(wait=False) is geocoding._INDEX_PENDING
+    release.set()
+    assert loader.get(wait=True) is built
+
+
+def test_resolve_locations_batches_geonames_lookups(monkeypatch):
+    from maps.geonames_reverse import ReverseGeocodeHit
+
+    queries = []
+
+    class _StubIndex:
+        def query(self, coords):
+            queries.append(list(coords))
+            return [
+                ReverseGeocodeHit(1, "Paris", "Île-de-France", "France", "FR", lat, lon, 0.1)
+                for lat, lon in coords
+            ]
+
+    monkeypatch.setattr(geocoding, "_geonames_geocoder", lambda: _StubIndex())
+
+    names = geocoding.resolve_location_names(
+        [{"lat": 48.85661, "lon": 2.35222}, None, {"lat": 48.85659, "lon": 2.35224}]
+    )
+
+    assert names == ["Paris — Île-de-France", None, "Paris — Île-de-France"]
+    assert queries == [[(48.8566, 2.3522)]]
+    assert geocoding.resolve_locations([{"lat": 1.0, "lon": 2.0}])[0].country == "France"
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from maps.geonames_reverse import (
+    GeoNamesReverseGeocoder,
+    build_reverse_geocode_index,
+    open_reverse_geocoder,
+)
+
+_PLACES = [
+    # geoname_id, name, latitude, longitude, feature_code, country, admin1, admin2, population
+    (1, "Paris", 48.85341, 2.3488, "PPLC", "FR", "11", "75", 2_138_551),
+    (2, "Versailles", 48.80359, 2.13424, "PPLA", "FR", "11", "78", 85_416),
+    (3, "Old Paris", 48.86, 2.35, "PPLH", "FR", "11", "75", 0),
+    (4, "Île-de-France", 48.5, 2.5, "ADM1", "FR", "11", "", 12_000_000),
+    (5, "France", 46.0, 2.0, "PCLI", "FR", "00", "", 67_000_000),
+    (6, "Suva", -18.14161, 178.44149, "PPLC", "FJ", "01", "", 77_366),
+    (7, "Taveuni", -16.85, -179.95, "PPL", "FJ", "03", "", 9_000),
+    (8, "Longyearbyen", 78.22334, 15.64689, "PPLA", "SJ", "21", "", 2_060),
+    (9, "Yvelines", 48.8, 1.85, "ADM2", "FR", "11", "78", 1_400_000),
+]
+
+
+def _create_search_db(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            """
+            CREATE TABLE search_index (
+                norm_name TEXT NOT NULL,
+                name_priority INTEGER NOT NULL,
+                population INTEGER NOT NULL,
+                geoname_id INTEGER NOT NULL,
+                matched_name TEXT NOT NULL,
+                primary_name TEXT NOT NULL,
+                asciiname TEXT,
+                latitude REAL NOT NULL,
+                longitude REAL NOT NULL,
+                feature_code TEXT,
+                country_code TEXT,
+                admin1_code TEXT,
+                admin2_code TEXT,
+                admin3_code TEXT,
+                admin4_code TEXT,
+                PRIMARY KEY (norm_name, name_priority, population DESC, geoname_id)
+            ) WITHOUT ROWID
+            """
+        )
+        rows = []
+        for geoname_id, name, lat, lon, code, country, admin1, admin2, population in _PLACES:
+            # Alternate names repeat the place; the index must not duplicate it.
+            for priority, matched in enumerate((name, name.upper())):
+                rows.append(
+                    (
+                        matched.lower() + str(priority),
+                        priority,
+                        population,
+                        geoname_id,
+                        matched,
+                        name,
+                        name,
+                        lat,
+                        lon,
+                        code,
+                        country,
+                        admin1,
+                        admin2,
+                        "",
+                        "",
+                    )
+                )
+        conn.executemany(
+            "INSERT INTO search_index VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+    return path
+
+
+@pytest.fixture
+def geocoder(tmp_path: Path) -> GeoNamesReverseGeocoder:
+    database = _create_search_db(tmp_path / "geonames.sqlite3")
+    return GeoNamesReverseGeocoder(build_reverse_geocode_index(database, tmp_path / "index.revgeo"))
+
+
+def test_index_returns_nearest_populated_place_with_hierarchy(geocoder) -> None:
+    hit = geocoder.nearest(48.857, 2.352)
+
+    assert len(geocoder) == 5
+    assert hit is not None
+    assert (hit.city, hit.region, hit.country, hit.country_code) == (
+        "Paris",
+        "Île-de-France",
+        "France",
+        "FR",
+    )
+    assert hit.distance_km < 1.0
+    assert hit.district == ""
+
+
+def test_batch_query_preserves_order_and_rejects_invalid_points(geocoder) -> None:
+    hits = geocoder.query(
+        [
+            (48.80, 2.13),
+            (float("nan"), 2.0),
+            (-16.9, 179.99),
+            (0.0, -60.0),
+            (78.2, 15.6),
+        ]
+    )
+
+    assert hits[0] is not None and hits[0].city == "Versailles"
+    assert hits[0].district == "Yvelines" and hits[0].region == "Île-de-France"
+    assert hits[1] is None
+    # Across the antimeridian and without a region row for the place.
+    assert hits[2] is not None and hits[2].city == "Taveuni"
+    assert hits[2].region == "" and hits[2].country == "FJ"
+    # Nothing within the search radius of the open ocean.
+    assert hits[3] is None
+    assert hits[4] is not None and hits[4].city == "Longyearbyen"
+
+
+def test_open_reverse_geocoder_builds_once_and_reuses_the_index(tmp_path: Path) -> None:
+    database = _create_search_db(tmp_path / "search" / "geonames.sqlite3")
+
+    assert open_reverse_geocoder(database, cache_dir=tmp_path / "cache", build=False) is None
+    first = open_reverse_geocoder(database, cache_dir=tmp_path / "cache")
+
+    index_path = database.with_suffix(".revgeo")
+    assert first is not None and first.nearest(48.85, 2.35).city == "Paris"
+    assert index_path.is_file()
+    modified = index_path.stat().st_mtime_ns
+
+    second = open_reverse_geocoder(database, cache_dir=tmp_path / "cache", build=False)
+
+    assert second is not None and second.nearest(-18.1, 178.4).city == "Suva"
+    assert index_path.stat().st_mtime_ns == modified
+    assert open_reverse_geocoder(tmp_path / "missing.sqlite3", cache_dir=tmp_path) is None
+
+
+def test_open_reverse_geocoder_rebuilds_a_stale_index(tmp_path: Path) -> None:
+    database = _create_search_db(tmp_path / "geonames.sqlite3")
+    stale = build_reverse_geocode_index(database, database.with_suffix(".revgeo"))
+    with sqlite3.connect(database) as conn:
+        conn.execute("DELETE FROM search_index WHERE geoname_id = 1")
+
+    geocoder = open_reverse_geocoder(database, cache_dir=tmp_path / "cache")
+
+    assert geocoder is not None
+    assert geocoder.nearest(48.857, 2.352).city == "Versailles"
+    assert stale.is_file()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from maps.helper_pool import HelperPoolUnavailableError, HelperProcessPool
+from maps.map_sources import MapSourceSpec
+from maps.tile_backend import OsmAndRasterBackend, RasterTile
+
+# Stand-in for the native helper: same JSON-line protocol, renders a flat PNG.
+# ``x`` doubles as a control channel: negative values crash the helper and the
+# ``delay`` field slows a render down.  With ``--threaded`` renders run
+# concurrently and answer out of order; ``--no-ids`` mimics an old helper
+# that neither echoes ids nor answers out of order.
+_HELPER_SOURCE = textwrap.dedent(
+    """
+    import json
+    import os
+    import sys
+    import threading
+    import time
+
+    threaded = "--threaded" in sys.argv
+    echo_ids = "--no-ids" not in sys.argv
+    fail_init = "--fail-init" in sys.argv
+    lock = threading.Lock()
+
+    def respond(request, response):
+        if echo_ids and "id" in request:
+            response["id"] = request["id"]
+        with lock:
+            sys.stdout.write(json.dumps(response) + "\\n")
+            sys.stdout.flush()
+
+    def render(request):
+        time.sleep(float(request.get("delay", 0.0)))
+        output = request.get("output_path")
+        if output:
+            from PIL import Image
+
+            Image.new("RGB", (4, 4), (10, 20, 30)).save(output, format="PNG")
+        respond(request, {"status": "ok", "x": request["x"], "pid": os.getpid()})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        command = request.get("command")
+        if command == "init":
+            if fail_init:
+                respond(request, {"status": "error", "message": "bad style"})
+            else:
+                respond(request, {"status": "ok", "min_zoom": 3, "max_zoom": 17})
+        elif command == "render":
+            if int(request["x"]) < 0:
+                os._exit(3)
+            if threaded:
+                threading.Thread(target=render, args=(request,), daemon=True).start()
+            else:
+                render(request)
+        elif command == "shutdown":
+            respond(request, {"status": "ok"})
+            break
+    """
+)
+
+
+@pytest.fixture
+def helper_script(tmp_path: Path) -> Path:
+    path = tmp_path / "stand_in_helper.py"
+    path.write_text(_HELPER_SOURCE, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def pool_factory(helper_script: Path):
+    pools: list[HelperProcessPool] = []
+
+    def create(*flags: str, **kwargs) -> HelperProcessPool:
+        pool = HelperProcessPool(
+            (sys.executable, str(helper_script), *flags),
+            init_payload={"command": "init"},
+            **kwargs,
+        )
+        pools.append(pool)
+        return pool
+
+    yield create
+    for pool in pools:
+        pool.shutdown()
+
+
+def _render(x: int, **extra: object) -> dict[str, object]:
+    return {"command": "render", "z": 1, "x": x, "y": 0, **extra}
+
+
+def test_pool_pipelines_requests_and_completes_them_out_of_order(pool_factory) -> None:
+    pool = pool_factory("--threaded", size=1, max_in_flight=2)
+    assert pool.start(timeout_ms=10000)["max_zoom"] == 17
+
+    slow = pool.submit(_render(1, delay=1.0))
+    fast = pool.submit(_render(2))
+
+    assert pool.wait(fast, timeout_ms=10000)["x"] == 2
+    assert not slow.done()
+    assert pool.wait(slow, timeout_ms=10000)["x"] == 1
+
+
+def test_pool_matches_responses_in_order_when_helper_omits_ids(pool_factory) -> None:
+    pool = pool_factory("--no-ids", size=1, max_in_flight=3)
+    pool.start(timeout_ms=10000)
+
+    futures = [pool.submit(_render(x)) for x in (5, 6, 7)]
+
+    assert [pool.wait(future, timeout_ms=10000)["x"] for future in futures] == [5, 6, 7]
+
+
+def test_pool_spreads_load_over_helpers_and_coalesces_duplicates(pool_factory) -> None:
+    pool = pool_factory(size=2, max_in_flight=1)
+    pool.start(timeout_ms=10000)
+
+    first = pool.submit(_render(1, delay=0.3), key="tile-1")
+    duplicate = pool.submit(_render(1, delay=0.3), key="tile-1")
+    other = pool.submit(_render(2), key="tile-2")
+
+    assert duplicate is first
+    responses = [pool.wait(future, timeout_ms=10000) for future in (first, other)]
+    assert responses[0]["pid"] != responses[1]["pid"]
+    assert sum(slot.completed for slot in pool.health()) == 2
+    assert not pool.is_pending("tile-1")
+
+
+def test_pool_restarts_a_crashed_helper_without_failing_its_neighbours(pool_factory) -> None:
+    pool = pool_factory(size=2, max_in_flight=1)
+    pool.start(timeout_ms=10000)
+
+    survivor = pool.submit(_render(1, delay=0.3))
+    crashed = pool.submit(_render(-1))
+
+    with pytest.raises(HelperPoolUnavailableError):
+        pool.wait(crashed, timeout_ms=10000)
+    assert pool.wait(survivor, timeout_ms=10000)["status"] == "ok"
+    assert pool.wait(pool.submit(_render(3)), timeout_ms=10000)["status"] == "ok"
+    assert sum(slot.restarts for slot in pool.health()) <= 1
+    assert not any(slot.retired for slot in pool.health())
+
+
+def test_pool_kills_a_helper_that_exceeds_the_timeout(pool_factory) -> None:
+    pool = pool_factory(size=1)
+    pool.start(timeout_ms=10000)
+    hung = pool.submit(_render(1, delay=30.0))
+
+    started = time.monotonic()
+    with pytest.raises(HelperPoolUnavailableError, match="Timed out"):
+        pool.wait(hung, timeout_ms=300)
+
+    assert time.monotonic() - started < 10.0
+    assert pool.wait(pool.submit(_render(2)), timeout_ms=10000)["x"] == 2
+    assert pool.health()[0].restarts == 1
+
+
+def test_pool_reports_unavailable_when_helpers_reject_init(pool_factory) -> None:
+    pool = pool_factory("--fail-init", size=1)
+
+    with pytest.raises(HelperPoolUnavailableError, match="bad style"):
+        pool.start(timeout_ms=10000)
+    with pytest.raises(HelperPoolUnavailableError):
+        pool.wait(pool.submit(_render(1)), timeout_ms=10000)
+    assert pool.health()[0].retired
+
+
+def test_osmand_backend_renders_concurrently_through_the_helper_pool(
+    tmp_path: Path,
+    helper_script: Path,
+    monkeypatch,
+) -> None:
+    for name in ("world.obf", "style.xml"):
+        (tmp_path / name).write_bytes(b"")
+    monkeypatch.setenv("IPHOTO_OSMAND_HELPER_PROCESSES", "2")
+    backend = OsmAndRasterBackend(
+        MapSourceSpec(
+            kind="osmand_obf",
+            data_path=tmp_path / "world.obf",
+            resources_root=tmp_path,
+            style_path=tmp_path / "style.xml",
+            helper_command=(sys.executable, str(helper_script), "--threaded"),
+        )
+    )
+    monkeypatch.setattr(backend, "_cache_directory", lambda: tmp_path / "cache")
+    tiles: dict[int, object] = {}
+
+    def load(x: int) -> None:
+        tiles[x] = backend.load_tile(3, x, 1)
+
+    try:
+        assert backend.probe_runtime().max_zoom == 17.0
+        assert backend.max_concurrent_requests == 4
+        threads = [threading.Thread(target=load, args=(x,)) for x in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+    finally:
+        backend.shutdown()
+
+    assert sorted(tiles) == list(range(6))
+    assert all(isinstance(tile, RasterTile) and tile.image.width() == 4 for tile in tiles.values())
+    assert backend.helper_health() == []
@@ -6,7 +6,12 @@ import pytest
 
 from iPhoto.cache.index_store import get_global_repository, reset_global_repository
 from iPhoto.config import RECENTLY_DELETED_DIR_NAME
-from iPhoto.index_sync_service import ensure_links, prune_index_scope
+from iPhoto.index_sync_service import (
+    ensure_links,
+    iter_album_roots,
+    prune_index_scope,
+    sync_album_registry,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -205,3 +210,52 @@ def test_ensure_links_keeps_db_live_roles_when_derived_snapshot_write_fails(
     assert data["motion.mov"]["live_partner_rel"] == "photo.heic"
     assert data["motion.mov"]["live_role"] == 1
     assert data["other.jpg"]["live_partner_rel"] is None
+
+
+def test_sync_album_registry_resolves_ids_and_prunes_vanished_albums(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    album_a = library_root / "album-a"
+    child = album_a / "child"
+    album_b = library_root / "album-b"
+    for root, album_id in ((library_root, "root-id"), (album_a, "A-ID"), (child, "child-id")):
+        root.mkdir(parents=True, exist_ok=True)
+        (root / ".iphoto.album.json").write_text(f'{{"id": "{album_id}"}}', encoding="utf-8")
+    album_b.mkdir()
+    (album_b / ".iphoto.album.json").write_text('{"id": "b-id"}', encoding="utf-8")
+    store = get_global_repository(library_root)
+
+    roots = [library_root, album_a, child, album_b]
+    assert sync_album_registry(library_root, roots, repository=store, prune=True) == 4
+    assert store.find_album_path_by_id("a-id") == "album-a"
+    assert store.find_album_path_by_id("child-id") == "album-a/child"
+    assert store.find_album_path_by_id("root-id") == ""
+
+    # Unchanged manifests are not re-registered; renamed albums are.
+    renamed = library_root / "album-c"
+    album_b.rename(renamed)
+    roots = [library_root, album_a, child, renamed]
+    assert sync_album_registry(library_root, roots, repository=store, prune=True) == 1
+    assert store.find_album_path_by_id("b-id") == "album-c"
+    assert "album-b" not in store.read_album_registry()
+
+    assert sync_album_registry(library_root, [library_root], repository=store, prune=True) == 0
+    assert store.find_album_path_by_id("a-id") is None
+
+
+def test_iter_album_roots_finds_nested_manifests_and_skips_reserved_dirs(tmp_path: Path) -> None:
+    library_root = tmp_path / "library"
+    deep = library_root / "2024" / "Trips" / "Kyoto"
+    work_manifest = library_root / "2023" / ".iPhoto" / "manifest.json"
+    for path in (
+        deep / ".iphoto.album.json",
+        work_manifest,
+        library_root / ".Trash" / "old" / ".iphoto.album.json",
+        library_root / "exported" / "set" / ".iphoto.album.json",
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('{"id": "x"}', encoding="utf-8")
+    (library_root / "2024" / "Trips" / "photo.jpg").write_bytes(b"")
+
+    roots = sorted(iter_album_roots(library_root))
+
+    assert roots == [library_root / "2023", deep]
@@ -240,3 +240,31 @@ def test_watcher_pause_suppresses_session_scan(tmp_path, qapp):
         manager._on_watcher_debounce_timeout()
 
     start_scanning.assert_not_called()
+
+
+def test_album_registry_is_synced_off_the_main_thread(tmp_path, qapp):
+    import threading
+
+    root = tmp_path / "Library"
+    root.mkdir()
+    calls = []
+    repository = object()
+
+    class _ScanService:
+        library_root = root
+
+        def repository(self):
+            return repository
+
+        def sync_library_album_registry(self, repository=None):
+            calls.append(
+                (threading.current_thread() is threading.main_thread(), repository)
+            )
+            return 0
+
+    manager = LibraryRuntimeController()
+    manager.bind_path(root)
+    manager.bind_scan_service(_ScanService())
+    manager._album_registry_pool.waitForDone(5000)
+
+    assert calls == [(False, repository)]
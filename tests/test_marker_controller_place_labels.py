@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+from dataclasses import replace
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 pytest.importorskip("PySide6", reason="PySide6 is required for marker controller tests", exc_type=ImportError)
@@ -11,7 +13,7 @@ pytest.importorskip("PySide6.QtCore", reason="QtCore is required for marker cont
 from PySide6.QtCore import QObject, QPointF, QRectF
 from PySide6.QtWidgets import QApplication
 
-from iPhoto.gui.ui.widgets.marker_controller import MarkerController, _MarkerCluster
+from iPhoto.gui.ui.widgets.marker_controller import MarkerController, _ClusterWorker, _MarkerCluster
 from maps.map_widget.map_renderer import CityAnnotation
 from iPhoto.library.runtime_controller import GeotaggedAsset
 
@@ -238,6 +240,64 @@ def test_marker_controller_reuses_existing_map_state_when_assets_are_unchanged(
     assert len(city_updates) == first_city_updates
 
 
+def test_marker_controller_patches_same_root_asset_updates(
+    qapp: QApplication,
+    tmp_path: Path,
+) -> None:
+    loader = _DummyThumbnailLoader()
+    controller = MarkerController(
+        _DummyMapWidget(),
+        loader,
+        marker_size=72,
+        thumbnail_size=192,
+        provides_place_labels=False,
+    )
+    invalidations: list[bool] = []
+    controller.thumbnailsInvalidated.connect(lambda: invalidations.append(True))
+    kept = _asset(tmp_path)
+    added = replace(kept, library_relative="b.jpg", asset_id="b", latitude=-33.9, longitude=151.2)
+
+    try:
+        controller.set_assets([kept], tmp_path)
+        controller._coordinates[0] = (99.0, 99.0)
+        controller.set_assets([added, kept], tmp_path)
+        qapp.processEvents()
+    finally:
+        controller.shutdown()
+
+    assert invalidations == [True]
+    assert loader.reset_calls == [tmp_path]
+    # The unchanged asset reuses its cached row; only the new one is projected.
+    assert controller._coordinates.tolist() == [[151.2, -33.9], [99.0, 99.0]]
+
+
+def test_cluster_worker_projects_and_culls_vectorised(
+    qapp: QApplication,
+    tmp_path: Path,
+) -> None:
+    del qapp
+    near = _asset(tmp_path)
+    also_near = replace(near, library_relative="b.jpg", asset_id="b")
+    far = replace(near, library_relative="c.jpg", asset_id="c", longitude=-120.0)
+    assets = [near, also_near, far]
+    coordinates = np.array([[a.longitude, a.latitude] for a in assets])
+    worker = _ClusterWorker()
+    results: list[list[_MarkerCluster]] = []
+    worker.finished.connect(lambda _request, clusters: results.append(clusters))
+
+    # Centre the viewport on ``near`` using normalised (unit world) coordinates.
+    center_x, center_y = worker._project_array_to_screen(
+        coordinates[:1], 0.0, 0.0, 0.0, 1.0, 1.0
+    )[0]
+    worker.build_clusters(7, assets, coordinates, 400, 300, center_x, center_y, 4.0, 48.0, 48, 72)
+
+    assert len(results) == 1
+    [cluster] = results[0]
+    assert cluster.assets == [near, also_near]
+    assert cluster.screen_pos.x() == pytest.approx(200.0)
+    assert cluster.screen_pos.y() == pytest.approx(150.0)
+
+
 def test_marker_controller_emits_raw_marker_assets(
     qapp: QApplication,
     tmp_path: Path,
@@ -361,7 +361,7 @@ def test_build_manual_face_record_saves_requested_box_without_face_detection(
 
     monkeypatch.setattr(FaceClusterPipeline, "_ensure_face_analysis", _fail_face_analysis)
     monkeypatch.setattr("iPhoto.people.manual_faces.load_image_rgb", lambda _path: fake_image)
-    monkeypatch.setattr("iPhoto.people.manual_faces.save_face_thumbnail", _save_thumbnail)
+    monkeypatch.setattr("iPhoto.people.manual_faces.store_face_crop", _save_thumbnail)
     monkeypatch.setattr("iPhoto.people.manual_faces.uuid.uuid4", lambda: SimpleNamespace(hex="manual-1"))
 
     face = build_manual_face_record(
@@ -388,7 +388,7 @@ def test_build_manual_face_record_accepts_non_face_region(
         "iPhoto.people.manual_faces.load_image_rgb",
         lambda _path: SimpleNamespace(size=(400, 300)),
     )
-    monkeypatch.setattr("iPhoto.people.manual_faces.save_face_thumbnail", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("iPhoto.people.manual_faces.store_face_crop", lambda *_args, **_kwargs: None)
 
     face = build_manual_face_record(
         asset_id="asset-1",
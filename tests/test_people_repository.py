@@ -103,7 +103,7 @@ def _person_record(
     )
 
 
-def test_remove_faces_for_assets_deletes_affected_person_rows_first(tmp_path: Path) -> None:
+def test_remove_faces_for_assets_updates_affected_person_incrementally(tmp_path: Path) -> None:
     repository = FaceRepository(tmp_path / "face_index.db")
     face_a = _face_record(
         face_id="face-a",
@@ -116,6 +116,7 @@ def test_remove_faces_for_assets_deletes_affected_person_rows_first(tmp_path: Pa
         asset_id="asset-b",
         asset_rel="album/b.jpg",
         person_id="person-a",
+        embedding=np.asarray([0.0, 1.0, 0.0], dtype=np.float32),
     )
     person = _person_record(person_id="person-a", key_face_id="face-a", face_count=2)
     repository.replace_all([face_a, face_b], [person])
@@ -124,9 +125,62 @@ def test_remove_faces_for_assets_deletes_affected_person_rows_first(tmp_path: Pa
 
     remaining_faces = repository.get_all_faces()
     assert [face.face_id for face in remaining_faces] == ["face-b"]
+    [record] = repository.get_all_person_records()
+    assert record.key_face_id == "face-b"
+    assert record.face_count == 1
+    assert np.allclose(record.center_embedding, [0.0, 1.0, 0.0])
+
+    repository.remove_faces_for_assets(["asset-b"])
+
+    assert repository.get_all_faces() == []
     assert repository.get_person_summaries() == []
 
 
+def test_remove_faces_for_assets_only_touches_removed_assets(tmp_path: Path, monkeypatch) -> None:
+    repository = FaceRepository(tmp_path / "face_index.db", tmp_path / "face_state.db")
+    faces = [
+        _face_record(
+            face_id=f"face-{person}-{asset}",
+            asset_id=f"asset-{asset}",
+            asset_rel=f"album/{asset}.jpg",
+            person_id=f"person-{person}",
+            thumbnail_path=f"thumbnails/{person}-{asset}.jpg",
+        )
+        for person in ("a", "b")
+        for asset in ("1", "2", "3")
+    ]
+    persons = [
+        _person_record(person_id="person-a", key_face_id="face-a-1", face_count=3),
+        _person_record(person_id="person-b", key_face_id="face-b-1", face_count=3, name="Bob"),
+    ]
+    repository.replace_all(faces, persons)
+    group = repository.create_group(["person-a", "person-b"])
+    assert group is not None
+    state = repository.state_repository
+    assert state is not None
+    assert state.get_group_cover_asset_id(group.group_id) is not None
+
+    def _fail(*_args, **_kwargs):
+        raise AssertionError("removal should not rescan whole persons or groups")
+
+    monkeypatch.setattr(repository, "_person_embedding_aggregate", _fail)
+    monkeypatch.setattr(repository, "refresh_group_assets", _fail)
+    repository.remove_faces_for_assets(["asset-1"])
+
+    records = {record.person_id: record for record in repository.get_all_person_records()}
+    assert {person_id: record.face_count for person_id, record in records.items()} == {
+        "person-a": 2,
+        "person-b": 2,
+    }
+    assert records["person-a"].key_face_id == "face-a-2"
+    assert state.get_person_cover_thumbnail_map(["person-a"]) == {
+        "person-a": "thumbnails/a-2.jpg"
+    }
+    assert set(state.get_group_asset_ids(group.group_id)) == {"asset-2", "asset-3"}
+    assert state.get_group_cover_asset_id(group.group_id) in {"asset-2", "asset-3"}
+    assert [summary.face_count for summary in repository.get_person_summaries()] == [2, 2]
+
+
 def test_person_cover_persists_and_custom_cover_survives_rescan(tmp_path: Path) -> None:
     repository = FaceRepository(tmp_path / "face_index.db", tmp_path / "face_state.db")
     faces = [
@@ -1421,3 +1475,62 @@ def test_get_person_ids_for_asset_ids_chunks_large_sqlite_in_queries(tmp_path: P
     )
 
     assert person_ids == [f"person-{index:04d}" for index in range(face_count)]
+
+
+def test_person_summaries_read_the_materialised_dashboard(tmp_path: Path, monkeypatch) -> None:
+    repository = FaceRepository(tmp_path / "face_index.db", tmp_path / "face_state.db")
+    faces = [
+        _face_record(face_id="face-a1", asset_id="asset-1", asset_rel="album/1.jpg", person_id="person-a"),
+        _face_record(face_id="face-a2", asset_id="asset-2", asset_rel="album/2.jpg", person_id="person-a"),
+        _face_record(face_id="face-b", asset_id="asset-3", asset_rel="album/3.jpg", person_id="person-b"),
+    ]
+    persons = [
+        _person_record(person_id="person-a", key_face_id="face-a1", face_count=2, name="Alice"),
+        _person_record(person_id="person-b", key_face_id="face-b", face_count=1, name="Bob"),
+    ]
+    repository.replace_all(faces, persons)
+    compute_calls: list[object] = []
+    compute = repository._compute_person_dashboard_rows
+
+    def _tracked_compute(person_ids=None):
+        compute_calls.append(person_ids)
+        return compute(person_ids)
+
+    monkeypatch.setattr(repository, "_compute_person_dashboard_rows", _tracked_compute)
+
+    # Opening the dashboard, hiding and reordering never recompute cards.
+    assert [(s.person_id, s.face_count) for s in repository.get_person_summaries()] == [
+        ("person-a", 2),
+        ("person-b", 1),
+    ]
+    repository.set_person_order(["person-b", "person-a"])
+    assert repository.set_person_hidden("person-a", True) is True
+    assert [s.person_id for s in repository.get_person_summaries(include_hidden=True)] == [
+        "person-b",
+        "person-a",
+    ]
+    assert [s.person_id for s in repository.get_person_summaries()] == ["person-b"]
+    assert compute_calls == []
+
+    # Mutations refresh only the cards they touch.
+    repository.rename_person("person-b", "Bobby")
+    result = repository.move_face_to_person("face-a2", "person-b")
+    assert result is not None
+    assert compute_calls == [("person-b",), ("person-a", "person-b")]
+    cards = {s.person_id: s for s in repository.get_person_summaries(include_hidden=True)}
+    assert (cards["person-a"].face_count, cards["person-b"].face_count) == (1, 2)
+    assert cards["person-b"].name == "Bobby"
+
+
+def test_person_dashboard_is_built_on_first_read_of_existing_state(tmp_path: Path) -> None:
+    repository = FaceRepository(tmp_path / "face_index.db", tmp_path / "face_state.db")
+    face = _face_record(face_id="face-a", asset_id="asset-a", asset_rel="album/a.jpg", person_id="person-a")
+    repository.replace_all([face], [_person_record(person_id="person-a", key_face_id="face-a", face_count=1)])
+    with sqlite3.connect(tmp_path / "face_state.db") as conn:
+        conn.execute("DELETE FROM people_dashboard")
+        conn.execute("DELETE FROM people_dashboard_state")
+
+    assert [summary.person_id for summary in repository.get_person_summaries()] == ["person-a"]
+    state_repository = repository.state_repository
+    assert state_repository is not None
+    assert [record.person_id for record in state_repository.read_person_dashboard()] == ["person-a"]
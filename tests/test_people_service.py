@@ -220,7 +220,9 @@ def test_people_service_rename_merge_and_build_query(tmp_path: Path) -> None:
     assert {summary.person_id: summary.name for summary in summaries}["person-a"] == "Alice"
 
     query = service.build_cluster_query("person-a")
-    assert query.asset_ids == ["asset-a"]
+    assert query.person_ids == ["person-a"]
+    assert global_repo.get_asset_ids_for_persons(query.person_ids) == ["asset-a"]
+    assert service.cluster_asset_ids("person-a") == ["asset-a"]
 
     assert service.merge_clusters("person-a", "person-b") is True
     merged = service.list_clusters()
@@ -317,7 +319,9 @@ def test_people_service_creates_groups_and_queries_common_assets(tmp_path: Path)
     assert listed[0].group_id == group.group_id
 
     query = service.build_group_query(group.group_id)
-    assert query.asset_ids == ["asset-shared"]
+    assert query.person_ids == ["person-a", "person-b"]
+    assert global_repo.get_asset_ids_for_persons(query.person_ids) == ["asset-shared"]
+    assert service.group_asset_ids(group.group_id) == ["asset-shared"]
     assert service.has_group(group.group_id) is True
     assert service.get_group_summary(group.group_id) is not None
     assert service.has_group("missing-group") is False
@@ -700,7 +704,7 @@ def test_add_manual_face_creates_manual_only_person(tmp_path: Path) -> None:
     assert summaries[0].name == "Manual Person"
     assert summaries[0].face_count == 1
     assert summaries[0].key_face_id == result.face_id
-    assert service.build_cluster_query(result.person_id).asset_ids == ["asset-a"]
+    assert service.cluster_asset_ids(result.person_id) == ["asset-a"]
     assert repository.get_all_faces() == []
     profile = repository.state_repository.get_profiles()[0]
     assert profile.person_id == result.person_id
@@ -747,7 +751,11 @@ def test_merge_manual_only_people_keeps_profiles_embedding_free(tmp_path: Path)
     assert summaries[0].person_id == target.person_id
     assert summaries[0].name == "Target"
     assert summaries[0].face_count == 2
-    assert service.build_cluster_query(target.person_id).asset_ids == ["asset-b", "asset-a"]
+    assert service.cluster_asset_ids(target.person_id) == ["asset-b", "asset-a"]
+    assert sorted(
+        get_global_repository(library_root).get_asset_ids_for_persons([target.person_id])
+    ) == ["asset-a", "asset-b"]
+    assert get_global_repository(library_root).get_asset_ids_for_persons([source.person_id]) == []
     assert repository.get_all_faces() == []
     profiles = {profile.person_id: profile for profile in repository.state_repository.get_profiles()}
     assert set(profiles) == {target.person_id}
@@ -803,7 +811,7 @@ def test_merge_manual_person_into_auto_person_preserves_auto_profile_decision(
     assert len(summaries) == 1
     assert summaries[0].person_id == "person-auto"
     assert summaries[0].face_count == 2
-    assert service.build_cluster_query("person-auto").asset_ids == [
+    assert service.cluster_asset_ids("person-auto") == [
         "asset-manual",
         "asset-auto",
     ]
@@ -1416,8 +1424,7 @@ def test_people_index_coordinator_preserves_committed_snapshot_when_done_status_
     summaries = service.list_clusters()
     assert len(summaries) == 1
     assert summaries[0].face_count == 2
-    query = service.build_cluster_query(summaries[0].person_id)
-    assert query.asset_ids == ["asset-new", "asset-shared"]
+    assert service.cluster_asset_ids(summaries[0].person_id) == ["asset-new", "asset-shared"]
     assert global_repo.get_rows_by_ids(["asset-new"])["asset-new"]["face_status"] == "pending"
     assert call_count["value"] == 3
 
@@ -249,3 +249,190 @@ def test_scan_album_refreshes_cached_row_missing_full_thumbnail(
     assert rows[0]["thumb_cache_key"]
     cache_file = root / ".iPhoto" / "cache" / "thumbs" / f"{rows[0]['thumb_cache_key']}.jpg"
     assert cache_file.exists()
+
+
+def test_file_discovery_prunes_excluded_directories(tmp_path: Path) -> None:
+    import queue
+
+    root = tmp_path / "Library"
+    (root / "Album" / "skip").mkdir(parents=True)
+    (root / "Album" / "keep.jpg").write_bytes(b"x")
+    (root / "Album" / "notes.txt").write_bytes(b"x")
+    (root / "Album" / "skip" / "hidden.jpg").write_bytes(b"x")
+
+    found: queue.Queue = queue.Queue()
+    thread = scanner_adapter.FileDiscoveryThread(
+        root,
+        found,
+        include=["**/*.jpg"],
+        exclude=["**/skip/**"],
+    )
+    thread.run()
+
+    paths = []
+    while (item := found.get_nowait()) is not None:
+        paths.append(item)
+    assert paths == [root / "Album" / "keep.jpg"]
+    assert thread.total_found == 1
+
+
+def test_file_discovery_walks_sorted_and_reports_completed_directories(
+    tmp_path: Path,
+) -> None:
+    import queue
+
+    root = tmp_path / "Library"
+    for rel in ("b/2.jpg", "b/1.jpg", "a/z.jpg", "a/y.jpg", "c/3.jpg", "root.jpg"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_bytes(b"x")
+
+    found: queue.Queue = queue.Queue()
+    thread = scanner_adapter.FileDiscoveryThread(
+        root,
+        found,
+        include=["**/*.jpg"],
+        exclude=[],
+        skip_dirs={"b"},
+        report_directories=True,
+    )
+    thread.run()
+
+    items = []
+    while (item := found.get_nowait()) is not None:
+        items.append(item)
+    assert items == [
+        root / "root.jpg",
+        scanner_adapter.DirectoryCompleted(""),
+        root / "a" / "y.jpg",
+        root / "a" / "z.jpg",
+        scanner_adapter.DirectoryCompleted("a"),
+        root / "c" / "3.jpg",
+        scanner_adapter.DirectoryCompleted("c"),
+    ]
+    assert thread.total_found == 4
+
+
+def test_scan_album_replays_completed_directories_and_reports_progressively(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    root = tmp_path / "Library"
+    (root / "done").mkdir(parents=True)
+    (root / "todo").mkdir()
+    (root / "todo" / "new.jpg").write_bytes(b"x")
+
+    def fake_process(_root, paths, _videos, **_kwargs):
+        for path in paths:
+            yield {"rel": path.relative_to(root).as_posix()}
+
+    monkeypatch.setattr(scanner_adapter, "process_media_paths", fake_process)
+    events: list[tuple[str, str]] = []
+
+    for row in scanner_adapter.scan_album(
+        root,
+        ["**/*.jpg"],
+        [],
+        existing_index={
+            "done/old.jpg": {"rel": "done/old.jpg", "cached": True},
+            "todo/new.jpg": {"rel": "todo/new.jpg"},
+        },
+        completed_dirs={"done"},
+        directory_callback=lambda rel_dir: events.append(("dir", rel_dir)),
+        thumbnail_cache_dir=tmp_path / "thumbs",
+    ):
+        events.append(("row", row["rel"]))
+
+    assert events == [
+        ("row", "done/old.jpg"),
+        ("dir", ""),
+        ("row", "todo/new.jpg"),
+        ("dir", "todo"),
+    ]
+
+
+def test_scan_album_pool_keeps_directory_reports_behind_their_rows(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    root = tmp_path / "Library"
+    for rel_dir, count in (("a", 60), ("b", 3), ("c", 1)):
+        (root / rel_dir).mkdir(parents=True)
+        for index in range(count):
+            (root / rel_dir / f"{index:02d}.jpg").write_bytes(b"x")
+
+    def fake_batch(batch_root, paths, _thumbnail_cache_dir):
+        return [{"rel": path.relative_to(batch_root).as_posix()} for path in paths]
+
+    monkeypatch.setattr(scanner_adapter, "_process_media_batch", fake_batch)
+    monkeypatch.setattr(
+        scanner_adapter,
+        "_create_process_pool",
+        lambda workers: ThreadPoolExecutor(max_workers=workers),
+    )
+    seen: list[str] = []
+    reported: list[tuple[str, int]] = []
+
+    for row in scanner_adapter.scan_album(
+        root,
+        ["**/*.jpg"],
+        [],
+        directory_callback=lambda rel_dir: reported.append((rel_dir, len(seen))),
+        thumbnail_cache_dir=tmp_path / "thumbs",
+        workers=2,
+    ):
+        seen.append(row["rel"])
+
+    assert sorted(seen) == sorted(
+        [f"a/{index:02d}.jpg" for index in range(60)]
+        + [f"b/{index:02d}.jpg" for index in range(3)]
+        + ["c/00.jpg"]
+    )
+    assert [rel_dir for rel_dir, _ in reported] == ["", "a", "b", "c"]
+    for rel_dir, yielded_before in reported:
+        prefix = f"{rel_dir}/" if rel_dir else ""
+        assert all(
+            rel in seen[:yielded_before]
+            for rel in seen
+            if rel.rpartition("/")[0] == rel_dir and rel.startswith(prefix)
+        )
+
+
+def test_process_media_paths_reuses_known_asset_ids(
+    tmp_path: Path,
+    monkeypatch,
+) -> None:
+    from iPhoto.infrastructure.services import metadata_provider
+
+    root = tmp_path / "Library"
+    root.mkdir()
+    asset = root / "imported.jpg"
+    asset.write_bytes(b"jpeg-data")
+
+    def _unexpected_hash(_path):
+        raise AssertionError("known asset ids must not be recomputed")
+
+    monkeypatch.setattr(metadata_provider, "compute_file_id", _unexpected_hash)
+    monkeypatch.setattr(scanner_adapter, "compute_file_id", _unexpected_hash)
+    monkeypatch.setattr(
+        scanner_adapter._metadata_provider,
+        "get_metadata_batch",
+        lambda paths: [],
+    )
+    monkeypatch.setattr(
+        scanner_adapter._thumbnail_generator,
+        "generate_micro_thumbnail",
+        lambda _path: None,
+    )
+
+    rows = list(
+        scanner_adapter.process_media_paths(
+            root,
+            [asset],
+            [],
+            asset_ids={asset: "as_known"},
+        )
+    )
+
+    assert [row["id"] for row in rows] == ["as_known"]
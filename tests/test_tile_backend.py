@@ -120,33 +120,39 @@ def test_osmand_raster_backend_retries_once_after_runtime_unavailable(tmp_path,
         helper_command=("helper.exe",),
     )
     backend = OsmAndRasterBackend(source)
-    cache_path = tmp_path / "cache" / "tile.png"
-    attempts: list[int] = []
+    attempts: list[Path] = []
 
     monkeypatch.setattr(backend, "_validate_paths", lambda: None)
-    monkeypatch.setattr(backend, "_cache_file_path", lambda z, x, y: cache_path)
-    monkeypatch.setattr(backend, "_ensure_process", lambda: object())
+    monkeypatch.setattr(backend, "_cache_directory", lambda: tmp_path / "cache")
+    monkeypatch.setattr(backend, "_ensure_pool", lambda: object())
 
-    def _fake_communicate(process, payload, *, timeout_ms=5000):
-        del process, payload, timeout_ms
-        attempts.append(1)
+    def _fake_request(pool, payload, *, timeout_ms=5000):
+        del pool, timeout_ms
+        staging_path = Path(str(payload["output_path"]))
+        attempts.append(staging_path)
         if len(attempts) == 1:
             raise TileBackendUnavailableError("helper timeout")
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        cache_path.write_bytes(b"png")
+        staging_path.write_bytes(b"png")
         return {"status": "ok"}
 
-    monkeypatch.setattr(backend, "_communicate", _fake_communicate)
-    monkeypatch.setattr(backend, "_load_cached_tile", lambda path: ("tile", Path(path)))
+    monkeypatch.setattr(backend, "_request", _fake_request)
+    monkeypatch.setattr(backend, "_decode_tile", lambda data, scale: ("tile", data, scale))
 
     shutdown_calls: list[int] = []
     monkeypatch.setattr(backend, "shutdown", lambda: shutdown_calls.append(1))
 
-    tile = backend.load_tile(2, 0, 0)
+    try:
+        tile = backend.load_tile(2, 0, 0)
+        cached = backend.load_tile(2, 0, 0)
+    finally:
+        backend._tile_cache.close()
 
-    assert tile == ("tile", cache_path)
+    assert tile == ("tile", b"png", 1.0)
+    assert cached == tile
     assert len(attempts) == 2
-    assert len(shutdown_calls) == 1
+    assert not attempts[-1].exists()
+    # The pool replaces the failed helper itself; healthy helpers keep running.
+    assert shutdown_calls == []
 
 
 def test_osmand_raster_backend_probe_does_not_start_helper_process(tmp_path, monkeypatch) -> None:
@@ -161,7 +167,7 @@ def test_osmand_raster_backend_probe_does_not_start_helper_process(tmp_path, mon
     ensure_calls: list[int] = []
 
     monkeypatch.setattr(backend, "_validate_paths", lambda: None)
-    monkeypatch.setattr(backend, "_ensure_process", lambda: ensure_calls.append(1))
+    monkeypatch.setattr(backend, "_ensure_pool", lambda: ensure_calls.append(1))
 
     metadata = backend.probe()
 
@@ -181,7 +187,7 @@ def test_osmand_raster_backend_probe_runtime_starts_helper_process(tmp_path, mon
     ensure_calls: list[int] = []
 
     monkeypatch.setattr(backend, "_validate_paths", lambda: None)
-    monkeypatch.setattr(backend, "_ensure_process", lambda: ensure_calls.append(1))
+    monkeypatch.setattr(backend, "_ensure_pool", lambda: ensure_calls.append(1))
 
     metadata = backend.probe_runtime()
 
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pytest
+
+from maps.tile_cache import RasterTileCache, remove_legacy_tile_tree
+
+
+@pytest.fixture
+def cache_factory(tmp_path: Path):
+    caches: list[RasterTileCache] = []
+
+    def create(**kwargs) -> RasterTileCache:
+        cache = RasterTileCache(tmp_path / "cache", **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield create
+    for cache in caches:
+        cache.close()
+
+
+def test_cache_serves_buffered_writes_and_persists_them_on_close(cache_factory) -> None:
+    cache = cache_factory()
+    cache.put(("1_00", 5, 1, 2), b"tile-a")
+
+    assert cache.get(("1_00", 5, 1, 2)) == b"tile-a"
+    assert cache.get(("2_00", 5, 1, 2)) is None
+    cache.close()
+
+    reopened = cache_factory()
+    assert reopened.get(("1_00", 5, 1, 2)) == b"tile-a"
+    assert reopened.stored_bytes == len(b"tile-a")
+
+
+def test_cache_flushes_batches_in_the_background(cache_factory) -> None:
+    cache = cache_factory()
+    cache.put(("1_00", 5, 1, 2), b"x" * 10)
+
+    deadline = time.monotonic() + 5.0
+    while cache.stored_bytes == 0 and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert cache.stored_bytes == 10
+
+
+def test_cache_evicts_least_recently_used_tiles_over_budget(cache_factory) -> None:
+    cache = cache_factory(budget_bytes=300, hot_zoom_levels=())
+    for x in range(3):
+        cache.put(("1_00", 10, x, 0), bytes(100))
+    cache.flush()
+    assert cache.get(("1_00", 10, 0, 0)) is not None
+    cache.flush()
+
+    cache.put(("1_00", 10, 3, 0), bytes(100))
+    cache.flush()
+
+    assert cache.stored_bytes <= 300
+    assert cache.get(("1_00", 10, 0, 0)) is not None
+    assert cache.get(("1_00", 10, 3, 0)) is not None
+    assert cache.get(("1_00", 10, 1, 0)) is None
+
+
+def test_cache_preloads_only_hot_zoom_levels(cache_factory) -> None:
+    cache = cache_factory()
+    cache.put(("1_00", 3, 0, 0), b"low")
+    cache.put(("1_00", 12, 0, 0), b"high")
+    cache.close()
+
+    reopened = cache_factory(hot_zoom_levels=(3,))
+
+    assert reopened.preload_hot_tiles() == 1
+
+
+def test_remove_legacy_tile_tree_keeps_the_database(tmp_path: Path) -> None:
+    legacy = tmp_path / "1_00" / "5" / "1"
+    legacy.mkdir(parents=True)
+    (legacy / "2.png").write_bytes(b"png")
+    (tmp_path / "tiles.db").write_bytes(b"")
+    (tmp_path / "staging").mkdir()
+
+    remove_legacy_tile_tree(tmp_path)
+
+    assert not (tmp_path / "1_00").exists()
+    assert (tmp_path / "tiles.db").exists()
+    assert (tmp_path / "staging").exists()
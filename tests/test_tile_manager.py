@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import threading
+
 from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
 
 from maps.map_sources import MapBackendMetadata
@@ -59,3 +61,50 @@ def test_tile_manager_serializes_worker_requests_under_event_reentrancy() -> Non
 
     assert loaded == [(1, 2, 3), (1, 2, 4)]
     assert backend.max_active_calls == 1
+
+
+class _ConcurrentBackend(_ReentrantBackend):
+    max_concurrent_requests = 3
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = threading.Lock()
+        self.release = threading.Event()
+
+    def load_tile(self, z: int, x: int, y: int) -> object:
+        with self._lock:
+            self._active_calls += 1
+            self.max_active_calls = max(self.max_active_calls, self._active_calls)
+        self.release.wait(5.0)
+        with self._lock:
+            self._active_calls -= 1
+        return {"tile": (z, x, y)}
+
+
+def test_tile_manager_runs_concurrent_backends_in_parallel_with_bounded_pending() -> None:
+    app = QCoreApplication.instance()
+    if app is None:
+        app = QCoreApplication([])
+
+    backend = _ConcurrentBackend()
+    manager = TileManager(backend, cache_limit=16, max_pending=4)
+    loaded: list[tuple[int, int, int]] = []
+    loop = QEventLoop()
+
+    def _on_loaded(key: tuple[int, int, int]) -> None:
+        loaded.append(key)
+        if len(loaded) == 4:
+            loop.quit()
+
+    manager.tile_loaded.connect(_on_loaded)
+    for x in range(6):
+        manager.ensure_tile((2, x, 0))
+    assert manager.pending_tiles() == {(2, x, 0) for x in range(4)}
+
+    QTimer.singleShot(200, backend.release.set)
+    QTimer.singleShot(5000, loop.quit)
+    loop.exec()
+    manager.shutdown()
+
+    assert sorted(loaded) == [(2, x, 0) for x in range(4)]
+    assert backend.max_active_calls == 3
@@ -3,9 +3,9 @@ from unittest.mock import MagicMock, patch
 from PySide6.QtGui import QImage
 from PIL import Image
 import pytest
-from io import BytesIO
 
 from iPhoto.utils import image_loader
+from iPhoto.utils.micro_thumbnail import PIXEL_FORMAT_RGB565, read_micro_header
 
 def test_qimage_from_pil_success():
     """Test successful conversion from PIL Image to QImage."""
@@ -102,11 +102,13 @@ def test_generate_micro_thumbnail_success(tmp_path):
     assert isinstance(blob, bytes)
     assert len(blob) > 0
 
-    # Verify blob is a valid JPEG
-    thumb = Image.open(BytesIO(blob))
-    assert thumb.format == "JPEG"
+    # Verify blob is a raw RGB565 micro thumbnail
+    header = read_micro_header(blob)
+    assert header is not None
+    assert header.pixel_format == PIXEL_FORMAT_RGB565
     # Verify dimensions: 100x50 -> max 16 -> 16x8
-    assert thumb.size == (16, 8)
+    assert (header.width, header.height) == (16, 8)
+    assert len(blob) == header.payload_size
 
 def test_generate_micro_thumbnail_preserves_aspect_ratio(tmp_path):
     """Test that aspect ratio is preserved during scaling."""
@@ -118,12 +120,12 @@ def test_generate_micro_thumbnail_preserves_aspect_ratio(tmp_path):
     blob = image_loader.generate_micro_thumbnail(image_path)
 
     assert blob is not None
-    thumb = Image.open(BytesIO(blob))
+    header = read_micro_header(blob)
     # 50x100 -> max 16 -> 8x16
-    assert thumb.size == (8, 16)
+    assert (header.width, header.height) == (8, 16)
 
 def test_generate_micro_thumbnail_converts_to_rgb(tmp_path):
-    """Test that RGBA images are converted to RGB for JPEG compatibility."""
+    """Test that RGBA images are flattened to opaque RGB pixels."""
     image_path = tmp_path / "alpha.png"
     img = Image.new("RGBA", (20, 20), color=(255, 0, 0, 128))
     img.save(image_path, format="PNG")
@@ -131,9 +133,11 @@ def test_generate_micro_thumbnail_converts_to_rgb(tmp_path):
     blob = image_loader.generate_micro_thumbnail(image_path)
 
     assert blob is not None
-    thumb = Image.open(BytesIO(blob))
-    assert thumb.mode == "RGB"
-    assert thumb.format == "JPEG"
+    qimg = image_loader.qimage_from_bytes(blob)
+    assert qimg is not None
+    assert qimg.size().width() == 16
+    assert not qimg.hasAlphaChannel()
+    assert qimg.pixelColor(0, 0).red() > 200
 
 def test_generate_micro_thumbnail_handles_missing_dependencies(monkeypatch, tmp_path):
     """Test returns None if Pillow dependencies are missing."""
@@ -154,3 +158,22 @@ def test_generate_micro_thumbnail_handles_io_errors(tmp_path):
     invalid_file.write_text("not an image")
     blob = image_loader.generate_micro_thumbnail(invalid_file)
     assert blob is None
+
+
+def test_qimage_from_micro_thumbnail_wraps_raw_pixels_without_decoding():
+    """Raw micro payloads are wrapped in place; other blobs are rejected."""
+    from iPhoto.utils.micro_thumbnail import PIXEL_FORMAT_RGB888, encode_micro_thumbnail
+
+    source = Image.new("RGB", (4, 2), color=(0, 0, 255))
+    source.putpixel((0, 0), (255, 0, 0))
+
+    for pixel_format in (PIXEL_FORMAT_RGB565, PIXEL_FORMAT_RGB888):
+        blob = encode_micro_thumbnail(source, pixel_format=pixel_format)
+        qimg = image_loader.qimage_from_micro_thumbnail(memoryview(blob))
+        assert qimg is not None
+        assert (qimg.width(), qimg.height()) == (4, 2)
+        assert qimg.pixelColor(0, 0).red() > 240
+        assert qimg.pixelColor(3, 1).blue() > 240
+
+    assert image_loader.qimage_from_micro_thumbnail(b"\xff\xd8\xffjpeg") is None
+    assert image_loader.qimage_from_micro_thumbnail(blob[:-1]) is None
@@ -268,3 +268,32 @@ def test_restore_selection_uses_current_grid_model_for_optimistic_move() -> None
         is_delete=False,
     )
     stale_model.optimistic_move_paths.assert_not_called()
+
+
+def test_paste_passes_skip_duplicates_preference(monkeypatch) -> None:
+    album_root = Path("D:/library/Album")
+    pasted = Path("D:/elsewhere/photo.jpg")
+    controller, facade = _make_controller(selected_paths=[])
+    controller._skip_duplicates_provider = lambda: True
+    facade.current_album = MagicMock(root=album_root)
+
+    mime = MagicMock()
+    mime.hasUrls.return_value = True
+    url = MagicMock()
+    url.isLocalFile.return_value = True
+    url.toLocalFile.return_value = str(pasted)
+    mime.urls.return_value = [url]
+    clipboard = MagicMock()
+    clipboard.mimeData.return_value = mime
+    monkeypatch.setattr(
+        "iPhoto.gui.ui.controllers.context_menu_controller.QGuiApplication.clipboard",
+        lambda: clipboard,
+    )
+
+    controller._paste_from_clipboard()
+
+    facade.import_files.assert_called_once_with(
+        [pasted],
+        destination=album_root,
+        skip_duplicates=True,
+    )
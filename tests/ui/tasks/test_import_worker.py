@@ -21,22 +21,49 @@ pytest.importorskip(
 
 from PySide6.QtWidgets import QApplication
 
-from iPhoto.gui.ui.tasks.import_worker import ImportWorker, ImportSignals
+from iPhoto.gui.ui.tasks import import_worker as import_worker_module
+from iPhoto.gui.ui.tasks.import_worker import ImportedFile, ImportWorker, ImportSignals
 
 
 class FakeScanService:
-    def __init__(self, *, fail_incremental: bool = False, fail_pair: bool = False) -> None:
+    def __init__(
+        self,
+        *,
+        fail_incremental: bool = False,
+        fail_pair: bool = False,
+        indexed_ids: set[str] | None = None,
+    ) -> None:
         self.fail_incremental = fail_incremental
         self.fail_pair = fail_pair
+        self.indexed_ids = indexed_ids or set()
         self.specific: list[tuple[Path, list[Path]]] = []
+        self.specific_ids: list[dict[Path, str]] = []
         self.paired: list[Path] = []
+        self.paired_imports: list[tuple[Path, list[dict]]] = []
         self.scanned: list[tuple[Path, bool]] = []
         self.finalized: list[tuple[Path, list[dict]]] = []
 
-    def scan_specific_files(self, root: Path, files: list[Path]) -> None:
+    def scan_specific_files(
+        self,
+        root: Path,
+        files: list[Path],
+        *,
+        asset_ids: dict[Path, str] | None = None,
+    ) -> list[dict]:
         self.specific.append((root, list(files)))
+        self.specific_ids.append(dict(asset_ids or {}))
         if self.fail_incremental:
             raise RuntimeError("chunk failed")
+        return [{"rel": f"Album/{path.name}"} for path in files]
+
+    def pair_imported_files(self, root: Path, rows: list[dict]) -> list:
+        self.paired_imports.append((root, list(rows)))
+        if self.fail_pair:
+            raise RuntimeError("pair failed")
+        return []
+
+    def indexed_asset_ids(self, asset_ids: list[str]) -> set[str]:
+        return {asset_id for asset_id in asset_ids if asset_id in self.indexed_ids}
 
     def pair_album(self, root: Path) -> None:
         self.paired.append(root)
@@ -71,8 +98,8 @@ def qapp() -> QApplication:
     return app
 
 
-def test_import_worker_prefers_pair_over_rescan(qapp: QApplication, tmp_path: Path) -> None:
-    """Incremental imports should use pairing instead of a full rescan when chunks succeed."""
+def test_import_worker_pairs_only_imported_rows(qapp: QApplication, tmp_path: Path) -> None:
+    """Successful chunks should finish with scoped pairing instead of an album pass."""
 
     destination = tmp_path / "Album"
     destination.mkdir()
@@ -104,7 +131,8 @@ def test_import_worker_prefers_pair_over_rescan(qapp: QApplication, tmp_path: Pa
     worker.run()
 
     assert scan_service.specific == [(destination, [destination / source.name])]
-    assert scan_service.paired == [destination]
+    assert scan_service.paired_imports == [(destination, [{"rel": "Album/photo.jpg"}])]
+    assert scan_service.paired == []
     assert scan_service.scanned == []
     assert lifecycle_service.reconciled == []
 
@@ -151,8 +179,102 @@ def test_import_worker_falls_back_to_full_rescan_after_incremental_failure(
     worker.run()
 
     assert errors == ["Incremental scan failed: chunk failed"]
-    assert scan_service.paired == []
+    assert scan_service.paired_imports == []
     assert scan_service.scanned == [(destination, False)]
     assert scan_service.finalized == [(destination, [{"rel": "photo.jpg"}])]
     assert lifecycle_service.reconciled == [(destination, [{"rel": "photo.jpg"}])]
     assert finished[-1] == (destination, [destination / source.name], True)
+
+
+def test_import_worker_indexes_chunks_while_copying(
+    qapp: QApplication,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Every chunk is indexed and all rows reach the scoped pairing step."""
+
+    monkeypatch.setattr(import_worker_module, "CHUNK_SIZE", 2)
+    destination = tmp_path / "Album"
+    destination.mkdir()
+    sources = []
+    for index in range(5):
+        source = tmp_path / f"photo{index}.jpg"
+        source.write_bytes(f"data{index}".encode())
+        sources.append(source)
+
+    signals = ImportSignals()
+    finished: list[tuple[Path, list[Path], bool]] = []
+    signals.finished.connect(
+        lambda root, imported, success: finished.append((root, imported, success))
+    )
+    scan_service = FakeScanService()
+
+    def copier(src: Path, dst: Path) -> Path:
+        target = dst / src.name
+        target.write_bytes(src.read_bytes())
+        return target
+
+    worker = ImportWorker(
+        sources,
+        destination,
+        copier,
+        signals,
+        scan_service=scan_service,
+        asset_lifecycle_service=FakeLifecycleService(),
+    )
+    worker.run()
+
+    expected = [destination / source.name for source in sources]
+    assert [files for _root, files in scan_service.specific] == [
+        expected[0:2],
+        expected[2:4],
+        expected[4:5],
+    ]
+    assert scan_service.paired_imports == [
+        (destination, [{"rel": f"Album/{path.name}"} for path in expected])
+    ]
+    assert finished[-1] == (destination, expected, True)
+
+
+def test_import_worker_skips_duplicate_content(
+    qapp: QApplication,
+    tmp_path: Path,
+) -> None:
+    """Copies whose asset id is already indexed or repeated are discarded."""
+
+    destination = tmp_path / "Album"
+    destination.mkdir()
+    sources = []
+    for name in ("known.jpg", "new.jpg", "again.jpg"):
+        source = tmp_path / name
+        source.write_bytes(name.encode())
+        sources.append(source)
+    ids = {"known.jpg": "as_known", "new.jpg": "as_new", "again.jpg": "as_new"}
+
+    signals = ImportSignals()
+    finished: list[tuple[Path, list[Path], bool]] = []
+    signals.finished.connect(
+        lambda root, imported, success: finished.append((root, imported, success))
+    )
+    scan_service = FakeScanService(indexed_ids={"as_known"})
+
+    def copier(src: Path, dst: Path) -> ImportedFile:
+        target = dst / src.name
+        target.write_bytes(src.read_bytes())
+        return ImportedFile(target, ids[src.name])
+
+    worker = ImportWorker(
+        sources,
+        destination,
+        copier,
+        signals,
+        skip_duplicates=True,
+        scan_service=scan_service,
+        asset_lifecycle_service=FakeLifecycleService(),
+    )
+    worker.run()
+
+    assert sorted(path.name for path in destination.iterdir()) == ["new.jpg"]
+    assert scan_service.specific == [(destination, [destination / "new.jpg"])]
+    assert scan_service.specific_ids == [{destination / "new.jpg": "as_new"}]
+    assert finished[-1] == (destination, [destination / "new.jpg"], True)
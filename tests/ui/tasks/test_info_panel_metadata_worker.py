@@ -0,0 +1,68 @@
+"""Tests for :mod:`iPhoto.gui.ui.tasks.info_panel_metadata_worker`."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip(
+    "PySide6",
+    reason="PySide6 is required for worker tests",
+    exc_type=ImportError,
+)
+
+from iPhoto.gui.ui.tasks import info_panel_metadata_worker as worker_module
+from iPhoto.gui.ui.tasks.info_panel_metadata_worker import InfoPanelMetadataWorker
+
+
+class _DetailsSource:
+    def __init__(self, stored: dict | None) -> None:
+        self.stored = stored
+        self.writes: list[tuple[Path, dict, dict]] = []
+
+    def read_asset_details(self, path: Path) -> dict | None:
+        return self.stored
+
+    def store_asset_details(self, path: Path, details: dict, extended: dict) -> bool:
+        self.writes.append((path, details, extended))
+        return True
+
+
+def test_worker_reads_indexed_details_without_exiftool(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    def _unexpected(paths):
+        raise AssertionError("ExifTool should not run for indexed details")
+
+    monkeypatch.setattr(worker_module, "get_metadata_batch", _unexpected)
+    source = _DetailsSource({"iso": 100, "lens_make": "Apple"})
+    worker = InfoPanelMetadataWorker(
+        tmp_path / "IMG_0001.jpg",
+        is_video=False,
+        details_source=source,
+    )
+
+    assert worker._read_metadata() == {"iso": 100, "lens_make": "Apple"}
+    assert source.writes == []
+
+
+def test_worker_persists_details_extracted_for_legacy_rows(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "IMG_0002.jpg"
+    payload = {"ExifIFD": {"ISO": 250, "MeteringMode": 5}}
+    monkeypatch.setattr(worker_module, "get_metadata_batch", lambda paths: [payload])
+    source = _DetailsSource(None)
+    worker = InfoPanelMetadataWorker(path, is_video=False, details_source=source)
+
+    metadata = worker._read_metadata()
+
+    assert metadata["iso"] == 250
+    assert len(source.writes) == 1
+    written_path, details, extended = source.writes[0]
+    assert written_path == path
+    assert details is metadata
+    assert extended == {"metering_mode": 5}
@@ -0,0 +1,94 @@
+"""Tests for the keyframe-indexed video scrub service."""
+
+from __future__ import annotations
+
+import os
+from fractions import Fraction
+from pathlib import Path
+
+import pytest
+
+av = pytest.importorskip("av", reason="PyAV is required for scrub decoding")
+np = pytest.importorskip("numpy")
+
+from iPhoto.gui.ui.tasks import video_scrub_service
+from iPhoto.gui.ui.tasks.video_scrub_service import KeyframeIndex, VideoScrubService
+
+
+def _write_clip(path: Path, *, frames: int = 60, gop: int = 10) -> Path:
+    with av.open(str(path), "w") as container:
+        stream = container.add_stream("mpeg4", rate=10)
+        stream.width = 64
+        stream.height = 48
+        stream.pix_fmt = "yuv420p"
+        stream.codec_context.gop_size = gop
+        stream.options = {"sc_threshold": "1000000000"}
+        for index in range(frames):
+            pixels = np.full((48, 64, 3), index * 4, dtype=np.uint8)
+            frame = av.VideoFrame.from_ndarray(pixels, format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return path
+
+
+def test_keyframe_index_picks_nearest_keyframe() -> None:
+    index = KeyframeIndex(time_base=Fraction(1, 10), start_pts=0, keyframes=(0, 10, 20))
+
+    assert index.nearest(0.4) == 0
+    assert index.nearest(0.6) == 10
+    assert index.nearest(9.0) == 20
+    assert KeyframeIndex.from_json(index.to_json()) == index
+
+
+def test_keyframe_index_is_persisted_per_video(tmp_path: Path, monkeypatch) -> None:
+    clip = _write_clip(tmp_path / "clip.mp4")
+    index = VideoScrubService(tmp_path / "cache").keyframe_index(clip)
+
+    assert index is not None
+    assert len(index.keyframes) == 6
+
+    def _fail(_source):
+        raise AssertionError("keyframe index should be read from disk")
+
+    monkeypatch.setattr(video_scrub_service, "_build_keyframe_index", _fail)
+    assert VideoScrubService(tmp_path / "cache").keyframe_index(clip) == index
+
+
+def test_read_strip_decodes_scaled_and_rotated_keyframes(tmp_path: Path) -> None:
+    clip = _write_clip(tmp_path / "clip.mp4")
+    service = VideoScrubService(tmp_path / "cache")
+
+    streamed: list[bytes] = []
+    frames = service.read_strip(clip, [0.5, 2.5, 4.5], (32, 24), on_frame=streamed.append)
+    assert frames is not None
+    assert streamed == frames
+    assert [len(frame) for frame in frames] == [32 * 24 * 3] * 3
+    assert frames[0] != frames[2]
+
+    rotated = service.read_strip(clip, [0.1, 0.2], (24, 32), rotation=90)
+    assert rotated is not None
+    assert [len(frame) for frame in rotated] == [24 * 32 * 3] * 2
+    assert rotated[0] == rotated[1]
+
+
+def test_strip_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    sources = []
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        source = tmp_path / name
+        source.write_bytes(name.encode("utf-8"))
+        sources.append(source)
+    strip = bytes(4 * 4 * 3)
+    service = VideoScrubService(tmp_path / "cache", strip_budget_bytes=2 * (len(strip) + 12))
+
+    service.store_strip(sources[0], 4, 4, 1, strip)
+    service.store_strip(sources[1], 4, 4, 1, strip)
+    for offset, path in enumerate(sorted((tmp_path / "cache").iterdir())):
+        os.utime(path, ns=(1_000_000_000 + offset, 1_000_000_000 + offset))
+    assert service.cached_strip(sources[0], 4, 1) is not None
+    service.store_strip(sources[2], 4, 4, 1, strip)
+
+    assert service.cached_strip(sources[0], 4, 1) == (4, 4, 1, strip)
+    assert service.cached_strip(sources[1], 4, 1) is None
+    assert service.cached_strip(sources[2], 4, 1) is not None
@@ -135,3 +135,53 @@ def test_worker_falls_back_to_individual_frames_when_contact_sheet_is_empty(monk
     assert ready_payloads[0][1] == 17
     assert all(generation == 17 for _frame, generation in thumb_payloads)
     assert finished_calls == [17]
+
+
+def test_worker_prefers_keyframe_strip_over_ffmpeg(monkeypatch, tmp_path) -> None:
+    class _ScrubService:
+        def __init__(self) -> None:
+            self.stored: list[tuple[int, int, int]] = []
+
+        def cached_strip(self, *_args):
+            return None
+
+        def read_strip(self, _source, sample_times, size, *, rotation=0, on_frame=None):
+            width, height = size
+            frames = [bytes(width * height * 3) for _time in sample_times]
+            for frame in frames:
+                on_frame(frame)
+            return frames
+
+        def store_strip(self, _source, thumb_w, thumb_h, count, _data):
+            self.stored.append((thumb_w, thumb_h, count))
+
+    scrub = _ScrubService()
+    worker = VideoTrimThumbnailWorker(
+        tmp_path / "clip.mp4",
+        generation=21,
+        duration_sec=4.0,
+        target_height=72,
+        target_width=96,
+        count=3,
+        scrub_service=scrub,
+    )
+    monkeypatch.setattr(
+        "iPhoto.gui.ui.tasks.video_trim_thumbnail_worker.probe_video_rotation",
+        lambda _path: (0, 1920, 1080),
+    )
+
+    def _unexpected(_duration):
+        raise AssertionError("ffmpeg fallback should not run")
+
+    monkeypatch.setattr(worker, "_extract_contact_sheet", _unexpected)
+    ready_payloads: list[tuple[list[QImage], int]] = []
+    thumb_payloads: list[tuple[QImage, int]] = []
+    worker.signals.ready.connect(lambda payload, generation: ready_payloads.append((payload, generation)))
+    worker.signals.thumbnail.connect(lambda frame, generation: thumb_payloads.append((frame, generation)))
+
+    worker.run()
+
+    assert len(ready_payloads) == 1
+    assert len(thumb_payloads) == 3
+    assert [image.size().toTuple() for image in ready_payloads[0][0]] == [(96, 54)] * 3
+    assert scrub.stored == [(96, 54, 3)]
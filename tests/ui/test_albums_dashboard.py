@@ -15,7 +15,7 @@ pytest.importorskip(
 )
 
 from PySide6.QtCore import QSize, Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtGui import QPixmap, QResizeEvent, QShowEvent
 from PySide6.QtWidgets import QApplication
 
 from iPhoto.errors import AlbumOperationError
@@ -24,6 +24,7 @@ from iPhoto.gui.services.pinned_items_service import PinnedItemsService
 from iPhoto.gui.ui.widgets.albums_dashboard import (
     AlbumCard,
     AlbumsDashboard,
+    DashboardThumbnailLoader,
 )
 from iPhoto.library.runtime_controller import LibraryRuntimeController
 from iPhoto.settings.manager import SettingsManager
@@ -329,3 +330,64 @@ def test_albums_dashboard_updates_cover_preview_immediately(qapp, mock_library,
 
         assert card.image_view._pixmap is not None
         request_thumb.assert_called_once_with(album.path, cover_path, QSize(512, 512))
+
+
+def test_albums_dashboard_defers_cover_requests_until_visible(qapp, mock_library, tmp_path):
+    album = MagicMock()
+    album.title = "Trips"
+    album.path = tmp_path / "Trips"
+    mock_library.list_albums.return_value = [album]
+    cover_path = album.path / "cover.jpg"
+    cache_file = tmp_path / "thumb.jpg"
+
+    with patch("PySide6.QtCore.QThreadPool.globalInstance"):
+        dashboard = AlbumsDashboard(mock_library)
+        qapp.processEvents()
+        generation = dashboard._current_generation
+
+        with patch.object(dashboard._thumb_loader, "request_with_absolute_key") as request_thumb:
+            dashboard._on_cover_cached(album.path, cache_file, generation)
+            dashboard._on_album_data_ready(album, 3, cover_path, album.path, generation)
+            request_thumb.assert_not_called()
+
+            dashboard.resize(800, 600)
+            dashboard.show()
+            qapp.processEvents()
+            dashboard._request_visible_covers()
+
+        request_thumb.assert_called_once_with(
+            album.path, cover_path, QSize(512, 512), cache_file
+        )
+        assert dashboard._pending_covers == {}
+        dashboard.hide()
+
+
+def test_album_card_show_and_resize_do_not_request_covers(qapp):
+    card = AlbumCard(Path("/tmp/test_album"), "My Album", 10)
+
+    card.showEvent(QShowEvent())
+    card.resizeEvent(QResizeEvent(QSize(320, 120), QSize(300, 100)))
+    qapp.processEvents()
+
+
+def test_thumbnail_loader_reads_cached_cover_on_its_pool(qapp, tmp_path):
+    cache_file = tmp_path / "thumb.png"
+    pixmap = QPixmap(8, 8)
+    pixmap.fill()
+    assert pixmap.save(str(cache_file))
+    loader = DashboardThumbnailLoader(library_root=tmp_path)
+    delivered = []
+    loader.thumbnailReady.connect(
+        lambda root, path, image: delivered.append((root, path, image.size()))
+    )
+
+    with patch("iPhoto.gui.ui.widgets.albums_dashboard.QPixmap") as gui_pixmap:
+        gui_pixmap.fromImage.side_effect = QPixmap.fromImage
+        loader.request_with_absolute_key(
+            tmp_path, tmp_path / "cover.jpg", QSize(512, 512), cache_file
+        )
+        gui_pixmap.assert_not_called()
+    assert loader._pool.waitForDone(5000)
+    qapp.processEvents()
+
+    assert delivered == [(tmp_path, tmp_path / "cover.jpg", QSize(8, 8))]
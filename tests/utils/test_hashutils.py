@@ -0,0 +1,23 @@
+"""Tests for :mod:`iPhoto.utils.hashutils`."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from iPhoto.utils.hashutils import compute_file_id, copy_with_file_id
+
+
+@pytest.mark.parametrize("size", [0, 17, 2 * 1024 * 1024, 3 * 1024 * 1024 + 5])
+def test_copy_with_file_id_matches_compute_file_id(tmp_path: Path, size: int) -> None:
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(size))
+    target = tmp_path / "target.bin"
+
+    file_id = copy_with_file_id(source, target, chunk_size=100_003)
+
+    assert target.read_bytes() == source.read_bytes()
+    assert file_id == compute_file_id(source)
+    assert target.stat().st_mtime == pytest.approx(source.stat().st_mtime)
@@ -2,6 +2,7 @@
 import io
 from PIL import Image
 from iPhoto.utils.image_loader import generate_micro_thumbnail
+from iPhoto.utils.micro_thumbnail import read_micro_header
 import tempfile
 import os
 from pathlib import Path
@@ -34,19 +35,14 @@ def test_generate_micro_thumbnail_preserves_orientation():
 
         assert thumb_bytes is not None
 
-        with Image.open(io.BytesIO(thumb_bytes)) as thumb:
-            # The thumbnail should be 16x16 max dimension.
-            # 100x50 -> 16x8 (landscape).
-            # Rotated 90 deg -> 8x16 (portrait).
+        header = read_micro_header(thumb_bytes)
+        # The thumbnail should be 16x16 max dimension.
+        # 100x50 -> 16x8 (landscape).
+        # Rotated 90 deg -> 8x16 (portrait).
 
-            # Check dimensions. Since we optimized by swapping order, we expect the visual orientation to be correct.
-            # Visual orientation: 50x100. Scaled to fit 16x16 -> 8x16.
-
-            # Note: generate_micro_thumbnail saves as JPEG without EXIF usually (unless copied),
-            # but it rotates the image pixels. So the resulting image should have dimensions that match the visual orientation.
-
-            # 8x16 is the correct visual aspect ratio for a 50x100 visual image.
-            assert thumb.size == (8, 16)
+        # The raw micro format carries no EXIF, so the pixels themselves must be rotated.
+        # 8x16 is the correct visual aspect ratio for a 50x100 visual image.
+        assert (header.width, header.height) == (8, 16)
 
     finally:
         os.unlink(tmp_path)
@@ -63,7 +59,7 @@ def test_generate_micro_thumbnail_small_png():
         thumb_bytes = generate_micro_thumbnail(Path(tmp_path))
         assert thumb_bytes is not None
 
-        with Image.open(io.BytesIO(thumb_bytes)) as thumb:
-            assert thumb.size == (16, 16)
+        header = read_micro_header(thumb_bytes)
+        assert (header.width, header.height) == (16, 16)
     finally:
         os.unlink(tmp_path)
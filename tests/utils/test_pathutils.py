@@ -58,3 +58,63 @@ def test_should_include(tmp_path):
 
     # Excluded
     assert not should_include(root / "bad.jpg", include, exclude, root=root)
+
+def _fnmatch_reference(rel, include, exclude):
+    import fnmatch
+
+    def _hit(globs):
+        for pattern in globs:
+            for expanded in _expand(pattern):
+                if fnmatch.fnmatch(rel, expanded):
+                    return True
+                if expanded.startswith("**/") and fnmatch.fnmatch(rel, expanded[3:]):
+                    return True
+        return False
+
+    return not _hit(exclude) and _hit(include)
+
+def test_compiled_matcher_agrees_with_fnmatch():
+    from iPhoto.config import DEFAULT_EXCLUDE, DEFAULT_INCLUDE
+    from iPhoto.utils.pathutils import compile_path_matcher
+
+    matcher = compile_path_matcher(DEFAULT_INCLUDE, DEFAULT_EXCLUDE)
+    samples = [
+        "a.jpg",
+        ".jpg",
+        "Album/IMG_0001.HEIC",
+        "Album/IMG_0001.heic.txt",
+        "Album/clip.MoV",
+        "Album/clip.mov",
+        "Album/._IMG_0001.jpg",
+        "Album/.DS_Store",
+        ".Trash/old.jpg",
+        "Album/.Trash/old.jpg",
+        ".iPhoto/cache/thumbs/x.jpg",
+        "dir.jpg/readme",
+        "Album/raw/IMG_1.CR3",
+    ]
+    for rel in samples:
+        assert matcher.matches_rel(rel) == _fnmatch_reference(
+            rel, DEFAULT_INCLUDE, DEFAULT_EXCLUDE
+        ), rel
+
+def test_compiled_matcher_handles_non_suffix_globs():
+    from iPhoto.utils.pathutils import compile_path_matcher
+
+    include = ["Album/IMG_[0-9]*.jpg", "**/*.tar.gz"]
+    exclude = ["Album/IMG_9*"]
+    matcher = compile_path_matcher(include, exclude)
+    for rel in ["Album/IMG_1.jpg", "Album/IMG_9.jpg", "Album/IMG_x.jpg", "x/y.tar.gz", "y.gz"]:
+        assert matcher.matches_rel(rel) == _fnmatch_reference(rel, include, exclude), rel
+
+def test_compiled_matcher_prunes_excluded_directories():
+    from iPhoto.config import DEFAULT_EXCLUDE, DEFAULT_INCLUDE
+    from iPhoto.utils.pathutils import compile_path_matcher
+
+    matcher = compile_path_matcher(DEFAULT_INCLUDE, DEFAULT_EXCLUDE)
+    assert matcher.prunes_dir(".Trash")
+    assert matcher.prunes_dir("Album/.Trash")
+    assert matcher.prunes_dir("Album/.iPhoto")
+    assert not matcher.prunes_dir("Album")
+    assert not matcher.prunes_dir("Album/Trash")
+    assert not compile_path_matcher(["*.jpg"], ["*.tmp"]).prunes_dir("Album")
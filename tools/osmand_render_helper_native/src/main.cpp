@@ -640,6 +640,10 @@ int main(int argc, char** argv)
         else
         {
             response = dispatchCommand(document.object(), session, shouldExit);
+            // Echo the request id so pooled clients can pipeline requests.
+            const auto requestId = document.object().value(QStringLiteral("id"));
+            if (!requestId.isUndefined())
+                response.insert(QStringLiteral("id"), requestId);
         }
 
         std::cout << QJsonDocument(response).toJson(QJsonDocument::Compact).constData() << std::endl;